@@ -7,8 +7,11 @@ Handles game state and provides API endpoints for the browser client
 import sys
 import os
 import secrets
+import hashlib
+import threading
+from functools import partial
 from flask import Flask, render_template, jsonify, request
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_cors import CORS
 
 # Add src directory to Python path
@@ -16,10 +19,13 @@ src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
 sys.path.insert(0, src_path)
 
 from engine import GameState
-from systems.architect import Difficulty
+from systems.architect import Difficulty, GameProfile
 from entities.crew_member import StealthPosture
 from core.resolution import Attribute, Skill
 from ui.settings import settings
+from core.state_delta import StateSection
+from core.session_manager import SessionManager
+from core.sharding import ShardConfig, ShardRelay
 
 app = Flask(__name__,
             static_folder='web/static',
@@ -39,73 +45,135 @@ else:
 # Use threading async_mode for Python 3.14 compatibility (eventlet not supported)
 socketio = SocketIO(app, cors_allowed_origins=cors_origins, async_mode='threading')
 
-# Global game state
-game_sessions = {}
-
 # --- EVENT BRIDGE ---
 # Import EventType from the correct module path (src/core/event_system.py)
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, process_bus, EventType, GameEvent
 
 class EventBridge:
-    """Bridges backend GameEvents to frontend SocketIO events."""
-    def __init__(self, socketio_instance):
+    """
+    Bridges one session's GameEvents to its SocketIO room.
+
+    Listens on the game's own event bus, queues client-facing events as they
+    fire and pushes them as a single batch once the command/turn has flushed,
+    so a session never sees another session's events.
+    """
+
+    # Backend event -> frontend event type
+    EVENT_LABELS = {
+        EventType.WARNING: 'WARNING',
+        EventType.COMBAT_LOG: 'COMBAT',
+        EventType.BIOLOGICAL_SLIP: 'BIOLOGICAL_SLIP',
+        EventType.PARANOIA_THRESHOLD_CROSSED: 'PARANOIA',
+        EventType.POWER_FAILURE: 'POWER_FAILURE',
+        EventType.ENVIRONMENTAL_STATE_CHANGE: 'ENVIRONMENT',
+        EventType.STEALTH_REPORT: 'STEALTH',
+    }
+
+    def __init__(self, socketio_instance, session_id, bus):
         self.socketio = socketio_instance
+        self.session_id = session_id
+        self.bus = bus
+        self._pending = []
         self.setup_listeners()
-        
+
     def setup_listeners(self):
-        # Subscribe to relevant events
-        event_bus.subscribe(EventType.WARNING, self.on_warning)
-        event_bus.subscribe(EventType.COMBAT_LOG, self.on_combat)
-        event_bus.subscribe(EventType.BIOLOGICAL_SLIP, self.on_biological_slip)
-        event_bus.subscribe(EventType.PARANOIA_THRESHOLD_CROSSED, self.on_paranoia)
-        event_bus.subscribe(EventType.POWER_FAILURE, self.on_power_failure)
-        event_bus.subscribe(EventType.ENVIRONMENTAL_STATE_CHANGE, self.on_environment_change)
-        event_bus.subscribe(EventType.STEALTH_REPORT, self.on_stealth_report)
-        
-    def on_warning(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'WARNING',
-            'data': event.payload
-        })
-        
-    def on_combat(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'COMBAT',
-            'data': event.payload
-        })
-        
-    def on_biological_slip(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'BIOLOGICAL_SLIP',
-            'data': event.payload
-        })
-        
-    def on_paranoia(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'PARANOIA',
-            'data': event.payload
-        })
-        
-    def on_power_failure(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'POWER_FAILURE',
-            'data': event.payload
-        })
-        
-    def on_environment_change(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'ENVIRONMENT',
-            'data': event.payload
-        })
-        
-    def on_stealth_report(self, event: GameEvent):
-        self.socketio.emit('game_event', {
-            'type': 'STEALTH',
-            'data': event.payload
+        for event_type in self.EVENT_LABELS:
+            self.bus.subscribe(event_type, self.on_event)
+
+    def cleanup(self):
+        for event_type in self.EVENT_LABELS:
+            self.bus.unsubscribe(event_type, self.on_event)
+        self._pending = []
+
+    def on_event(self, event: GameEvent):
+        self._pending.append({
+            'type': self.EVENT_LABELS[event.type],
+            'data': self._client_payload(event.payload or {})
         })
 
-# Initialize Event Bridge
-event_bridge = EventBridge(socketio)
+    @classmethod
+    def _client_payload(cls, value):
+        """Drop engine object references (game_state, *_ref) so payloads stay JSON-safe."""
+        if isinstance(value, dict):
+            return {key: cls._client_payload(item) for key, item in value.items()
+                    if isinstance(item, (str, int, float, bool, list, tuple, dict, type(None)))}
+        if isinstance(value, (list, tuple)):
+            return [cls._client_payload(item) for item in value]
+        return value
+
+    def drain(self):
+        """Return and clear the events queued since the last frame."""
+        events, self._pending = self._pending, []
+        return events
+
+    def flush(self):
+        """Push queued events to the session's room as one batch."""
+        events = self.drain()
+        if events:
+            self.socketio.emit('game_events', {'events': events}, to=self.session_id)
+
+
+# One bridge per resident session, keyed like game_sessions
+event_bridges = {}
+
+
+def _activate_session(session_id, game):
+    """A game became resident (new, rehydrated or loaded): apply settings, bridge its events."""
+    with game.event_bus.activate():
+        settings.apply_to_game(game)
+    # Every session journals its autosaves to a slot of its own
+    game.save_manager.autosave_slot = _autosave_slot(session_id)
+    previous = event_bridges.get(session_id)
+    if previous is not None:
+        previous.cleanup()
+    event_bridges[session_id] = EventBridge(socketio, session_id, game.event_bus)
+
+
+def _autosave_slot(session_id):
+    """Autosave slot for a session; hashed so session ids never reach the filesystem."""
+    return "autosave_" + hashlib.sha256(session_id.encode()).hexdigest()[:16]
+
+
+def _release_session(session_id, game):
+    """A game is leaving memory (hibernated, replaced or discarded)."""
+    bridge = event_bridges.get(session_id)
+    # A replaced game is released after its successor is bridged; leave that bridge alone
+    if bridge is not None and bridge.bus is game.event_bus:
+        del event_bridges[session_id]
+        bridge.cleanup()
+
+
+# This process's shard (SHARD_* env from start_web_server.py; one shard by default)
+shard = ShardConfig.from_env()
+
+
+def _shard_url(index):
+    """Base URL of a shard as seen by the requesting client ('' = this server)."""
+    if index == shard.index:
+        return ''
+    host = request.host.rsplit(':', 1)[0]
+    return f"{request.scheme}://{host}:{shard.port_for(index)}"
+
+
+def _misdirected(session_id):
+    """Response payload for a session owned by another shard, or None if it's ours."""
+    if shard.owns(session_id):
+        return None
+    owner = shard.owner(session_id)
+    return {'error': 'Session belongs to another shard', 'shard': owner, 'shard_url': _shard_url(owner)}
+
+
+# Global game state: bounded, idle sessions hibernate to disk.
+# Rehydrated sessions keep the server profile (no host audio).
+game_sessions = SessionManager(
+    loader=partial(GameState.from_dict, profile=GameProfile.server()),
+    max_active=int(os.environ.get('MAX_ACTIVE_SESSIONS', 32)),
+    max_sessions=int(os.environ.get('MAX_SESSIONS', 1024)),
+    idle_seconds=float(os.environ.get('SESSION_IDLE_SECONDS', 600)),
+    hibernate_dir=os.environ.get('SESSION_HIBERNATE_DIR', os.path.join('data', 'sessions')),
+    on_activate=_activate_session,
+    on_release=_release_session,
+)
 
 
 def _generate_quick_actions(game, player_room):
@@ -151,17 +219,8 @@ def _generate_quick_actions(game, player_room):
     return actions
 
 
-def serialize_game_state(game):
-    """Convert game state to JSON-serializable format"""
-    player_room = game.station_map.get_room_name(*game.player.location)
-    weather_status = game.weather.get_status()
-    room_icons = game.room_states.get_status_icons(player_room)
-
-    # Get room items
-    room_items = game.station_map.get_items_in_room(*game.player.location)
-    item_list = [{"name": str(i), "description": i.description} for i in room_items]
-
-    # Get crew status
+def _serialize_crew(game):
+    """Per-member status entries (StateSection.CREW)."""
     crew_status = []
     for m in game.crew:
         room = game.station_map.get_room_name(*m.location)
@@ -182,48 +241,75 @@ def serialize_game_state(game):
             'out_of_place': getattr(m, 'out_of_place', False),
             'out_of_place_reason': getattr(m, 'out_of_place_reason', None)
         })
+    return crew_status
 
-    # Get player inventory
-    inventory = [{"name": item.name, "description": item.description} for item in game.player.inventory]
 
-    # Get map rendering
-    map_display = game.renderer.render(game, game.player)
-    ascii_map = game.renderer.render_raw_grid(game, game.player)
+def _serialize_inventory(game):
+    """Player inventory (StateSection.INVENTORY)."""
+    return [{"name": item.name, "description": item.description} for item in game.player.inventory]
 
-    # Room description modifiers
-    room_desc = game.room_states.get_room_description_modifiers(player_room)
 
-    # Generate context-aware quick actions
-    quick_actions = _generate_quick_actions(game, player_room)
-
-    # --- 3D Visibility System (Tier 11.1) ---
+def _visible_rooms(game, player_room):
+    """Current room + adjacent rooms through non-barricaded doors (Tier 11.1)."""
     from systems.room_state import RoomState
-    
-    # Compute visible rooms: current room + adjacent rooms through non-barricaded doors
+
     visible_rooms = [player_room]
-    adjacent_rooms = game.station_map.get_connections(player_room)
-    for adj_room in adjacent_rooms:
+    for adj_room in game.station_map.get_connections(player_room):
         # Adjacent rooms are visible unless barricaded
         if not game.room_states.has_state(adj_room, RoomState.BARRICADED):
             visible_rooms.append(adj_room)
-    
-    # Compute per-room lighting state
-    dark_rooms = []
+    return visible_rooms
+
+
+def _serialize_room(game):
+    """Player-room context (StateSection.ROOM)."""
+    from systems.room_state import RoomState
+
+    player_room = game.station_map.get_room_name(*game.player.location)
+    room_items = game.station_map.get_items_in_room(*game.player.location)
+    return {
+        'room_icons': game.room_states.get_status_icons(player_room),
+        'room_description': game.room_states.get_room_description_modifiers(player_room),
+        'items': [{"name": str(i), "description": i.description} for i in room_items],
+        'quick_actions': _generate_quick_actions(game, player_room),
+        'visible_rooms': _visible_rooms(game, player_room),
+        'dark_rooms': [room_name for room_name in game.station_map.rooms.keys()
+                       if game.room_states.has_state(room_name, RoomState.DARK)],
+    }
+
+
+def _serialize_map(game):
+    """Rendered and raw map text (StateSection.MAP)."""
+    return {
+        'map': game.renderer.render(game, game.player),
+        'ascii_map': game.renderer.render_raw_grid(game, game.player),
+    }
+
+
+def _serialize_lighting(game):
+    """Per-room lighting state (StateSection.LIGHTING)."""
+    from systems.room_state import RoomState
+
+    player_room = game.station_map.get_room_name(*game.player.location)
+    visible_rooms = _visible_rooms(game, player_room)
     room_lighting = {}
     for room_name in game.station_map.rooms.keys():
-        is_dark = game.room_states.has_state(room_name, RoomState.DARK)
-        is_powered = game.power_on
         room_lighting[room_name] = {
-            'is_dark': is_dark,
-            'is_powered': is_powered,
+            'is_dark': game.room_states.has_state(room_name, RoomState.DARK),
+            'is_powered': game.power_on,
             'visibility': 'full' if room_name == player_room else ('partial' if room_name in visible_rooms else 'hidden')
         }
-        if is_dark:
-            dark_rooms.append(room_name)
-    
-    # Check if player has flashlight equipped
-    flashlight_active = any('FLASHLIGHT' in item.name.upper() for item in game.player.inventory)
+    return room_lighting
+
+
+def _serialize_warnings(game):
+    """Ambient location hints (StateSection.WARNINGS)."""
+    return game.get_ambient_warnings() if hasattr(game, 'get_ambient_warnings') else []
 
+
+def _serialize_status(game):
+    """Cheap scalar header fields, rebuilt on every response."""
+    player_room = game.station_map.get_room_name(*game.player.location)
     return {
         'turn': game.turn,
         'mode': game.mode.value,
@@ -231,21 +317,12 @@ def serialize_game_state(game):
         'temperature': round(game.temperature, 1),
         'power_on': game.power_on,
         'location': player_room,
-        'room_icons': room_icons,
-        'room_description': room_desc,
-        'weather': weather_status,
+        'weather': game.weather.get_status(),
         'sabotage_status': game.sabotage.get_status() if not game.radio_operational or not game.helicopter_operational else None,
-        'items': item_list,
-        'crew': crew_status,
-        'inventory': inventory,
-        'map': map_display,
-        'ascii_map': ascii_map,
         'paranoia': game.paranoia_level,
         'player_health': game.player.health,
         'player_alive': game.player.is_alive,
         'player_stress': game.player.stress if hasattr(game.player, 'stress') else 0,
-        'quick_actions': quick_actions,
-        'ambient_warnings': game.get_ambient_warnings() if hasattr(game, 'get_ambient_warnings') else [],
         'player_stealth_posture': game.player.stealth_posture.name if hasattr(game.player, 'stealth_posture') else "STANDING",
         'detection_status': getattr(game.player, 'detection_status', None), # 'detected' or 'evaded'
         'stealth_modifiers': {
@@ -260,14 +337,102 @@ def serialize_game_state(game):
             'wind_direction': game.weather.wind_direction.value,
             'temperature_modifier': game.weather.temperature_modifier
         } if hasattr(game, 'weather') else None,
-        # --- 3D Visibility (Tier 11.1) ---
-        'visible_rooms': visible_rooms,
-        'dark_rooms': dark_rooms,
-        'room_lighting': room_lighting,
-        'flashlight_active': flashlight_active
+        # Check if player has flashlight equipped
+        'flashlight_active': any('FLASHLIGHT' in item.name.upper() for item in game.player.inventory)
     }
 
 
+SECTION_BUILDERS = {
+    StateSection.CREW: _serialize_crew,
+    StateSection.INVENTORY: _serialize_inventory,
+    StateSection.ROOM: _serialize_room,
+    StateSection.MAP: _serialize_map,
+    StateSection.LIGHTING: _serialize_lighting,
+    StateSection.WARNINGS: _serialize_warnings,
+}
+
+# How each section lands in the response payload
+SECTION_KEYS = {
+    StateSection.CREW: 'crew',
+    StateSection.INVENTORY: 'inventory',
+    StateSection.LIGHTING: 'room_lighting',
+    StateSection.WARNINGS: 'ambient_warnings',
+}
+
+
+def serialize_game_state(game, full=True, client=None, built=None):
+    """
+    Convert game state to JSON-serializable format.
+
+    With ``full=False`` only sections the game marked dirty are rebuilt, and only
+    entries that changed since ``client``'s last response are included:
+    ``crew`` lists changed members, ``room_lighting`` changed rooms, and ``map``/
+    ``ascii_map`` become ``{"rows": {index: row}, "length": n}`` patches.
+    Pass one ``built`` dict when serializing for several clients of a game so
+    each section is built once.
+    """
+    built = {} if built is None else built
+
+    def builder(section, build):
+        def run():
+            if section not in built:
+                built[section] = build(game)
+            return built[section]
+        return run
+
+    builders = {section: builder(section, build) for section, build in SECTION_BUILDERS.items()}
+    changes = game.state_tracker.collect(builders, full=full, client=client)
+
+    state = _serialize_status(game)
+    state['state_version'] = game.state_tracker.version
+    state['full'] = full
+    for section, value in changes.items():
+        if section in (StateSection.ROOM, StateSection.MAP):
+            state.update(value)
+        else:
+            state[SECTION_KEYS[section]] = value
+    return state
+
+
+# Sections a non-turn command can dirty; commands that advance the turn dirty
+# everything through TURN_ADVANCE.
+COMMAND_DIRTY_SECTIONS = {
+    'GET': (StateSection.INVENTORY, StateSection.ROOM, StateSection.MAP),
+    'DROP': (StateSection.INVENTORY, StateSection.ROOM, StateSection.MAP),
+    'ATTACK': (StateSection.CREW, StateSection.ROOM, StateSection.MAP),
+    'TEST': (StateSection.CREW, StateSection.ROOM),
+    'HEAT': (StateSection.ROOM,),
+    'APPLY': (StateSection.CREW, StateSection.ROOM),
+    'CANCEL': (StateSection.ROOM,),
+    'INTERROGATE': (StateSection.CREW,),
+    'ASK': (StateSection.CREW,),
+}
+
+
+def _rest_client(data=None):
+    """
+    Delta baseline key for a REST client (``client`` token in the query or body).
+
+    None for callers that send no token; they always get full snapshots.
+    """
+    token = request.args.get('client')
+    if token is None and data:
+        token = data.get('client')
+    return f"rest:{token}" if token else None
+
+
+def _wants_full_state(data=None):
+    """``full=1`` escape hatch (query string or JSON body) for a complete snapshot."""
+    value = request.args.get('full')
+    if value is None and data:
+        value = data.get('full')
+    return _is_flag_set(value)
+
+
+def _is_flag_set(value):
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
 @app.route('/')
 def index():
     """Serve the main game page"""
@@ -280,6 +445,13 @@ def favicon():
     return '', 204
 
 
+@app.route('/api/shard/<session_id>', methods=['GET'])
+def get_shard(session_id):
+    """Sticky routing: which shard (and URL) owns this session."""
+    owner = shard.owner(session_id)
+    return jsonify({'shard': owner, 'shard_count': shard.count, 'url': _shard_url(owner)})
+
+
 @app.route('/api/new_game', methods=['POST'])
 def new_game():
     """Start a new game"""
@@ -296,30 +468,38 @@ def new_game():
 
     # Create new game
     session_id = data.get('session_id', 'default')
-    game = GameState(seed=None, difficulty=difficulty)
-    settings.apply_to_game(game)
+    misdirected = _misdirected(session_id)
+    if misdirected:
+        return jsonify(misdirected), 421
 
-    game_sessions[session_id] = game
+    game = GameState(seed=None, difficulty=difficulty, profile=GameProfile.server())
+    game_sessions.put(session_id, game)
+    with game.event_bus.activate():
+        state = serialize_game_state(game)
 
     return jsonify({
         'success': True,
         'session_id': session_id,
-        'game_state': serialize_game_state(game)
+        'game_state': state
     })
 
 
 @app.route('/api/game_state/<session_id>', methods=['GET'])
 def get_game_state(session_id):
     """Get current game state"""
-    if session_id not in game_sessions:
-        return jsonify({'error': 'Session not found'}), 404
-
-    game = game_sessions[session_id]
-
-    # Check for game over
-    game_over, won, message = game.check_game_over()
+    misdirected = _misdirected(session_id)
+    if misdirected:
+        return jsonify(misdirected), 421
+    with game_sessions.use(session_id) as game:
+        if game is None:
+            return jsonify({'error': 'Session not found'}), 404
+
+        with game.event_bus.activate():
+            # Check for game over
+            game_over, won, message = game.check_game_over()
+            client = _rest_client()
+            state = serialize_game_state(game, full=client is None or _wants_full_state(), client=client)
 
-    state = serialize_game_state(game)
     state['game_over'] = game_over
     state['won'] = won
     state['game_over_message'] = message if game_over else None
@@ -334,15 +514,55 @@ def execute_command():
     session_id = data.get('session_id', 'default')
     command = data.get('command', '').strip().upper()
 
-    if session_id not in game_sessions:
-        return jsonify({'error': 'Session not found'}), 404
+    misdirected = _misdirected(session_id)
+    if misdirected:
+        return jsonify(misdirected), 421
+
+    # Pinned, so another request's eviction can't hibernate the game mid-command
+    with game_sessions.use(session_id) as game:
+        if game is None:
+            return jsonify({'error': 'Session not found'}), 404
+
+        # Everything a command triggers stays on this session's bus
+        client = _rest_client(data)
+        with game.event_bus.activate():
+            response = _run_command(game, session_id, command, full=client is None or _wants_full_state(data),
+                                    client=client)
+
+    # REST clients still get pushed events on their room, just not in the body
+    bridge = event_bridges.get(session_id)
+    if bridge is not None:
+        bridge.flush()
+    return jsonify(response)
 
-    game = game_sessions[session_id]
 
+@app.route('/api/release_client', methods=['POST'])
+def release_client():
+    """Drop a REST client's delta baseline (sent by the browser when its tab closes)."""
+    data = request.get_json(silent=True) or {}
+    session_id = data.get('session_id', 'default')
+    client = _rest_client(data)
+    # A hibernated game's tracker is rebuilt empty anyway
+    if client is not None and game_sessions.is_resident(session_id):
+        with game_sessions.use(session_id) as game:
+            if game is not None:
+                game.state_tracker.forget(client)
+    return jsonify({'success': True})
+
+
+def _run_command(game, session_id, command, full=False, client=None):
+    """Execute a command for one session and build the response payload for ``client``."""
     # Parse command
     cmd = command.split()
     if not cmd:
-        return jsonify({'success': True, 'message': '', 'game_state': serialize_game_state(game)})
+        return {'success': True, 'message': '', 'game_state': serialize_game_state(game, full=full, client=client)}
+
+    if cmd[0] == "LOAD":
+        return _load_session_game(game, session_id, cmd[1] if len(cmd) > 1 else "auto", full=full, client=client)
+    if cmd[0] == "RESUME":
+        return _resume_session_game(game, session_id, cmd[1] if len(cmd) > 1 else None, full=full, client=client)
+
+    game.state_tracker.mark(*COMMAND_DIRTY_SECTIONS.get(cmd[0], ()))
 
     # Start capturing CRT output
     game.crt.start_capture()
@@ -350,6 +570,10 @@ def execute_command():
     # Execute command and capture output
     result = _execute_game_command(game, cmd)
 
+    # Commands that don't end the turn leave combat/movement batches pending;
+    # flush them so the frame carries everything the command produced.
+    game.reporter.flush()
+
     # Stop capture and get extra messages (combat batches, movements, etc.)
     extra_messages = game.crt.stop_capture()
     if extra_messages:
@@ -368,16 +592,67 @@ def execute_command():
     # Check for game over
     game_over, won, message = game.check_game_over()
 
-    state = serialize_game_state(game)
+    state = serialize_game_state(game, full=full, client=client)
     state['game_over'] = game_over
     state['won'] = won
     state['game_over_message'] = message if game_over else None
 
-    return jsonify({
+    return {
         'success': True,
         'message': result,
         'game_state': state
-    })
+    }
+
+
+def _load_session_game(game, session_id, slot, full=False, client=None):
+    """LOAD: replace the session's game with a saved one."""
+    loaded = game.save_manager.load_game(slot, factory=partial(GameState.from_dict, profile=GameProfile.server()))
+    if not loaded:
+        return {'success': True, 'message': "Failed to load game.",
+                'game_state': serialize_game_state(game, full=full, client=client)}
+    return _replace_session_game(session_id, loaded, "*** GAME LOADED ***", client=client)
+
+
+def _resume_session_game(game, session_id, turn, full=False, client=None):
+    """RESUME [TURN]: list the turns in the session's autosave journal, or rewind to one."""
+    turns = game.save_manager.journal_turns()
+    if turn is None or not turn.isdigit() or int(turn) not in turns:
+        if turns:
+            message = "Resumable turns: " + ", ".join(str(t) for t in turns) + "\nUsage: RESUME <TURN>"
+        else:
+            message = "No autosave journal to resume from yet."
+        return {'success': True, 'message': message, 'game_state': serialize_game_state(game, full=full, client=client)}
+
+    resumed = game.save_manager.load_journal(turn=int(turn),
+                                             factory=partial(GameState.from_dict, profile=GameProfile.server()))
+    if not resumed:
+        return {'success': True, 'message': "Failed to resume game.",
+                'game_state': serialize_game_state(game, full=full, client=client)}
+    return _replace_session_game(session_id, resumed, f"*** RESUMED AT TURN {turn} ***", client=client)
+
+
+def _replace_session_game(session_id, replacement, message, client=None):
+    """
+    Swap a restored game into the session.
+
+    The replacement goes back through ``game_sessions``, which bridges its own
+    bus and cleans up the old game (detaching its bus) once this request
+    releases it.
+    """
+    game_sessions.put(session_id, replacement)
+    with replacement.event_bus.activate():
+        game_over, won, game_over_message = replacement.check_game_over()
+        # The client still holds the pre-load snapshot
+        state = serialize_game_state(replacement, full=True, client=client)
+    state['game_over'] = game_over
+    state['won'] = won
+    state['game_over_message'] = game_over_message if game_over else None
+
+    return {
+        'success': True,
+        'message': message,
+        'game_state': state
+    }
 
 
 def _execute_game_command(game, cmd):
@@ -580,17 +855,6 @@ def _execute_game_command(game, cmd):
         game.save_manager.save_game(game, slot)
         output.append(f"Game saved to slot: {slot}")
 
-    elif action == "LOAD":
-        slot = cmd[1] if len(cmd) > 1 else "auto"
-        new_game_state = game.save_manager.load_game(slot)
-        if new_game_state:
-            if isinstance(new_game_state, dict):
-                new_game_state = GameState.from_dict(new_game_state)
-            game.__dict__.update(new_game_state.__dict__)
-            output.append("*** GAME LOADED ***")
-        else:
-            output.append("Failed to load game.")
-
     elif action == "INTERROGATE" or action == "ASK":
         if len(cmd) < 2:
             output.append("Usage: INTERROGATE <NAME> [TOPIC]")
@@ -724,6 +988,7 @@ ENVIRONMENT:
 SYSTEM:
   SAVE [SLOT]   - Save game
   LOAD [SLOT]   - Load game
+  RESUME [TURN] - Rewind to an autosaved turn
   HELP          - Show this help
 """
 
@@ -739,6 +1004,136 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection"""
     print('Client disconnected')
+    _leave_session_room(request.sid)
+
+
+# Sockets in each session's room, and the reverse; every socket gets frames
+# diffed against what it last received. Socket handlers run on their own
+# threads, so both maps are only touched under room_lock.
+session_sockets = {}
+socket_sessions = {}
+room_lock = threading.Lock()
+
+
+def _join_session_room(session_id):
+    sid = request.sid
+    with room_lock:
+        previous = socket_sessions.get(sid)
+        if previous == session_id:
+            return
+        socket_sessions[sid] = session_id
+        session_sockets.setdefault(session_id, set()).add(sid)
+        if previous is not None:
+            _discard_socket(previous, sid)
+    if previous is not None:
+        leave_room(previous)
+        _forget_socket(previous, sid)
+    join_room(session_id)
+
+
+def _leave_session_room(sid):
+    with room_lock:
+        session_id = socket_sessions.pop(sid, None)
+        if session_id is None:
+            return
+        _discard_socket(session_id, sid)
+    _forget_socket(session_id, sid)
+
+
+def _discard_socket(session_id, sid):
+    """Remove sid from a session's room set (caller holds room_lock)."""
+    sockets = session_sockets.get(session_id, set())
+    sockets.discard(sid)
+    if not sockets:
+        session_sockets.pop(session_id, None)
+
+
+def _forget_socket(session_id, sid):
+    # A hibernated game's tracker is rebuilt empty anyway
+    if game_sessions.is_resident(session_id):
+        with game_sessions.use(session_id) as game:
+            if game is not None:
+                game.state_tracker.forget(sid)
+
+
+def _push_frame_to_room(session_id, frame, skip):
+    """Send a command's frame to the session's other sockets, each with its own state delta."""
+    with room_lock:
+        others = sorted(session_sockets.get(session_id, ()))
+    others = [sid for sid in others if sid != skip]
+    if not others:
+        return
+    with game_sessions.use(session_id) as game:
+        if game is None:
+            return
+        with game.event_bus.activate():
+            game_over, won, message = game.check_game_over()
+            built = {}
+            for sid in others:
+                state = serialize_game_state(game, full=False, client=sid, built=built)
+                state['game_over'] = game_over
+                state['won'] = won
+                state['game_over_message'] = message if game_over else None
+                socketio.emit('turn_frame', dict(frame, game_state=state), to=sid)
+
+
+@socketio.on('join_session')
+def handle_join_session(data):
+    """Join the session's room and push a full snapshot to resync the client."""
+    session_id = (data or {}).get('session_id', 'default')
+    misdirected = _misdirected(session_id)
+    if misdirected:
+        emit('turn_frame', dict(misdirected, success=False))
+        return
+    _join_session_room(session_id)
+
+    with game_sessions.use(session_id) as game:
+        if game is None:
+            emit('turn_frame', {'success': False, 'error': 'Session not found'})
+            return
+
+        with game.event_bus.activate():
+            game_over, won, message = game.check_game_over()
+            state = serialize_game_state(game, full=True, client=request.sid)
+    state['game_over'] = game_over
+    state['won'] = won
+    state['game_over_message'] = message if game_over else None
+
+    emit('turn_frame', {'success': True, 'message': '', 'game_state': state, 'events': []})
+
+
+@socketio.on('command')
+def handle_command(data):
+    """
+    Socket command channel.
+
+    Runs the command on the session's bus and pushes one ``turn_frame`` to each
+    socket in the session's room: captured output, that socket's state delta and
+    every bridged event the turn produced. Replaces the REST command + polling
+    round trips.
+    """
+    data = data or {}
+    session_id = data.get('session_id', 'default')
+    command = data.get('command', '').strip().upper()
+    misdirected = _misdirected(session_id)
+    if misdirected:
+        emit('turn_frame', dict(misdirected, success=False))
+        return
+    _join_session_room(session_id)
+
+    with game_sessions.use(session_id) as game:
+        if game is None:
+            emit('turn_frame', {'success': False, 'error': 'Session not found'})
+            return
+
+        with game.event_bus.activate():
+            frame = _run_command(game, session_id, command, full=_is_flag_set(data.get('full')),
+                                 client=request.sid)
+
+    bridge = event_bridges.get(session_id)
+    frame['events'] = bridge.drain() if bridge is not None else []
+    emit('turn_frame', frame)
+    _push_frame_to_room(session_id, frame, skip=request.sid)
 
 
 if __name__ == '__main__':
@@ -751,6 +1146,14 @@ if __name__ == '__main__':
     host = os.environ.get('HOST', '127.0.0.1')
     port = int(os.environ.get('PORT', 5000))
 
+    # Many games share this process: an emit outside any session scope must not
+    # reach every session's subscribers
+    process_bus.broadcast_unscoped = False
+
+    if shard.sharded:
+        print(f"\nShard {shard.index + 1}/{shard.count}")
+        ShardRelay(shard).start()
+
     print("\nStarting server...")
     print(f"Navigate to: http://{host}:{port}")
     print("\nPress CTRL+C to stop the server")
@@ -6,46 +6,168 @@ Cross-platform audio using winsound (Windows), terminal bell, or subprocess.
 
 import threading
 import queue
+import shutil
 import sys
 import os
-import subprocess
 import time
+import weakref
 from enum import Enum
 from core.event_system import event_bus, EventType, GameEvent
 
-# Determine audio backend
-AUDIO_BACKEND = None
+# A terminal bell is always available as a last resort
+AUDIO_AVAILABLE = True
 
-# Try Windows winsound first
-try:
-    import winsound
-    AUDIO_BACKEND = 'winsound'
-except ImportError:
-    pass
+_backend = None
+_backend_lock = threading.Lock()
 
-# Check for macOS afplay
-if AUDIO_BACKEND is None and sys.platform == 'darwin':
+
+def _probe_backend():
+    """Pick the best available backend: winsound, afplay, paplay/aplay, then the bell."""
     try:
-        subprocess.run(['which', 'afplay'], capture_output=True, check=True)
-        AUDIO_BACKEND = 'afplay'
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        import winsound
+        return 'winsound'
+    except ImportError:
         pass
 
-# Check for Linux paplay (PulseAudio) or aplay (ALSA)
-if AUDIO_BACKEND is None and sys.platform.startswith('linux'):
-    for cmd in ['paplay', 'aplay']:
-        try:
-            subprocess.run(['which', cmd], capture_output=True, check=True)
-            AUDIO_BACKEND = cmd
-            break
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+    # Check for macOS afplay
+    if sys.platform == 'darwin' and shutil.which('afplay'):
+        return 'afplay'
+
+    # Check for Linux paplay (PulseAudio) or aplay (ALSA)
+    if sys.platform.startswith('linux'):
+        for cmd in ('paplay', 'aplay'):
+            if shutil.which(cmd):
+                return cmd
+
+    return 'bell'
 
-# Fallback to terminal bell
-if AUDIO_BACKEND is None:
-    AUDIO_BACKEND = 'bell'
 
-AUDIO_AVAILABLE = AUDIO_BACKEND is not None
+def detect_backend():
+    """Probe for an audio backend on first use and cache the answer for the process."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _probe_backend()
+    return _backend
+
+
+def __getattr__(name):
+    # AUDIO_BACKEND used to be probed at import time; resolve it on demand instead
+    if name == 'AUDIO_BACKEND':
+        return detect_backend()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AudioMixer:
+    """
+    Single playback thread shared by every AudioManager in the process.
+
+    Managers keep their own request queue; the mixer drains them in order of
+    session priority plus sound priority, and fills idle time with the ambient
+    loop of the highest-priority session. The thread starts with the first
+    manager that plays something and exits once the last one shuts down.
+    """
+
+    IDLE_WAIT = 0.1
+
+    def __init__(self):
+        self._managers = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def register(self, manager):
+        with self._lock:
+            self._managers.add(manager)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="audio-mixer", daemon=True)
+                self._thread.start()
+
+    def unregister(self, manager):
+        with self._lock:
+            self._managers.discard(manager)
+            thread = self._thread if not self._managers else None
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def wake(self):
+        self._wake.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        # Managers are only held inside the helpers below, never across a wait,
+        # so a session that is dropped without cleanup can still be collected.
+        while True:
+            with self._lock:
+                if not any(m._running for m in self._managers):
+                    self._thread = None
+                    return
+            self._wake.clear()
+
+            if self._play_queued():
+                continue
+
+            # Play ambient if nothing is queued anywhere before the wait runs out
+            if self._wake.wait(self.IDLE_WAIT):
+                continue
+            self._play_ambient()
+
+    def _live_managers(self):
+        with self._lock:
+            return [m for m in self._managers if m._running]
+
+    def _play_queued(self) -> bool:
+        requests = []
+        for manager in self._live_managers():
+            try:
+                sound, priority = manager.queue.get_nowait()
+            except Exception:
+                continue  # queue.Empty, or a queue a caller swapped out
+            requests.append((manager.session_priority + priority, manager, sound))
+
+        requests.sort(key=lambda request: request[0], reverse=True)
+        for _, manager, sound in requests:
+            try:
+                if not manager.muted:
+                    manager._play_sound(sound)
+                manager.queue.task_done()
+            except Exception:
+                pass  # Silently fail on audio errors
+        return bool(requests)
+
+    def _play_ambient(self):
+        ambient = [m for m in self._live_managers() if m.ambient_sound and m.ambient_running and not m.muted]
+        if not ambient:
+            return
+        manager = max(ambient, key=lambda m: m.session_priority)
+        # Use volume to control density of ambient sound
+        # Lower volume = fewer loops play (creating gaps/sparser sound)
+        if manager.volume >= 1.0 or manager._ambient_rng.random() < manager.volume:
+            try:
+                manager._play_sound(manager.ambient_sound, ambient=True)
+            except Exception:
+                pass
+
+
+class _WeakEventHandler:
+    """Bus callback that does not keep its AudioManager alive (or in the mixer)."""
+
+    __slots__ = ('_manager',)
+
+    def __init__(self, manager):
+        self._manager = weakref.ref(manager)
+
+    def __call__(self, event):
+        manager = self._manager()
+        if manager is not None:
+            manager.handle_game_event(event)
+
+
+mixer = AudioMixer()
 
 
 class Sound(Enum):
@@ -183,25 +305,29 @@ class AudioManager:
         "Kennel": Sound.WIND,
     }
     
-    def __init__(self, enabled=True, rng=None, player_ref=None, station_map=None):
+    def __init__(self, enabled=True, rng=None, player_ref=None, station_map=None, session_priority=0,
+                 mixer=None):
         self.enabled = enabled and AUDIO_AVAILABLE
+        # Disabled (headless/server) sessions get the null backend: no probing, no thread
+        self._backend = None if self.enabled else 'null'
+        self.session_priority = session_priority
+        self._mixer = mixer
         self.muted = False
         self.volume = 1.0
         self.player_ref = player_ref  # Reference to player for spatial filtering
         self.station_map = station_map
         from systems.architect import RandomnessEngine
         self.rng = rng or RandomnessEngine()
+        # The worker thread fires on wall-clock timeouts; giving it its own stream
+        # keeps ambient density rolls out of the seeded game RNG.
+        self._ambient_rng = RandomnessEngine()
         
-        # Audio queue for async playback
+        # Audio queue for async playback (drained by the shared mixer)
         self.queue = queue.Queue()
         self.ambient_sound = None
         self.ambient_running = False
-        self._running = True  # Control flag for thread
-        
-        # Start audio thread
-        if self.enabled:
-            self._audio_thread = threading.Thread(target=self._audio_worker, daemon=True)
-            self._audio_thread.start()
+        self._running = True  # Control flag for the mixer
+        self._attached = False
 
         # Tier 6.4: Subscribe to events
         self._subscribe_to_events()
@@ -212,13 +338,15 @@ class AudioManager:
     def cleanup(self):
         """Unsubscribe and shutdown."""
         for event_type in self.EVENT_MAP:
-            event_bus.unsubscribe(event_type, self.handle_game_event)
+            event_bus.unsubscribe(event_type, self._event_handler)
         self.shutdown()
 
     def _subscribe_to_events(self):
         """Subscribe to all events defined in EVENT_MAP."""
+        # Weak, so a session dropped without cleanup() stops playing once collected
+        self._event_handler = _WeakEventHandler(self)
         for event_type in self.EVENT_MAP:
-            event_bus.subscribe(event_type, self.handle_game_event)
+            event_bus.subscribe(event_type, self._event_handler)
 
     def handle_game_event(self, event: GameEvent):
         """Callback for event bus to trigger audio."""
@@ -348,29 +476,29 @@ class AudioManager:
 
         self.ambient_loop(ambient_sound)
     
-    def _audio_worker(self):
-        """Background thread for processing audio queue."""
-        while self._running:
-            try:
-                sound, priority = self.queue.get(timeout=0.1)
-                if not self.muted:
-                    self._play_sound(sound)
-                self.queue.task_done()
-            except queue.Empty:
-                # Play ambient if nothing in queue
-                if self.ambient_sound and self.ambient_running and not self.muted:
-                    # Use volume to control density of ambient sound
-                    # Lower volume = fewer loops play (creating gaps/sparser sound)
-                    if self.volume >= 1.0 or self.rng.random() < self.volume:
-                        self._play_sound(self.ambient_sound, ambient=True)
+    @property
+    def backend(self):
+        """Backend name, probed lazily the first time a sound is actually played."""
+        if self._backend is None:
+            self._backend = detect_backend()
+        return self._backend
+
+    @property
+    def mixer(self):
+        """The mixer playing this manager's sounds (the process-wide one unless injected)."""
+        return self._mixer if self._mixer is not None else mixer
+
+    def _attach(self):
+        """Hand this manager to the shared mixer (starting its thread on first use)."""
+        mixer = self.mixer
+        if not self._attached and self._running:
+            self._attached = True
+            mixer.register(self)
+        mixer.wake()
     
     def _play_sound(self, sound, ambient=False):
         """Play sound using the available backend."""
-        if not self.enabled or not AUDIO_AVAILABLE:
-            return
-        
-        # Check volume threshold - effectively mute if volume is zero
-        if self.volume <= 0.0:
+        if not self.enabled or self.backend == 'null':
             return
 
         # Volume check (0.0 volume is effectively muted)
@@ -383,17 +511,18 @@ class AudioManager:
         if ambient:
             duration = int(duration * 0.3)  # Shorter for ambient loop
             # Simulate volume control for ambient sounds by adjusting density
-            if self.rng.random() > self.volume:
+            if self._ambient_rng.random() > self.volume:
                 time.sleep(duration / 1000.0)
                 return
 
+        backend = self.backend
         try:
-            if AUDIO_BACKEND == 'winsound':
+            if backend == 'winsound':
                 self._play_winsound(freq_range, duration)
-            elif AUDIO_BACKEND == 'bell':
+            elif backend == 'bell':
                 self._play_bell(sound)
             # Note: afplay/aplay require audio files, so fall back to bell
-            elif AUDIO_BACKEND in ('afplay', 'aplay', 'paplay'):
+            elif backend in ('afplay', 'aplay', 'paplay'):
                 self._play_bell(sound)
         except Exception:
             pass  # Silently fail on audio errors
@@ -434,6 +563,7 @@ class AudioManager:
             return
         
         self.queue.put((sound, priority))
+        self._attach()
     
     def play_sync(self, sound):
         """Play a sound synchronously (blocks)."""
@@ -450,6 +580,8 @@ class AudioManager:
         """
         self.ambient_sound = sound
         self.ambient_running = True
+        if self.enabled:
+            self._attach()
     
     def stop_ambient(self):
         """Stop the ambient sound loop."""
@@ -488,10 +620,11 @@ class AudioManager:
         return self.volume
     
     def shutdown(self):
-        """Stop the audio thread."""
+        """Detach from the shared mixer (its thread exits with the last manager)."""
         self._running = False
-        if self.enabled and self._audio_thread.is_alive():
-            self._audio_thread.join(timeout=1.0)
+        if self._attached:
+            self._attached = False
+            self.mixer.unregister(self)
 
     def trigger_event(self, event_type):
         """
@@ -0,0 +1,44 @@
+"""
+Config Cache
+Process-level cache of parsed JSON configuration files.
+
+Every GameState reads the same character roster, design briefs and recipe
+files; parsing them once per process keeps new games cheap for the test
+suite, the web server and headless simulations. Entries are keyed by absolute
+path and revalidated against the file's mtime, so edited files are picked up.
+
+Returned data is shared between callers and must be treated as read-only;
+copy anything that will be mutated (e.g. per-character schedules).
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+_cache: Dict[str, Tuple[int, Any]] = {}
+_lock = threading.Lock()
+
+
+def load_json(path) -> Any:
+    """Parsed contents of a JSON file, reusing the cached parse while the file is unchanged.
+
+    Raises OSError / ValueError like open() + json.load() would.
+    """
+    key = os.path.abspath(os.fspath(path))
+    mtime = os.stat(key).st_mtime_ns
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(key, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    with _lock:
+        _cache[key] = (mtime, data)
+    return data
+
+
+def clear():
+    """Drop all cached parses (tests that rewrite config files in place)."""
+    with _lock:
+        _cache.clear()
@@ -1,7 +1,10 @@
-import json
 from pathlib import Path
 from typing import Dict, Any
 
+from core.config_cache import load_json
+
+DEFAULT_BRIEFS_PATH = Path(__file__).resolve().parents[2] / "config" / "design_briefs.json"
+
 
 class DesignBriefRegistry:
     """
@@ -11,15 +14,14 @@ class DesignBriefRegistry:
     """
 
     def __init__(self, path: Path | None = None):
-        base_path = Path(__file__).resolve().parents[2]
-        self.path = path or base_path / "config" / "design_briefs.json"
+        self.path = path or DEFAULT_BRIEFS_PATH
         self.briefs: Dict[str, Dict[str, Any]] = self._load()
 
     def _load(self) -> Dict[str, Dict[str, Any]]:
+        # Parsed once per process and shared between registries (read-only)
         if not self.path.exists():
             return {}
-        with self.path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = load_json(self.path)
         return data if isinstance(data, dict) else {}
 
     def get_brief(self, key: str) -> Dict[str, Any]:
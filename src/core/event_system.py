@@ -1,7 +1,10 @@
-from enum import Enum, auto
-from dataclasses import dataclass, field
-from typing import Dict, List, Callable, Any
+from enum import Enum, IntEnum, auto
+from typing import Dict, List, Callable, Any, Optional, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
 import time
+import weakref
 
 class EventType(Enum):
     # Core Game Events
@@ -82,51 +85,338 @@ class EventType(Enum):
     MUTINY_IMPRISONMENT = auto()      # Player locked in Generator Room
     ESCAPE_ATTEMPT = auto()           # Player tries to escape imprisonment
 
-@dataclass
+class EventPriority(IntEnum):
+    """
+    Explicit TURN_ADVANCE ordering. Higher values dispatch first; subscribers with
+    equal priority keep subscription order.
+    """
+    CLOCK = 100         # Time/temperature tick before anything reads the hour
+    ENVIRONMENT = 50    # Weather, sabotage, power and room states
+    DEFAULT = 0
+    OUTCOME = -50       # Endgame checks see the settled turn
+    PERSISTENCE = -100  # Autosave captures the fully-resolved turn
+
+
 class GameEvent:
-    type: EventType
-    payload: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
+    """
+    A single bus message. Slotted to keep per-event allocation small; the
+    timestamp is only resolved when something reads it.
+    """
+    __slots__ = ("type", "payload", "_timestamp")
+
+    def __init__(self, type: EventType, payload: Optional[Dict[str, Any]] = None, timestamp: Optional[float] = None):
+        self.type = type
+        self.payload = payload if payload is not None else {}
+        self._timestamp = timestamp
+
+    @property
+    def timestamp(self) -> float:
+        if self._timestamp is None:
+            self._timestamp = time.time()
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: float):
+        self._timestamp = value
+
+    def __repr__(self):
+        return f"GameEvent(type={self.type}, payload={self.payload!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, GameEvent):
+            return NotImplemented
+        return self.type == other.type and self.payload == other.payload
+
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Tuple[Callable[[GameEvent], None], ...] = ()
+
 
 class EventBus:
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(EventBus, cls).__new__(cls)
-            cls._instance._subscribers = {}
-        return cls._instance
-
-    def __init__(self):
-        # Initialized in __new__ to ensure singleton safety if re-instantiated, 
-        # but standard singleton pattern usually relies on module imports. 
-        # We will keep it simple.
-        if not hasattr(self, '_subscribers'):
-            self._subscribers: Dict[EventType, List[Callable[[GameEvent], None]]] = {}
-
-    def subscribe(self, event_type: EventType, callback: Callable[[GameEvent], None]):
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+    """
+    Publish/subscribe hub for GameEvents.
+
+    The process owns one root bus (``process_bus``) for module-level listeners that
+    read everything they need from the payload. Each GameState owns a session bus
+    parented to it, so a session's emits reach its own subscribers plus the root
+    listeners, never another session's subsystems.
+
+    Subscriptions are compiled into a per-type tuple of callbacks (priority order)
+    that is only rebuilt when subscriptions change, so a session ``emit`` never sorts
+    or copies subscriber lists, and event types nobody listens to return immediately.
+
+    An emit on the root bus outside any session scope is broadcast to every
+    attached session's subscribers (legacy single-game behaviour). With several
+    sessions attached that leaks into other games, so such emits are logged, and
+    hosts running many games (the web server) clear ``broadcast_unscoped`` to only
+    broadcast while a single session exists.
+
+    Subscribers that filter events themselves (e.g. by verbosity) can register a
+    ``gate``; ``is_listening`` consults those gates so emitters can skip building
+    payloads that every subscriber would discard.
+    """
+
+    def __init__(self, parent: Optional["EventBus"] = None):
+        # event type -> [(-priority, sequence, callback)], kept sorted
+        self._entries: Dict[EventType, List[Tuple[int, int, Callable[[GameEvent], None]]]] = {}
+        self._sequence = 0
+        self._revision = 0
+        self._table: Dict[EventType, Tuple[Callable[[GameEvent], None], ...]] = {}
+        self._table_key = None
+        self._own_table: Dict[EventType, Tuple[Callable[[GameEvent], None], ...]] = {}
+        self._own_key = None
+        # (event type, callback) -> zero-arg predicate; absent means always listening
+        self._gates: Dict[Tuple[EventType, Callable[[GameEvent], None]], Callable[[], bool]] = {}
+        self._parent = parent
+        self._sessions: "weakref.WeakSet[EventBus]" = weakref.WeakSet()
+        if parent is not None:
+            parent._sessions.add(self)
+        # Root only: broadcast unscoped emits even with several sessions attached
+        self.broadcast_unscoped = True
+        self._unscoped_logged: set = set()
+
+    @property
+    def _subscribers(self) -> Dict[EventType, List[Callable[[GameEvent], None]]]:
+        """Own subscribers per event type, in dispatch order (legacy view; ``clear()`` clears the bus)."""
+        return _SubscriberView(self, {
+            event_type: [entry[2] for entry in entries] for event_type, entries in self._entries.items()
+        })
+
+    @_subscribers.setter
+    def _subscribers(self, value: Dict[EventType, List[Callable[[GameEvent], None]]]):
+        # Bulk restore (tests snapshot/restore this): order is kept, priorities reset.
+        self._entries = {}
+        for event_type, callbacks in (value or {}).items():
+            for callback in callbacks:
+                self.subscribe(event_type, callback)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._revision += 1
+
+    def subscribe(self, event_type: EventType, callback: Callable[[GameEvent], None],
+                  priority: int = EventPriority.DEFAULT, gate: Optional[Callable[[], bool]] = None):
+        self._sequence += 1
+        entries = self._entries.setdefault(event_type, [])
+        entries.append((-int(priority), self._sequence, callback))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        if gate is not None:
+            self._gates[(event_type, callback)] = gate
+        self._invalidate()
 
     def unsubscribe(self, event_type: EventType, callback: Callable[[GameEvent], None]):
-        if event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+        entries = self._entries.get(event_type)
+        if entries:
+            for index, entry in enumerate(entries):
+                if entry[2] == callback:
+                    del entries[index]
+                    if not entries:
+                        del self._entries[event_type]
+                    self._gates.pop((event_type, callback), None)
+                    self._invalidate()
+                    return
+        # Systems built outside a session scope registered on the root bus
+        if self._parent is not None:
+            self._parent.unsubscribe(event_type, callback)
+
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """True if an emit of this type on this bus would reach any callback."""
+        if event_type in self._dispatch_table():
+            return True
+        return any(event_type in session._entries for session in self._broadcast_sessions())
+
+    def is_listening(self, event_type: EventType) -> bool:
+        """
+        True if an emit of this type would reach a subscriber that acts on it.
+
+        Like ``has_subscribers``, but callbacks registered with a ``gate`` only count
+        while their gate is open, so a reporter filtering SYSTEM_LOG at the current
+        verbosity does not force every emitter to format its text.
+        """
+        for callback in self._dispatch_table().get(event_type, _EMPTY):
+            if self._gate_open(event_type, callback):
+                return True
+        for session in self._broadcast_sessions():
+            for callback in session._own_callbacks(event_type):
+                if session._gate_open(event_type, callback):
+                    return True
+        return False
+
+    def _gate_open(self, event_type: EventType, callback: Callable[[GameEvent], None]) -> bool:
+        key = (event_type, callback)
+        gate = self._gates.get(key)
+        if gate is None and self._parent is not None:
+            gate = self._parent._gates.get(key)
+        return gate is None or bool(gate())
+
+    def emit_text(self, event_type: EventType, template: str, *args, **fields) -> bool:
+        """
+        Emit a ``{"text": ...}`` event, formatting ``template`` only if someone listens.
+
+        Hot paths (per-NPC AI logs, schedule checks) call this instead of building an
+        f-string up front. Returns True if the event was emitted.
+        """
+        if not self.is_listening(event_type):
+            return False
+        payload = {"text": template.format(*args)}
+        payload.update(fields)
+        self.emit(GameEvent(event_type, payload))
+        return True
+
+    def _dispatch_table(self) -> Dict[EventType, Tuple[Callable[[GameEvent], None], ...]]:
+        """Return the compiled per-type callback tuples, rebuilding only after changes."""
+        parent = self._parent
+        key = (self._revision, parent._revision) if parent is not None else self._revision
+        if key == self._table_key:
+            return self._table
+
+        merged: Dict[EventType, List[Tuple[int, int, int, Callable[[GameEvent], None]]]] = {}
+        if parent is not None:
+            # Root listeners win ties against session subscribers (legacy import order)
+            for event_type, entries in parent._entries.items():
+                merged.setdefault(event_type, []).extend((p, 0, seq, cb) for p, seq, cb in entries)
+        for event_type, entries in self._entries.items():
+            merged.setdefault(event_type, []).extend((p, 1, seq, cb) for p, seq, cb in entries)
+
+        self._table = {
+            event_type: tuple(entry[3] for entry in sorted(entries, key=lambda e: e[:3]))
+            for event_type, entries in merged.items()
+        }
+        self._table_key = key
+        return self._table
 
     def emit(self, event: GameEvent):
         """
         Pushes an event to all subscribers.
+
+        Session buses dispatch root listeners and their own subscribers in priority
+        order. The root bus keeps the legacy broadcast for emits made outside any
+        session scope, so single-game callers (CLI, tests) behave exactly as before.
         """
-        if event.type in self._subscribers:
-            for callback in self._subscribers[event.type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"ERROR processing event {event.type}: {e}")
+        callbacks = self._dispatch_table().get(event.type, _EMPTY)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"ERROR processing event {event.type}: {e}")
+
+        if self._parent is None and self._sessions:
+            sessions = self._broadcast_sessions()
+            if len(self._sessions) > 1 and event.type not in self._unscoped_logged:
+                self._unscoped_logged.add(event.type)
+                logger.warning("Unscoped %s emitted on the root bus with %d sessions attached (%s)",
+                               event.type, len(self._sessions),
+                               "broadcast to all" if sessions else "not broadcast")
+            for session in sessions:
+                for callback in session._own_callbacks(event.type):
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        print(f"ERROR processing event {event.type}: {e}")
+
+    def _broadcast_sessions(self) -> List["EventBus"]:
+        """Sessions a root emit outside any session scope reaches (see class docs)."""
+        if self._parent is not None:
+            return []
+        sessions = list(self._sessions)
+        if len(sessions) > 1 and not self.broadcast_unscoped:
+            return []
+        return sessions
+
+    def _own_callbacks(self, event_type: EventType) -> Tuple[Callable[[GameEvent], None], ...]:
+        """Own subscribers only, for root broadcasts (the root part already ran)."""
+        if self._own_key != self._revision:
+            self._own_table = {
+                etype: tuple(entry[2] for entry in entries) for etype, entries in self._entries.items()
+            }
+            self._own_key = self._revision
+        return self._own_table.get(event_type, _EMPTY)
 
     def clear(self):
-        self._subscribers = {}
+        self._entries = {}
+        self._gates = {}
+        self._invalidate()
+        if self._parent is None:
+            # Legacy semantics: clearing the global bus wipes every listener.
+            for session in list(self._sessions):
+                session.clear()
+            self._sessions = weakref.WeakSet()
+
+    def detach(self):
+        """Drop all subscriptions and stop receiving root broadcasts (session teardown)."""
+        self._entries = {}
+        self._gates = {}
+        self._invalidate()
+        if self._parent is not None:
+            self._parent._sessions.discard(self)
+
+    @contextmanager
+    def activate(self):
+        """Route module-level ``event_bus`` calls to this bus for the current thread/context."""
+        token = _active_bus.set(self)
+        try:
+            yield self
+        finally:
+            _active_bus.reset(token)
+
+
+class _SubscriberView(dict):
+    """Snapshot dict behind ``EventBus._subscribers`` whose ``clear()`` reaches the bus."""
+
+    def __init__(self, bus: EventBus, subscribers):
+        super().__init__(subscribers)
+        self._bus = bus
+
+    def clear(self):
+        super().clear()
+        self._bus.clear()
+
+
+class _ActiveBusProxy:
+    """
+    Compatibility shim behind the module-level ``event_bus``.
+
+    Systems keep calling ``event_bus.subscribe/emit``; the proxy forwards to the bus
+    activated for the current context (a GameState's session bus) or the root bus.
+    """
+
+    def __getattr__(self, name):
+        return getattr(get_active_bus(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_active_bus(), name, value)
+
+
+process_bus = EventBus()
+_active_bus: ContextVar[Optional[EventBus]] = ContextVar("active_event_bus", default=None)
+
+
+def get_active_bus() -> EventBus:
+    """Return the session bus activated for this context, falling back to the root bus."""
+    return _active_bus.get() or process_bus
+
+
+def new_session_bus() -> EventBus:
+    """Create a bus scoped to a single game session, under the current root bus."""
+    root = get_active_bus()
+    while root._parent is not None:
+        root = root._parent
+    return EventBus(parent=root)
+
+
+@contextmanager
+def isolated_bus():
+    """
+    Route ``event_bus`` to a fresh, empty root bus for the duration of the block.
+
+    Tests use this instead of wiping ``process_bus``: nothing subscribed earlier
+    (including other live sessions) sees the block's emits, and sessions created
+    inside it hang off the fresh root.
+    """
+    with EventBus().activate() as bus:
+        yield bus
+
 
 # Global global accessor
-event_bus = EventBus()
+event_bus = _ActiveBusProxy()
@@ -89,6 +89,23 @@ class ResolutionSystem:
 
         raise ValueError("RandomnessEngine (rng) must be provided for roll_check to ensure determinism.")
 
+    @staticmethod
+    def roll_checks(pool_sizes, rng):
+        """
+        Executes several dice pool checks at once; returns success counts in order.
+
+        Pools are clamped to a minimum of 1 like roll_check. Engines without a
+        batch API fall back to one calculate_success call per pool.
+        """
+        pool_sizes = [max(1, pool_size) for pool_size in pool_sizes]
+
+        if rng and callable(getattr(type(rng), "calculate_success_batch", None)):
+            return rng.calculate_success_batch(pool_sizes)
+        if rng and hasattr(rng, "calculate_success"):
+            return [rng.calculate_success(pool_size)["success_count"] for pool_size in pool_sizes]
+
+        raise ValueError("RandomnessEngine (rng) must be provided for roll_checks to ensure determinism.")
+
     @staticmethod
     def resolve_pool(base_pool, skills_attributes, modifiers):
         """
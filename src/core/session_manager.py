@@ -0,0 +1,330 @@
+"""
+Session Manager
+Bounded store for live game sessions on a long-running server.
+
+Keeps at most ``max_active`` GameStates resident, least-recently-used first
+out. Sessions that fall out of the resident set, or sit idle longer than
+``idle_seconds``, are hibernated: serialized through ``to_dict`` into a
+compressed snapshot on disk, with every subsystem ``cleanup()`` hook run.
+They are rehydrated lazily the next time the session is requested.
+``max_sessions`` caps resident plus hibernated sessions; beyond it the oldest
+snapshots are discarded.
+
+Request handlers hold a session through ``use()`` while they run a command:
+pinned sessions are skipped by LRU and idle eviction, and a pinned game that
+is replaced or discarded is only cleaned up once its last user lets go.
+
+Eviction only takes the ``to_dict`` snapshot under the lock; compressing and
+writing it happens after the lock is released, so one session's hibernation
+does not stall requests for every other session.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from systems.persistence import write_atomic
+
+
+class SessionManager:
+    """LRU-bounded session store with idle hibernation to disk."""
+
+    def __init__(self,
+                 loader: Callable[[Dict[str, Any]], Any],
+                 max_active: int = 32,
+                 max_sessions: int = 1024,
+                 idle_seconds: float = 600.0,
+                 hibernate_dir: str = "data/sessions",
+                 on_activate: Optional[Callable[[str, Any], None]] = None,
+                 on_release: Optional[Callable[[str, Any], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            loader: Rebuilds a game from its ``to_dict`` snapshot (GameState.from_dict).
+            max_active: Resident GameStates kept in memory.
+            max_sessions: Resident + hibernated sessions kept at all.
+            idle_seconds: Hibernate sessions untouched for this long (0 disables).
+            hibernate_dir: Where snapshots are written.
+            on_activate: Called with (session_id, game) when a game becomes resident.
+            on_release: Called with (session_id, game) before a game is cleaned up.
+            clock: Time source, injectable for tests.
+        """
+        self.loader = loader
+        self.max_active = max(1, max_active)
+        self.max_sessions = max(self.max_active, max_sessions)
+        self.idle_seconds = idle_seconds
+        self.hibernate_dir = hibernate_dir
+        self.on_activate = on_activate
+        self.on_release = on_release
+        self.clock = clock
+
+        self._active: "OrderedDict[str, Any]" = OrderedDict()  # session_id -> game, LRU first
+        self._last_used: Dict[str, float] = {}
+        self._hibernated: "OrderedDict[str, str]" = OrderedDict()  # session_id -> snapshot path
+        self._pins: Dict[str, int] = {}  # session_id -> handlers currently using it
+        self._orphans: Dict[str, List[Any]] = {}  # session_id -> dropped games still pinned
+        self._hibernating: Dict[str, Any] = {}  # session_id -> game whose snapshot is being written
+        self._writes: "deque[Tuple[str, Any, Optional[Dict[str, Any]]]]" = deque()
+        self._lock = threading.RLock()
+        self._written = threading.Condition(self._lock)
+
+        self.stats = {"hibernated": 0, "rehydrated": 0, "evicted": 0}
+
+    # --- Mapping-style access ---
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return (session_id in self._active or session_id in self._hibernated
+                    or session_id in self._hibernating)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._active) + len(self._hibernated) + len(self._hibernating)
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def is_resident(self, session_id: str) -> bool:
+        return session_id in self._active
+
+    def is_pinned(self, session_id: str) -> bool:
+        return self._pins.get(session_id, 0) > 0
+
+    @contextmanager
+    def use(self, session_id: str) -> Iterator[Any]:
+        """
+        ``get()`` a session and pin it for the duration of the block.
+
+        Yields the game, or None if the session is unknown. While pinned the game
+        is never hibernated or cleaned up by another request's eviction.
+        """
+        with self._lock:
+            self._pins[session_id] = self._pins.get(session_id, 0) + 1
+            try:
+                game = self._get(session_id)
+            except BaseException:
+                self._unpin(session_id)
+                raise
+        try:
+            self._write_queued()
+            yield game
+        finally:
+            with self._lock:
+                self._unpin(session_id)
+            self._write_queued()
+
+    def _unpin(self, session_id: str):
+        count = self._pins.get(session_id, 0) - 1
+        if count > 0:
+            self._pins[session_id] = count
+            return
+        self._pins.pop(session_id, None)
+        for game in self._orphans.pop(session_id, []):
+            self._release(session_id, game)
+        # Catch up on eviction that was skipped while this session was in use
+        self._evict_overflow()
+
+    def get(self, session_id: str):
+        """Return the session's game, rehydrating it if hibernated; None if unknown."""
+        with self._lock:
+            game = self._get(session_id)
+        self._write_queued()
+        return game
+
+    def _get(self, session_id: str):
+        self._await_hibernation(session_id)
+        game = self._active.get(session_id)
+        if game is None:
+            path = self._hibernated.get(session_id)
+            if path is None:
+                return None
+            game = self._rehydrate(session_id, path)
+            if game is None:
+                return None
+            # The snapshot is only dropped once it has produced a game
+            del self._hibernated[session_id]
+            self._remove_snapshot(path)
+            self._admit(session_id, game)
+        else:
+            self._active.move_to_end(session_id)
+        self._last_used[session_id] = self.clock()
+        self._reap_idle()
+        return game
+
+    def put(self, session_id: str, game):
+        """Register a new game, replacing (and cleaning up) any previous one."""
+        with self._lock:
+            self.discard(session_id)
+            self._last_used[session_id] = self.clock()
+            self._admit(session_id, game)
+            self._reap_idle()
+        self._write_queued()
+
+    def discard(self, session_id: str):
+        """Forget a session entirely, cleaning up its game and snapshot."""
+        with self._lock:
+            self._await_hibernation(session_id)
+            game = self._active.pop(session_id, None)
+            if game is not None:
+                if self.is_pinned(session_id):
+                    self._orphans.setdefault(session_id, []).append(game)
+                else:
+                    self._release(session_id, game)
+            self._last_used.pop(session_id, None)
+            path = self._hibernated.pop(session_id, None)
+            if path is not None:
+                self._remove_snapshot(path)
+
+    def close(self):
+        """Hibernate every resident session (server shutdown)."""
+        with self._lock:
+            for session_id in list(self._active):
+                self._queue_hibernation(session_id)
+        self._write_queued()
+
+    # --- Hibernation ---
+
+    def hibernate(self, session_id: str) -> bool:
+        """Snapshot a resident session to disk and release it from memory (not while pinned)."""
+        with self._lock:
+            job = self._begin_hibernation(session_id)
+        return job is not None and self._finish_hibernation(*job)
+
+    def reap_idle(self):
+        """Hibernate resident sessions idle longer than ``idle_seconds`` (pinned ones are skipped)."""
+        with self._lock:
+            self._reap_idle()
+        self._write_queued()
+
+    def _reap_idle(self):
+        if not self.idle_seconds:
+            return
+        cutoff = self.clock() - self.idle_seconds
+        # LRU order: stop at the first session that is still warm
+        for session_id in list(self._active):
+            if self._last_used.get(session_id, 0) > cutoff:
+                break
+            self._queue_hibernation(session_id)
+
+    def _begin_hibernation(self, session_id: str):
+        """Take a resident session's snapshot and mark it hibernating (caller holds the lock)."""
+        if self.is_pinned(session_id):
+            return None
+        game = self._active.pop(session_id, None)
+        if game is None:
+            return None
+        self._last_used.pop(session_id, None)
+        self._hibernating[session_id] = game
+        try:
+            data = game.to_dict()
+        except (TypeError, ValueError) as e:
+            print(f"[SessionManager] Could not hibernate {session_id}: {e}")
+            data = None
+        return session_id, game, data
+
+    def _finish_hibernation(self, session_id: str, game, data: Optional[Dict[str, Any]]) -> bool:
+        """Write a snapshot taken by ``_begin_hibernation`` and release the game (lock not held)."""
+        path = None
+        try:
+            if data is not None:
+                path = self._write_snapshot(session_id, data)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[SessionManager] Could not hibernate {session_id}: {e}")
+        finally:
+            with self._lock:
+                del self._hibernating[session_id]
+                if path is not None:
+                    self._hibernated[session_id] = path
+                self._written.notify_all()
+                self._release(session_id, game)
+                if path is None:
+                    self.stats["evicted"] += 1
+                else:
+                    self.stats["hibernated"] += 1
+                    self._enforce_session_cap()
+        return path is not None
+
+    def _queue_hibernation(self, session_id: str):
+        job = self._begin_hibernation(session_id)
+        if job is not None:
+            self._writes.append(job)
+
+    def _write_queued(self):
+        """Write snapshots queued by eviction; called once the lock is released."""
+        while True:
+            with self._lock:
+                if not self._writes:
+                    return
+                job = self._writes.popleft()
+            self._finish_hibernation(*job)
+
+    def _await_hibernation(self, session_id: str):
+        # A session mid-hibernation is neither resident nor on disk yet
+        self._written.wait_for(lambda: session_id not in self._hibernating)
+
+    def _admit(self, session_id: str, game):
+        self._active[session_id] = game
+        self._active.move_to_end(session_id)
+        if self.on_activate:
+            self.on_activate(session_id, game)
+        self._evict_overflow(keep=session_id)
+
+    def _evict_overflow(self, keep: Optional[str] = None):
+        # Least recently used first; pinned sessions may hold the set over the cap briefly
+        while len(self._active) > self.max_active:
+            oldest = next((sid for sid in self._active
+                           if sid != keep and not self.is_pinned(sid)), None)
+            if oldest is None:
+                break
+            self._queue_hibernation(oldest)
+        self._enforce_session_cap()
+
+    def _release(self, session_id: str, game):
+        if self.on_release:
+            self.on_release(session_id, game)
+        game.cleanup()
+
+    def _enforce_session_cap(self):
+        while len(self) > self.max_sessions and self._hibernated:
+            _, path = self._hibernated.popitem(last=False)
+            self._remove_snapshot(path)
+            self.stats["evicted"] += 1
+
+    def _rehydrate(self, session_id: str, path: str):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            game = self.loader(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[SessionManager] Could not rehydrate {session_id}: {e}")
+            return None
+        self.stats["rehydrated"] += 1
+        return game
+
+    # --- Snapshot files ---
+
+    def _snapshot_path(self, session_id: str) -> str:
+        # Session ids come from clients; never use them as file names directly
+        digest = hashlib.sha256(session_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.hibernate_dir, f"{digest}.json.gz")
+
+    def _write_snapshot(self, session_id: str, data: Dict[str, Any]) -> str:
+        os.makedirs(self.hibernate_dir, exist_ok=True)
+        path = self._snapshot_path(session_id)
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        write_atomic(path, gzip.compress(payload, compresslevel=5))
+        return path
+
+    @staticmethod
+    def _remove_snapshot(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,197 @@
+"""
+Session Sharding
+Splits sessions across N server processes so turns run on separate cores.
+
+Every session is owned by exactly one shard, picked by a stable hash of its
+session_id; any shard can answer "who owns this session?" so clients can be
+routed sticky without a shared table. Process-level events that matter to
+every shard are relayed over a local socket hub run by the launcher: a role
+unlocked on one shard (META_UNLOCK) is recorded by every shard's
+meta-progression. The counters behind it need no relay; the profile store
+merges each shard's changes into the shared file when it flushes.
+"""
+
+import os
+import threading
+import zlib
+from dataclasses import dataclass
+from multiprocessing.connection import Client, Listener
+from typing import Dict, List, Optional, Tuple
+
+from core.event_system import process_bus, EventBus, EventType, GameEvent
+
+# Process-level events forwarded to the other shards
+RELAYED_EVENTS = (EventType.META_UNLOCK,)
+
+# Payload key marking an event that arrived from another shard
+RELAY_ORIGIN_KEY = "relayed_from"
+
+
+def shard_for(session_id: str, shard_count: int) -> int:
+    """Stable shard index for a session (same answer in every process)."""
+    if shard_count <= 1:
+        return 0
+    return zlib.crc32(session_id.encode("utf-8")) % shard_count
+
+
+@dataclass
+class ShardConfig:
+    index: int = 0
+    count: int = 1
+    host: str = "127.0.0.1"
+    base_port: int = 5000
+    relay_address: Optional[Tuple[str, int]] = None
+    relay_key: bytes = b""
+
+    @classmethod
+    def from_env(cls, environ=None) -> "ShardConfig":
+        """Read the SHARD_* variables set by start_web_server.py."""
+        env = os.environ if environ is None else environ
+        relay = env.get("SHARD_RELAY_ADDRESS")
+        relay_address = None
+        if relay:
+            relay_host, relay_port = relay.rsplit(":", 1)
+            relay_address = (relay_host, int(relay_port))
+        return cls(
+            index=int(env.get("SHARD_INDEX", 0)),
+            count=max(1, int(env.get("SHARD_COUNT", 1))),
+            host=env.get("HOST", "127.0.0.1"),
+            base_port=int(env.get("SHARD_BASE_PORT", env.get("PORT", 5000))),
+            relay_address=relay_address,
+            relay_key=bytes.fromhex(env.get("SHARD_RELAY_KEY", "")),
+        )
+
+    @property
+    def sharded(self) -> bool:
+        return self.count > 1
+
+    def owner(self, session_id: str) -> int:
+        return shard_for(session_id, self.count)
+
+    def owns(self, session_id: str) -> bool:
+        return self.owner(session_id) == self.index
+
+    def port_for(self, index: int) -> int:
+        return self.base_port + index
+
+
+def _relay_payload(payload: Dict) -> Dict:
+    """Keep only plain data; engine objects can't cross the process boundary."""
+    return {key: value for key, value in (payload or {}).items()
+            if isinstance(value, (str, int, float, bool, list, tuple, dict, type(None)))}
+
+
+class RelayHub:
+    """
+    Fan-out hub run by the launcher: every message from one shard is
+    forwarded to all the others.
+    """
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), authkey: bytes = b""):
+        self._listener = Listener(address, authkey=authkey or None)
+        self.address = self._listener.address
+        self._connections: List = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> "RelayHub":
+        threading.Thread(target=self._accept_loop, name="shard-relay-hub", daemon=True).start()
+        return self
+
+    def close(self):
+        self._closed = True
+        self._listener.close()
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                if self._closed:
+                    return
+                continue
+            with self._lock:
+                self._connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        while True:
+            try:
+                message = conn.recv()
+            except (OSError, EOFError):
+                break
+            with self._lock:
+                peers = [peer for peer in self._connections if peer is not conn]
+            for peer in peers:
+                try:
+                    peer.send(message)
+                except OSError:
+                    pass
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+
+
+class ShardRelay:
+    """
+    Per-process relay client.
+
+    Publishes RELAYED_EVENTS seen on this process's bus to the hub. Events
+    received from other shards are emitted on the relay's own scoped bus (a
+    child of the process bus, tagged with ``relayed_from`` so they are not
+    echoed back): process-level listeners such as meta-progression see them,
+    live game sessions do not.
+    """
+
+    def __init__(self, config: ShardConfig, event_types=RELAYED_EVENTS, bus=process_bus):
+        self.config = config
+        self.event_types = tuple(event_types)
+        self.bus = bus
+        self.inbox = EventBus(parent=bus)
+        self._conn = None
+        self._send_lock = threading.Lock()
+
+    def start(self) -> "ShardRelay":
+        if self.config.relay_address is None:
+            return self
+        self._conn = Client(self.config.relay_address, authkey=self.config.relay_key or None)
+        for event_type in self.event_types:
+            self.bus.subscribe(event_type, self._on_local_event)
+        threading.Thread(target=self._receive_loop, name="shard-relay", daemon=True).start()
+        return self
+
+    def cleanup(self):
+        for event_type in self.event_types:
+            self.bus.unsubscribe(event_type, self._on_local_event)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.inbox.detach()
+
+    def _on_local_event(self, event: GameEvent):
+        payload = event.payload or {}
+        if RELAY_ORIGIN_KEY in payload or self._conn is None:
+            return
+        with self._send_lock:
+            try:
+                outgoing = _relay_payload(payload)
+                outgoing[RELAY_ORIGIN_KEY] = self.config.index
+                self._conn.send((event.type.name, outgoing))
+            except OSError as e:
+                print(f"[ShardRelay] Dropped {event.type.name}: {e}")
+
+    def _receive_loop(self):
+        while self._conn is not None:
+            try:
+                type_name, payload = self._conn.recv()
+            except (OSError, EOFError):
+                return
+            event_type = EventType.__members__.get(type_name)
+            if event_type is None:
+                continue
+            # Scoped emit: process listeners only, never another session's subsystems
+            self.inbox.emit(GameEvent(event_type, payload))
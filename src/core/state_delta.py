@@ -0,0 +1,195 @@
+"""Versioned, dirty-tracked state snapshots for incremental client updates.
+
+Subsystems mark the sections of the client-facing state they changed (either
+directly through ``StateDeltaTracker.mark`` or implicitly through the events
+they already emit). A serializer then rebuilds only dirty sections and ships
+only the entries that differ from what that client last received. Every
+client (socket connection or REST token) of a session keeps its own baseline.
+"""
+
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
+
+
+class StateSection(Enum):
+    CREW = "crew"            # Per-member status entries (keyed by name)
+    INVENTORY = "inventory"  # Player inventory
+    ROOM = "room"            # Player room: items, icons, description, quick actions
+    MAP = "map"              # Rendered map rows
+    LIGHTING = "lighting"    # Per-room lighting/visibility (keyed by room)
+    WARNINGS = "warnings"    # Ambient location hints
+
+
+ALL_SECTIONS = frozenset(StateSection)
+
+# Which sections an emitted event can invalidate
+DIRTYING_EVENTS: Dict[EventType, frozenset] = {
+    EventType.TURN_ADVANCE: ALL_SECTIONS,
+    EventType.MOVEMENT: frozenset({StateSection.CREW, StateSection.MAP, StateSection.ROOM,
+                                   StateSection.LIGHTING, StateSection.WARNINGS}),
+    EventType.ITEM_PICKUP: frozenset({StateSection.INVENTORY, StateSection.ROOM, StateSection.MAP}),
+    EventType.ITEM_DROP: frozenset({StateSection.INVENTORY, StateSection.ROOM, StateSection.MAP}),
+    EventType.CRAFTING_REPORT: frozenset({StateSection.INVENTORY}),
+    EventType.CREW_DEATH: frozenset({StateSection.CREW, StateSection.MAP, StateSection.ROOM}),
+    EventType.ATTACK_RESULT: frozenset({StateSection.CREW, StateSection.MAP}),
+    EventType.TEST_RESULT: frozenset({StateSection.CREW}),
+    EventType.TRUST_THRESHOLD_CROSSED: frozenset({StateSection.CREW}),
+    EventType.BARRICADE_ACTION: frozenset({StateSection.ROOM, StateSection.LIGHTING, StateSection.MAP}),
+    EventType.POWER_FAILURE: frozenset({StateSection.LIGHTING, StateSection.ROOM}),
+    EventType.ENVIRONMENTAL_STATE_CHANGE: frozenset({StateSection.LIGHTING, StateSection.ROOM}),
+}
+
+# Sections whose payload is a list of dicts diffed by this key
+KEYED_LIST_SECTIONS = {StateSection.CREW: "name"}
+# Sections whose payload is a dict diffed per key
+KEYED_DICT_SECTIONS = {StateSection.LIGHTING}
+# Sections whose payload maps names to newline-joined text, diffed per row
+TEXT_ROW_SECTIONS = {StateSection.MAP}
+
+
+class StateDeltaTracker:
+    """
+    Tracks which client-facing sections are dirty and what each client last saw.
+
+    ``version`` increases on every mark, so callers can tag payloads and clients
+    can detect gaps and request ``full`` snapshots. Clients are identified by any
+    hashable key; ``None`` is the default client. Other clients' baselines are
+    kept for at most ``max_clients`` clients and ``client_ttl`` seconds since
+    their last collect; an expired client just gets whole sections again.
+    """
+
+    def __init__(self, max_clients: int = 16, client_ttl: float = 600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.version = 0
+        self.max_clients = max(1, max_clients)
+        self.client_ttl = client_ttl
+        self.clock = clock
+        self._dirty: Dict[Hashable, set] = {None: set(ALL_SECTIONS)}
+        self._last_sent: Dict[Hashable, Dict[StateSection, Any]] = {None: {}}
+        self._last_seen: "OrderedDict[Hashable, float]" = OrderedDict()  # LRU first
+        for event_type in DIRTYING_EVENTS:
+            event_bus.subscribe(event_type, self._on_dirtying_event, priority=EventPriority.PERSISTENCE)
+
+    def cleanup(self):
+        for event_type in DIRTYING_EVENTS:
+            event_bus.unsubscribe(event_type, self._on_dirtying_event)
+
+    def _on_dirtying_event(self, event: GameEvent):
+        self.mark(*DIRTYING_EVENTS.get(event.type, ()))
+
+    def mark(self, *sections: StateSection):
+        """Flag sections as changed since each client's last collect()."""
+        if sections:
+            for dirty in self._dirty.values():
+                dirty.update(sections)
+            self.version += 1
+
+    def mark_all(self):
+        self.mark(*ALL_SECTIONS)
+
+    def is_dirty(self, section: StateSection, client: Hashable = None) -> bool:
+        return section in self._dirty.get(client, ALL_SECTIONS)
+
+    def forget(self, client: Hashable):
+        """Drop a disconnected client's baseline."""
+        if client is not None:
+            self._dirty.pop(client, None)
+            self._last_sent.pop(client, None)
+            self._last_seen.pop(client, None)
+
+    def _touch(self, client: Hashable):
+        """Record a collect for client and expire idle or least-recently-seen baselines."""
+        now = self.clock()
+        self._last_seen[client] = now
+        self._last_seen.move_to_end(client)
+        for stale, seen in list(self._last_seen.items()):
+            if len(self._last_seen) <= self.max_clients and now - seen <= self.client_ttl:
+                break
+            self.forget(stale)
+
+    def reset(self):
+        """Forget what every client has; the next collect() is a full snapshot."""
+        self._last_sent = {client: {} for client in self._last_sent}
+        self.mark_all()
+
+    def collect(self, builders: Dict[StateSection, Callable[[], Any]], full: bool = False,
+                client: Hashable = None) -> Dict[StateSection, Any]:
+        """
+        Build and diff sections for ``client``'s next payload.
+
+        Only sections dirty for that client are rebuilt. With ``full`` every
+        section is rebuilt and returned whole; otherwise only entries/rows changed
+        since the client's last payload are returned and clean or unchanged
+        sections are omitted.
+        """
+        if client is not None:
+            self._touch(client)
+        if full or client not in self._last_sent:
+            self._last_sent[client] = {}
+        last_sent = self._last_sent[client]
+        dirty = self._dirty.setdefault(client, set(ALL_SECTIONS))
+        sections = ALL_SECTIONS if full else frozenset(dirty)
+        changes: Dict[StateSection, Any] = {}
+
+        for section, build in builders.items():
+            if section not in sections and section in last_sent:
+                continue
+            current = build()
+            previous = last_sent.get(section)
+            last_sent[section] = current
+            if previous is None:
+                changes[section] = current
+                continue
+            delta = diff_section(section, previous, current)
+            if delta is not None:
+                changes[section] = delta
+
+        dirty.clear()
+        return changes
+
+
+def diff_section(section: StateSection, previous: Any, current: Any) -> Optional[Any]:
+    """Return the changed part of a section, or None if nothing changed."""
+    if previous == current:
+        return None
+
+    key = KEYED_LIST_SECTIONS.get(section)
+    if key and isinstance(previous, list) and isinstance(current, list):
+        before = {entry.get(key): entry for entry in previous}
+        return [entry for entry in current if before.get(entry.get(key)) != entry]
+
+    if section in KEYED_DICT_SECTIONS and isinstance(previous, dict) and isinstance(current, dict):
+        return {name: value for name, value in current.items() if previous.get(name) != value}
+
+    if section in TEXT_ROW_SECTIONS and isinstance(previous, dict) and isinstance(current, dict):
+        return {
+            name: diff_rows(previous.get(name, ""), text)
+            for name, text in current.items() if previous.get(name) != text
+        }
+
+    return current
+
+
+def diff_rows(previous: str, current: str) -> Dict[str, Any]:
+    """Row-level delta for newline-joined text: changed rows by index plus the row count."""
+    old_rows = previous.split("\n")
+    new_rows = current.split("\n")
+    changed = {
+        index: row for index, row in enumerate(new_rows)
+        if index >= len(old_rows) or old_rows[index] != row
+    }
+    return {"rows": changed, "length": len(new_rows)}
+
+
+def apply_rows(previous: str, delta: Dict[str, Any]) -> str:
+    """Inverse of diff_rows (used by tests and non-browser clients)."""
+    rows = previous.split("\n")[:delta["length"]]
+    rows.extend([""] * (delta["length"] - len(rows)))
+    for index, row in delta["rows"].items():
+        rows[int(index)] = row
+    return "\n".join(rows)
+
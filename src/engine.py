@@ -1,33 +1,40 @@
 from typing import Optional, List, Dict, Any
 
+import functools
 import json
 import os
 import sys
 import random
 import time
 
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, new_session_bus
 from core.resolution import Attribute, Skill, ResolutionSystem
+from core.config_cache import load_json
 from core.design_briefs import DesignBriefRegistry
+from core.state_delta import StateDeltaTracker
 
 from entities.crew_member import CrewMember
 from entities.item import Item
 from entities.station_map import StationMap
+from entities.station_layout import StationLayout
 
 from systems.ai import AISystem
 from systems.alert import AlertSystem
 from systems.security import SecuritySystem, SecurityLog
-from systems.architect import RandomnessEngine, GameMode, TimeSystem, Difficulty, DifficultySettings, Verbosity
+from systems.architect import RandomnessEngine, GameMode, GameProfile, TimeSystem, Difficulty, DifficultySettings, Verbosity
 from systems.commands import CommandDispatcher, GameContext
 from systems.combat import CombatSystem, CoverType
 from systems.crafting import CraftingSystem
 from systems.endgame import EndgameSystem
 from systems.forensics import BiologicalSlipGenerator, BloodTestSim, ForensicDatabase, EvidenceLog, ForensicsSystem
+from systems.interrogation import InterrogationSystem
 from systems.missionary import MissionarySystem
 from systems.persistence import SaveManager, CURRENT_SAVE_VERSION
 from systems.psychology import PsychologySystem
 from systems.random_events import RandomEventSystem
 from systems.room_state import RoomState, RoomStateManager
+from systems.schedule_index import ScheduleIndex
+from systems.spatial_index import CrewRoster, CrewSpatialIndex
 from systems.sabotage import SabotageManager
 from systems.social import DialogueManager, LynchMobSystem, TrustMatrix, SocialThresholds, bucket_for_thresholds, bucket_label
 from systems.stealth import StealthSystem
@@ -44,10 +51,41 @@ from ui.message_reporter import MessageReporter
 from audio.audio_manager import AudioManager, Sound
 
 
+class LazySubsystem:
+    """
+    A GameState subsystem built the first time something reads it.
 
+    For systems only a few command paths use (crafting, interrogation); games
+    that never touch them skip the construction and bus subscriptions. The
+    factory runs on the game's session bus and the instance then shadows the
+    descriptor, so later reads are plain attribute lookups.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, game, owner=None):
+        if game is None:
+            return self
+        with game.event_bus.activate():
+            system = self.factory(game)
+        game.__dict__[self.name] = system
+        return system
+
+    @staticmethod
+    def built(game, name):
+        """The subsystem if it has been constructed, else None (never builds it)."""
+        return game.__dict__.get(name)
 
 
 class GameState:
+    crafting = LazySubsystem(lambda game: CraftingSystem())
+    interrogation_system = LazySubsystem(lambda game: InterrogationSystem(game.rng, game.room_states))
+
     @property
     def paranoia_level(self):
         return getattr(self, "_paranoia_level", 0)
@@ -79,6 +117,15 @@ class GameState:
                 "threshold": self.social_thresholds.paranoia_thresholds[new_bucket-1] if direction == "UP" else self.social_thresholds.paranoia_thresholds[new_bucket]
             }))
 
+    @property
+    def crew(self):
+        return self._crew
+
+    @crew.setter
+    def crew(self, members):
+        # Roster changes are counted so crew indexes can skip rescanning members
+        self._crew = members if isinstance(members, CrewRoster) else CrewRoster(members)
+
     @property
     def temperature(self):
         return self.time_system.temperature if hasattr(self, "time_system") else -40.0
@@ -107,8 +154,20 @@ class GameState:
         if hasattr(self, "sabotage"):
             self.sabotage.helicopter_operational = bool(value)
 
-    def __init__(self, seed=None, difficulty=Difficulty.NORMAL, characters_path=None, start_hour=None, thresholds: SocialThresholds = None):
+    def __init__(self, seed=None, difficulty=Difficulty.NORMAL, characters_path=None, start_hour=None, thresholds: SocialThresholds = None,
+                 station_layout: StationLayout = None, headless: bool = False, profile: GameProfile = None):
+        # 0. Session-scoped event bus: every subsystem built below subscribes here,
+        # so this game's turns never dispatch into another session's listeners.
+        self.event_bus = new_session_bus()
+        with self.event_bus.activate():
+            self._initialize(seed, difficulty, characters_path, start_hour, thresholds, station_layout,
+                             profile or (GameProfile.headless() if headless else GameProfile.full()))
+
+    def _initialize(self, seed, difficulty, characters_path, start_hour, thresholds, station_layout=None, profile=None):
         # 1. Pre-initialization of essential attributes to avoid AttributeErrors in setters/listeners
+        # The profile decides which side channels (audio, stdout, save files) are wired up
+        self.profile = profile or GameProfile.full()
+        self.headless = self.profile == GameProfile.headless()
         self.social_thresholds = thresholds or SocialThresholds()
         self.rng = RandomnessEngine(seed)
         self.player = None
@@ -126,7 +185,10 @@ class GameState:
         
         # 3. Time and Persistence
         self.time_system = TimeSystem(start_hour=start_hour if start_hour is not None else 19)
-        self.save_manager = SaveManager(game_state_factory=GameState.from_dict)
+        # Loaded games keep this game's side channels
+        self.save_manager = SaveManager(game_state_factory=functools.partial(GameState.from_dict, profile=self.profile),
+                                        autosave=self.profile.persistence,
+                                        journaled=self.profile.journal)
         
         # 4. Global State
         self.power_on = True
@@ -139,7 +201,7 @@ class GameState:
         # self.verbosity = Verbosity.STANDARD
 
         # 5. Core Simulation Systems
-        self.station_map = StationMap()
+        self.station_map = StationMap(layout=station_layout)
         self.weather = WeatherSystem()
         self.sabotage = SabotageManager(self.difficulty_settings)
         self.radio_operational = self.sabotage.radio_operational
@@ -160,10 +222,15 @@ class GameState:
         self._initialize_crew()  
 
         # 7. Initialize Subsystems requiring crew/map/player
-        self.audio = AudioManager(enabled=True, rng=self.rng, player_ref=self.player, station_map=self.station_map)
+        self.audio = AudioManager(enabled=self.profile.audio, rng=self.rng, player_ref=self.player, station_map=self.station_map)
         self.crt = CRTOutput()
+        if not self.profile.terminal:
+            self.crt.start_capture()
         self.renderer = TerminalRenderer(self.station_map)
         self.reporter = MessageReporter(self.crt, self)
+        self.state_tracker = StateDeltaTracker()
+        self.schedule_index = ScheduleIndex()
+        self.crew_index = CrewSpatialIndex()
 
         self.forensics = ForensicsSystem(rng=self.rng)
         self.missionary = MissionarySystem()
@@ -178,7 +245,7 @@ class GameState:
         self.alert_system = AlertSystem(self)
         self.security_system = SecuritySystem(self)
         self.progression = ProgressionSystem(self)
-        self.crafting = CraftingSystem()
+        # crafting and interrogation_system are LazySubsystems (built on first use)
         self.endgame = EndgameSystem(self.design_registry) # Agent 8
         self.combat = CombatSystem(self.rng, self.room_states)
         self.ai_system = AISystem()
@@ -212,9 +279,9 @@ class GameState:
     def _initialize_crew(self):
         """Load crew data from configuration."""
         try:
-            with open(self.characters_config_path, 'r') as f:
-                data = json.load(f)
-                
+            # Shared, cached parse: copy anything a CrewMember may mutate
+            data = load_json(self.characters_config_path)
+
             if isinstance(data, list):
                 crew_list = data
             else:
@@ -241,11 +308,11 @@ class GameState:
                     behavior_type=char_data.get("behavior", char_data.get("behavior_type", "Neutral")),
                     attributes=attrs,
                     skills=skills,
-                    schedule=char_data.get("schedule"),
-                    invariants=char_data.get("invariants")
+                    schedule=[dict(entry) for entry in char_data.get("schedule") or []],
+                    invariants=[dict(entry) for entry in char_data.get("invariants") or []]
                 )
-                
-                member.forbidden_rooms = char_data.get("forbidden_rooms", [])
+
+                member.forbidden_rooms = list(char_data.get("forbidden_rooms", []))
                 member.security_role = char_data.get("security_role", False)
                 
                 start_room = char_data.get("start_location", "Rec Room")
@@ -301,6 +368,10 @@ class GameState:
         if self.game_over:
             return
 
+        with self.event_bus.activate():
+            self._advance_turn(power_on)
+
+    def _advance_turn(self, power_on: Optional[bool]):
         self.turn += 1
         
         for member in self.crew:
@@ -330,9 +401,11 @@ class GameState:
         if hasattr(self, 'reporter'):
             self.reporter.flush()
 
-        if self.turn % 5 == 0 and hasattr(self, 'save_manager'):
+        if self.turn % 5 == 0 and hasattr(self, 'save_manager') and self.save_manager.autosave:
             try:
-                self.save_manager.save_game(self, "autosave")
+                # Snapshot now, write on the background saver (deduped against
+                # SaveManager's own interval autosave on the same turn)
+                self.save_manager.autosave_game(self)
             except Exception:
                 pass
         self._emit_population_status()
@@ -549,6 +622,11 @@ class GameState:
 
     def cleanup(self):
         """Clean up game state and unsubscribe from events."""
+        with self.event_bus.activate():
+            self._cleanup_subsystems()
+        self.event_bus.detach()
+
+    def _cleanup_subsystems(self):
         # Core Systems
         if hasattr(self, 'time_system') and self.time_system:
             self.time_system.cleanup()
@@ -570,8 +648,9 @@ class GameState:
             self.random_events.cleanup()
         if hasattr(self, 'endgame') and self.endgame:
             self.endgame.cleanup()
-        if hasattr(self, 'crafting') and self.crafting:
-            self.crafting.cleanup()
+        crafting = LazySubsystem.built(self, 'crafting')
+        if crafting:
+            crafting.cleanup()
         if hasattr(self, 'psychology') and self.psychology:
             self.psychology.cleanup()
         if hasattr(self, 'missionary') and self.missionary:
@@ -588,6 +667,11 @@ class GameState:
             self.audio.cleanup()
         if hasattr(self, 'reporter') and self.reporter:
             self.reporter.cleanup()
+        if hasattr(self, 'state_tracker') and self.state_tracker:
+            self.state_tracker.cleanup()
+        if hasattr(self, 'save_manager') and self.save_manager:
+            # Flushes any autosave still being written
+            self.save_manager.cleanup()
 
     def check_win_condition(self):
         if self.last_ending_payload:
@@ -695,16 +779,25 @@ class GameState:
             "crew": [m.to_dict() for m in self.crew],
             "player_location": self.player.location if self.player else (0, 0),
             "journal": self.journal,
-            "trust": self.trust_system.matrix if hasattr(self, "trust_system") else {},
-            "crafting": self.crafting.to_dict() if hasattr(self.crafting, "to_dict") else {},
+            "trust": self.trust_system.to_dict() if hasattr(self, "trust_system") else {},
+            "crafting": self._crafting_state(),
             "alert_system": self.alert_system.to_dict() if hasattr(self, "alert_system") else {},
             "security_system": self.security_system.to_dict() if hasattr(self, "security_system") else {},
             "security_log": self.security_log.to_dict() if hasattr(self, "security_log") else {}
         }
 
+    def _crafting_state(self):
+        crafting = LazySubsystem.built(self, "crafting")
+        return crafting.to_dict() if hasattr(crafting, "to_dict") else {}
+
     @classmethod
-    def from_dict(cls, data):
-        """Deserialize game state from dictionary with defensive defaults and validation."""
+    def from_dict(cls, data, profile: GameProfile = None):
+        """
+        Deserialize game state from dictionary with defensive defaults and validation.
+
+        ``profile`` picks the restored game's side channels (the full profile by
+        default); hosts that built the game with another profile pass it back in.
+        """
         if not data or not isinstance(data, dict):
             return None
 
@@ -716,112 +809,115 @@ class GameState:
         except ValueError:
             difficulty = Difficulty.NORMAL
 
-        game = cls(difficulty=difficulty)
+        game = cls(difficulty=difficulty, profile=profile)
 
-        game.power_on = data.get("power_on", True)
-        game.paranoia_level = data.get("paranoia_level", 0)
+        # Rehydrated subsystems must subscribe to the loaded game's own bus
+        with game.event_bus.activate():
+            game.power_on = data.get("power_on", True)
+            game.paranoia_level = data.get("paranoia_level", 0)
 
-        mode_val = data.get("mode", GameMode.INVESTIGATIVE.value)
-        try:
-            game.mode = GameMode(mode_val)
-        except ValueError:
-            game.mode = GameMode.INVESTIGATIVE
-
-        game.helicopter_status = data.get("helicopter_status", "BROKEN")
-        game.helicopter_operational = data.get("helicopter_operational", True)
-        game.radio_operational = data.get("radio_operational", True)
-        game.helicopter_operational = data.get("helicopter_operational", game.helicopter_operational)
-        game.radio_operational = data.get("radio_operational", game.radio_operational)
-        game.escape_route = data.get("escape_route")
-        game.overland_escape_turns = data.get("overland_escape_turns")
-        game.rescue_signal_active = data.get("rescue_signal_active", False)
-        game.rescue_turns_remaining = data.get("rescue_turns_remaining")
-        game.turn = data.get("turn", getattr(game, "turn", 1))
-        game.rescue_eta_turns = data.get("rescue_eta_turns", game.rescue_eta_turns)
-        game.alert_status = data.get("alert_status", "calm")
-        game.alert_status = data.get("alert_status", "CALM")
-        game.alert_turns_remaining = data.get("alert_turns_remaining", 0)
-
-        if "rng" in data:
-            game.rng.from_dict(data["rng"])
-
-        if "time_system" in data:
-            game.time_system = TimeSystem.from_dict(data["time_system"])
-        else:
-            game.time_system.turn_count = data.get("turn", 1) - 1
-
-        if "station_map" in data:
-            game.station_map = StationMap.from_dict(data["station_map"])
-        else:
-            game.station_map = StationMap()
-
-        crew_data = data.get("crew", [])
-        if crew_data:
-            game.crew = []
-            for m_data in crew_data:
-                try:
-                    member = CrewMember.from_dict(m_data)
-                except Exception:
-                    name = m_data.get("name", "Unknown") if isinstance(m_data, dict) else "Unknown"
-                    member = CrewMember(name, m_data.get("role", "None") if isinstance(m_data, dict) else "None", m_data.get("behavior_type", "Neutral") if isinstance(m_data, dict) else "Neutral")
-                if member:
-                    game.crew.append(member)
-        else:
-            game.crew = []
-
-        game.player = next((m for m in game.crew if m.name == "MacReady"), None)
-        if not game.player:
-            fallback_player = CrewMember("MacReady", "Pilot", "Neutral")
-            game.crew.insert(0, fallback_player)
-            game.player = fallback_player
-
-        if "player_location" in data and game.player:
-            loc = data.get("player_location")
-            if isinstance(loc, (list, tuple)) and len(loc) == 2:
-                game.player.location = (loc[0], loc[1])
-
-        game.journal = data.get("journal", [])
-
-        if hasattr(game, "trust_system") and game.trust_system:
-            game.trust_system.cleanup()
-        game.trust_system = TrustMatrix(game.crew, thresholds=game.social_thresholds)
-        trust_data = data.get("trust")
-        if trust_data and isinstance(trust_data, dict):
-            game.trust_system.matrix.update(trust_data)
-
-        game.renderer.map = game.station_map
-        game.parser.set_known_names([m.name for m in game.crew])
-        game.room_states = RoomStateManager(list(game.station_map.rooms.keys()))
-        game.crafting = CraftingSystem.from_dict(data.get("crafting"), game)
-        game.security_log = SecurityLog.from_dict(data.get("security_log", {}))
-
-        # Rehydrate security system state
-        security_data = data.get("security_system")
-        if security_data:
-            if hasattr(game, "security_system") and game.security_system:
-                game.security_system = SecuritySystem.from_dict(
-                    security_data,
-                    game_state=game,
-                    existing_system=game.security_system
-                )
+            mode_val = data.get("mode", GameMode.INVESTIGATIVE.value)
+            try:
+                game.mode = GameMode(mode_val)
+            except ValueError:
+                game.mode = GameMode.INVESTIGATIVE
+
+            game.helicopter_status = data.get("helicopter_status", "BROKEN")
+            game.helicopter_operational = data.get("helicopter_operational", True)
+            game.radio_operational = data.get("radio_operational", True)
+            game.helicopter_operational = data.get("helicopter_operational", game.helicopter_operational)
+            game.radio_operational = data.get("radio_operational", game.radio_operational)
+            game.escape_route = data.get("escape_route")
+            game.overland_escape_turns = data.get("overland_escape_turns")
+            game.rescue_signal_active = data.get("rescue_signal_active", False)
+            game.rescue_turns_remaining = data.get("rescue_turns_remaining")
+            game.turn = data.get("turn", getattr(game, "turn", 1))
+            game.rescue_eta_turns = data.get("rescue_eta_turns", game.rescue_eta_turns)
+            game.alert_status = data.get("alert_status", "calm")
+            game.alert_status = data.get("alert_status", "CALM")
+            game.alert_turns_remaining = data.get("alert_turns_remaining", 0)
+
+            if "rng" in data:
+                game.rng.from_dict(data["rng"])
+
+            if "time_system" in data:
+                game.time_system = TimeSystem.from_dict(data["time_system"])
+            else:
+                game.time_system.turn_count = data.get("turn", 1) - 1
+
+            if "station_map" in data:
+                game.station_map = StationMap.from_dict(data["station_map"])
             else:
-                game.security_system = SecuritySystem.from_dict(security_data, game_state=game)
-
-        if hasattr(game, "sabotage"):
-            game.sabotage.radio_operational = game.radio_operational
-            game.sabotage.radio_working = game.radio_operational
-            game.sabotage.chopper_operational = game.helicopter_operational
-            game.sabotage.helicopter_working = game.helicopter_operational
-        # Restore alert system/state
-        alert_data = data.get("alert_system", {})
-        if hasattr(game, "alert_system") and game.alert_system:
-            game.alert_system.cleanup()
-        game.alert_system = AlertSystem.from_dict(alert_data, game)
-        game.alert_status = data.get("alert_status", game.alert_status)
-        game.alert_turns_remaining = data.get("alert_turns_remaining", game.alert_turns_remaining)
-        if hasattr(game, "alert_system") and game.alert_system:
-            game.alert_system.cleanup()
-        game.alert_system = AlertSystem.from_dict(data.get("alert_system"), game)
+                game.station_map = StationMap()
+
+            crew_data = data.get("crew", [])
+            if crew_data:
+                game.crew = []
+                for m_data in crew_data:
+                    try:
+                        member = CrewMember.from_dict(m_data)
+                    except Exception:
+                        name = m_data.get("name", "Unknown") if isinstance(m_data, dict) else "Unknown"
+                        member = CrewMember(name, m_data.get("role", "None") if isinstance(m_data, dict) else "None", m_data.get("behavior_type", "Neutral") if isinstance(m_data, dict) else "Neutral")
+                    if member:
+                        game.crew.append(member)
+            else:
+                game.crew = []
+
+            game.player = next((m for m in game.crew if m.name == "MacReady"), None)
+            if not game.player:
+                fallback_player = CrewMember("MacReady", "Pilot", "Neutral")
+                game.crew.insert(0, fallback_player)
+                game.player = fallback_player
+
+            if "player_location" in data and game.player:
+                loc = data.get("player_location")
+                if isinstance(loc, (list, tuple)) and len(loc) == 2:
+                    game.player.location = (loc[0], loc[1])
+
+            game.journal = data.get("journal", [])
+
+            if hasattr(game, "trust_system") and game.trust_system:
+                game.trust_system.cleanup()
+            game.trust_system = TrustMatrix(game.crew, thresholds=game.social_thresholds)
+            trust_data = data.get("trust")
+            if trust_data and isinstance(trust_data, dict):
+                game.trust_system.load(trust_data)
+
+            game.renderer.map = game.station_map
+            game.parser.set_known_names([m.name for m in game.crew])
+            game.room_states = RoomStateManager(list(game.station_map.rooms.keys()))
+            if data.get("crafting"):
+                game.crafting = CraftingSystem.from_dict(data.get("crafting"), game)
+            game.security_log = SecurityLog.from_dict(data.get("security_log", {}))
+
+            # Rehydrate security system state
+            security_data = data.get("security_system")
+            if security_data:
+                if hasattr(game, "security_system") and game.security_system:
+                    game.security_system = SecuritySystem.from_dict(
+                        security_data,
+                        game_state=game,
+                        existing_system=game.security_system
+                    )
+                else:
+                    game.security_system = SecuritySystem.from_dict(security_data, game_state=game)
+
+            if hasattr(game, "sabotage"):
+                game.sabotage.radio_operational = game.radio_operational
+                game.sabotage.radio_working = game.radio_operational
+                game.sabotage.chopper_operational = game.helicopter_operational
+                game.sabotage.helicopter_working = game.helicopter_operational
+            # Restore alert system/state
+            alert_data = data.get("alert_system", {})
+            if hasattr(game, "alert_system") and game.alert_system:
+                game.alert_system.cleanup()
+            game.alert_system = AlertSystem.from_dict(alert_data, game)
+            game.alert_status = data.get("alert_status", game.alert_status)
+            game.alert_turns_remaining = data.get("alert_turns_remaining", game.alert_turns_remaining)
+            if hasattr(game, "alert_system") and game.alert_system:
+                game.alert_system.cleanup()
+            game.alert_system = AlertSystem.from_dict(data.get("alert_system"), game)
 
         return game
 
@@ -857,7 +953,7 @@ def main():
 
         try:
             prompt = game.crt.prompt("CMD")
-            user_input = input(prompt).strip()
+            user_input = game.crt.read_line(prompt).strip()
             if not user_input:
                 continue
 
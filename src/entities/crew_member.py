@@ -4,6 +4,8 @@ from core.resolution import Attribute, Skill, ResolutionSystem
 from core.event_system import event_bus, EventType, GameEvent
 from systems.forensics import BiologicalSlipGenerator
 from systems.pathfinding import pathfinder
+from systems.schedule_index import CompiledSchedule, current_hour, note_crew_change, schedule_snapshot
+from systems import schedule_index, spatial_index
 from entities.item import Item
 from enum import Enum, auto
 
@@ -221,6 +223,62 @@ class CrewMember:
 
         return " ".join(desc)
 
+    # Spatial indexes (weakly referenced) notified whenever location changes
+    _spatial_refs = ()
+    # Schedule indexes (weakly referenced) whose revision position, vital state
+    # and schedule changes bump
+    _schedule_refs = ()
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self._location = value
+        note_crew_change(self)
+        for ref in self._spatial_refs:
+            index = ref()
+            if index is not None:
+                index.on_moved(self, value)
+
+    def attach_spatial_index(self, index):
+        spatial_index.attach(self, index)
+
+    def attach_schedule_index(self, index):
+        schedule_index.attach(self, index)
+
+    @property
+    def is_alive(self):
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, value):
+        self._is_alive = value
+        note_crew_change(self)
+
+    @property
+    def schedule(self):
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, value):
+        self._schedule = value
+        self._compiled_schedule = None
+        note_crew_change(self)
+
+    @property
+    def compiled_schedule(self) -> CompiledSchedule:
+        """Hour -> room table for the schedule, rebuilt after the schedule is reassigned."""
+        if self._compiled_schedule is None:
+            self._compiled_schedule = CompiledSchedule(self._schedule)
+        return self._compiled_schedule
+
+    def invalidate_schedule(self):
+        """Call after editing schedule entries in place."""
+        self._compiled_schedule = None
+        note_crew_change(self)
+
     def check_location_hints(self, game_state):
         """Check if character is deviating from expected location patterns.
         
@@ -434,7 +492,8 @@ class CrewMember:
         m.silent_takedown_unlocked = data.get("silent_takedown_unlocked", False)
 
         # Enhanced search memory
-        m.search_history = set(data.get("search_history", []))
+        # JSON turns tile tuples into lists; restore them so the set can hold them
+        m.search_history = {tuple(e) if isinstance(e, list) else e for e in data.get("search_history", [])}
         search_anchor = data.get("search_anchor")
         m.search_anchor = tuple(search_anchor) if search_anchor else None
         m.search_spiral_radius = data.get("search_spiral_radius", 1)
@@ -582,43 +641,18 @@ class CrewMember:
 
         Returns True if the character is in a location that doesn't match their
         current schedule entry, making them suspicious and easier to interrogate.
+        Corridors are neutral: NPCs can pass through them without being flagged.
         """
-        if not hasattr(self, 'schedule') or not self.schedule:
+        if not self.schedule:
             self.out_of_place = False
             self.out_of_place_reason = None
             return False
 
-        current_hour = getattr(game_state.time_system, "hour", getattr(game_state, "current_hour", 0))
-        current_room = game_state.station_map.get_room_name(*self.location)
-
-        # Find the scheduled room for the current hour
-        expected_room = None
-        for entry in self.schedule:
-            start = entry.get("start", 0)
-            end = entry.get("end", 24)
-            room = entry.get("room")
-
-            # Handle wrap-around schedules (e.g., 20:00 to 08:00)
-            if start < end:
-                if start <= current_hour < end:
-                    expected_room = room
-                    break
-            else:  # Wrap around midnight
-                if current_hour >= start or current_hour < end:
-                    expected_room = room
-                    break
-
-        out_of_schedule = False
+        snapshot = schedule_snapshot(game_state)
+        out_of_schedule = snapshot.is_out_of_place(self)
         reason = None
-
-        if expected_room:
-            # Check if current room matches expected (allow partial matches for flexibility)
-            # e.g., "Corridor near Lab" should match if expected is "Lab"
-            if expected_room not in current_room and current_room not in expected_room:
-                # Corridors are neutral - NPCs can be in corridors without being "out of schedule"
-                if not current_room.startswith("Corridor"):
-                    out_of_schedule = True
-                    reason = f"Expected: {expected_room}, current: {current_room}"
+        if out_of_schedule:
+            reason = f"Expected: {snapshot.expected_room(self)}, current: {snapshot.current_room(self)}"
 
         self.out_of_place = out_of_schedule
         self.out_of_place_reason = reason
@@ -634,27 +668,12 @@ class CrewMember:
         - out_of_schedule: Boolean
         """
         current_room = game_state.station_map.get_room_name(*self.location)
-        current_hour = getattr(game_state.time_system, "hour", getattr(game_state, "current_hour", 0))
-
-        expected_room = None
-        for entry in self.schedule:
-            start = entry.get("start", 0)
-            end = entry.get("end", 24)
-            room = entry.get("room")
-
-            if start < end:
-                if start <= current_hour < end:
-                    expected_room = room
-                    break
-            else:
-                if current_hour >= start or current_hour < end:
-                    expected_room = room
-                    break
+        hour = current_hour(game_state)
 
         return {
-            "expected_room": expected_room,
+            "expected_room": self.compiled_schedule.room_at(hour),
             "current_room": current_room,
-            "current_hour": current_hour,
+            "current_hour": hour,
             "out_of_schedule": self.is_out_of_schedule(game_state)
         }
 
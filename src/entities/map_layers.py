@@ -0,0 +1,222 @@
+"""Raster layers for StationMap.
+
+Every per-tile property of the station is stored as a flat, row-major raster
+(index = y * width + x) so lookups are a single index and whole-map queries
+don't have to walk Python dicts of tuples:
+
+    room_ids     uint16  0 = corridor, n = room_names[n]
+    walkable     uint8   1 = can be entered
+    vents        uint8   1 = vent tile
+    cover        uint8   hiding-spot cover bonus
+    opaque       uint8   1 = blocks line of sight
+    camera_cover uint8   number of cameras whose cone covers the tile
+
+Rasters are stdlib ``array``/``bytearray`` buffers, so they always work. When
+NumPy is installed, ``as_array`` exposes zero-copy 2D views and the batch
+queries below run vectorized.
+"""
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Camera facing -> unit vector
+CAMERA_DIRECTIONS = {
+    "N": (0, -1),
+    "S": (0, 1),
+    "E": (1, 0),
+    "W": (-1, 0),
+}
+
+
+def camera_cone(position: Tuple[int, int], facing: str, range_tiles: int) -> List[Tuple[int, int]]:
+    """Tiles in a camera's cone of view (unclipped).
+
+    Range 1: 1 tile wide, Range 2: 3 tiles wide, Range 3: 5 tiles wide.
+    """
+    dx, dy = CAMERA_DIRECTIONS.get(facing.upper(), (0, 0))
+    x, y = position
+    tiles = []
+    for dist in range(1, range_tiles + 1):
+        center_x = x + dx * dist
+        center_y = y + dy * dist
+        spread = dist - 1  # 0, 1, 2 tiles to each side
+        for offset in range(-spread, spread + 1):
+            if dx != 0:  # Facing E/W, spread along Y
+                tiles.append((center_x, center_y + offset))
+            else:  # Facing N/S, spread along X
+                tiles.append((center_x + offset, center_y))
+    return tiles
+
+
+class MapLayers:
+    """Row-major raster layers plus batch queries over them."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        size = width * height
+        self.room_names: List[Optional[str]] = [None]  # index 0 = corridor
+        self.room_ids = array('H', bytes(2 * size))
+        self.walkable = bytearray(b'\x01' * size)
+        self.vents = bytearray(size)
+        self.cover = bytearray(size)
+        self.opaque = bytearray(size)
+        self.camera_cover = bytearray(size)
+
+    @classmethod
+    def from_station_map(cls, station_map) -> "MapLayers":
+        layers = cls(station_map.width, station_map.height)
+        layers.paint_rooms(station_map.rooms)
+        for x, y in station_map.vents:
+            layers.set(layers.vents, x, y, 1)
+        for (x, y), spot in station_map.hiding_spots.items():
+            layers.set(layers.cover, x, y, min(255, spot.get("cover_bonus", 0)))
+            if spot.get("blocks_los"):
+                layers.set(layers.opaque, x, y, 1)
+        for position, camera in station_map.security_cameras.items():
+            layers.add_camera(position, camera.get("facing", "N"), camera.get("range", 3))
+        return layers
+
+    # --- Indexing ---
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def get(self, layer, x: int, y: int, default=0):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return layer[y * self.width + x]
+        return default
+
+    def set(self, layer, x: int, y: int, value):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            layer[y * self.width + x] = value
+
+    def as_array(self, layer):
+        """Zero-copy (height, width) NumPy view of a layer; requires NumPy."""
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is not installed")
+        dtype = np.uint16 if isinstance(layer, array) else np.uint8
+        return np.frombuffer(layer, dtype=dtype).reshape(self.height, self.width)
+
+    # --- Painting ---
+
+    def paint_rooms(self, rooms: Dict[str, Tuple[int, int, int, int]]):
+        """Rasterize room rectangles; the first room listed wins any overlap."""
+        width = self.width
+        room_ids = self.room_ids
+        for name, (x1, y1, x2, y2) in rooms.items():
+            room_id = len(self.room_names)
+            self.room_names.append(name)
+            x1, x2 = max(0, x1), min(width - 1, x2)
+            for y in range(max(0, y1), min(self.height - 1, y2) + 1):
+                row = y * width
+                for i in range(row + x1, row + x2 + 1):
+                    if not room_ids[i]:
+                        room_ids[i] = room_id
+
+    def add_camera(self, position: Tuple[int, int], facing: str, range_tiles: int):
+        for x, y in camera_cone(position, facing, range_tiles):
+            if 0 <= x < self.width and 0 <= y < self.height:
+                i = y * self.width + x
+                self.camera_cover[i] = min(255, self.camera_cover[i] + 1)
+
+    # --- Queries ---
+
+    def room_id_at(self, x: int, y: int) -> int:
+        return self.get(self.room_ids, x, y)
+
+    def room_name_at(self, x: int, y: int) -> Optional[str]:
+        """Room name, or None for corridors and out-of-bounds tiles."""
+        return self.room_names[self.get(self.room_ids, x, y)]
+
+    def rooms_in_radius(self, x: int, y: int, radius: int) -> Set[str]:
+        """Named rooms with at least one tile within Euclidean radius of (x, y)."""
+        x1, x2 = max(0, x - radius), min(self.width - 1, x + radius)
+        y1, y2 = max(0, y - radius), min(self.height - 1, y + radius)
+        if x1 > x2 or y1 > y2:
+            return set()
+        r2 = radius * radius
+
+        if HAS_NUMPY:
+            window = self.as_array(self.room_ids)[y1:y2 + 1, x1:x2 + 1]
+            ys, xs = np.ogrid[y1:y2 + 1, x1:x2 + 1]
+            inside = (xs - x) ** 2 + (ys - y) ** 2 <= r2
+            ids = np.unique(window[inside])
+        else:
+            ids = set()
+            room_ids, width = self.room_ids, self.width
+            for ty in range(y1, y2 + 1):
+                dy2 = (ty - y) ** 2
+                row = ty * width
+                for tx in range(x1, x2 + 1):
+                    if (tx - x) ** 2 + dy2 <= r2:
+                        ids.add(room_ids[row + tx])
+        return {self.room_names[i] for i in ids if i}
+
+    def occupancy_counts(self, positions: Iterable[Tuple[int, int]]) -> Dict[str, int]:
+        """Occupants per named room for a batch of positions (corridors skipped)."""
+        width, height = self.width, self.height
+        room_ids = self.room_ids
+        counts = Counter(
+            room_ids[y * width + x] for x, y in positions
+            if 0 <= x < width and 0 <= y < height
+        )
+        return {self.room_names[i]: n for i, n in counts.items() if i}
+
+    def visible_tiles(self, x: int, y: int, radius: int) -> Set[Tuple[int, int]]:
+        """Tiles within radius of (x, y) with a clear line of sight.
+
+        Opaque tiles (e.g. booths, fuel drums) are visible themselves but hide
+        whatever is behind them; unwalkable tiles behave the same way.
+        """
+        if not self.in_bounds(x, y):
+            return set()
+        width = self.width
+        opaque, walkable = self.opaque, self.walkable
+        r2 = radius * radius
+        visible = {(x, y)}
+        for ty in range(max(0, y - radius), min(self.height - 1, y + radius) + 1):
+            for tx in range(max(0, x - radius), min(width - 1, x + radius) + 1):
+                if (tx - x) ** 2 + (ty - y) ** 2 > r2 or (tx, ty) in visible:
+                    continue
+                # Walk the Bresenham line, stopping at the first blocker before the target
+                blocked = False
+                for lx, ly in _line(x, y, tx, ty)[1:-1]:
+                    i = ly * width + lx
+                    if opaque[i] or not walkable[i]:
+                        blocked = True
+                        break
+                if not blocked:
+                    visible.add((tx, ty))
+        return visible
+
+
+def _line(x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+    """Bresenham line from (x0, y0) to (x1, y1), inclusive."""
+    points = []
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        points.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            return points
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
@@ -0,0 +1,212 @@
+"""Station layouts: data-driven room/vent/device placement for StationMap.
+
+The classic 20x20 station is hand-written in StationMap. Larger stations are
+described by a StationLayout, either loaded from JSON or produced by
+StationGenerator, which carves a grid of room cells separated by corridors.
+The named rooms the rest of the game refers to (Rec Room, Generator, Kennel...)
+are always present; the remaining cells become numbered filler modules.
+"""
+
+import json
+from typing import Dict, List, Optional, Tuple
+
+from systems.architect import RandomnessEngine
+
+Coord = Tuple[int, int]
+
+# Rooms referenced by name in schedules, events and AI; every layout needs them
+CORE_ROOMS = (
+    "Rec Room", "Infirmary", "Generator", "Kennel", "Radio Room",
+    "Storage", "Lab", "Sleeping Quarters", "Mess Hall", "Hangar",
+)
+
+FILLER_KINDS = (
+    "Workshop", "Supply Depot", "Pump Room", "Bunkroom", "Observation Post",
+    "Fuel Store", "Drill Bay", "Cold Lab", "Boiler Room", "Archive",
+)
+
+HIDING_LABELS = (
+    "a stack of crates", "behind a bulkhead", "under a workbench",
+    "a row of lockers", "a pile of tarps", "behind fuel drums",
+)
+
+# Rooms that always get a camera / motion sensor (mirrors the classic station)
+CAMERA_ROOMS = ("Rec Room", "Radio Room", "Storage", "Hangar", "Lab")
+SENSOR_ROOMS = ("Radio Room", "Generator", "Kennel")
+
+
+def _coord(value) -> Coord:
+    return (int(value[0]), int(value[1]))
+
+
+class StationLayout:
+    """Everything StationMap needs to build a station other than the classic one."""
+
+    def __init__(self, width: int, height: int,
+                 rooms: Dict[str, Tuple[int, int, int, int]],
+                 vents=None, vent_links: Dict[Coord, List[Coord]] = None,
+                 connections: Dict[str, List[str]] = None,
+                 hiding_spots: Dict[Coord, Dict] = None,
+                 cameras: Dict[Coord, Dict] = None,
+                 motion_sensors: Dict[Coord, Dict] = None,
+                 seed=None):
+        self.width = width
+        self.height = height
+        self.rooms = dict(rooms)
+        self.vents = set(vents or ())
+        self.vent_links = dict(vent_links or {})
+        self.connections = dict(connections or {})
+        self.hiding_spots = dict(hiding_spots or {})
+        self.cameras = dict(cameras or {})
+        self.motion_sensors = dict(motion_sensors or {})
+        self.seed = seed
+
+    def to_dict(self):
+        return {
+            "width": self.width,
+            "height": self.height,
+            "seed": self.seed,
+            "rooms": {name: list(bounds) for name, bounds in self.rooms.items()},
+            "vents": sorted(list(v) for v in self.vents),
+            "vent_links": [[list(a), [list(b) for b in links]] for a, links in self.vent_links.items()],
+            "connections": self.connections,
+            "hiding_spots": [dict(meta, x=x, y=y) for (x, y), meta in self.hiding_spots.items()],
+            "cameras": [dict(meta, x=x, y=y) for (x, y), meta in self.cameras.items()],
+            "motion_sensors": [dict(meta, x=x, y=y) for (x, y), meta in self.motion_sensors.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a layout from JSON data; raises ValueError on malformed input."""
+        if not isinstance(data, dict):
+            raise ValueError("Station layout must be a JSON object")
+        try:
+            width, height = int(data["width"]), int(data["height"])
+            rooms = {name: tuple(int(v) for v in bounds) for name, bounds in data["rooms"].items()}
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid station layout: {e}") from e
+        if any(len(bounds) != 4 for bounds in rooms.values()):
+            raise ValueError("Invalid station layout: room bounds must be [x1, y1, x2, y2]")
+
+        def _placed(entries):
+            placed = {}
+            for entry in entries or []:
+                meta = {k: v for k, v in entry.items() if k not in ("x", "y")}
+                placed[(int(entry["x"]), int(entry["y"]))] = meta
+            return placed
+
+        return cls(
+            width, height, rooms,
+            vents={_coord(v) for v in data.get("vents", [])},
+            vent_links={_coord(a): [_coord(b) for b in links] for a, links in data.get("vent_links", [])},
+            connections={name: list(adj) for name, adj in data.get("connections", {}).items()},
+            hiding_spots=_placed(data.get("hiding_spots")),
+            cameras=_placed(data.get("cameras")),
+            motion_sensors=_placed(data.get("motion_sensors")),
+            seed=data.get("seed"),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "StationLayout":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+
+class StationGenerator:
+    """
+    Procedural station builder.
+
+    The map is split into square cells; each cell holds one rectangular room
+    with a one-tile corridor ring around it. Rooms in neighbouring cells are
+    connected and their vents linked, so the vent network is a lattice over
+    the whole station. Output is fully determined by the RandomnessEngine seed.
+    """
+
+    def __init__(self, rng: Optional[RandomnessEngine] = None, seed=None):
+        self.rng = rng or RandomnessEngine(seed)
+
+    def generate(self, width: int, height: int, cell_size: int = 10,
+                 hiding_chance: float = 0.3, camera_chance: float = 0.1,
+                 sensor_chance: float = 0.05) -> StationLayout:
+        if cell_size < 5:
+            raise ValueError("cell_size must be at least 5")
+        cols, rows = width // cell_size, height // cell_size
+        if cols * rows < len(CORE_ROOMS):
+            raise ValueError(
+                f"A {width}x{height} station with {cell_size}-tile cells has room for "
+                f"{cols * rows} rooms; at least {len(CORE_ROOMS)} are required"
+            )
+        rng = self.rng
+
+        # Scatter the named rooms over the grid; everything else is filler
+        cell_count = cols * rows
+        core_cells = dict(zip(rng.sample(range(cell_count), len(CORE_ROOMS)), CORE_ROOMS))
+        names: List[str] = []
+        for index in range(cell_count):
+            names.append(core_cells.get(index) or f"{rng.choose(FILLER_KINDS)} {index + 1}")
+
+        rooms = {}
+        slack = (cell_size - 5) // 2  # rooms are at least 3 tiles across
+        for index, name in enumerate(names):
+            ox, oy = (index % cols) * cell_size, (index // cols) * cell_size
+            x1 = ox + 1 + rng.randint(0, slack)
+            y1 = oy + 1 + rng.randint(0, slack)
+            x2 = ox + cell_size - 2 - rng.randint(0, slack)
+            y2 = oy + cell_size - 2 - rng.randint(0, slack)
+            rooms[name] = (x1, y1, x2, y2)
+
+        def _interior(name) -> Coord:
+            x1, y1, x2, y2 = rooms[name]
+            return (rng.randint(x1, x2), rng.randint(y1, y2))
+
+        # Adjacent cells are connected rooms; one vent per room, linked the same way
+        vent_at = {name: _interior(name) for name in names}
+        connections: Dict[str, List[str]] = {name: [] for name in names}
+        vent_links: Dict[Coord, List[Coord]] = {vent: [] for vent in vent_at.values()}
+        for index, name in enumerate(names):
+            col, row = index % cols, index // cols
+            for other in ((index + 1) if col + 1 < cols else None,
+                          (index + cols) if row + 1 < rows else None):
+                if other is None:
+                    continue
+                other_name = names[other]
+                connections[name].append(other_name)
+                connections[other_name].append(name)
+                a, b = vent_at[name], vent_at[other_name]
+                if a != b:
+                    vent_links[a].append(b)
+                    vent_links[b].append(a)
+
+        hiding_spots, cameras, motion_sensors = {}, {}, {}
+        for name in names:
+            if rng.random_float() < hiding_chance:
+                hiding_spots[_interior(name)] = {
+                    "room": name,
+                    "cover_bonus": rng.randint(1, 3),
+                    "blocks_los": rng.random_float() < 0.5,
+                    "label": rng.choose(HIDING_LABELS),
+                }
+            if name in CAMERA_ROOMS or rng.random_float() < camera_chance:
+                cameras[_interior(name)] = {
+                    "room": name,
+                    "facing": rng.choose("NSEW"),
+                    "range": 3,
+                    "label": f"{name} camera",
+                }
+            if name in SENSOR_ROOMS or rng.random_float() < sensor_chance:
+                motion_sensors[_interior(name)] = {"room": name, "label": f"{name} motion sensor"}
+
+        return StationLayout(
+            width, height, rooms,
+            vents=set(vent_at.values()),
+            vent_links=vent_links,
+            connections=connections,
+            hiding_spots=hiding_spots,
+            cameras=cameras,
+            motion_sensors=motion_sensors,
+            seed=getattr(rng, "seed", None),
+        )
@@ -3,16 +3,22 @@
 from typing import List, Dict, Tuple, Optional
 from typing import List, Dict, Tuple
 from entities.item import Item
+from entities.map_layers import MapLayers
+from entities.station_layout import StationLayout
 
 
 class StationMap:
     """Represents the Antarctic research station layout.
 
     The station is a 20x20 grid with named rooms. Items can be placed
-    in rooms and crew members navigate between them.
+    in rooms and crew members navigate between them. Larger or generated
+    stations are built from a StationLayout instead of the classic layout.
     """
 
-    def __init__(self, width=20, height=20):
+    def __init__(self, width=20, height=20, layout: Optional[StationLayout] = None):
+        self.layout = layout
+        if layout is not None:
+            width, height = layout.width, layout.height
         self.width = width
         self.height = height
         self.grid = [['.' for _ in range(width)] for _ in range(height)]
@@ -31,42 +37,39 @@ class StationMap:
             "Mess Hall": (5, 0, 9, 4),        # Food and kitchen (north-center)
             "Hangar": (5, 15, 10, 19),        # Helicopter storage (south-center)
         }
+        if layout is not None:
+            self.rooms = dict(layout.rooms)
         # Vent locations (coordinates where a vent exists)
         self.vents = {
             (2, 2), (7, 2), (13, 2), (17, 2), # North vents
             (2, 8), (7, 8), (13, 8), (17, 8), # Central vents
             (2, 17), (7, 17), (13, 17), (17, 17) # South vents
-        }
+        } if layout is None else set(layout.vents)
         self.room_items = {}
-        # Precompute room lookup to avoid repeated room-scan on every query.
-        # Hot paths (rendering, AI movement) call get_room_name thousands of times;
-        # this keeps the lookup O(1) instead of iterating every room definition.
-        self._coord_to_room = self._build_room_lookup()
         # Designated hiding spots with metadata for stealth/combat interactions.
         # Each entry: (x, y): {"room": name, "cover_bonus": int, "blocks_los": bool, "label": str}
         self.hiding_spots = self._build_hiding_spots()
         # Fixed security device placements for cameras and motion sensors
         # Mirrors hiding_spots structure for quick lookup
         self.security_cameras, self.motion_sensors = self._build_security_devices()
+        # Raster layers (room ids, walkability, vents, cover, camera coverage).
+        # Hot paths (rendering, AI movement) call get_room_name thousands of times;
+        # a flat room-id raster keeps that a single index instead of a dict of tuples.
+        self.layers = MapLayers.from_station_map(self)
+        self._corridor_names: Dict[Tuple[int, int], str] = {}
         # Lightweight vent graph for network traversal + entry/exit metadata
         self.vent_graph = self._build_vent_graph()
+        # Bumped whenever walkability changes; pathfinding caches are keyed on it
+        self.topology_revision = 0
 
-    def _build_room_lookup(self):
-        lookup = {}
-        for y in range(self.height):
-            for x in range(self.width):
-                room_name = None
-                for name, (x1, y1, x2, y2) in self.rooms.items():
-                    if x1 <= x <= x2 and y1 <= y <= y2:
-                        room_name = name
-                        break
-                lookup[(x, y)] = room_name or f"Corridor (Sector {x},{y})"
-        return lookup
+    def bump_topology(self):
+        """Invalidate cached paths after editing the grid or room layout."""
+        self.topology_revision += 1
 
     def _build_vent_graph(self):
         """Create vent graph with adjacency and entry/exit classification."""
         # Manually connect vents in a grid-like lattice to avoid pathfinding costs later.
-        neighbors = {
+        neighbors = self.layout.vent_links if self.layout is not None else {
             (2, 2): [(7, 2), (2, 8)],
             (7, 2): [(2, 2), (13, 2), (7, 8)],
             (13, 2): [(7, 2), (17, 2), (13, 8)],
@@ -116,8 +119,17 @@ class StationMap:
         return None
 
     def is_walkable(self, x, y):
-        """Check if a position is within map bounds."""
-        return 0 <= x < self.width and 0 <= y < self.height
+        """Check if a position is within map bounds and not walled off."""
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.layers.walkable[y * self.width + x])
+
+    def set_walkable(self, x: int, y: int, walkable: bool):
+        """Open or wall off a tile; cached paths are invalidated on change."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        i = y * self.width + x
+        if bool(self.layers.walkable[i]) != walkable:
+            self.layers.walkable[i] = 1 if walkable else 0
+            self.bump_topology()
 
     def project_toward(self, start: Tuple[int, int], target: Tuple[int, int],
                        min_distance: int = 3, max_distance: int = 5) -> Optional[Tuple[int, int]]:
@@ -168,9 +180,27 @@ class StationMap:
 
     def get_room_name(self, x, y):
         """Get the name of the room at the given coordinates."""
-        # Fast O(1) lookup using precomputed grid map (see _build_room_lookup).
+        # Fast O(1) lookup in the room-id raster (see MapLayers).
         # Falls back gracefully for out-of-bounds coordinates to preserve behavior.
-        return self._coord_to_room.get((x, y), f"Corridor (Sector {x},{y})")
+        name = self.layers.room_name_at(x, y)
+        if name is not None:
+            return name
+        corridor = self._corridor_names.get((x, y))
+        if corridor is None:
+            corridor = self._corridor_names[(x, y)] = f"Corridor (Sector {x},{y})"
+        return corridor
+
+    def get_rooms_in_radius(self, x: int, y: int, radius: int) -> set:
+        """Names of rooms with any tile within radius of (x, y)."""
+        return self.layers.rooms_in_radius(x, y, radius)
+
+    def get_room_occupancy(self, positions) -> Dict[str, int]:
+        """Count positions per room in one pass (corridors are skipped)."""
+        return self.layers.occupancy_counts(positions)
+
+    def get_visible_tiles(self, x: int, y: int, radius: int) -> set:
+        """Tiles within radius with clear line of sight (LOS-blocking cover is opaque)."""
+        return self.layers.visible_tiles(x, y, radius)
 
     def is_at_vent(self, x, y):
         """Check if there is a vent at the given coordinates."""
@@ -226,6 +256,8 @@ class StationMap:
 
     def get_connections(self, room_name: str) -> List[str]:
         """Get names of rooms connected to the given room."""
+        if self.layout is not None:
+            return list(self.layout.connections.get(room_name, []))
         # Simple adjacency map for the station layout
         connections = {
             "Rec Room": ["Mess Hall", "Infirmary", "Radio Room", "Storage", "Sleeping Quarters", "Lab", "Generator", "Hangar", "Kennel"],
@@ -297,8 +329,9 @@ class StationMap:
         return {
             "width": self.width,
             "height": self.height,
-            "room_items": items_dict
-            # rooms and grid are static/derived, so we don't save them
+            "room_items": items_dict,
+            # The classic layout is static, so only custom/generated layouts are saved
+            **({"layout": self.layout.to_dict()} if self.layout is not None else {})
         }
 
     @classmethod
@@ -310,7 +343,13 @@ class StationMap:
 
         width = data.get("width", 20)
         height = data.get("height", 20)
-        sm = cls(width, height)
+        layout = None
+        if data.get("layout"):
+            try:
+                layout = StationLayout.from_dict(data["layout"])
+            except ValueError as e:
+                print(f"[StationMap] Ignoring invalid saved layout: {e}")
+        sm = cls(width, height, layout=layout)
         
         items_dict = data.get("room_items", {})
         for room, items_data in items_dict.items():
@@ -329,6 +368,8 @@ class StationMap:
         These locations provide defensive bonuses and sometimes block line-of-sight.
         Coordinates are chosen within the existing room rectangles to align with furniture.
         """
+        if self.layout is not None:
+            return dict(self.layout.hiding_spots)
         return {
             (6, 6): {"room": "Rec Room", "cover_bonus": 2, "blocks_los": True, "label": "the rec room booths"},
             (1, 1): {"room": "Infirmary", "cover_bonus": 1, "blocks_los": False, "label": "a medicine cabinet"},
@@ -357,6 +398,8 @@ class StationMap:
         Cameras have: room, facing direction, range
         Motion sensors have: room
         """
+        if self.layout is not None:
+            return dict(self.layout.cameras), dict(self.layout.motion_sensors)
         cameras = {
             (6, 6): {"room": "Rec Room", "facing": "S", "range": 3, "label": "Rec Room camera"},
             (12, 2): {"room": "Radio Room", "facing": "E", "range": 3, "label": "Radio booth camera"},
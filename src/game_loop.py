@@ -1,6 +1,7 @@
 """Main game loop for The Thing game."""
 
 import os
+import sys
 import atexit
 
 # Cross-platform readline support for command history
@@ -332,6 +333,10 @@ def main():
     # Apply saved settings (palette, text speed, audio)
     settings.apply_to_game(game)
 
+    # Animate text effects off the game loop when a player is at the terminal
+    if sys.stdout.isatty():
+        game.crt.start_pipeline()
+
     # Agent 5 Boot Sequence
     game.crt.boot_sequence()
     game.audio.ambient_loop(Sound.THRUM)
@@ -364,7 +369,8 @@ def main():
             break
 
         # Render the current game state
-        _render_game_state(game)
+        with game.crt.frame():
+            _render_game_state(game)
 
         # Get and parse player input
         cmd = _get_player_input(game)
@@ -379,6 +385,7 @@ def main():
         _handle_game_over(game, ending_state.get("result") == "win", ending_state.get("message", "Game Over."))
 
     event_bus.unsubscribe(EventType.ENDING_REPORT, _handle_ending)
+    game.crt.stop_pipeline()
 
 
 def _handle_game_over(game, won, message):
@@ -436,7 +443,7 @@ def _handle_game_over(game, won, message):
 
     game.crt.output("\nPress ENTER to exit...")
     try:
-        input()
+        game.crt.read_line()
     except EOFError:
         pass
 
@@ -490,7 +497,7 @@ def _get_player_input(game):
     """Get and parse player input. Returns command list or None on EOF."""
     try:
         prompt = game.crt.prompt("CMD")
-        user_input = input(prompt).strip()
+        user_input = game.crt.read_line(prompt).strip()
         if not user_input:
             return []
 
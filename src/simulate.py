@@ -0,0 +1,230 @@
+"""
+Headless Simulation Runner
+Plays many seeded games without audio, terminal output, readline or autosave
+and records one outcome row per game, for balance questions such as
+infection spread, lynch-mob frequency and the ending distribution per
+Difficulty.
+
+Every game is a pure function of (seed, difficulty, policy, turns), so any row
+can be replayed exactly. Seeds are spread across a process pool and rows are
+streamed to a columnar file as they complete:
+
+    python src/simulate.py --games 5000 --turns 200 --difficulty HARD --output runs.cols.gz
+"""
+
+import argparse
+import contextlib
+import gzip
+import json
+import os
+import sys
+from multiprocessing import get_context
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from engine import GameState
+from systems.architect import Difficulty
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHARACTERS_PATH = os.path.join(REPO_ROOT, "config", "characters.json")
+
+COLUMNS = (
+    "seed", "difficulty", "policy", "ending", "ending_id", "result",
+    "turns", "deaths", "infections", "initial_infected", "player_alive", "lynch_mob_turns",
+)
+
+DIRECTIONS = ("NORTH", "SOUTH", "EAST", "WEST")
+
+
+# === PLAYER POLICIES ===
+# A policy takes one player action per call. The runner advances the turn
+# itself if the action didn't (blocked moves, free actions).
+
+def idle_policy(game):
+    """Player stands still and lets the station play out."""
+    game.advance_turn()
+
+
+def wander_policy(game):
+    """Player walks in a random direction each turn (drawn from the game RNG)."""
+    _dispatch(game, f"MOVE {game.rng.choose(DIRECTIONS)}")
+
+
+def script_policy(commands: List[str]) -> Callable:
+    """Policy that cycles through a fixed list of player commands."""
+    def policy(game):
+        _dispatch(game, commands[game.turn % len(commands)])
+    return policy
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "wander": wander_policy,
+}
+
+
+def _dispatch(game, command: str):
+    with game.event_bus.activate():
+        game.dispatcher.dispatch(game.context, command)
+
+
+def resolve_policy(name: str, script: Optional[List[str]] = None) -> Callable:
+    if script:
+        return script_policy(script)
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy '{name}' (choose from {', '.join(sorted(POLICIES))})")
+    return POLICIES[name]
+
+
+# === SINGLE GAME ===
+
+def run_game(seed: int, difficulty: Difficulty = Difficulty.NORMAL, policy: str = "idle",
+             turns: int = 200, script: Optional[List[str]] = None) -> Dict:
+    """Play one headless game to an ending or the turn limit; return its outcome row."""
+    # Some systems still print directly; a headless game discards that too
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return _play(seed, difficulty, policy, turns, script)
+
+
+def _play(seed, difficulty, policy, turns, script) -> Dict:
+    game = GameState(seed=seed, difficulty=difficulty, characters_path=CHARACTERS_PATH, headless=True)
+    act = resolve_policy(policy, script)
+    initial_infected = sum(1 for m in game.crew if m.is_infected)
+    lynch_mob_turns = 0
+    try:
+        while not game.game_over and game.turn < turns:
+            turn = game.turn
+            act(game)
+            if game.turn == turn and not game.game_over:
+                game.advance_turn()
+            if game.lynch_mob.active_mob:
+                lynch_mob_turns += 1
+            # Nobody reads the captured terminal output
+            game.crt.buffer.clear()
+
+        ending = game.last_ending_payload or {}
+        return {
+            "seed": seed,
+            "difficulty": difficulty.name,
+            "policy": "script" if script else policy,
+            "ending": ending.get("ending_type", "NONE"),
+            "ending_id": ending.get("ending_id"),
+            "result": ending.get("result", "timeout"),
+            "turns": game.turn,
+            "deaths": sum(1 for m in game.crew if not m.is_alive),
+            "infections": sum(1 for m in game.crew if m.is_infected),
+            "initial_infected": initial_infected,
+            "player_alive": bool(game.player and game.player.is_alive),
+            "lynch_mob_turns": lynch_mob_turns,
+        }
+    finally:
+        game.cleanup()
+
+
+def _run_task(task: Tuple) -> Dict:
+    seed, difficulty_name, policy, turns, script = task
+    return run_game(seed, Difficulty[difficulty_name], policy, turns, script)
+
+
+def simulate(seeds: Iterable[int], difficulty: Difficulty = Difficulty.NORMAL, policy: str = "idle",
+             turns: int = 200, workers: Optional[int] = None, script: Optional[List[str]] = None,
+             chunksize: int = 8) -> Iterator[Dict]:
+    """
+    Yield one outcome row per seed, in seed order.
+
+    workers=1 runs in-process; otherwise games are spread over a process pool
+    (default: one worker per CPU).
+    """
+    resolve_policy(policy, script)  # Fail fast on a bad policy name
+    tasks = ((seed, difficulty.name, policy, turns, script) for seed in seeds)
+    if workers == 1:
+        yield from map(_run_task, tasks)
+        return
+    with get_context("spawn").Pool(processes=workers) as pool:
+        yield from pool.imap(_run_task, tasks, chunksize=chunksize)
+
+
+# === COLUMNAR OUTPUT ===
+
+class ColumnarWriter:
+    """
+    Streams rows to a gzip file as column blocks.
+
+    Each line of the file is one JSON object mapping column -> list of values
+    for up to block_rows rows, so files stay compact and readers can load a
+    single column without materialising row dicts.
+    """
+
+    def __init__(self, path: str, columns: Tuple[str, ...] = COLUMNS, block_rows: int = 1024):
+        self.path = path
+        self.columns = columns
+        self.block_rows = block_rows
+        self.rows_written = 0
+        self._block: Dict[str, List] = {name: [] for name in columns}
+        self._pending = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    def write(self, row: Dict):
+        for name in self.columns:
+            self._block[name].append(row.get(name))
+        self._pending += 1
+        if self._pending >= self.block_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        self._file.write(json.dumps(self._block, separators=(",", ":")) + "\n")
+        self.rows_written += self._pending
+        self._block = {name: [] for name in self.columns}
+        self._pending = 0
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_columns(path: str) -> Dict[str, List]:
+    """Load a ColumnarWriter file back into column -> values."""
+    columns: Dict[str, List] = {}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            for name, values in json.loads(line).items():
+                columns.setdefault(name, []).extend(values)
+    return columns
+
+
+# === CLI ===
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless games for balance analysis.")
+    parser.add_argument("--games", type=int, default=100, help="number of games (seeds) to play")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--turns", type=int, default=200, help="turn limit per game")
+    parser.add_argument("--difficulty", choices=[d.name for d in Difficulty], default="NORMAL")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="idle")
+    parser.add_argument("--script", help="semicolon-separated player commands, e.g. 'MOVE N;HIDE;WAIT'")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--output", default="simulation.cols.gz")
+    args = parser.parse_args(argv)
+
+    script = [cmd.strip() for cmd in args.script.split(";") if cmd.strip()] if args.script else None
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    endings: Dict[str, int] = {}
+    with ColumnarWriter(args.output) as writer:
+        for row in simulate(seeds, Difficulty[args.difficulty], args.policy, args.turns, args.workers, script):
+            writer.write(row)
+            endings[row["ending"]] = endings.get(row["ending"], 0) + 1
+
+    print(f"[Simulate] {writer.rows_written} games -> {args.output}")
+    for ending, count in sorted(endings.items(), key=lambda item: -item[1]):
+        print(f"  {ending:<16} {count:>6}  ({count / max(1, writer.rows_written):.1%})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
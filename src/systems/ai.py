@@ -2,8 +2,10 @@ from typing import TYPE_CHECKING, Tuple, Optional, List, Dict, Any
 from core.resolution import Attribute, Skill
 from core.event_system import event_bus, EventType, GameEvent
 from core.perception import normalize_perception_payload
-from systems.pathfinding import pathfinder
+from systems.pathfinding import pathfinder, router
+from systems.schedule_index import compiled_schedule
 from systems.ai_cache import AICache
+from systems.perception_map import perception_for
 
 if TYPE_CHECKING:
     from engine import GameState, CrewMember, StationMap
@@ -31,6 +33,7 @@ class AISystem:
         self.alert_speed_bonus = 0
         self.alert_context: Dict[str, Any] = {"active": False, "observation_bonus": 0, "speed_multiplier": 1}
         self.alert_speed_bonus = 0
+        self._path_stats_seen = dict(pathfinder.stats)  # For per-turn PATH_CACHE deltas
         event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
         event_bus.subscribe(EventType.PERCEPTION_EVENT, self.on_perception_event)
         self.security_roles = {"commander", "radio op"}
@@ -67,16 +70,17 @@ class AISystem:
         suspicion_delta = payload.get("suspicion_delta", 0)
         
         # Diagnostics
-        event_bus.emit(GameEvent(EventType.DIAGNOSTIC, {
-            "type": "AI_PERCEPTION_HOOK",
-            "room": payload.get("room"),
-            "location": payload.get("location"),
-            "observer": observer.name if hasattr(observer, 'name') else "Unknown",
-            "actor": payload.get("actor"),
-            "outcome": outcome,
-            "severity": payload.get("severity"),
-            "margin": abs(player_successes - opponent_successes)
-        }))
+        if event_bus.is_listening(EventType.DIAGNOSTIC):
+            event_bus.emit(GameEvent(EventType.DIAGNOSTIC, {
+                "type": "AI_PERCEPTION_HOOK",
+                "room": payload.get("room"),
+                "location": payload.get("location"),
+                "observer": observer.name if hasattr(observer, 'name') else "Unknown",
+                "actor": payload.get("actor"),
+                "outcome": outcome,
+                "severity": payload.get("severity"),
+                "margin": abs(player_successes - opponent_successes)
+            }))
         
         # If we have full context, trigger reactions
         if game_state and observer and player:
@@ -617,6 +621,23 @@ class AISystem:
                 "turn": game_state.turn
             }))
 
+        self._emit_path_cache_stats(game_state)
+
+    def _emit_path_cache_stats(self, game_state: 'GameState'):
+        """Report this turn's path cache hits/misses (and process-wide totals)."""
+        stats = dict(pathfinder.stats)
+        previous, self._path_stats_seen = self._path_stats_seen, stats
+        if not event_bus.is_listening(EventType.DIAGNOSTIC):
+            return
+        event_bus.emit(GameEvent(EventType.DIAGNOSTIC, {
+            "type": "PATH_CACHE",
+            "hits": stats["hits"] - previous["hits"],
+            "misses": stats["misses"] - previous["misses"],
+            "total": stats,
+            "size": pathfinder.cache_size(),
+            "turn": game_state.turn
+        }))
+
     def _request_budget(self, amount: int) -> bool:
         """Check if action is within budget. Returns True if allowed."""
         if self.budget_spent + amount <= self.budget_limit:
@@ -760,31 +781,13 @@ class AISystem:
                 return
 
         # 3. Check Schedule
-        # Schedule entries: {"start": 8, "end": 20, "room": "Rec Room"}
-        current_hour = game_state.time_system.hour
-        destination = None
-        for entry in member.schedule:
-            start = entry.get("start", 0)
-            end = entry.get("end", 24)
-            room = entry.get("room")
-
-            # Handle wrap-around schedules (e.g., 20:00 to 08:00)
-            if start < end:
-                if start <= current_hour < end:
-                    destination = room
-                    break
-            else: # Wrap around midnight
-                if current_hour >= start or current_hour < end:
-                    destination = room
-                    break
-
-        if destination:
+        # Compiled hour -> room table; the target tile is precomputed per map
+        target_pos = compiled_schedule(member).target_at(game_state.time_system.hour, game_state.station_map)
+        if target_pos:
             # Move towards destination room
-            target_pos = game_state.station_map.rooms.get(destination)
-            if target_pos:
-                tx, ty, _, _ = target_pos
-                self._pathfind_step(member, tx, ty, game_state, steps=self._get_alert_steps())
-                return
+            tx, ty = target_pos
+            self._pathfind_step(member, tx, ty, game_state, steps=self._get_alert_steps())
+            return
 
         # 4. Idling / Wandering
         if game_state.rng.random_float() < 0.3:
@@ -944,7 +947,7 @@ class AISystem:
         
         # Cornered: In barricaded room with hostile NPCs
         current_room = game_state.station_map.get_room_name(*member.location)
-        if hasattr(game_state, 'room_states') and game_state.room_states.is_barricaded(current_room):
+        if hasattr(game_state, 'room_states') and game_state.room_states.is_entry_blocked(current_room):
             hostile_npcs = [
                 m for m in game_state.crew
                 if m.is_alive and not getattr(m, 'is_infected', False)
@@ -1146,9 +1149,8 @@ class AISystem:
         # Mark member as having sabotaged (for forensics)
         member.add_knowledge_tag(f"Sabotaged:{current_room}")
         
-        event_bus.emit(GameEvent(EventType.SYSTEM_LOG, {
-            "text": f"DEBUG: Infected {member.name} sabotaged {target} in {current_room}"
-        }))
+        event_bus.emit_text(EventType.SYSTEM_LOG, "DEBUG: Infected {} sabotaged {} in {}",
+                            member.name, target, current_room)
 
     def _thing_attack(self, attacker: 'CrewMember', target: 'CrewMember', game_state: 'GameState'):
         """The Thing attacks a human target."""
@@ -1203,14 +1205,13 @@ class AISystem:
         if member == player or not player.is_alive:
             return False
 
-        member_room = game_state.station_map.get_room_name(*member.location)
         player_room = self.cache.player_room if self.cache else game_state.station_map.get_room_name(*player.location)
-        in_vent = getattr(player, "in_vent", False)
-        
-        if member_room != player_room:
-            # Vent noise can carry into rooms that share an entry grate
-            if not (in_vent and game_state.station_map.is_vent_entry(*member.location)):
-                return False
+        in_vent = self.cache.player_in_vent if self.cache else getattr(player, "in_vent", False)
+        perception = self.cache.perception if self.cache else perception_for(game_state)
+
+        # Same room, or vent noise carrying to an entry grate the NPC stands on
+        if not perception.can_perceive(member, player, in_vent):
+            return False
 
         noise = self.cache.player_noise if self.cache else player.get_noise_level()
         if in_vent:
@@ -1218,18 +1219,44 @@ class AISystem:
         alert_system = getattr(game_state, "alert_system", None)
         if alert_system and alert_system.is_active:
             noise += max(0, alert_system.get_observation_bonus() // 2)
-        # Use cached visibility modifier if available
-        vis_mod = self.cache.get_visibility_modifier(player_room, game_state) if self.cache else None
-        
-        # We need a small update to StealthSystem to accept vis_mod, or just pass normal
         alert_bonus = self.alert_context.get("observation_bonus", 0) if self.alert_context else 0
-        detected = stealth.evaluate_detection(member, player, game_state, noise_level=noise, alert_bonus=alert_bonus)
+        # The player's side of the contest is shared by every observer this turn
+        subject_context = None
+        if self.cache and hasattr(stealth, "prepare_subject_context"):
+            subject_context = self.cache.get_player_detection_context(stealth, game_state, noise, alert_bonus)
+        if self.cache and member.name not in self.cache.player_detections:
+            self._batch_player_detection(member, player, game_state, stealth, perception, in_vent, noise,
+                                         alert_bonus, subject_context)
+        detected = self.cache.player_detections.pop(member.name, None) if self.cache else None
+        if detected is None:
+            detected = stealth.evaluate_detection(member, player, game_state, noise_level=noise,
+                                                  alert_bonus=alert_bonus, subject_context=subject_context)
         if detected and hasattr(member, "add_knowledge_tag"):
             member.add_knowledge_tag(f"Spotted {player.name} in {player_room}")
             room = self._record_last_seen(member, player.location, game_state, player_room)
             self._enter_search_mode(member, player.location, room, game_state)
         return detected
 
+    def _batch_player_detection(self, member, player, game_state, stealth, perception, in_vent, noise,
+                                alert_bonus, subject_context):
+        """
+        Roll the first perceiving NPC's detection check together with every other
+        NPC that can perceive the player this turn, in one dice batch.
+
+        Noise and the player's position are fixed for the AI pass, so the later
+        NPCs just read their result from the turn cache when their turn comes.
+        """
+        observers = [member] + [
+            other for other in game_state.crew
+            if other is not member and other is not player and other.is_alive
+            and not getattr(other, "is_revealed", False)
+            and other.name not in self.cache.player_detections
+            and perception.can_perceive(other, player, in_vent)
+        ]
+        results = stealth.evaluate_detection_batch(observers, player, game_state, noise_level=noise,
+                                                   alert_bonus=alert_bonus, subject_context=subject_context)
+        self.cache.player_detections.update(zip((o.name for o in observers), results))
+
     def _pathfind_step(self, member: 'CrewMember', target_x: int, target_y: int, game_state: 'GameState', steps: int = 1):
         """Take one or more steps toward target using A* pathfinding with cache and budget."""
         goal = (target_x, target_y)
@@ -1243,46 +1270,33 @@ class AISystem:
         path = None
         current_path_index = 0
 
-            cost = self.COST_ASTAR if use_astar else self.COST_PATH_CACHE
-
-        # Calculate path once if budget allows
-        cache_key = (member.location, goal)
-        use_astar = True
-        if hasattr(pathfinder, '_path_cache') and cache_key in pathfinder._path_cache:
-            use_astar = False
-
-        cost = self.COST_ASTAR if use_astar else self.COST_PATH_CACHE
-        
-        path = None
-        path_found = False
-
-        # Optimize: Compute path once, then iterate steps
-        if self._request_budget(cost):
-            path = pathfinder.find_path(member.location, goal, station_map, current_turn)
-            path_found = True
+        # Room goals (schedules, gatherings) read a precomputed flow field: O(1) per step
+        field = None
+        if router.is_room_goal(goal, station_map):
+            if self._request_budget(self.COST_PATH_CACHE):
+                room_states = getattr(game_state, 'room_states', None)
+                blocked = room_states.get_blocked_rooms() if room_states else frozenset()
+                field = router.field_for(goal, station_map, blocked)
+        else:
+            # Calculate path once if budget allows
+            use_astar = not pathfinder.is_cached(member.location, goal, station_map)
 
-        for i in range(steps):
-            dx, dy = 0, 0
+            cost = self.COST_ASTAR if use_astar else self.COST_PATH_CACHE
 
-            if path_found:
-                if path and i + 1 < len(path):
-                    next_node = path[i+1]
-                    dx = next_node[0] - member.location[0]
-                    dy = next_node[1] - member.location[1]
-                else:
-                    # Path blocked or ended
-                    break
-            else:
-                # Budget exhausted - fall back to greedy movement (0 cost)
-        if self._request_budget(cost):
-            path = pathfinder.find_path(member.location, goal, station_map, current_turn)
+            if self._request_budget(cost):
+                path = pathfinder.find_path(member.location, goal, station_map, current_turn)
 
         for _ in range(steps):
             dx, dy = 0, 0
 
             # Use path if available
             target_next = None
-            if path and len(path) > current_path_index + 1:
+            if field is not None:
+                target_next = field.next_step(member.location)
+                if target_next:
+                    dx = target_next[0] - member.location[0]
+                    dy = target_next[1] - member.location[1]
+            elif path and len(path) > current_path_index + 1:
                 target_next = path[current_path_index + 1]
                 # Ensure next node is reachable (adjacent)
                 if abs(target_next[0] - member.location[0]) <= 1 and abs(target_next[1] - member.location[1]) <= 1:
@@ -1379,9 +1393,7 @@ class AISystem:
         # Remove the used tripwire
         del game_state.deployed_items[member_pos]
 
-        event_bus.emit(GameEvent(EventType.SYSTEM_LOG, {
-            "text": f"Tripwire triggered and consumed in {room}."
-        }))
+        event_bus.emit_text(EventType.SYSTEM_LOG, "Tripwire triggered and consumed in {}.", room)
 
     def _pursue_player(self, member: 'CrewMember', game_state: 'GameState'):
         """Move one step toward the player when detected via perception."""
@@ -1611,12 +1623,10 @@ class AISystem:
         member.current_search_target = None
         member.search_turns_remaining = self.SEARCH_TURNS
 
-        event_bus.emit(GameEvent(EventType.SYSTEM_LOG, {
-            "text": f"{member.name} is searching around {anchor_room} (Last seen at turn {game_state.turn})."
-        }))
-        event_bus.emit(GameEvent(EventType.MESSAGE, {
-            "text": f"{member.name} starts a thorough sweep of {anchor_room} and adjacent areas!"
-        }))
+        event_bus.emit_text(EventType.SYSTEM_LOG, "{} is searching around {} (Last seen at turn {}).",
+                            member.name, anchor_room, game_state.turn)
+        event_bus.emit_text(EventType.MESSAGE, "{} starts a thorough sweep of {} and adjacent areas!",
+                            member.name, anchor_room)
 
     def _execute_search(self, member: 'CrewMember', game_state: 'GameState') -> bool:
         """Advance the search pattern; returns True if a search action occurred.
@@ -1692,9 +1702,8 @@ class AISystem:
             else:
                 member.search_history = set()  # Clear history for fresh search
 
-            event_bus.emit(GameEvent(EventType.SYSTEM_LOG, {
-                "text": f"{member.name} re-acquired target! Search reset around {anchor_room}."
-            }))
+            event_bus.emit_text(EventType.SYSTEM_LOG, "{} re-acquired target! Search reset around {}.",
+                                member.name, anchor_room)
 
             # Re-initialize search targets around new location
             self._enter_search_mode(member, new_location, anchor_room, game_state)
@@ -1,5 +1,6 @@
 from typing import Dict, Tuple, Optional, Any, TYPE_CHECKING
 from core.resolution import Attribute, Skill
+from systems.perception_map import PerceptionMap
 
 if TYPE_CHECKING:
     from engine import GameState, CrewMember, StationMap
@@ -17,9 +18,23 @@ class AICache:
         if hasattr(game_state, 'player'):
              self.player_noise = game_state.player.get_noise_level()
         
+        self.player_in_vent = getattr(game_state.player, "in_vent", False)
+
         self.power_on = game_state.power_on
         self.room_modifiers: Dict[str, Any] = {}
         self.room_visibility: Dict[str, float] = {}
+        # Perception pre-pass for the turn: sight/hearing geometry and the
+        # player's side of every detection contest (room, darkness,
+        # weather/power modifiers, dice pool). Published on the game state so
+        # missionary witness checks share it.
+        self.perception = PerceptionMap(game_state)
+        try:
+            game_state.perception = self.perception
+        except AttributeError:
+            pass
+        # Player detection results rolled in one batch for every NPC that can
+        # perceive the player, consumed as each NPC takes its turn
+        self.player_detections: Dict[str, bool] = {}
 
     def get_room_modifiers(self, room_name: str, game_state: 'GameState'):
         if room_name not in self.room_modifiers:
@@ -41,3 +56,6 @@ class AICache:
             
             self.room_visibility[room_name] = mod
         return self.room_visibility[room_name]
+
+    def get_player_detection_context(self, stealth, game_state: 'GameState', noise: int, alert_bonus: int = 0) -> dict:
+        return self.perception.subject_context(stealth, game_state.player, game_state, noise, alert_bonus)
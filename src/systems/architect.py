@@ -8,8 +8,9 @@ import random
 import json
 import pickle
 import base64
+from dataclasses import dataclass
 from enum import Enum
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 from core.resolution import ResolutionSystem
 
 
@@ -72,6 +73,36 @@ class DifficultySettings:
         return cls.SETTINGS[difficulty].copy()
 
 
+@dataclass(frozen=True)
+class GameProfile:
+    """
+    Which side channels a GameState wires up.
+
+    audio       - play through the shared audio mixer (otherwise the null backend)
+    terminal    - CRT output prints to stdout (otherwise it is captured)
+    persistence - create the save directory and autosave on turn advance
+    journal     - autosave as a per-turn journal that can be resumed at any turn
+    """
+    audio: bool = True
+    terminal: bool = True
+    persistence: bool = True
+    journal: bool = False
+
+    @classmethod
+    def full(cls) -> "GameProfile":
+        return cls()
+
+    @classmethod
+    def headless(cls) -> "GameProfile":
+        """Simulations, tests and batch tools: no audio, output or saves."""
+        return cls(audio=False, terminal=False, persistence=False)
+
+    @classmethod
+    def server(cls) -> "GameProfile":
+        """Web sessions: the browser plays sound, so the host stays silent."""
+        return cls(audio=False, journal=True)
+
+
 class GameMode(Enum):
     INVESTIGATIVE = "Investigative"
     EMERGENCY = "Emergency"
@@ -81,6 +112,12 @@ class GameMode(Enum):
 
 
 class RandomnessEngine:
+    # randint(1, 6) draws getrandbits(3) - the top 3 bits of one 32-bit Mersenne
+    # word - and rejects 6 and 7. Mapping each word's high byte through these
+    # tables reproduces that sequence for a whole batch of dice at C speed.
+    _FACES = bytes((b >> 5) + 1 if (b >> 5) < 6 else 0 for b in range(256))
+    _REJECTED = bytes(b for b in range(256) if (b >> 5) >= 6)
+
     def __init__(self, seed=None):
         self.seed = seed
         self._random = random.Random(self.seed)
@@ -98,12 +135,26 @@ class RandomnessEngine:
     def sample(self, population, k):
         return self._random.sample(population, k)
         
+    def _roll_faces(self, count):
+        """
+        Roll `count` d6 as a bytes object of faces (1-6).
+
+        Consumes the generator exactly like `count` roll_d6() calls, so batched
+        and one-at-a-time checks replay identically from a saved state.
+        """
+        faces = b""
+        while len(faces) < count:
+            needed = count - len(faces)
+            words = self._random.getrandbits(32 * needed).to_bytes(4 * needed, "little")
+            faces += words[3::4].translate(self._FACES, self._REJECTED)
+        return faces
+
     def calculate_success(self, pool_size):
         """
         Executes a dice pool check.
         Success = 6s.
         """
-        dice = [self.roll_d6() for _ in range(pool_size)]
+        dice = list(self._roll_faces(pool_size))
         successes = dice.count(6)
         return {
             "success": successes > 0,
@@ -112,6 +163,22 @@ class RandomnessEngine:
             "dice_count": pool_size
         }
 
+    def calculate_success_batch(self, pool_sizes):
+        """
+        Resolve many dice pools in one draw.
+
+        Returns the success count (6s) for each pool, in order. The result is
+        identical to calling calculate_success() on each pool in turn.
+        """
+        pools = [max(0, int(size)) for size in pool_sizes]
+        faces = self._roll_faces(sum(pools))
+        counts = []
+        start = 0
+        for size in pools:
+            counts.append(faces.count(6, start, start + size))
+            start += size
+        return counts
+
     def choose(self, collection):
         if not collection:
             return None
@@ -167,7 +234,7 @@ class TimeSystem:
         self.turn_count = 0
         self.start_hour = start_hour
         # Subscribe to turn advances
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.CLOCK)
 
     def cleanup(self):
         event_bus.unsubscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
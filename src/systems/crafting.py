@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from core.config_cache import load_json
 from core.event_system import event_bus, EventType, GameEvent
 from core.resolution import Skill
 from entities.item import Item
@@ -28,10 +28,9 @@ class CraftingSystem:
         if not self.data_path.exists():
             return
         try:
-            with open(self.data_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                recipes_list = data.get("recipes", [])
-                self.recipes = {r["id"]: r for r in recipes_list}
+            data = load_json(self.data_path)
+            recipes_list = data.get("recipes", [])
+            self.recipes = {r["id"]: r for r in recipes_list}
         except Exception as e:
             print(f"Error loading crafting recipes: {e}")
 
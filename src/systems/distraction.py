@@ -6,6 +6,7 @@ high-noise PERCEPTION_EVENTs that pull NPC investigation.
 
 from typing import Tuple, TYPE_CHECKING, List, Optional
 from core.event_system import event_bus, EventType, GameEvent
+from systems.spatial_index import crew_index
 
 if TYPE_CHECKING:
     from engine import GameState
@@ -189,12 +190,9 @@ class DistractionSystem:
         hearing_range = noise_level + 2
         room = station_map.get_room_name(*location)
 
-        for npc in game_state.crew:
+        for npc in crew_index(game_state).within(location, hearing_range):
             if npc == game_state.player or not npc.is_alive:
                 continue
-            dist = abs(npc.location[0] - location[0]) + abs(npc.location[1] - location[1])
-            if dist > hearing_range:
-                continue
             heard.append(npc.name)
             self._flag_investigation(npc, location, room, game_state)
             
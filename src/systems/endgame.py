@@ -1,7 +1,7 @@
 from typing import Optional, Dict, Any
 
 from core.design_briefs import DesignBriefRegistry
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 
 
 class EndgameSystem:
@@ -18,7 +18,7 @@ class EndgameSystem:
         self.resolved = False
         
         # Subscribe to triggers
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.OUTCOME)
         event_bus.subscribe(EventType.CREW_DEATH, self.on_crew_death)
         event_bus.subscribe(EventType.HELICOPTER_REPAIRED, self.on_helicopter_repaired)
         event_bus.subscribe(EventType.SOS_EMITTED, self.on_sos_emitted)
@@ -6,7 +6,7 @@ describing the combined impact of environmental conditions.
 """
 
 from typing import Optional, Dict
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 from systems.environmental_contract import (
     EnvironmentalSnapshot, EnvironmentalThresholds, EnvironmentalEffects,
     TemperatureLevel, VisibilityLevel
@@ -38,7 +38,7 @@ class EnvironmentalCoordinator:
         self.max_history = 100
         
         # Subscribe to events
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.ENVIRONMENT)
         event_bus.subscribe(EventType.POWER_FAILURE, self.on_power_failure)
     
     def cleanup(self):
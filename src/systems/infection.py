@@ -1,5 +1,6 @@
 from core.event_system import EventType, GameEvent, event_bus
 from core.resolution import ResolutionSystem
+from systems.spatial_index import crew_index
 
 def check_for_communion(game_state):
     """
@@ -11,15 +12,16 @@ def check_for_communion(game_state):
     - 50% chance per turn if POWER is OFF (Dark).
     """
     
-    # 1. Group crew by location
+    # 1. Group crew by location (tile buckets from the spatial index,
+    # visited in crew order so dice are rolled in a stable order)
+    index = crew_index(game_state)
     location_groups = {}
     for member in game_state.crew:
         if not member.is_alive:
             continue
-        loc = member.location
+        loc = tuple(member.location)
         if loc not in location_groups:
-            location_groups[loc] = []
-        location_groups[loc].append(member)
+            location_groups[loc] = [m for m in index.at(loc) if m.is_alive]
     
     # Instantiate ResolutionSystem once
     res = ResolutionSystem()
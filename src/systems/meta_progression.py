@@ -10,6 +10,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from core.event_system import event_bus, EventType, GameEvent
+from systems.profile_store import profile_store, merge_counters
 
 
 # Meta progress file location
@@ -49,19 +50,30 @@ class MetaProgressionSystem:
     Roles are unlocked by accumulating lifetime statistics across multiple
     game sessions. Once unlocked, roles can be selected at game start to
     provide permanent bonuses.
+
+    Progress lives in the shared profile store: counter changes only mark it
+    dirty, and the file is written in batches or when a game ends. Writes merge
+    this instance's changes into the file, so several instances (or server
+    shards) sharing it all keep their counts. Unlock conditions are indexed by
+    stat, so a change re-checks only the roles that watch that stat.
     """
     
-    def __init__(self, progress_file: str = None, unlockables_file: str = None):
+    def __init__(self, progress_file: str = None, unlockables_file: str = None, store=None):
         self.progress_file = progress_file or META_PROGRESS_FILE
         self.unlockables_file = unlockables_file or UNLOCKABLES_FILE
+        self._store = store or profile_store
         
         self.stats = LifetimeStats()
         self.unlocked_roles: Dict[str, UnlockedRole] = {}
         self.selected_role: Optional[str] = None
         self.role_definitions: Dict[str, dict] = {}
+        # stat name -> [(threshold, role_id)] for roles still locked, lowest threshold first
+        self._pending_unlocks: Dict[str, List[tuple]] = {}
         
         self._load_role_definitions()
         self._load_progress()
+        self._index_unlocks()
+        self._store_token = self._store.register(self.progress_file, self.to_dict, merge=self.merge_progress)
         self._subscribe_events()
     
     def _subscribe_events(self):
@@ -71,14 +83,17 @@ class MetaProgressionSystem:
         event_bus.subscribe(EventType.ENDING_REPORT, self._on_ending)
         event_bus.subscribe(EventType.REPAIR_COMPLETE, self._on_repair)
         event_bus.subscribe(EventType.TURN_ADVANCE, self._on_turn)
+        event_bus.subscribe(EventType.META_UNLOCK, self._on_unlock)
     
     def cleanup(self):
-        """Unsubscribe from events."""
+        """Unsubscribe from events and write any unsaved progress."""
         event_bus.unsubscribe(EventType.COMBAT_LOG, self._on_combat)
         event_bus.unsubscribe(EventType.TEST_RESULT, self._on_blood_test)
         event_bus.unsubscribe(EventType.ENDING_REPORT, self._on_ending)
         event_bus.unsubscribe(EventType.REPAIR_COMPLETE, self._on_repair)
         event_bus.unsubscribe(EventType.TURN_ADVANCE, self._on_turn)
+        event_bus.unsubscribe(EventType.META_UNLOCK, self._on_unlock)
+        self._store.unregister(self.progress_file, self._store_token)
     
     def _load_role_definitions(self):
         """Load role definitions from unlockables.json."""
@@ -94,58 +109,79 @@ class MetaProgressionSystem:
     def _load_progress(self):
         """Load meta-progression data from file."""
         try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r') as f:
-                    data = json.load(f)
-                    
-                    # Load lifetime stats
-                    stats_data = data.get("stats", {})
-                    self.stats = LifetimeStats(
-                        games_won=stats_data.get("games_won", 0),
-                        games_lost=stats_data.get("games_lost", 0),
-                        things_killed=stats_data.get("things_killed", 0),
-                        crew_members_saved=stats_data.get("crew_members_saved", 0),
-                        blood_tests_performed=stats_data.get("blood_tests_performed", 0),
-                        systems_repaired=stats_data.get("systems_repaired", 0),
-                        total_turns_survived=stats_data.get("total_turns_survived", 0),
-                        endings_achieved=stats_data.get("endings_achieved", {}),
-                        first_played=stats_data.get("first_played", ""),
-                        last_played=stats_data.get("last_played", "")
+            data = self._store.load(self.progress_file)
+            if data:
+                # Load lifetime stats
+                stats_data = data.get("stats", {})
+                self.stats = LifetimeStats(
+                    games_won=stats_data.get("games_won", 0),
+                    games_lost=stats_data.get("games_lost", 0),
+                    things_killed=stats_data.get("things_killed", 0),
+                    crew_members_saved=stats_data.get("crew_members_saved", 0),
+                    blood_tests_performed=stats_data.get("blood_tests_performed", 0),
+                    systems_repaired=stats_data.get("systems_repaired", 0),
+                    total_turns_survived=stats_data.get("total_turns_survived", 0),
+                    endings_achieved=dict(stats_data.get("endings_achieved", {})),
+                    first_played=stats_data.get("first_played", ""),
+                    last_played=stats_data.get("last_played", "")
+                )
+                
+                # Load unlocked roles
+                for role_id, role_data in data.get("unlocked_roles", {}).items():
+                    self.unlocked_roles[role_id] = UnlockedRole(
+                        role_id=role_id,
+                        name=role_data.get("name", role_id),
+                        description=role_data.get("description", ""),
+                        bonuses=dict(role_data.get("bonuses", {})),
+                        unlocked_at=role_data.get("unlocked_at", "")
                     )
-                    
-                    # Load unlocked roles
-                    for role_id, role_data in data.get("unlocked_roles", {}).items():
-                        self.unlocked_roles[role_id] = UnlockedRole(
-                            role_id=role_id,
-                            name=role_data.get("name", role_id),
-                            description=role_data.get("description", ""),
-                            bonuses=role_data.get("bonuses", {}),
-                            unlocked_at=role_data.get("unlocked_at", "")
-                        )
-                    
-                    self.selected_role = data.get("selected_role")
+                
+                self.selected_role = data.get("selected_role")
         except (IOError, json.JSONDecodeError) as e:
             print(f"Warning: Could not load meta progress: {e}")
     
+    def to_dict(self) -> dict:
+        """Serializable meta-progression data (the progress file contents)."""
+        return {
+            "stats": asdict(self.stats),
+            "unlocked_roles": {
+                role_id: asdict(role) 
+                for role_id, role in self.unlocked_roles.items()
+            },
+            "selected_role": self.selected_role
+        }
+    
+    @staticmethod
+    def merge_progress(base: dict, ours: dict, theirs: dict) -> dict:
+        """
+        Fold this instance's changes since ``base`` into the progress file ``theirs``.
+
+        Lifetime counters add our delta, unlocked roles are the union of both
+        sides, and a role selection only overrides the file if we changed it.
+        """
+        merged = dict(theirs)
+        stats = merge_counters(base.get("stats", {}), ours.get("stats", {}), theirs.get("stats", {}))
+        played = [ours["stats"].get("first_played"), theirs.get("stats", {}).get("first_played")]
+        stats["first_played"] = min((p for p in played if p), default="")
+        stats["last_played"] = max(ours["stats"].get("last_played", ""),
+                                   theirs.get("stats", {}).get("last_played", ""))
+        merged["stats"] = stats
+        roles = dict(theirs.get("unlocked_roles", {}))
+        for role_id, role in ours.get("unlocked_roles", {}).items():
+            roles.setdefault(role_id, role)
+        merged["unlocked_roles"] = roles
+        if ours.get("selected_role") != base.get("selected_role") or "selected_role" not in theirs:
+            merged["selected_role"] = ours.get("selected_role")
+        return merged
+
     def save(self):
-        """Save meta-progression data to file."""
-        try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.progress_file), exist_ok=True)
-            
-            data = {
-                "stats": asdict(self.stats),
-                "unlocked_roles": {
-                    role_id: asdict(role) 
-                    for role_id, role in self.unlocked_roles.items()
-                },
-                "selected_role": self.selected_role
-            }
-            
-            with open(self.progress_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
-            print(f"Warning: Could not save meta progress: {e}")
+        """Save meta-progression data to file now."""
+        self._store.mark_dirty(self.progress_file, self._store_token)
+        self._store.flush(self.progress_file)
+    
+    def _mark_dirty(self):
+        """Queue progress for the store's next batched write."""
+        self._store.mark_dirty(self.progress_file, self._store_token)
     
     def _on_combat(self, event: GameEvent):
         """Track Things killed from combat events."""
@@ -157,22 +193,26 @@ class MetaProgressionSystem:
             is_thing = event.payload.get("target_was_thing", False)
             if is_thing:
                 self.stats.things_killed += 1
-                self._check_unlocks()
+                self._mark_dirty()
+                self._check_unlocks("things_killed")
     
     def _on_blood_test(self, event: GameEvent):
         """Track blood tests performed."""
         self.stats.blood_tests_performed += 1
-        self._check_unlocks()
+        self._mark_dirty()
+        self._check_unlocks("blood_tests_performed")
     
     def _on_repair(self, event: GameEvent):
         """Track systems repaired."""
         self.stats.systems_repaired += 1
-        self._check_unlocks()
+        self._mark_dirty()
+        self._check_unlocks("systems_repaired")
     
     def _on_turn(self, event: GameEvent):
         """Track turns survived."""
         self.stats.total_turns_survived += 1
-        self._check_unlocks()
+        self._mark_dirty()
+        self._check_unlocks("total_turns_survived")
     
     def _on_ending(self, event: GameEvent):
         """Track game endings and wins/losses."""
@@ -199,11 +239,29 @@ class MetaProgressionSystem:
         if not self.stats.first_played:
             self.stats.first_played = now
         
-        self._check_unlocks()
+        self._check_unlocks("games_won", "games_lost", "crew_members_saved")
+        # Session end: write now rather than waiting for the batch timer
         self.save()
     
-    def _check_unlocks(self):
-        """Check if any new roles should be unlocked."""
+    def _on_unlock(self, event: GameEvent):
+        """Record roles unlocked elsewhere (another instance or server shard)."""
+        role_id = event.payload.get("role_id")
+        role_def = self.role_definitions.get(role_id)
+        if role_def is None or role_id in self.unlocked_roles:
+            return
+        self.unlocked_roles[role_id] = UnlockedRole(
+            role_id=role_id,
+            name=role_def.get("name", role_id),
+            description=role_def.get("description", ""),
+            bonuses=role_def.get("bonuses", {}),
+            unlocked_at=event.payload.get("unlocked_at", "")
+        )
+        for pending in self._pending_unlocks.values():
+            pending[:] = [entry for entry in pending if entry[1] != role_id]
+    
+    def _index_unlocks(self):
+        """Group locked roles by the stat their unlock condition watches."""
+        self._pending_unlocks = {}
         for role_id, role_def in self.role_definitions.items():
             # Skip already unlocked or default role
             if role_id in self.unlocked_roles or role_id == "default":
@@ -213,36 +271,49 @@ class MetaProgressionSystem:
             if not condition:
                 continue
             
-            stat_name = condition.get("stat")
-            threshold = condition.get("threshold", 0)
+            self._pending_unlocks.setdefault(condition.get("stat"), []).append(
+                (condition.get("threshold", 0), role_id))
+        for pending in self._pending_unlocks.values():
+            pending.sort(key=lambda entry: entry[0])
+    
+    def _check_unlocks(self, *stat_names: str):
+        """Check if any new roles should be unlocked (only those watching ``stat_names``, if given)."""
+        for stat_name in stat_names or list(self._pending_unlocks):
+            pending = self._pending_unlocks.get(stat_name)
+            if not pending:
+                continue
             
             # Get current stat value
             current_value = getattr(self.stats, stat_name, 0)
             
-            if current_value >= threshold:
-                self._unlock_role(role_id, role_def)
+            while pending and current_value >= pending[0][0]:
+                _, role_id = pending.pop(0)
+                if role_id not in self.unlocked_roles:
+                    self._unlock_role(role_id, self.role_definitions[role_id])
     
     def _unlock_role(self, role_id: str, role_def: dict):
         """Unlock a new role."""
-        self.unlocked_roles[role_id] = UnlockedRole(
+        role = UnlockedRole(
             role_id=role_id,
             name=role_def.get("name", role_id),
             description=role_def.get("description", ""),
             bonuses=role_def.get("bonuses", {}),
             unlocked_at=datetime.now().isoformat()
         )
+        self.unlocked_roles[role_id] = role
         
         # Emit unlock event
         event_bus.emit(GameEvent(
             EventType.META_UNLOCK,
             payload={
                 "role_id": role_id,
-                "role_name": role_def.get("name", role_id),
-                "description": role_def.get("description", "")
+                "role_name": role.name,
+                "description": role.description,
+                "unlocked_at": role.unlocked_at
             }
         ))
         
-        self.save()
+        self._mark_dirty()
         print(f"[META] Unlocked role: {role_def.get('name', role_id)}!")
     
     def select_role(self, role_id: str) -> bool:
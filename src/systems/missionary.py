@@ -1,6 +1,8 @@
 import random
 from core.logger import hidden_logger
 from core.event_system import event_bus, EventType, GameEvent
+from systems.perception_map import perception_for
+from systems.spatial_index import crew_index
 
 class MissionarySystem:
     ROLE_HABITATS = {
@@ -267,9 +269,8 @@ class MissionarySystem:
         """
         Checks for any uninfected crew members who can see the agent.
         """
-        CORRIDOR_VISUAL_RANGE = 5
-
-        for other in game_state.crew:
+        # The turn's perception map already knows who has line of sight to the tile
+        for other in perception_for(game_state).witnesses(agent.location, game_state):
             if other == agent or other == target or not other.is_alive:
                 continue
 
@@ -277,8 +278,7 @@ class MissionarySystem:
             if other.is_infected:
                 continue
 
-            if self.is_visible(agent.location, other.location, game_state.station_map):
-                return True
+            return True
         return False
 
     def is_visible(self, loc1, loc2, station_map):
@@ -394,13 +394,10 @@ class MissionarySystem:
     def has_witnesses_in_room(self, agent, game_state):
         """Check if there are any human witnesses in the same room."""
         room_name = game_state.station_map.get_room_name(*agent.location)
-        
-        for other in game_state.crew:
+
+        for other in crew_index(game_state).in_room(room_name):
             if other == agent or not other.is_alive or other.is_infected:
                 continue
-                
-            other_room = game_state.station_map.get_room_name(*other.location)
-            if other_room == room_name:
-                return True
-                
+            return True
+
         return False
@@ -1,7 +1,10 @@
 """A* Pathfinding system for NPC navigation."""
 
 import heapq
-from typing import List, Tuple, Optional, Dict
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, List, Tuple, Optional, Dict
 
 # Pre-computed neighbor constants to avoid allocation in loops
 # Format: (dx, dy, cost)
@@ -13,20 +16,66 @@ NEIGHBORS = (
 # Heuristic weight for tie-breaking
 HEURISTIC_WEIGHT = 0.41421356
 
+# Cached paths kept per station map before least-recently-used ones are dropped
+PATH_CACHE_SIZE = 4096
+
+
+def _walkable_mask(station_map):
+    """Row-major walkability raster of a map, or None when it has no layers."""
+    layers = getattr(station_map, "layers", None)
+    return getattr(layers, "walkable", None)
+
+
+class _MapPathCache:
+    """LRU of (start, goal) -> path for one station map at one topology revision."""
+
+    __slots__ = ('revision', 'paths')
+
+    def __init__(self, revision):
+        self.revision = revision
+        self.paths: "OrderedDict[Tuple[Tuple[int, int], Tuple[int, int]], List[Tuple[int, int]]]" = OrderedDict()
+
+
 class PathfindingSystem:
     """A* pathfinding for NPC navigation in the station.
 
-    Provides efficient path calculation with optional caching to avoid
-    recalculating paths every turn.
+    Paths are cached across turns, per station map, and only invalidated when
+    that map's topology revision changes (walls, room layout). A* reads nothing
+    but walkability; room states such as barricades are checked by the mover
+    when it steps, so they never invalidate the cache. NPCs walking the same
+    schedule routes every game-hour hit the cache.
     """
 
-    def __init__(self):
-        self._path_cache: Dict[Tuple[Tuple[int, int], Tuple[int, int]], List[Tuple[int, int]]] = {}
-        self._cache_turn = -1
+    def __init__(self, max_cache_size: int = PATH_CACHE_SIZE):
+        self.max_cache_size = max_cache_size
+        self._caches: "weakref.WeakKeyDictionary[Any, _MapPathCache]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
 
     def clear_cache(self):
-        """Clear the path cache. Call when map state changes (barricades, etc)."""
-        self._path_cache.clear()
+        """Drop every cached path (tests, or map edits outside the revision counters)."""
+        with self._lock:
+            self._caches = weakref.WeakKeyDictionary()
+
+    def _cache_for(self, station_map, revision) -> _MapPathCache:
+        cache = self._caches.get(station_map)
+        if cache is None or cache.revision != revision:
+            if cache is not None:
+                self.stats["invalidations"] += 1
+            cache = _MapPathCache(revision)
+            self._caches[station_map] = cache
+        return cache
+
+    def is_cached(self, start: Tuple[int, int], goal: Tuple[int, int], station_map) -> bool:
+        """True if find_path would be answered from the cache."""
+        revision = getattr(station_map, 'topology_revision', 0)
+        with self._lock:
+            cache = self._caches.get(station_map)
+            return cache is not None and cache.revision == revision and (start, goal) in cache.paths
+
+    def cache_size(self) -> int:
+        with self._lock:
+            return sum(len(cache.paths) for cache in self._caches.values())
 
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int],
                   station_map, current_turn: int = 0) -> Optional[List[Tuple[int, int]]]:
@@ -36,27 +85,35 @@ class PathfindingSystem:
             start: Starting (x, y) position
             goal: Target (x, y) position
             station_map: StationMap instance for walkability checks
-            current_turn: Current game turn for cache invalidation
+            current_turn: Unused; paths are invalidated by the map's topology_revision
 
         Returns:
             List of (x, y) positions from start to goal, or None if no path exists
         """
-        # Invalidate cache on new turn
-        if current_turn != self._cache_turn:
-            self.clear_cache()
-            self._cache_turn = current_turn
+        revision = getattr(station_map, 'topology_revision', 0)
+        cache_key = (start, goal)
 
         # Check cache
-        cache_key = (start, goal)
-        if cache_key in self._path_cache:
-            return self._path_cache[cache_key]
+        with self._lock:
+            cache = self._cache_for(station_map, revision)
+            path = cache.paths.get(cache_key)
+            if path is not None:
+                cache.paths.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                return path
+            self.stats["misses"] += 1
 
         # A* implementation
         path = self._astar(start, goal, station_map)
 
         # Cache result
         if path:
-            self._path_cache[cache_key] = path
+            with self._lock:
+                cache = self._cache_for(station_map, revision)
+                cache.paths[cache_key] = path
+                if len(cache.paths) > self.max_cache_size:
+                    cache.paths.popitem(last=False)
+                    self.stats["evictions"] += 1
 
         return path
 
@@ -132,6 +189,8 @@ class PathfindingSystem:
         # Cache map dimensions for faster bounds checking
         map_width = station_map.width
         map_height = station_map.height
+        # Walkability raster (None for maps without layers: everything in bounds is open)
+        walkable = _walkable_mask(station_map)
         # Localize globals for speed in loop
         heappush = heapq.heappush
         heappop = heapq.heappop
@@ -157,6 +216,8 @@ class PathfindingSystem:
                 # Inline is_walkable check
                 if not (0 <= nx < map_width and 0 <= ny < map_height):
                     continue
+                if walkable is not None and not walkable[ny * map_width + nx]:
+                    continue
 
                 neighbor = (nx, ny)
                 tentative_g = current_g + cost
@@ -219,5 +280,194 @@ class PathfindingSystem:
         return path
 
 
+class FlowField:
+    """Next-hop and distance toward one goal for every tile of a map.
+
+    Built with a single Dijkstra pass outward from the goal, so looking up an
+    NPC's next step is an O(1) index instead of a heap search.
+    """
+
+    __slots__ = ('goal', 'goal_room', 'width', 'height', 'blocked_rooms', 'revision', 'next_hop', 'distance')
+
+    def __init__(self, goal: Tuple[int, int], station_map, blocked_rooms: frozenset = frozenset()):
+        self.goal = goal
+        self.goal_room = station_map.get_room_name(*goal)
+        self.width = station_map.width
+        self.height = station_map.height
+        # Tiles inside blocked rooms (other than the goal's own room) are never
+        # routed *through*; NPCs standing at their edge still get a way out.
+        self.blocked_rooms = frozenset(blocked_rooms) - {self.goal_room}
+        # Walls and room layout the field was built against
+        self.revision = getattr(station_map, 'topology_revision', 0)
+        size = self.width * self.height
+        # Flat arrays indexed y * width + x; -1 = no route
+        self.next_hop: List[int] = [-1] * size
+        self.distance: List[float] = [float('inf')] * size
+        self._build(station_map)
+
+    def _build(self, station_map):
+        width, height = self.width, self.height
+        goal_x, goal_y = self.goal
+        if not (0 <= goal_x < width and 0 <= goal_y < height):
+            return
+        goal_index = goal_y * width + goal_x
+        self.distance[goal_index] = 0.0
+        self._relax(station_map, [(0.0, goal_index)])
+
+    def _relax(self, station_map, open_set: List[Tuple[float, int]]):
+        """Dijkstra outward from open_set, only ever shortening recorded distances."""
+        width, height = self.width, self.height
+        goal_index = self.goal[1] * width + self.goal[0]
+        blocked = self.blocked_rooms
+        get_room_name = station_map.get_room_name
+        walkable = _walkable_mask(station_map)
+
+        distance = self.distance
+        next_hop = self.next_hop
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while open_set:
+            current_dist, current = heappop(open_set)
+            if current_dist > distance[current]:
+                continue
+            cx, cy = current % width, current // width
+            if blocked and current != goal_index and get_room_name(cx, cy) in blocked:
+                continue
+            for dx, dy, cost in NEIGHBORS:
+                nx, ny = cx + dx, cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = ny * width + nx
+                if walkable is not None and not walkable[neighbor]:
+                    continue
+                candidate = current_dist + cost
+                if candidate < distance[neighbor]:
+                    distance[neighbor] = candidate
+                    next_hop[neighbor] = current
+                    heappush(open_set, (candidate, neighbor))
+
+    def _room_tiles(self, station_map, room_names) -> List[int]:
+        """Flat indices of the tiles belonging to room_names."""
+        rooms = getattr(station_map, 'rooms', {})
+        tiles = []
+        for name in room_names:
+            bounds = rooms.get(name)
+            if not bounds:
+                continue
+            x1, y1, x2, y2 = bounds[:4]
+            for y in range(max(0, y1), min(self.height - 1, y2) + 1):
+                for x in range(max(0, x1), min(self.width - 1, x2) + 1):
+                    if station_map.get_room_name(x, y) == name:
+                        tiles.append(y * self.width + x)
+        return tiles
+
+    def rebase(self, station_map, blocked_rooms: frozenset) -> bool:
+        """
+        Adapt the field in place to a new set of blocked rooms.
+
+        Reopened rooms are relaxed outward from their own tiles. A newly blocked
+        room is free if no route passed through it; otherwise returns False and
+        the field must be rebuilt.
+        """
+        blocked_rooms = frozenset(blocked_rooms) - {self.goal_room}
+        closed = blocked_rooms - self.blocked_rooms
+        opened = self.blocked_rooms - blocked_rooms
+        if closed:
+            hops = set(self.next_hop)
+            if any(index in hops for index in self._room_tiles(station_map, closed)):
+                return False
+        self.blocked_rooms = blocked_rooms
+        if opened:
+            distance = self.distance
+            seeds = [(distance[index], index) for index in self._room_tiles(station_map, opened)
+                     if distance[index] != float('inf')]
+            heapq.heapify(seeds)
+            self._relax(station_map, seeds)
+        return True
+
+    def next_step(self, position: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Adjacent tile to move to from position, or None (at goal / unreachable)."""
+        x, y = position
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        hop = self.next_hop[y * self.width + x]
+        if hop < 0:
+            return None
+        return (hop % self.width, hop // self.width)
+
+    def distance_from(self, position: Tuple[int, int]) -> float:
+        x, y = position
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return float('inf')
+        return self.distance[y * self.width + x]
+
+
+class _MapRoutes:
+    """Flow fields for one station map's room goals."""
+
+    __slots__ = ('room_goals', 'fields', 'revision')
+
+    def __init__(self, station_map):
+        self.revision = getattr(station_map, 'topology_revision', 0)
+        rooms = getattr(station_map, 'rooms', None)
+        self.room_goals = frozenset(bounds[:2] for bounds in rooms.values()) if isinstance(rooms, dict) else frozenset()
+        self.fields: Dict[Tuple[int, int], FlowField] = {}
+
+
+class FlowFieldRouter:
+    """All-pairs room routing: one flow field per room goal, per station map.
+
+    Schedule movement targets room origins, so a handful of fields answer
+    almost every NPC step. Fields are built lazily and thrown away only when the
+    map's topology_revision moves (walls, room layout). When the set of
+    barricaded rooms changes, existing fields are rebased in place (see
+    FlowField.rebase) and only rebuilt if a new barricade cuts a route they
+    use; other room states and barricades on the goal's own room leave them
+    untouched.
+    """
+
+    def __init__(self):
+        self._routes: "weakref.WeakKeyDictionary[Any, _MapRoutes]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.stats = {"builds": 0, "hits": 0, "rebases": 0}
+
+    def _routes_for(self, station_map) -> _MapRoutes:
+        routes = self._routes.get(station_map)
+        if routes is None or routes.revision != getattr(station_map, 'topology_revision', 0):
+            routes = _MapRoutes(station_map)
+            self._routes[station_map] = routes
+        return routes
+
+    def is_room_goal(self, goal: Tuple[int, int], station_map) -> bool:
+        with self._lock:
+            return goal in self._routes_for(station_map).room_goals
+
+    def field_for(self, goal: Tuple[int, int], station_map,
+                  blocked_rooms: frozenset = frozenset()) -> FlowField:
+        """Flow field toward goal, adapted to the blocked rooms (rebuilt if the map topology changed)."""
+        blocked_rooms = frozenset(blocked_rooms)
+        with self._lock:
+            routes = self._routes_for(station_map)
+            field = routes.fields.get(goal)
+            if field is not None:
+                if field.blocked_rooms == blocked_rooms - {field.goal_room}:
+                    self.stats["hits"] += 1
+                    return field
+                if field.rebase(station_map, blocked_rooms):
+                    self.stats["rebases"] += 1
+                    return field
+            field = FlowField(goal, station_map, blocked_rooms)
+            routes.fields[goal] = field
+            self.stats["builds"] += 1
+            return field
+
+    def clear(self):
+        with self._lock:
+            self._routes = weakref.WeakKeyDictionary()
+
+
 # Global pathfinding instance for shared use
 pathfinder = PathfindingSystem()
+# Global room-goal router (flow fields) for schedule movement
+router = FlowFieldRouter()
@@ -0,0 +1,116 @@
+"""
+Perception Map
+Per-turn "who can see or hear what?" shared by the AI, the missionary witness
+checks and stealth contests.
+
+Built once per turn (AICache owns the AI's copy; ``perception_for`` hands the
+same map to every other system). Geometry is resolved once per tile: a tile in
+a named room sees that whole room, a corridor tile sees corridor tiles within
+CORRIDOR_SIGHT, and a vent entry grate hears whatever moves in the ducts. The
+observer-independent half of a stealth contest (darkness, frost, power and
+weather modifiers, the subject's dice pool) is cached per subject. Observers
+are looked up through the crew spatial index, so an NPC that moves during the
+AI update is seen where it now stands.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from systems.spatial_index import crew_index
+
+Coord = Tuple[int, int]
+
+CORRIDOR_SIGHT = 5  # Euclidean tiles visible along open corridors
+
+
+class PerceptionMap:
+    """One turn's sight and hearing lookups for a game."""
+
+    def __init__(self, game_state):
+        self.turn = getattr(game_state, "turn", 0)
+        self.power_on = getattr(game_state, "power_on", True)
+        self.station_map = game_state.station_map
+        self._views: Dict[Coord, Tuple[str, Optional[str]]] = {}
+        self._vent_entries: Optional[FrozenSet[Coord]] = None
+        # (id(subject), noise, alert_bonus) -> prepared stealth subject context
+        self.subject_contexts: Dict[Tuple[int, int, int], dict] = {}
+        self.stats = {"views": 0, "contexts": 0}
+
+    def is_current(self, game_state) -> bool:
+        return (self.turn == getattr(game_state, "turn", 0)
+                and self.power_on == getattr(game_state, "power_on", True)
+                and self.station_map is game_state.station_map)
+
+    # --- Geometry ---
+
+    def view(self, location) -> Tuple[str, Optional[str]]:
+        """("room", name) for a named-room tile, ("corridor", None) otherwise."""
+        location = tuple(location)
+        view = self._views.get(location)
+        if view is None:
+            name = self.station_map.get_room_name(*location)
+            view = ("room", name) if name in self.station_map.rooms else ("corridor", None)
+            self._views[location] = view
+            self.stats["views"] += 1
+        return view
+
+    def can_see(self, from_location, to_location) -> bool:
+        """Line of sight between two tiles (same named room, or nearby corridor tiles)."""
+        kind, room = self.view(from_location)
+        other_kind, other_room = self.view(to_location)
+        if kind == "room":
+            return room == other_room
+        if other_kind == "room":
+            return False
+        dx = from_location[0] - to_location[0]
+        dy = from_location[1] - to_location[1]
+        return dx * dx + dy * dy <= CORRIDOR_SIGHT * CORRIDOR_SIGHT
+
+    def witnesses(self, location, game_state) -> List:
+        """Crew members (crew order) with line of sight to a tile."""
+        kind, room = self.view(location)
+        index = crew_index(game_state)
+        if kind == "room":
+            return index.in_room(room)
+        return [member for member in index.within(location, CORRIDOR_SIGHT, metric="euclidean")
+                if self.view(member.location)[0] == "corridor"]
+
+    def hears_vents(self, location) -> bool:
+        """Whether a tile is an entry grate that carries duct noise."""
+        return tuple(location) in self.vent_entries()
+
+    def vent_entries(self) -> FrozenSet[Coord]:
+        if self._vent_entries is None:
+            self._vent_entries = frozenset(tuple(coord) for coord in self.station_map.get_vent_entry_nodes())
+        return self._vent_entries
+
+    def can_perceive(self, observer, subject, in_vent: bool = False) -> bool:
+        """Whether ``observer`` stands where it could notice ``subject`` at all."""
+        station_map = self.station_map
+        if station_map.get_room_name(*observer.location) == station_map.get_room_name(*subject.location):
+            return True
+        return in_vent and self.hears_vents(observer.location)
+
+    # --- Stealth contests ---
+
+    def subject_context(self, stealth, subject, game_state, noise: int, alert_bonus: int = 0) -> dict:
+        """The subject's side of every detection contest this turn (built once per noise level)."""
+        key = (id(subject), noise, alert_bonus)
+        context = self.subject_contexts.get(key)
+        if context is None:
+            context = stealth.prepare_subject_context(subject, game_state, noise, alert_bonus)
+            self.subject_contexts[key] = context
+            self.stats["contexts"] += 1
+        return context
+
+
+def perception_for(game_state) -> PerceptionMap:
+    """This turn's perception map for a game, building (and caching) it on first use."""
+    perception = getattr(game_state, "perception", None)
+    if isinstance(perception, PerceptionMap) and perception.is_current(game_state):
+        return perception
+    perception = PerceptionMap(game_state)
+    try:
+        game_state.perception = perception
+    except AttributeError:
+        pass  # Read-only stand-ins just get a throwaway map
+    return perception
@@ -1,10 +1,16 @@
+import gzip
 import json
+import marshal
 import os
 import hashlib
+import itertools
 import shutil
+import tempfile
+import threading
 from copy import deepcopy
 from datetime import datetime
-from core.event_system import event_bus, EventType, GameEvent
+from typing import Dict, Optional
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 
 # Current save file version - increment when save format changes
 CURRENT_SAVE_VERSION = 2
@@ -18,6 +24,7 @@ MIGRATIONS = {
 # Save slot configuration
 SAVE_SLOTS = ["slot_1", "slot_2", "slot_3", "slot_4", "slot_5"]
 AUTO_SAVE_INTERVAL = 10  # Auto-save every N turns
+SLOT_INDEX_FILENAME = "slots.index.json"  # Sidecar metadata for the slot menu
 
 DEFAULT_REQUIRED_FIELDS = {
     "turn": 1,
@@ -64,6 +71,68 @@ def compute_checksum(data: dict) -> str:
     return hashlib.sha256(json_str.encode('utf-8')).hexdigest()[:16]
 
 
+def encode_save(data: dict, compress: bool = False) -> bytes:
+    """
+    Serialise save data to compact JSON, stamping data['checksum'].
+
+    The checksum is taken over the same sorted, compact JSON that is written,
+    so the dict is only encoded once. compress=True gzips the result; readers
+    detect that from the file header.
+    """
+    body = {k: v for k, v in data.items() if k not in {"_checksum", "checksum"}}
+    text = json.dumps(body, sort_keys=True, separators=(',', ':'))
+    checksum = hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+    data['checksum'] = checksum
+    text = f'{text[:-1]}{"," if body else ""}"checksum":"{checksum}"}}'
+    raw = text.encode('utf-8')
+    return gzip.compress(raw, compresslevel=6) if compress else raw
+
+
+def decode_save(raw: bytes) -> dict:
+    """Parse a save file's bytes (plain or gzipped JSON)."""
+    if raw[:2] == b'\x1f\x8b':
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def read_save_file(filepath: str) -> dict:
+    with open(filepath, 'rb') as f:
+        return decode_save(f.read())
+
+
+def write_atomic(filepath: str, payload: bytes):
+    """
+    Write to a temp file and rename over the target, so readers never see a partial save.
+
+    Each call gets its own temp file next to the target, so concurrent writers
+    (several sessions' save managers sharing a slot or the slot index) never
+    truncate or rename each other's data; the last rename wins.
+    """
+    directory, name = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def snapshot_save_data(data: dict) -> dict:
+    """Detach to_dict() output from live game objects (lists shared with the game, etc.)."""
+    try:
+        return marshal.loads(marshal.dumps(data))
+    except ValueError:
+        # Non-primitive values slipped in; deepcopy handles anything
+        return deepcopy(data)
+
+
 def _extract_version(data: dict) -> int:
     """Return the version value from known metadata keys."""
     if not isinstance(data, dict):
@@ -212,31 +281,389 @@ def migrate_save(data: dict, from_version: int, to_version: int) -> dict:
     return migrated_data
 
 
+JOURNAL_CHECKPOINT_INTERVAL = 50
+
+
+def _encode_section(value) -> str:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+
+def apply_journal_delta(state: dict, record: dict):
+    """Apply one delta record from a SaveJournal to a save dict in place."""
+    state.update(record.get("set", {}))
+    for key in record.get("unset", []):
+        state.pop(key, None)
+    for key, tail in record.get("extend", {}).items():
+        state.setdefault(key, []).extend(tail)
+    crew_changes = record.get("crew")
+    if crew_changes or "crew_order" in record:
+        members = {m.get("name"): m for m in state.get("crew", [])}
+        members.update(crew_changes or {})
+        order = record.get("crew_order") or [m.get("name") for m in state.get("crew", [])]
+        state["crew"] = [members[name] for name in order]
+
+
+class SaveJournal:
+    """
+    Append-only save file: one full checkpoint followed by per-turn deltas.
+
+    Each line is a JSON record. Deltas are keyed by top-level save section;
+    crew members are diffed individually by name, and lists that only grew
+    (journal entries, logs) record just the new items, so appending a turn
+    costs roughly what changed. Every checkpoint_interval deltas the file is
+    compacted into a fresh checkpoint. A torn final line (crash mid-append)
+    is ignored on replay.
+    """
+
+    def __init__(self, filepath: str, checkpoint_interval: int = JOURNAL_CHECKPOINT_INTERVAL):
+        self.filepath = filepath
+        self.checkpoint_interval = checkpoint_interval
+        self.deltas_since_checkpoint = 0
+        self._lock = threading.Lock()
+        self._sections: Dict[str, str] = {}
+        self._lengths: Dict[str, int] = {}
+        self._crew: Dict[str, str] = {}
+        self._crew_order: list = []
+
+    def reset(self):
+        """Forget the recorded baseline; the next record() writes a checkpoint."""
+        with self._lock:
+            self._sections = {}
+
+    def record(self, state: dict) -> int:
+        """Append the changes since the last record (or a checkpoint). Returns bytes written."""
+        with self._lock:
+            if (not self._sections or self.deltas_since_checkpoint >= self.checkpoint_interval
+                    or not os.path.exists(self.filepath)):
+                return self._checkpoint(state)
+
+            line = self._encode_line(self._diff(state))
+            with open(self.filepath, 'ab') as f:
+                f.write(line)
+            self.deltas_since_checkpoint += 1
+            return len(line)
+
+    def _checkpoint(self, state: dict) -> int:
+        line = self._encode_line({"type": "checkpoint", "turn": state.get("turn"), "state": state})
+        write_atomic(self.filepath, line)
+        self._remember(state)
+        self.deltas_since_checkpoint = 0
+        return len(line)
+
+    @staticmethod
+    def _encode_line(record: dict) -> bytes:
+        return (json.dumps(record, separators=(',', ':')) + "\n").encode('utf-8')
+
+    def _tracks_crew(self, state: dict) -> bool:
+        names = [m.get("name") for m in state.get("crew", []) if isinstance(m, dict)]
+        return len(names) == len(state.get("crew", [])) and len(set(names)) == len(names)
+
+    def _remember(self, state: dict):
+        self._sections = {}
+        self._lengths = {}
+        self._crew = {}
+        self._crew_order = []
+        for key, value in state.items():
+            if key == "crew" and self._tracks_crew(state):
+                self._crew = {m["name"]: _encode_section(m) for m in value}
+                self._crew_order = [m["name"] for m in value]
+                self._sections[key] = ""
+                continue
+            self._sections[key] = _encode_section(value)
+            if isinstance(value, list):
+                self._lengths[key] = len(value)
+
+    def _diff(self, state: dict) -> dict:
+        record = {"type": "delta", "turn": state.get("turn")}
+        changed, extended = {}, {}
+        unset = [key for key in self._sections if key not in state]
+        for key in unset:
+            del self._sections[key]
+            self._lengths.pop(key, None)
+
+        for key, value in state.items():
+            if key == "crew" and self._crew_order and self._tracks_crew(state):
+                self._diff_crew(value, record)
+                continue
+            encoded = _encode_section(value)
+            if self._sections.get(key) == encoded:
+                continue
+            old_len = self._lengths.get(key)
+            if (isinstance(value, list) and old_len is not None and len(value) > old_len
+                    and _encode_section(value[:old_len]) == self._sections[key]):
+                extended[key] = value[old_len:]
+            else:
+                changed[key] = value
+            self._sections[key] = encoded
+            if isinstance(value, list):
+                self._lengths[key] = len(value)
+            else:
+                self._lengths.pop(key, None)
+
+        if changed:
+            record["set"] = changed
+        if extended:
+            record["extend"] = extended
+        if unset:
+            record["unset"] = unset
+        return record
+
+    def _diff_crew(self, crew: list, record: dict):
+        members = {}
+        for member in crew:
+            encoded = _encode_section(member)
+            if self._crew.get(member["name"]) != encoded:
+                members[member["name"]] = member
+                self._crew[member["name"]] = encoded
+        order = [m["name"] for m in crew]
+        if order != self._crew_order:
+            record["crew_order"] = order
+            self._crew_order = order
+            self._crew = {name: self._crew[name] for name in order}
+        if members:
+            record["crew"] = members
+
+    @staticmethod
+    def read_records(filepath: str) -> list:
+        records = []
+        with open(filepath, 'rb') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break  # Torn write at the tail; everything before it is intact
+        return records
+
+    @classmethod
+    def turns(cls, filepath: str) -> list:
+        """Turns that can be resumed from this journal."""
+        return [r.get("turn") for r in cls.read_records(filepath)]
+
+    @classmethod
+    def replay(cls, filepath: str, turn: Optional[int] = None) -> Optional[dict]:
+        """Rebuild the save dict at the latest turn (or the last record at or before `turn`)."""
+        state = None
+        for record in cls.read_records(filepath):
+            if turn is not None and state is not None and (record.get("turn") or 0) > turn:
+                break
+            if record.get("type") == "checkpoint":
+                state = record["state"]
+            elif state is not None:
+                apply_journal_delta(state, record)
+        return state
+
+
+class AsyncSaveWriter:
+    """
+    Background thread that encodes and writes save snapshots.
+
+    Pending saves are keyed by slot: a newer snapshot for a slot replaces one
+    that hasn't been written yet (coalescing), so a slow disk never builds a
+    backlog of stale autosaves. The thread starts on first use.
+    """
+
+    def __init__(self, write_fn):
+        self._write_fn = write_fn
+        self._pending: Dict[str, dict] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._busy = False
+        self._closed = False
+        self.stats = {"queued": 0, "written": 0, "coalesced": 0, "failed": 0}
+
+    def submit(self, slot_name: str, data: dict):
+        with self._cond:
+            if slot_name in self._pending:
+                self.stats["coalesced"] += 1
+            # Re-insert so the dict stays ordered by submission time
+            self._pending.pop(slot_name, None)
+            self._pending[slot_name] = data
+            self.stats["queued"] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._closed = False
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def discard(self, slot_name: str):
+        """Drop a pending (not yet started) write, e.g. when a newer save supersedes it."""
+        with self._cond:
+            self._pending.pop(slot_name, None)
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued save is on disk. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Finish pending writes and stop the thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                slot_name = next(iter(self._pending))
+                data = self._pending.pop(slot_name)
+                self._busy = True
+            try:
+                ok = self._write_fn(slot_name, data)
+            except Exception:
+                ok = False
+            with self._cond:
+                self._busy = False
+                self.stats["written" if ok else "failed"] += 1
+                self._cond.notify_all()
+
+
 class SaveManager:
-    def __init__(self, save_dir="data/saves", game_state_factory=None):
+    def __init__(self, save_dir="data/saves", game_state_factory=None, autosave=True, compress=False,
+                 journaled=False):
         self.save_dir = save_dir
         self.game_state_factory = game_state_factory
-        if not os.path.exists(self.save_dir):
-            os.makedirs(self.save_dir)
-
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        self.autosave = autosave
+        # gzip save files (loading handles both encodings)
+        self.compress = compress
+        # The save directory is created on first write, so games that never
+        # save (tests, simulations) don't touch the filesystem.
+        self.writer = AsyncSaveWriter(self._write_queued)
+        # Snapshots are numbered when taken; under the write lock an older
+        # snapshot never overwrites a newer one for the same slot
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = itertools.count()
+        self._written_seq: Dict[str, int] = {}
+        # Journaled autosaves append a delta every turn instead of rewriting the slot
+        self.journaled = journaled
+        # Slot written by turn-advance autosaves; hosts running several games
+        # give each its own so their journals don't interleave
+        self.autosave_slot = "autosave"
+        self.journal_writer = AsyncSaveWriter(self._append_journal)
+        self._journals: Dict[str, SaveJournal] = {}
+        # Slot metadata index, cached until the file changes on disk
+        self._index_lock = threading.Lock()
+        self._slot_index: Optional[dict] = None
+        self._slot_index_mtime = None
+        self._last_autosave_turn = None
+
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.PERSISTENCE)
 
     def cleanup(self):
         event_bus.unsubscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
-        
+        self.writer.close()
+        self.journal_writer.close()
+
     def on_turn_advance(self, event: GameEvent):
         """Subscriber for TURN_ADVANCE event. Handles auto-saving."""
         game_state = event.payload.get("game_state")
         current_turn = event.payload.get("turn")
         if game_state:
             self.apply_suspicion_decay(game_state, current_turn)
-        if game_state and game_state.turn % AUTO_SAVE_INTERVAL == 0:
+        if self.autosave and game_state and (self.journaled or game_state.turn % AUTO_SAVE_INTERVAL == 0):
             try:
-                self.save_game(game_state, "autosave")
+                self.autosave_game(game_state)
             except Exception:
                 pass  # Don't interrupt gameplay on save failure
 
+    def autosave_game(self, game_state, slot_name=None) -> bool:
+        """
+        Snapshot the game on the calling thread and hand it to the background writer.
+
+        Returns immediately; at most one autosave is taken per turn per slot.
+        Use writer.flush() (journal_writer.flush() when journaled) to wait for
+        it to reach disk.
+        """
+        slot_name = slot_name or self.autosave_slot
+        turn = getattr(game_state, "turn", None)
+        if self._last_autosave_turn == (slot_name, turn):
+            return False
+        self._last_autosave_turn = (slot_name, turn)
+        snapshot = snapshot_save_data(game_state.to_dict())
+        if self.journaled:
+            # Deltas are taken against the last recorded state, so coalesced
+            # snapshots just fold several turns into one record
+            self.journal_writer.submit(slot_name, snapshot)
+            return True
+        seq = next(self._snapshot_seq)
+        self.writer.submit(slot_name, (seq, snapshot))
+        return True
+
+    # === Journaled Saves ===
+
+    def journal_path(self, slot_name: str) -> str:
+        return os.path.join(self.save_dir, f"{os.path.basename(slot_name)}.journal")
+
+    def _journal(self, slot_name: str) -> SaveJournal:
+        if slot_name not in self._journals:
+            self._journals[slot_name] = SaveJournal(self.journal_path(slot_name))
+        return self._journals[slot_name]
+
+    def _append_journal(self, slot_name: str, data: dict) -> bool:
+        try:
+            self._ensure_save_dir()
+            self._journal(slot_name).record(data)
+            return True
+        except Exception as e:
+            print(f"Failed to append save journal: {e}")
+            return False
+
+    def journal_turns(self, slot_name=None) -> list:
+        slot_name = os.path.basename(slot_name or self.autosave_slot)
+        self.journal_writer.flush()
+        path = self.journal_path(slot_name)
+        return SaveJournal.turns(path) if os.path.exists(path) else []
+
+    def load_journal(self, slot_name=None, turn=None, factory=None):
+        """
+        Rebuild a game from a save journal at its latest turn, or at `turn`.
+
+        The replayed state is then compacted into a fresh checkpoint on the
+        journal writer; resuming from an earlier turn discards later records.
+        """
+        slot_name = os.path.basename(slot_name or self.autosave_slot)
+        self.journal_writer.flush()
+        filepath = self.journal_path(slot_name)
+        if not os.path.exists(filepath):
+            print(f"Save journal not found: {filepath}")
+            return None
+        try:
+            data = SaveJournal.replay(filepath, turn)
+            if data is None:
+                print(f"Save journal {filepath} has no checkpoint")
+                return None
+            data = migrate_save(data, _extract_version(data), CURRENT_SAVE_VERSION)
+
+            journal = self._journal(slot_name)
+            journal.reset()
+            self.journal_writer.submit(slot_name, snapshot_save_data(data))
+            self._last_autosave_turn = None
+
+            hydrator = factory if factory else self.game_state_factory
+            return hydrator(data) if hydrator else data
+        except Exception as e:
+            print(f"Failed to load save journal {filepath}: {e}")
+            return None
+
+    def _write_queued(self, slot_name: str, item) -> bool:
+        seq, data = item
+        return self._write_snapshot(slot_name, data, seq)
+
             
+    def _ensure_save_dir(self):
+        if not os.path.isdir(self.save_dir):
+            os.makedirs(self.save_dir, exist_ok=True)
+
     def backup_save(self, filepath: str) -> bool:
         """
         Create a backup of an existing save file before overwriting.
@@ -296,33 +723,44 @@ class SaveManager:
         if not slot_name or slot_name.startswith('.'):
             print(f"Invalid slot name: {slot_name}")
             return False
-        # Security: Sanitize slot name to prevent path traversal
-        slot_name = os.path.basename(slot_name)
-
-        filename = f"{slot_name}.json"
-        filepath = os.path.join(self.save_dir, filename)
 
+        # This save supersedes any queued autosave for the same slot
+        self.writer.discard(slot_name)
+        seq = next(self._snapshot_seq)
         try:
-            # Backup existing save first
-            if not self.backup_save(filepath):
-                raise RuntimeError("Failed to create backup before saving")
-
-            # Get game state data
             data = game_state.to_dict()
+        except Exception as e:
+            print(f"Failed to save game: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        if self._write_snapshot(slot_name, data, seq):
+            print(f"Game saved to {os.path.join(self.save_dir, f'{slot_name}.json')}")
+            return True
+        return False
 
+    def _write_snapshot(self, slot_name: str, data: dict, seq: int) -> bool:
+        """Stamp metadata, encode, back up the old file and atomically replace it."""
+        filepath = os.path.join(self.save_dir, f"{slot_name}.json")
+        try:
             # Add save metadata
+            saved_at = datetime.now().isoformat()
             data['_save_version'] = CURRENT_SAVE_VERSION
             data['save_version'] = CURRENT_SAVE_VERSION
-            data['_saved_at'] = datetime.now().isoformat()
-            data['save_version'] = CURRENT_SAVE_VERSION
-            data['saved_at'] = datetime.now().isoformat()
-
-            # Compute and add checksum (must be last)
-            data['checksum'] = compute_checksum(data)
-
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=4)
-            print(f"Game saved to {filepath}")
+            data['_saved_at'] = saved_at
+            data['saved_at'] = saved_at
+            payload = encode_save(data, self.compress)
+
+            with self._write_lock:
+                if seq < self._written_seq.get(slot_name, -1):
+                    return True  # A newer save of this slot is already on disk
+                self._written_seq[slot_name] = seq
+                self._ensure_save_dir()
+                # Backup existing save first
+                if not self.backup_save(filepath):
+                    raise RuntimeError("Failed to create backup before saving")
+                write_atomic(filepath, payload)
+                self._update_slot_index(slot_name, self._slot_metadata(slot_name, data), os.stat(filepath))
             return True
         except Exception as e:
             print(f"Failed to save game: {e}")
@@ -342,13 +780,15 @@ class SaveManager:
         filename = f"{slot_name}.json"
         filepath = os.path.join(self.save_dir, filename)
 
+        if not os.path.exists(filepath) and os.path.exists(self.journal_path(slot_name)):
+            # Journaled autosaves only exist as a journal
+            return self.load_journal(slot_name, factory=factory)
         if not os.path.exists(filepath):
             print(f"Save file not found: {filepath}")
             return None
 
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = read_save_file(filepath)
 
             # Verify checksum on the raw data first
             stored_checksum = data.get('_checksum') or data.get('checksum')
@@ -439,8 +879,7 @@ class SaveManager:
             backups.sort(reverse=True)  # Most recent first
             backup_path = os.path.join(backup_dir, backups[0])
 
-            with open(backup_path, 'r') as f:
-                data = json.load(f)
+            data = read_save_file(backup_path)
 
             # Validate backup too (legacy-friendly first pass)
             is_valid, _ = validate_save_data(data, required_fields=[])
@@ -470,9 +909,7 @@ class SaveManager:
             self.backup_save(filepath)
             # Preserve existing save before overwriting with migrated data
             self.backup_save(filepath)
-            data['checksum'] = compute_checksum(data)
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=4)
+            write_atomic(filepath, encode_save(data, self.compress))
         except Exception:
             pass  # Migration resave failure is non-critical
 
@@ -492,7 +929,11 @@ class SaveManager:
     def get_slot_metadata(self, slot_name: str) -> dict:
         """
         Get metadata for a save slot without loading the full game state.
-        
+
+        Served from the slot index when its entry matches the save file's
+        size and mtime; otherwise the save is parsed once and the index
+        entry refreshed.
+
         Args:
             slot_name: Name of the slot to check
             
@@ -505,29 +946,71 @@ class SaveManager:
 
         filename = f"{slot_name}.json"
         filepath = os.path.join(self.save_dir, filename)
-        
-        if not os.path.exists(filepath):
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
             return None
-        
+
+        entry = self._load_slot_index().get(slot_name)
+        if entry and entry.get("file_mtime_ns") == stat.st_mtime_ns and entry.get("file_size") == stat.st_size:
+            return {k: v for k, v in entry.items() if not k.startswith("file_")}
+
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            # Extract metadata
-            return {
-                "slot_name": slot_name,
-                "timestamp": data.get("saved_at") or data.get("_saved_at", "Unknown"),
-                "turn": data.get("turn", 0),
-                "difficulty": data.get("difficulty", "Normal"),
-                "player_location": data.get("player_location", [0, 0]),
-                "crew_count": len(data.get("crew", [])),
-                "save_version": data.get("save_version") or data.get("_save_version", 0),
-                "survivor_mode": data.get("survivor_mode", False),
-                "thumbnail": self._extract_thumbnail(data)
-            }
-        except (IOError, json.JSONDecodeError):
+            data = read_save_file(filepath)
+        except (IOError, ValueError):
             return None
-    
+        metadata = self._slot_metadata(slot_name, data)
+        self._update_slot_index(slot_name, metadata, stat)
+        return metadata
+
+    def _slot_metadata(self, slot_name: str, data: dict) -> dict:
+        return {
+            "slot_name": slot_name,
+            "timestamp": data.get("saved_at") or data.get("_saved_at", "Unknown"),
+            "turn": data.get("turn", 0),
+            "difficulty": data.get("difficulty", "Normal"),
+            "player_location": data.get("player_location", [0, 0]),
+            "crew_count": len(data.get("crew", [])),
+            "save_version": data.get("save_version") or data.get("_save_version", 0),
+            "survivor_mode": data.get("survivor_mode", False),
+            "checksum": data.get("checksum"),
+            "thumbnail": self._extract_thumbnail(data)
+        }
+
+    def _load_slot_index(self) -> dict:
+        """Slot name -> metadata from the sidecar index ({} if missing or unreadable)."""
+        path = os.path.join(self.save_dir, SLOT_INDEX_FILENAME)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return {}
+        if self._slot_index is None or self._slot_index_mtime != mtime:
+            try:
+                self._slot_index = read_save_file(path)
+            except (IOError, ValueError):
+                self._slot_index = {}
+            self._slot_index_mtime = mtime
+        return self._slot_index
+
+    def _update_slot_index(self, slot_name: str, metadata: Optional[dict], stat=None):
+        """Set (or with metadata=None, drop) a slot's index entry. Failures are non-critical."""
+        path = os.path.join(self.save_dir, SLOT_INDEX_FILENAME)
+        try:
+            with self._index_lock:
+                index = dict(self._load_slot_index())
+                if metadata is None:
+                    if index.pop(slot_name, None) is None:
+                        return
+                else:
+                    index[slot_name] = dict(metadata, file_mtime_ns=stat.st_mtime_ns, file_size=stat.st_size)
+                self._ensure_save_dir()
+                write_atomic(path, json.dumps(index, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+                self._slot_index = index
+                self._slot_index_mtime = os.stat(path).st_mtime_ns
+        except Exception:
+            pass  # Listing falls back to parsing the save
+
     def _extract_thumbnail(self, data: dict) -> str:
         """Extract or generate ASCII thumbnail from save data."""
         # Check if thumbnail was saved
@@ -642,6 +1125,7 @@ class SaveManager:
                 # Create backup before deleting
                 self.backup_save(filepath)
                 os.remove(filepath)
+                self._update_slot_index(slot_name, None)
                 print(f"Deleted save slot {slot_number}.")
                 return True
             else:
@@ -666,15 +1150,13 @@ class SaveManager:
         filepath = os.path.join(self.save_dir, "campaign.json")
         
         try:
+            self._ensure_save_dir()
             # Backup existing campaign
             self.backup_save(filepath)
             
             campaign_state["saved_at"] = datetime.now().isoformat()
             campaign_state["save_version"] = CURRENT_SAVE_VERSION
-            campaign_state["checksum"] = compute_checksum(campaign_state)
-            
-            with open(filepath, 'w') as f:
-                json.dump(campaign_state, f, indent=2)
+            write_atomic(filepath, encode_save(campaign_state, self.compress))
             
             print("Campaign progress saved.")
             return True
@@ -695,9 +1177,8 @@ class SaveManager:
             return None
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
+            data = read_save_file(filepath)
+
             # Verify checksum
             stored_checksum = data.get("checksum")
             if stored_checksum:
@@ -706,7 +1187,7 @@ class SaveManager:
                     print("Warning: Campaign save may be corrupted.")
             
             return data
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, ValueError) as e:
             print(f"Failed to load campaign: {e}")
             return None
     
@@ -0,0 +1,252 @@
+"""
+Profile Store
+Shared in-memory home for cross-session profile files (career statistics,
+meta-progression).
+
+Owners register a serializer per file (several owners may share one file)
+and mark it dirty when their counters change; the store writes dirty files in
+one batch on a timer, at session end or at interpreter exit, always
+atomically. Loads are cached per path and only re-read when the file changes
+on disk, so constructing a second manager over the same file does not parse it
+again.
+
+Owners that register a ``merge`` function are flushed read-merge-write under
+a file lock: the file is re-read and only what the owner changed since its
+last write is folded in, so other owners of the file (other sessions, or other
+server shards writing the same profile) keep their progress. Owners without
+one overwrite the file, the last to change it winning.
+"""
+
+import atexit
+import itertools
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from systems.persistence import write_atomic
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks (Windows): merges are still correct within one process
+    fcntl = None
+
+# merge(base, ours, theirs) -> document to write
+MergeFn = Callable[[Any, Any, Any], Any]
+
+
+def merge_counters(base: dict, ours: dict, theirs: dict) -> dict:
+    """
+    Three-way merge of a counter document.
+
+    ``theirs`` (the file as it is now) plus whatever ``ours`` changed since
+    ``base`` (what we last wrote or loaded): numbers add our delta, nested dicts
+    merge key by key, and anything else keeps our value if we changed it.
+    """
+    merged = dict(theirs or {})
+    base = base or {}
+    for key, value in ours.items():
+        old = base.get(key)
+        current = merged.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            merged[key] = (current if isinstance(current, (int, float)) else 0) + value - (
+                old if isinstance(old, (int, float)) else 0)
+        elif isinstance(value, dict):
+            merged[key] = merge_counters(old if isinstance(old, dict) else {}, value,
+                                         current if isinstance(current, dict) else {})
+        elif value != old or key not in merged:
+            merged[key] = value
+    return merged
+
+
+def _copy(data: Any) -> Any:
+    return json.loads(json.dumps(data))
+
+
+class ProfileStore:
+    """Cached, batched, atomic JSON documents keyed by file path."""
+
+    FLUSH_INTERVAL = 30.0  # Seconds between a first change and its background flush
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._docs: Dict[str, Tuple[Optional[int], Any]] = {}  # path -> (mtime_ns, data)
+        self._owners: Dict[str, Dict[int, Callable[[], Any]]] = {}  # path -> token -> serializer
+        self._merges: Dict[int, MergeFn] = {}  # token -> merge function
+        self._bases: Dict[int, Any] = {}  # token -> what the owner last loaded or wrote
+        self._dirty: Dict[str, List[int]] = {}  # path -> tokens of changed owners, oldest change first
+        self._tokens = itertools.count(1)
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self.stats = {"loads": 0, "writes": 0}
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    @staticmethod
+    def _mtime(key: str) -> Optional[int]:
+        try:
+            return os.stat(key).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self, path, default: Any = None) -> Any:
+        """
+        Parsed contents of a profile file, or ``default`` if it does not exist.
+
+        Dirty data registered for the path wins over the file; otherwise the cached
+        parse is reused until the file's mtime changes.
+        """
+        key = self._key(path)
+        with self._lock:
+            owner = self._dirty_owner(key)
+            if owner is not None:
+                return owner()
+            mtime = self._mtime(key)
+            cached = self._docs.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            data = default
+            if mtime is not None:
+                with open(key, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.stats["loads"] += 1
+            self._docs[key] = (mtime, data)
+            return data
+
+    def register(self, path, serializer: Callable[[], Any], merge: Optional[MergeFn] = None) -> int:
+        """
+        Attach a live owner of a file; ``serializer`` is called at flush time.
+
+        With ``merge`` the owner's changes are merged into the file instead of
+        replacing it; register after loading, since the current ``serializer()``
+        output is taken as the owner's starting point.
+
+        Returns the owner's token for ``mark_dirty`` and ``unregister``.
+        """
+        token = next(self._tokens)
+        with self._lock:
+            self._owners.setdefault(self._key(path), {})[token] = serializer
+            if merge is not None:
+                self._merges[token] = merge
+                self._bases[token] = _copy(serializer())
+        return token
+
+    def unregister(self, path, token: int):
+        """Flush this owner's unsaved changes and detach it (other owners stay)."""
+        key = self._key(path)
+        with self._lock:
+            if token in self._dirty.get(key, ()):
+                self.flush(key)
+            owners = self._owners.get(key)
+            if owners is not None:
+                owners.pop(token, None)
+                if not owners:
+                    del self._owners[key]
+            self._merges.pop(token, None)
+            self._bases.pop(token, None)
+
+    def mark_dirty(self, path, token: int):
+        """Note that the owner ``token`` changed a file; it is written by the next flush."""
+        with self._lock:
+            tokens = self._dirty.setdefault(self._key(path), [])
+            if token in tokens:
+                tokens.remove(token)
+            tokens.append(token)
+            if self._timer is None and self.flush_interval is not None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def is_dirty(self, path) -> bool:
+        with self._lock:
+            return self._key(path) in self._dirty
+
+    def _dirty_owner(self, key: str) -> Optional[Callable[[], Any]]:
+        """Serializer of the owner that changed ``key`` most recently."""
+        tokens = self._dirty.get(key)
+        if not tokens:
+            return None
+        return self._owners.get(key, {}).get(tokens[-1])
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self, path=None) -> bool:
+        """Write dirty files (all of them, or just ``path``). Returns False if any write failed."""
+        with self._lock:
+            keys = [self._key(path)] if path is not None else list(self._dirty)
+            ok = True
+            for key in keys:
+                owners = self._owners.get(key, {})
+                tokens = [token for token in self._dirty.pop(key, ()) if token in owners]
+                if not tokens:
+                    continue
+                try:
+                    self._write(key, tokens)
+                except OSError as e:
+                    print(f"Warning: Could not save profile data to {key}: {e}")
+                    ok = False
+            if not self._dirty and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return ok
+
+    def _write(self, key: str, tokens: List[int]):
+        """Write the changes of the dirty owners ``tokens`` to ``key``."""
+        owners = self._owners[key]
+        merging = any(token in self._merges for token in tokens)
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        with self._file_lock(key if merging else None):
+            data = self._read(key) if merging else None
+            written = {}
+            for token in tokens:
+                ours = owners[token]()
+                merge = self._merges.get(token)
+                if merge is None:
+                    data = ours
+                else:
+                    written[token] = _copy(ours)
+                    data = merge(self._bases[token], ours, data) if data else ours
+            write_atomic(key, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        # Later flushes only fold in what changed after this write
+        self._bases.update(written)
+        self._docs[key] = (self._mtime(key), data)
+        self.stats["writes"] += 1
+
+    def _read(self, key: str) -> Any:
+        """The file as it is on disk right now (None if missing or unreadable)."""
+        if self._mtime(key) is None:
+            return None
+        try:
+            with open(key, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except ValueError as e:
+            print(f"Warning: Replacing unreadable profile data in {key}: {e}")
+            return None
+        self.stats["loads"] += 1
+        return data
+
+    @staticmethod
+    @contextmanager
+    def _file_lock(key: Optional[str]):
+        """Hold an exclusive lock on ``key`` across processes (no-op for None or without fcntl)."""
+        if key is None or fcntl is None:
+            yield
+            return
+        with open(key + ".lock", "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+# Global profile store shared by statistics and meta-progression
+profile_store = ProfileStore()
@@ -1,5 +1,6 @@
 from core.resolution import Attribute
 from core.event_system import event_bus, EventType, GameEvent
+from systems.spatial_index import crew_index
 
 class PsychologySystem:
     MAX_STRESS = 10
@@ -75,16 +76,11 @@ class PsychologySystem:
 
         # 2. Isolation Checks
         # Humans gain stress when alone (fear of being picked off)
-        room_counts = {}
-        for m in game_state.crew:
-            if m.is_alive:
-                room_name = game_state.station_map.get_room_name(*m.location)
-                room_counts[room_name] = room_counts.get(room_name, 0) + 1
-        
+        index = crew_index(game_state)
         for m in game_state.crew:
             if m.is_alive and not m.is_infected: # Things don't feel isolation stress
-                room_name = game_state.station_map.get_room_name(*m.location)
-                if room_counts[room_name] == 1:
+                roommates = index.in_room(index.room_of(m))
+                if sum(1 for other in roommates if other.is_alive) == 1:
                     self.add_stress(m, 1)
 
         # 3. Panic Resolution & Cascades
@@ -1,6 +1,7 @@
 from enum import Enum, auto
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 from core.resolution import Attribute, Skill, ResolutionModifiers
+from systems.schedule_index import compiled_schedule, schedule_snapshot
 
 
 class RoomState(Enum):
@@ -26,10 +27,11 @@ class RoomStateManager:
         self.room_states = {name: set() for name in room_names}
         # room_name -> barricade strength (0 = broken)
         self.barricade_strength = {}
+        self._blocked_rooms = None
         self._set_initial_states()
 
         # Subscribe to events
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.ENVIRONMENT)
         event_bus.subscribe(EventType.POWER_FAILURE, self.on_power_failure)
         event_bus.subscribe(EventType.TEMPERATURE_THRESHOLD_CROSSED, self.on_temperature_threshold)
         event_bus.subscribe(EventType.ENVIRONMENTAL_STATE_CHANGE, self.on_environmental_change)
@@ -83,16 +85,31 @@ class RoomStateManager:
 
     def add_state(self, room_name, state):
         if room_name in self.room_states:
-            self.room_states[room_name].add(state)
+            states = self.room_states[room_name]
+            if state is RoomState.BARRICADED and state not in states:
+                self._blocked_rooms = None
+            states.add(state)
             return True
         return False
     
     def remove_state(self, room_name, state):
         if room_name in self.room_states:
-            self.room_states[room_name].discard(state)
+            states = self.room_states[room_name]
+            if state is RoomState.BARRICADED and state in states:
+                self._blocked_rooms = None
+            states.discard(state)
             return True
         return False
     
+    def get_blocked_rooms(self):
+        """Frozenset of rooms whose entry is barricaded (cached until a barricade goes up or down)."""
+        blocked = self._blocked_rooms
+        if blocked is None:
+            blocked = frozenset(name for name, states in self.room_states.items()
+                                if RoomState.BARRICADED in states)
+            self._blocked_rooms = blocked
+        return blocked
+
     def has_state(self, room_name, state):
         if room_name in self.room_states:
             return state in self.room_states[room_name]
@@ -311,7 +328,7 @@ class RoomStateManager:
     def is_entry_blocked(self, room_name):
         """Check if entry to a room is blocked by a barricade."""
         return self.has_state(room_name, RoomState.BARRICADED)
-    
+
     def get_communion_modifier(self, room_name):
         return 0.4 if self.has_state(room_name, RoomState.DARK) else 0.0
     
@@ -346,41 +363,23 @@ class RoomStateManager:
     # === Schedule Slip Detection ===
     def _get_expected_room(self, member, current_hour):
         """Return the expected room for a member based on schedule and hour."""
-        for entry in getattr(member, "schedule", []) or []:
-            start = entry.get("start", 0)
-            end = entry.get("end", 24)
-            room = entry.get("room")
-            if not room:
-                continue
-
-            # Handle wrap-around schedules (e.g., 20 -> 08)
-            if start < end:
-                if start <= current_hour < end:
-                    return room
-            else:
-                if current_hour >= start or current_hour < end:
-                    return room
-        return None
+        return compiled_schedule(member).room_at(current_hour)
 
     def _check_schedule_slips(self, game_state):
         """Flag NPCs who are off their expected schedule location."""
         if not hasattr(game_state, "crew"):
             return
 
-        current_hour = getattr(game_state.time_system, "hour", getattr(game_state, "current_hour", 0))
+        snapshot = schedule_snapshot(game_state)
+        current_hour = snapshot.hour
         for member in game_state.crew:
             previous_flag = getattr(member, "schedule_slip_flag", False)
             member.schedule_slip_flag = False
             member.schedule_slip_reason = None
 
-            if not getattr(member, "is_alive", True):
-                continue
-            expected_room = self._get_expected_room(member, current_hour)
-            if not expected_room:
-                continue
-
-            actual_room = game_state.station_map.get_room_name(*member.location)
-            if actual_room != expected_room:
+            if snapshot.is_slipped(member):
+                expected_room = snapshot.expected_room(member)
+                actual_room = snapshot.current_room(member)
                 member.schedule_slip_flag = True
                 member.schedule_slip_reason = (
                     f"{member.name} should be in {expected_room} around {current_hour:02d}00, "
@@ -388,6 +387,5 @@ class RoomStateManager:
                 )
                 # Emit once when the slip is first detected to avoid spam
                 if not previous_flag:
-                    event_bus.emit(GameEvent(EventType.MESSAGE, {
-                        "text": f"[SLIP] {member.name} is off-schedule (expected: {expected_room})."
-                    }))
+                    event_bus.emit_text(EventType.MESSAGE, "[SLIP] {} is off-schedule (expected: {}).",
+                                        member.name, expected_room)
@@ -1,5 +1,5 @@
 from enum import Enum
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 
 class SabotageEvent(Enum):
     POWER_OUTAGE = "power_outage"
@@ -42,7 +42,7 @@ class SabotageManager:
         self.power_sabotaged = False
         
         # Subscribe to turn advances
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.ENVIRONMENT)
 
     def cleanup(self):
         event_bus.unsubscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
@@ -0,0 +1,197 @@
+"""
+Schedule Index
+Compiles crew schedules into hour -> room tables and answers "who is where
+they should be?" once per turn for every system that asks.
+
+Schedule entries look like {"start": 8, "end": 20, "room": "Rec Room"}; a
+start >= end wraps around midnight. The first entry covering an hour wins.
+"""
+
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+HOURS_PER_DAY = 24
+
+
+def attach(member, index: "ScheduleIndex"):
+    """Register index for change notifications on member (kept weakly)."""
+    refs = [ref for ref in member._schedule_refs if ref() is not None and ref() is not index]
+    refs.append(weakref.ref(index))
+    member._schedule_refs = tuple(refs)
+
+
+def note_crew_change(member):
+    """Called by CrewMember when its position, vital state or schedule changes."""
+    for ref in member._schedule_refs:
+        index = ref()
+        if index is not None:
+            index.revision += 1
+
+
+def _covers(entry: Dict, hour: int) -> bool:
+    start = entry.get("start", 0)
+    end = entry.get("end", 24)
+    # Handle wrap-around schedules (e.g., 20:00 to 08:00)
+    if start < end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class CompiledSchedule:
+    """A schedule flattened to a 24-slot table, with room targets per map."""
+
+    __slots__ = ("rooms", "_targets_map", "_targets")
+
+    def __init__(self, schedule):
+        rooms: List[Optional[str]] = []
+        entries = [entry for entry in (schedule or []) if entry.get("room")]
+        for hour in range(HOURS_PER_DAY):
+            rooms.append(next((entry["room"] for entry in entries if _covers(entry, hour)), None))
+        self.rooms: Tuple[Optional[str], ...] = tuple(rooms)
+        self._targets_map = None
+        self._targets: Tuple[Optional[Tuple[int, int]], ...] = ()
+
+    def room_at(self, hour) -> Optional[str]:
+        return self.rooms[int(hour) % HOURS_PER_DAY]
+
+    def target_at(self, hour, station_map) -> Optional[Tuple[int, int]]:
+        """Tile to walk to for this hour (the scheduled room's origin corner)."""
+        if self._targets_map is not station_map:
+            targets = []
+            for room in self.rooms:
+                bounds = station_map.rooms.get(room) if room else None
+                targets.append((bounds[0], bounds[1]) if bounds else None)
+            self._targets = tuple(targets)
+            self._targets_map = station_map
+        return self._targets[int(hour) % HOURS_PER_DAY]
+
+
+def compiled_schedule(member) -> CompiledSchedule:
+    """The member's compiled schedule (cached on CrewMember, built on demand otherwise)."""
+    compiled = getattr(member, "compiled_schedule", None)
+    if isinstance(compiled, CompiledSchedule):
+        return compiled
+    return CompiledSchedule(getattr(member, "schedule", None))
+
+
+def current_hour(game_state) -> int:
+    return getattr(game_state.time_system, "hour", getattr(game_state, "current_hour", 0))
+
+
+class ScheduleSnapshot:
+    """
+    Expected-vs-actual room for every crew member at one moment.
+
+    Two bitmaps (bit i = game_state.crew[i]) capture the two notions of
+    "off schedule" used around the game:
+      slipped      - alive and not in the exact scheduled room (slip detection)
+      out_of_place - in a different named room; corridors and partial name
+                     matches are tolerated (renderer, interrogation, missionary)
+    """
+
+    __slots__ = ("hour", "expected", "actual", "slipped", "out_of_place", "_slots", "_station_map")
+
+    def __init__(self, game_state):
+        self.hour = current_hour(game_state)
+        self._station_map = game_state.station_map
+        crew = list(getattr(game_state, "crew", None) or [])
+        self.expected: List[Optional[str]] = []
+        self.actual: List[str] = []
+        self.slipped = 0
+        self.out_of_place = 0
+        self._slots: Dict[int, int] = {}
+
+        for i, member in enumerate(crew):
+            self._slots[id(member)] = i
+            expected, actual, slipped, out_of_place = self._status(member)
+            self.expected.append(expected)
+            self.actual.append(actual)
+            if slipped:
+                self.slipped |= 1 << i
+            if out_of_place:
+                self.out_of_place |= 1 << i
+
+    def _status(self, member) -> Tuple[Optional[str], str, bool, bool]:
+        expected = compiled_schedule(member).room_at(self.hour)
+        actual = self._station_map.get_room_name(*member.location)
+        if not expected:
+            return expected, actual, False, False
+        slipped = actual != expected and getattr(member, "is_alive", True)
+        # Allow partial matches, e.g. "Corridor near Lab" vs "Lab"
+        out_of_place = (expected not in actual and actual not in expected
+                        and not actual.startswith("Corridor"))
+        return expected, actual, slipped, out_of_place
+
+    def expected_room(self, member) -> Optional[str]:
+        slot = self._slots.get(id(member))
+        return self._status(member)[0] if slot is None else self.expected[slot]
+
+    def current_room(self, member) -> str:
+        slot = self._slots.get(id(member))
+        return self._status(member)[1] if slot is None else self.actual[slot]
+
+    def is_slipped(self, member) -> bool:
+        slot = self._slots.get(id(member))
+        return self._status(member)[2] if slot is None else bool(self.slipped >> slot & 1)
+
+    def is_out_of_place(self, member) -> bool:
+        slot = self._slots.get(id(member))
+        return self._status(member)[3] if slot is None else bool(self.out_of_place >> slot & 1)
+
+
+class ScheduleIndex:
+    """
+    Per-game cache of the current ScheduleSnapshot.
+
+    The snapshot is rebuilt only when the hour, a crew position/vital state or
+    a schedule changes, so the renderer, slip detection, interrogation and
+    missionary checks within a turn all share one computation. For CrewMember
+    crews the check is O(1): the cache is keyed on this index's revision, which
+    the game's members bump on every such change. Other crew objects (test
+    doubles) fall back to comparing every member's state.
+    """
+
+    def __init__(self):
+        self.revision = 0
+        self._key = None
+        self._snapshot: Optional[ScheduleSnapshot] = None
+        self._tracked = False  # Every member of the cached crew reports its changes
+        self.stats = {"builds": 0, "hits": 0}
+
+    def invalidate(self):
+        self._key = None
+        self._snapshot = None
+
+    def _key_for(self, game_state, crew, tracked: bool):
+        head = (current_hour(game_state), id(game_state.station_map), id(crew), len(crew),
+                getattr(crew, "revision", None))
+        if tracked:
+            return head + (self.revision,)
+        return head + (
+            tuple((id(m), tuple(m.location), getattr(m, "is_alive", True), compiled_schedule(m).rooms)
+                  for m in crew),
+        )
+
+    def snapshot(self, game_state) -> ScheduleSnapshot:
+        crew = getattr(game_state, "crew", None) or []
+        if self._snapshot is not None:
+            if self._key_for(game_state, crew, self._tracked) == self._key:
+                self.stats["hits"] += 1
+                return self._snapshot
+        # Class-level check so mocks with auto-attributes are compared instead
+        self._tracked = all(callable(getattr(type(m), "attach_schedule_index", None)) for m in crew)
+        if self._tracked:
+            for member in crew:
+                member.attach_schedule_index(self)
+        self._snapshot = ScheduleSnapshot(game_state)
+        self._key = self._key_for(game_state, crew, self._tracked)
+        self.stats["builds"] += 1
+        return self._snapshot
+
+
+def schedule_snapshot(game_state) -> ScheduleSnapshot:
+    """Current snapshot via the game's ScheduleIndex, or a fresh one for bare states."""
+    index = getattr(game_state, "schedule_index", None)
+    if isinstance(index, ScheduleIndex):
+        return index.snapshot(game_state)
+    return ScheduleSnapshot(game_state)
@@ -4,8 +4,10 @@ Manages security cameras and motion sensors that detect movement and log
 events to a security console that NPCs can check.
 """
 
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import weakref
+from typing import Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 from core.event_system import event_bus, EventType, GameEvent
+from entities.map_layers import CAMERA_DIRECTIONS, camera_cone
 
 if TYPE_CHECKING:
     from engine import GameState
@@ -30,48 +32,51 @@ class Camera(SecurityDevice):
     """Security camera with directional cone of view."""
 
     # Direction vectors for cone calculation
-    DIRECTIONS = {
-        "N": (0, -1),
-        "S": (0, 1),
-        "E": (1, 0),
-        "W": (-1, 0),
-    }
+    DIRECTIONS = CAMERA_DIRECTIONS
+
+    # Security systems (weakly referenced) whose device index includes this
+    # camera; moving, refacing or re-ranging it bumps their geometry revision
+    _index_refs = ()
 
     def __init__(self, position: Tuple[int, int], room: str, facing: str, range_tiles: int = 3):
+        self._coverage: Optional[FrozenSet[Tuple[int, int]]] = None
         super().__init__(position, room, "camera")
         self.facing = facing.upper()
         self.range_tiles = range_tiles
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("position", "facing", "range_tiles"):
+            super().__setattr__("_coverage", None)
+            for ref in self._index_refs:
+                system = ref()
+                if system is not None:
+                    system.geometry_revision += 1
+
+    def attach_index(self, system: "SecuritySystem"):
+        """Register a system whose device index must rebuild when this camera's cone changes."""
+        refs = [ref for ref in self._index_refs if ref() is not None and ref() is not system]
+        refs.append(weakref.ref(system))
+        super().__setattr__("_index_refs", tuple(refs))
+
+    @property
+    def coverage(self) -> FrozenSet[Tuple[int, int]]:
+        """Tiles in this camera's cone, whether or not it is operational."""
+        if self._coverage is None:
+            # Camera sees a cone spreading out in the facing direction
+            # Range 1: 1 tile wide, Range 2: 3 tiles wide, Range 3: 5 tiles wide
+            self._coverage = frozenset(camera_cone(self.position, self.facing, self.range_tiles))
+        return self._coverage
+
     def get_visible_tiles(self) -> List[Tuple[int, int]]:
         """Return all tiles this camera can see (cone of view)."""
         if not self.is_operational():
             return []
-
-        visible = []
-        dx, dy = self.DIRECTIONS.get(self.facing, (0, 0))
-        x, y = self.position
-
-        # Camera sees a cone spreading out in the facing direction
-        # Range 1: 1 tile wide, Range 2: 3 tiles wide, Range 3: 5 tiles wide
-        for dist in range(1, self.range_tiles + 1):
-            center_x = x + dx * dist
-            center_y = y + dy * dist
-
-            # Width of cone at this distance
-            spread = dist - 1  # 0, 1, 2 tiles to each side
-
-            if dx != 0:  # Facing E/W, spread along Y
-                for offset in range(-spread, spread + 1):
-                    visible.append((center_x, center_y + offset))
-            else:  # Facing N/S, spread along X
-                for offset in range(-spread, spread + 1):
-                    visible.append((center_x + offset, center_y))
-
-        return visible
+        return camera_cone(self.position, self.facing, self.range_tiles)
 
     def can_see(self, target_pos: Tuple[int, int]) -> bool:
         """Check if camera can see the given position."""
-        return target_pos in self.get_visible_tiles()
+        return self.is_operational() and tuple(target_pos) in self.coverage
 
 
 class MotionSensor(SecurityDevice):
@@ -176,6 +181,13 @@ class SecuritySystem:
         self.game_state = game_state
         self.cameras: Dict[Tuple[int, int], Camera] = {}
         self.motion_sensors: Dict[Tuple[int, int], MotionSensor] = {}
+        # Tile -> devices that cover it (cameras first, in insertion order).
+        # Holds every device; operational state is checked per lookup, so
+        # sabotage and repairs never invalidate it.
+        self._device_index: Optional[Dict[Tuple[int, int], List[SecurityDevice]]] = None
+        self._device_index_key = None
+        # Bumped by this system's cameras when their cones change
+        self.geometry_revision = 0
         if game_state and hasattr(game_state, "security_log"):
             self.security_log = game_state.security_log
         else:
@@ -241,30 +253,55 @@ class SecuritySystem:
         if not mover or not new_pos:
             return
 
-        turn = game_state.turn if game_state else 0
+        devices = self.devices_covering(new_pos)
+        if not devices:
+            return
 
-        # Check cameras
-        for camera in self.cameras.values():
-            if camera.can_see(new_pos):
+        turn = game_state.turn if game_state else 0
+        for device in devices:
+            if not device.is_operational():
+                continue
+            if device.device_type == "camera":
+                # Check cameras
                 self._log_detection(
-                    turn, "camera", camera.room,
+                    turn, "camera", device.room,
                     getattr(mover, "name", "Unknown"),
                     new_pos,
-                    f"Camera in {camera.room} detected movement",
+                    f"Camera in {device.room} detected movement",
                     game_state=game_state
                 )
-
-        # Check motion sensors
-        for sensor in self.motion_sensors.values():
-            if sensor.detects(new_pos):
+            else:
+                # Check motion sensors
                 self._log_detection(
-                    turn, "motion_sensor", sensor.room,
+                    turn, "motion_sensor", device.room,
                     getattr(mover, "name", "Unknown"),
                     new_pos,
-                    f"Motion sensor in {sensor.room} triggered",
+                    f"Motion sensor in {device.room} triggered",
                     game_state=game_state
                 )
 
+    def devices_covering(self, position: Tuple[int, int]) -> List[SecurityDevice]:
+        """Cameras and sensors whose coverage includes a tile (operational or not)."""
+        key = (len(self.cameras), len(self.motion_sensors), self.geometry_revision)
+        if self._device_index is None or self._device_index_key != key:
+            self._build_device_index()
+            self._device_index_key = key
+        return self._device_index.get(tuple(position), [])
+
+    def invalidate_device_index(self):
+        """Force a rebuild after replacing devices in place."""
+        self._device_index = None
+
+    def _build_device_index(self):
+        index: Dict[Tuple[int, int], List[SecurityDevice]] = {}
+        for camera in self.cameras.values():
+            camera.attach_index(self)
+            for tile in camera.coverage:
+                index.setdefault(tile, []).append(camera)
+        for sensor in self.motion_sensors.values():
+            index.setdefault(tuple(sensor.position), []).append(sensor)
+        self._device_index = index
+
     def _log_detection(self, turn: int, device_type: str, device_room: str,
                        target_name: str, target_pos: Tuple[int, int], description: str,
                        game_state: Optional['GameState'] = None):
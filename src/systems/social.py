@@ -1,7 +1,17 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, TYPE_CHECKING
 from enum import Enum, auto
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 from core.event_system import event_bus, EventType, GameEvent
 from core.resolution import Attribute, Skill
 
@@ -70,24 +80,104 @@ class SocialThresholds:
     def _clamp(value: int) -> int:
         return max(0, min(100, int(value)))
 
+def _trust_value(value: float):
+    """Stored trust as the caller would expect it: whole numbers come back as int."""
+    return int(value) if value.is_integer() else value
+
+
+class _TrustRow(MutableMapping):
+    """One observer's row of a TrustMatrix, viewed as {subject: trust}."""
+
+    __slots__ = ("_trust", "_row")
+
+    def __init__(self, trust: "TrustMatrix", row: int):
+        self._trust = trust
+        self._row = row
+
+    def __getitem__(self, subject):
+        col = self._trust._index[subject]
+        return _trust_value(self._trust._values[self._row * self._trust._size + col])
+
+    def __setitem__(self, subject, value):
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Trust for {subject!r} must be a number, not {type(value).__name__}")
+        if subject not in self._trust._index:
+            self._trust._add_member(subject)
+        self._trust._set(self._row, self._trust._index[subject], value)
+
+    def __delitem__(self, subject):
+        raise TypeError("TrustMatrix rows always hold every crew member")
+
+    def __iter__(self):
+        return iter(self._trust._names)
+
+    def __len__(self):
+        return self._trust._size
+
+
+class _TrustRows(MutableMapping):
+    """Dict-of-dicts view (matrix[observer][subject]) over the dense trust storage."""
+
+    __slots__ = ("_trust",)
+
+    def __init__(self, trust: "TrustMatrix"):
+        self._trust = trust
+
+    def __getitem__(self, observer):
+        return _TrustRow(self._trust, self._trust._index[observer])
+
+    def __setitem__(self, observer, subjects):
+        if not isinstance(subjects, Mapping):
+            raise TypeError(f"Trust row for {observer!r} must be a mapping, not {type(subjects).__name__}")
+        if observer not in self._trust._index:
+            self._trust._add_member(observer)
+        row = self[observer]
+        for subject, value in subjects.items():
+            row[subject] = value
+
+    def __delitem__(self, observer):
+        raise TypeError("TrustMatrix rows always hold every crew member")
+
+    def __contains__(self, observer):
+        return observer in self._trust._index
+
+    def __iter__(self):
+        return iter(self._trust._names)
+
+    def __len__(self):
+        return self._trust._size
+
+
 class TrustMatrix:
+    """
+    Observer -> subject trust scores (0-100) for the whole crew.
+
+    Scores live in one dense row-major array indexed by crew position, with a
+    running sum per subject column (excluding self-trust), so average trust is
+    O(1) and paranoia decay is a single vectorized pass when NumPy is
+    installed. Threshold buckets are kept as a parallel vector; bulk passes
+    (decay, the lynch check) compare old and new bucket vectors once and emit
+    TRUST_THRESHOLD_CROSSED for the entries that moved. `matrix` remains
+    available as a dict-of-dicts style view.
+    """
+
     def __init__(self, crew, thresholds: Optional[SocialThresholds] = None):
-        # Dictionary of dictionaries: self.matrix[observer][subject] = trust_value
         # Default trust is 50
-        self.matrix = {m.name: {other.name: 50 for other in crew} for m in crew}
+        self._names: List[str] = [m.name for m in crew]
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        self._size = len(self._names)
+        self._values = array('d', [50.0]) * (self._size * self._size)
+        self._column_sums: List[float] = [50.0 * max(0, self._size - 1)] * self._size
+        # self.matrix[observer][subject] = trust_value
+        self.matrix = _TrustRows(self)
         self.crew_ref = {m.name: m for m in crew} # Keep reference for tag updates
         self.thresholds = thresholds or SocialThresholds()
+        # Bucket of every score (row-major, like _values) and of every average
+        self._buckets = array('b')
+        self._average_values: List[float] = []
+        self._average_buckets: List[int] = []
         self._set_initial_biases()
-        self._trust_buckets: Dict[str, Dict[str, int]] = {
-            observer: {subject: bucket_for_thresholds(value, self.thresholds.trust_thresholds)
-                       for subject, value in subjects.items()}
-            for observer, subjects in self.matrix.items()
-        }
-        self._average_values: Dict[str, float] = {m.name: self.get_average_trust(m.name) for m in crew}
-        self._average_buckets: Dict[str, int] = {
-            name: bucket_for_thresholds(avg, self.thresholds.trust_thresholds)
-            for name, avg in self._average_values.items()
-        }
+        self.rebuild_buckets()
         
         # Subscribe to events
         event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
@@ -95,6 +185,121 @@ class TrustMatrix:
     def cleanup(self):
         event_bus.unsubscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
 
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Plain nested dicts for saving."""
+        return {observer: dict(subjects) for observer, subjects in self.matrix.items()}
+
+    def load(self, data) -> int:
+        """
+        Hydrate saved scores from ``to_dict`` output; returns how many were applied.
+
+        Never raises: rows for names outside the crew, rows that are not
+        mappings and non-numeric scores are skipped with a warning.
+        """
+        applied = skipped = 0
+        if not isinstance(data, Mapping):
+            data = {}
+        for observer, subjects in data.items():
+            row = self._index.get(observer)
+            if row is None or not isinstance(subjects, Mapping):
+                skipped += 1
+                continue
+            for subject, value in subjects.items():
+                col = self._index.get(subject)
+                if col is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                    skipped += 1
+                    continue
+                self._set(row, col, max(0, min(100, value)))
+                applied += 1
+        if skipped:
+            print(f"Warning: Skipped {skipped} unreadable trust entries while loading")
+        self.rebuild_buckets()
+        return applied
+
+    # --- Dense storage ---
+
+    def _set(self, row: int, col: int, value):
+        i = row * self._size + col
+        if row != col:
+            self._column_sums[col] += value - self._values[i]
+        self._values[i] = value
+
+    def _add_member(self, name: str):
+        """Grow the matrix for a name not in the starting crew (e.g. from an older save)."""
+        old_size, old_values = self._size, self._values
+        self._names.append(name)
+        self._index[name] = old_size
+        self._size = size = old_size + 1
+        values = array('d', [50.0]) * (size * size)
+        for row in range(old_size):
+            values[row * size:row * size + old_size] = old_values[row * old_size:(row + 1) * old_size]
+        self._values = values
+        self._recompute_column_sums()
+        if self._buckets:
+            self.rebuild_buckets()
+
+    def _recompute_column_sums(self):
+        size, values = self._size, self._values
+        self._column_sums = [
+            sum(values[col::size]) - values[col * size + col]
+            for col in range(size)
+        ]
+
+    def as_array(self):
+        """Zero-copy (observers, subjects) NumPy view of the trust scores; requires NumPy."""
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is not installed")
+        return np.frombuffer(self._values, dtype=np.float64).reshape(self._size, self._size)
+
+    def apply_decay(self, amount: float):
+        """
+        Lower every trust score (except self-trust) by `amount`, flooring at 0.
+
+        Pair threshold crossings are detected for the whole matrix afterwards.
+        """
+        size = self._size
+        if amount <= 0 or size < 2:
+            return
+        previous = array('d', self._values)
+        if HAS_NUMPY:
+            grid = self.as_array()
+            diagonal = grid.diagonal().copy()
+            np.subtract(grid, amount, out=grid)
+            np.maximum(grid, 0.0, out=grid)
+            np.fill_diagonal(grid, diagonal)
+            self._column_sums = (grid.sum(axis=0) - diagonal).tolist()
+        else:
+            values = self._values
+            for i in range(len(values)):
+                if i % (size + 1):  # Skip the diagonal
+                    value = values[i] - amount
+                    values[i] = value if value > 0 else 0.0
+            self._recompute_column_sums()
+        self._emit_pair_crossings(previous)
+
+    def _bucket_vector(self, values) -> array:
+        """Threshold bucket of every value, in one pass."""
+        thresholds = self.thresholds.trust_thresholds
+        if HAS_NUMPY and len(values):
+            scores = np.frombuffer(values, dtype=np.float64)
+            return array('b', np.searchsorted(thresholds, scores, side='right').astype(np.int8).tobytes())
+        return array('b', [bisect_right(thresholds, value) for value in values])
+
+    def _emit_pair_crossings(self, previous: array):
+        """Compare bucket vectors after a bulk update and emit for every pair that moved."""
+        old_buckets, new_buckets = self._buckets, self._bucket_vector(self._values)
+        self._buckets = new_buckets
+        if HAS_NUMPY:
+            moved = np.flatnonzero(np.frombuffer(old_buckets, dtype=np.int8)
+                                   != np.frombuffer(new_buckets, dtype=np.int8)).tolist()
+        else:
+            moved = [i for i, (old, new) in enumerate(zip(old_buckets, new_buckets)) if old != new]
+        size, names, values = self._size, self._names, self._values
+        for i in moved:
+            row, col = divmod(i, size)
+            self._emit_trust_threshold(names[row], names[col], _trust_value(previous[i]),
+                                       _trust_value(values[i]), new_buckets[i])
+
     def _set_initial_biases(self):
         # Hierarchical Distrust
         if "Childs" in self.matrix and "Garry" in self.matrix["Childs"]:
@@ -122,84 +327,65 @@ class TrustMatrix:
 
     def modify_trust(self, observer_name, subject_name, amount):
         """Adjusts trust and emits threshold events when buckets change."""
-        if observer_name in self.matrix and subject_name in self.matrix[observer_name]:
-            current = self.matrix[observer_name][subject_name]
+        row, col = self._index.get(observer_name), self._index.get(subject_name)
+        if row is not None and col is not None:
+            i = row * self._size + col
+            current = _trust_value(self._values[i])
             new_value = max(0, min(100, current + amount))
-            self.matrix[observer_name][subject_name] = new_value
-            self._maybe_emit_trust_threshold(observer_name, subject_name, current, new_value)
+            self._set(row, col, new_value)
+            new_bucket = bisect_right(self.thresholds.trust_thresholds, new_value)
+            if new_bucket != self._buckets[i]:
+                self._buckets[i] = new_bucket
+                self._emit_trust_threshold(observer_name, subject_name, current, new_value, new_bucket)
 
     def get_trust(self, observer_name, subject_name):
         """Returns the trust score observer has for subject."""
-        if observer_name in self.matrix and subject_name in self.matrix[observer_name]:
-            return self.matrix[observer_name][subject_name]
+        row, col = self._index.get(observer_name), self._index.get(subject_name)
+        if row is not None and col is not None:
+            return _trust_value(self._values[row * self._size + col])
         return 50 # Default neutral
 
     def get_average_trust(self, subject_name):
         """The 'Global Trust' used to determine if a character is tied up."""
-        total = 0
-        count = 0
-        for observer_name in self.matrix:
-            if observer_name != subject_name:
-                if subject_name in self.matrix[observer_name]:
-                    total += self.matrix[observer_name][subject_name]
-                    count += 1
-        return total / count if count > 0 else 50.0
+        col = self._index.get(subject_name)
+        if col is None or self._size < 2:
+            return 50.0
+        return self._column_sums[col] / (self._size - 1)
 
     def rebuild_buckets(self):
         """Recalculate bucket caches after bulk trust updates (e.g., save hydration)."""
-        self._trust_buckets = {
-            observer: {subject: bucket_for_thresholds(value, self.thresholds.trust_thresholds)
-                       for subject, value in subjects.items()}
-            for observer, subjects in self.matrix.items()
-        }
-        self._average_values = {observer: self.get_average_trust(observer) for observer in self.matrix}
-        self._average_buckets = {
-            name: bucket_for_thresholds(avg, self.thresholds.trust_thresholds)
-            for name, avg in self._average_values.items()
-        }
-
-
-    def _maybe_emit_trust_threshold(self, observer_name: str, subject_name: str, previous_value: float, new_value: float):
-        previous_bucket = self._trust_buckets.get(observer_name, {}).get(
-            subject_name, bucket_for_thresholds(previous_value, self.thresholds.trust_thresholds)
-        )
-        new_bucket = bucket_for_thresholds(new_value, self.thresholds.trust_thresholds)
-
-        if new_bucket != previous_bucket:
+        self._buckets = self._bucket_vector(self._values)
+        self._average_values = [self.get_average_trust(name) for name in self._names]
+        self._average_buckets = [bisect_right(self.thresholds.trust_thresholds, avg)
+                                 for avg in self._average_values]
 
-            self._trust_buckets.setdefault(observer_name, {})[subject_name] = new_bucket
-            
-            # Find the specific threshold crossed
-            crossed_threshold = None
-            thresholds = sorted(self.thresholds.trust_thresholds)
-            direction = "UP" if new_value > previous_value else "DOWN"
-
-            if direction == "DOWN":
-                 for t in reversed(thresholds):
-                     if previous_value >= t and new_value < t:
-                         crossed_threshold = t
-                         break
-            else: # UP
-                 for t in thresholds:
-                     if previous_value < t and new_value >= t:
-                         crossed_threshold = t
-                         break
-
-            event_bus.emit(GameEvent(EventType.TRUST_THRESHOLD_CROSSED, {
-                "scope": "pair",
-                "observer": observer_name,
-                "subject": subject_name,
-                "target": subject_name, # Alias for test compatibility
-                "value": new_value,
-                "new_value": new_value, # Alias for test compatibility
-                "previous_value": previous_value,
-                "threshold": crossed_threshold,
-                "bucket": bucket_label(new_bucket),
-                "direction": direction
-            }))
+    @staticmethod
+    def _crossing(thresholds: List[int], previous_value: float, new_value: float):
+        """Direction of a bucket change and the first threshold crossed on the way."""
+        if new_value > previous_value:
+            crossed = [t for t in thresholds if previous_value < t <= new_value]
+            return "UP", (crossed[0] if crossed else None)
+        crossed = [t for t in thresholds if new_value < t <= previous_value]
+        return "DOWN", (crossed[-1] if crossed else None)
+
+    def _emit_trust_threshold(self, observer_name: str, subject_name: str, previous_value: float,
+                              new_value: float, new_bucket: int):
+        direction, crossed_threshold = self._crossing(self.thresholds.trust_thresholds, previous_value, new_value)
+        event_bus.emit(GameEvent(EventType.TRUST_THRESHOLD_CROSSED, {
+            "scope": "pair",
+            "observer": observer_name,
+            "subject": subject_name,
+            "target": subject_name, # Alias for test compatibility
+            "value": new_value,
+            "new_value": new_value, # Alias for test compatibility
+            "previous_value": previous_value,
+            "threshold": crossed_threshold,
+            "bucket": bucket_label(new_bucket),
+            "direction": direction
+        }))
 
-            # Update Relationship Tags
-            self._update_relationship_tags(observer_name, subject_name, new_bucket)
+        # Update Relationship Tags
+        self._update_relationship_tags(observer_name, subject_name, new_bucket)
 
     def _update_relationship_tags(self, observer_name: str, subject_name: str, bucket: int):
         """Update Friend/Rival tags based on trust bucket."""
@@ -221,37 +407,25 @@ class TrustMatrix:
         elif label == "critical": # < 20
              observer.relationship_tags.append(f"Rival:{subject_name}")
 
-    def _track_average_threshold(self, member_name: str, average_value: float):
-        previous_value = self._average_values.get(member_name, average_value)
-        previous_bucket = self._average_buckets.get(
-            member_name, bucket_for_thresholds(previous_value, self.thresholds.trust_thresholds)
-        )
-        new_bucket = bucket_for_thresholds(average_value, self.thresholds.trust_thresholds)
-
-        self._average_values[member_name] = average_value
-        if new_bucket != previous_bucket:
-            self._average_buckets[member_name] = new_bucket
-            
-            # Find the specific threshold crossed
-            crossed_threshold = None
-            thresholds = sorted(self.thresholds.trust_thresholds)
-            if average_value < previous_value: # DOWN
-                 direction = "DOWN"
-                 for t in reversed(thresholds):
-                     if previous_value >= t and average_value < t:
-                         crossed_threshold = t
-                         break
-            else: # UP
-                 direction = "UP"
-                 for t in thresholds:
-                     if previous_value < t and average_value >= t:
-                         crossed_threshold = t
-                         break
-
+    def _emit_average_crossings(self, crew):
+        """Compare average-trust buckets for the living crew once and emit for those that moved."""
+        thresholds = self.thresholds.trust_thresholds
+        for member in crew:
+            col = self._index.get(member.name)
+            if col is None or not member.is_alive:
+                continue
+            average_value = self.get_average_trust(member.name)
+            previous_value = self._average_values[col]
+            new_bucket = bisect_right(thresholds, average_value)
+            self._average_values[col] = average_value
+            if new_bucket == self._average_buckets[col]:
+                continue
+            self._average_buckets[col] = new_bucket
+            direction, crossed_threshold = self._crossing(thresholds, previous_value, average_value)
             event_bus.emit(GameEvent(EventType.TRUST_THRESHOLD_CROSSED, {
                 "scope": "average",
-                "subject": member_name,
-                "target": member_name, # Alias for test compatibility
+                "subject": member.name,
+                "target": member.name, # Alias for test compatibility
                 "value": average_value,
                 "new_value": average_value, # Alias for test compatibility
                 "previous_value": previous_value,
@@ -263,12 +437,11 @@ class TrustMatrix:
     def check_for_lynch_mob(self, crew, game_state=None, lynch_threshold: Optional[int] = None):
         """If global trust in a human falls below the configured threshold, they are targeted."""
         threshold = self.thresholds.lynch_average_threshold if lynch_threshold is None else lynch_threshold
+        # Every living member's average is checked for crossings, not just those before a target
+        self._emit_average_crossings(crew)
         for member in crew:
             if member.is_alive:
                 avg = self.get_average_trust(member.name)
-                # This call will emit TRUST_THRESHOLD_CROSSED if buckets change
-                self._track_average_threshold(member.name, avg)
-                
                 # Check for Lynch Trigger specifically
                 if avg < threshold:
                     # Emit LYNCH_MOB_TRIGGER event
@@ -289,10 +462,7 @@ class TrustMatrix:
             # Global Trust Decay based on Paranoia
             decay_amount = int(game_state.paranoia_level / 20)
             if decay_amount > 0:
-                for observer in self.matrix:
-                    for subject in self.matrix[observer]:
-                        if observer != subject:
-                            self.matrix[observer][subject] = max(0, self.matrix[observer][subject] - decay_amount)
+                self.apply_decay(decay_amount)
 
             targeted = self.check_for_lynch_mob(game_state.crew, game_state)
             if targeted and targeted.is_alive:
@@ -361,12 +531,10 @@ class LynchMobSystem:
 
     def _load_gathering_location(self):
         """Load lynch mob gathering location from config, default to Rec Room."""
-        import json
         import os
+        from core.config_cache import load_json
         try:
-            config_path = os.path.join("config", "game_settings.json")
-            with open(config_path, 'r') as f:
-                settings = json.load(f)
+            settings = load_json(os.path.join("config", "game_settings.json"))
             return settings.get("lynch_mob", {}).get("gathering_location", "Rec Room")
         except Exception:
             return "Rec Room"  # Fallback default
@@ -0,0 +1,239 @@
+"""
+Crew Spatial Index
+Per-tile and per-room buckets of crew members, kept current as they move.
+
+CrewMember.location notifies every index tracking the member, so co-location
+questions ("who is on this tile / in this room / within N tiles?") are bucket
+lookups instead of scans over the whole crew. Results are always returned in
+crew order so callers that roll dice per member stay deterministic.
+"""
+
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Coord = Tuple[int, int]
+
+
+class CrewRoster(list):
+    """
+    A crew list that counts its own mutations.
+
+    ``revision`` changes whenever members are added, removed, replaced or
+    reordered, so indexes can tell the roster is unchanged without comparing
+    every member.
+    """
+
+    revision = 0
+
+    def _mutated(self):
+        self.revision += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._mutated()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._mutated()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._mutated()
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._mutated()
+        return result
+
+    def append(self, member):
+        super().append(member)
+        self._mutated()
+
+    def extend(self, members):
+        super().extend(members)
+        self._mutated()
+
+    def insert(self, index, member):
+        super().insert(index, member)
+        self._mutated()
+
+    def remove(self, member):
+        super().remove(member)
+        self._mutated()
+
+    def pop(self, index=-1):
+        member = super().pop(index)
+        self._mutated()
+        return member
+
+    def clear(self):
+        super().clear()
+        self._mutated()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._mutated()
+
+    def reverse(self):
+        super().reverse()
+        self._mutated()
+
+
+class CrewSpatialIndex:
+    """Tile -> members and room -> members buckets for one game's crew."""
+
+    def __init__(self):
+        self.station_map = None
+        self._roster = None
+        self._roster_revision = None
+        self._crew_ids: Tuple[int, ...] = ()
+        self._slots: Dict[int, int] = {}
+        self._members: List = []
+        self._positions: Dict[int, Coord] = {}
+        self._member_rooms: Dict[int, str] = {}
+        self._tiles: Dict[Coord, List] = {}
+        self._rooms: Dict[str, List] = {}
+        # Members that can't notify us of moves (plain objects in tests, etc.)
+        self._polled: List = []
+        self.stats = {"rebuilds": 0, "moves": 0}
+
+    # --- Maintenance ---
+
+    def sync(self, crew, station_map) -> "CrewSpatialIndex":
+        """Rebuild if the crew roster or map changed; refresh members that can't notify."""
+        if self._roster_changed(crew) or station_map is not self.station_map:
+            self._rebuild(crew, tuple(map(id, crew)), station_map)
+        else:
+            for member in self._polled:
+                location = tuple(member.location)
+                if self._positions.get(id(member)) != location:
+                    self._place(member, location)
+        return self
+
+    def _roster_changed(self, crew) -> bool:
+        # A CrewRoster says whether it changed; plain lists are compared by member
+        if isinstance(crew, CrewRoster):
+            return crew is not self._roster or crew.revision != self._roster_revision
+        return tuple(map(id, crew)) != self._crew_ids
+
+    def _rebuild(self, crew, crew_ids, station_map):
+        self.station_map = station_map
+        self._roster = crew if isinstance(crew, CrewRoster) else None
+        self._roster_revision = getattr(crew, "revision", None)
+        self._crew_ids = crew_ids
+        self._members = list(crew)
+        self._slots = {member_id: slot for slot, member_id in enumerate(crew_ids)}
+        self._positions = {}
+        self._member_rooms = {}
+        self._tiles = {}
+        self._rooms = {}
+        self._polled = []
+        for member in self._members:
+            # Class-level check so mocks with auto-attributes are polled instead
+            if callable(getattr(type(member), "attach_spatial_index", None)):
+                member.attach_spatial_index(self)
+            else:
+                self._polled.append(member)
+            self._place(member, tuple(member.location))
+        self.stats["rebuilds"] += 1
+
+    def on_moved(self, member, location):
+        """Called by CrewMember when its location is assigned."""
+        if id(member) in self._slots:
+            self._place(member, tuple(location))
+            self.stats["moves"] += 1
+
+    def _place(self, member, location: Coord):
+        member_id = id(member)
+        old = self._positions.get(member_id)
+        if old == location:
+            return
+        if old is not None:
+            self._tiles[old].remove(member)
+            if not self._tiles[old]:
+                del self._tiles[old]
+            old_room = self._member_rooms.pop(member_id, None)
+            if old_room is not None:
+                self._rooms[old_room].remove(member)
+                if not self._rooms[old_room]:
+                    del self._rooms[old_room]
+        self._positions[member_id] = location
+        self._tiles.setdefault(location, []).append(member)
+        # Room buckets need a map; tile buckets work without one
+        if self.station_map is not None:
+            room = self.station_map.get_room_name(*location)
+            self._member_rooms[member_id] = room
+            self._rooms.setdefault(room, []).append(member)
+
+    def _ordered(self, members: Iterable) -> List:
+        members = list(members)
+        if len(members) > 1:
+            members.sort(key=lambda m: self._slots[id(m)])
+        return members
+
+    # --- Queries ---
+
+    def at(self, location: Coord) -> List:
+        """Members standing on a tile, in crew order."""
+        return self._ordered(self._tiles.get(tuple(location), ()))
+
+    def first_at(self, location: Coord, exclude=None):
+        """First member (crew order) on a tile other than ``exclude``, or None."""
+        bucket = self._tiles.get(tuple(location))
+        if not bucket:
+            return None
+        candidates = [m for m in bucket if m is not exclude]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda m: self._slots[id(m)])
+
+    def in_room(self, room_name: str) -> List:
+        """Members whose tile belongs to room_name (corridor sectors included), in crew order."""
+        return self._ordered(self._rooms.get(room_name, ()))
+
+    def room_of(self, member) -> Optional[str]:
+        return self._member_rooms.get(id(member))
+
+    def within(self, location: Coord, radius: int, metric: str = "manhattan") -> List:
+        """Members within radius of location, in crew order.
+
+        metric is "manhattan", "euclidean" or "chebyshev".
+        """
+        x, y = location
+        if (2 * radius + 1) ** 2 < len(self._members):
+            candidates = []
+            for ty in range(y - radius, y + radius + 1):
+                for tx in range(x - radius, x + radius + 1):
+                    candidates.extend(self._tiles.get((tx, ty), ()))
+        else:
+            candidates = self._members
+
+        found = []
+        for member in candidates:
+            mx, my = self._positions[id(member)]
+            dx, dy = abs(mx - x), abs(my - y)
+            if metric == "euclidean":
+                inside = dx * dx + dy * dy <= radius * radius
+            elif metric == "chebyshev":
+                inside = max(dx, dy) <= radius
+            else:
+                inside = dx + dy <= radius
+            if inside:
+                found.append(member)
+        return self._ordered(found)
+
+
+def crew_index(game_state) -> CrewSpatialIndex:
+    """The game's synced spatial index, or a throwaway one for bare states."""
+    index = getattr(game_state, "crew_index", None)
+    if not isinstance(index, CrewSpatialIndex):
+        index = CrewSpatialIndex()
+    return index.sync(getattr(game_state, "crew", None) or [], getattr(game_state, "station_map", None))
+
+
+def attach(member, index: CrewSpatialIndex):
+    """Register index for move notifications on member (kept weakly)."""
+    refs = [ref for ref in member._spatial_refs if ref() is not None and ref() is not index]
+    refs.append(weakref.ref(index))
+    member._spatial_refs = tuple(refs)
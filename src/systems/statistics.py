@@ -7,9 +7,10 @@ Statistics persist to a JSON file.
 import os
 import json
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, fields
 from typing import Dict, List, Optional
 from core.event_system import event_bus, EventType, GameEvent
+from systems.profile_store import profile_store, merge_counters
 
 
 # Statistics file location
@@ -63,13 +64,21 @@ class CareerStats:
 
 
 class StatisticsManager:
-    """Manages game statistics tracking and persistence."""
+    """Manages game statistics tracking and persistence.
 
-    def __init__(self):
+    Career data is kept in the shared profile store and written atomically
+    when a session ends (or on save()), merged into whatever other managers
+    sharing the file wrote meanwhile; loading reuses the store's cached parse.
+    """
+
+    def __init__(self, stats_file: str = None, store=None):
+        self.stats_file = stats_file or STATS_FILE
+        self._store = store or profile_store
         self.career = CareerStats()
         self.current_session: Optional[GameSessionStats] = None
         self._visited_rooms = set()
         self.load()
+        self._store_token = self._store.register(self.stats_file, self.to_dict, merge=self.merge_career)
         self._subscribe_events()
 
     def _subscribe_events(self):
@@ -85,38 +94,50 @@ class StatisticsManager:
     def load(self):
         """Load career statistics from file."""
         try:
-            if os.path.exists(STATS_FILE):
-                with open(STATS_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Reconstruct CareerStats from dict
-                    self.career = CareerStats(
-                        total_games=data.get('total_games', 0),
-                        victories=data.get('victories', 0),
-                        deaths=data.get('deaths', 0),
-                        infections=data.get('infections', 0),
-                        quits=data.get('quits', 0),
-                        total_turns=data.get('total_turns', 0),
-                        total_things_killed=data.get('total_things_killed', 0),
-                        total_humans_killed=data.get('total_humans_killed', 0),
-                        total_blood_tests=data.get('total_blood_tests', 0),
-                        total_things_revealed=data.get('total_things_revealed', 0),
-                        best_survival_turns=data.get('best_survival_turns', 0),
-                        fastest_victory_turns=data.get('fastest_victory_turns', 999999),
-                        sessions=data.get('sessions', [])[-20:]  # Keep last 20
-                    )
+            data = self._store.load(self.stats_file)
         except (IOError, json.JSONDecodeError):
-            pass  # Use defaults
+            return  # Use defaults
+        if not data:
+            return
+        # Reconstruct CareerStats from dict
+        known = {f.name for f in fields(CareerStats)}
+        values = {key: value for key, value in data.items() if key in known}
+        values['ending_types_witnessed'] = dict(values.get('ending_types_witnessed', {}))
+        values['sessions'] = list(values.get('sessions', []))[-20:]  # Keep last 20
+        self.career = CareerStats(**values)
+
+    def to_dict(self) -> dict:
+        """Serializable career statistics (the stats file contents)."""
+        data = asdict(self.career)
+        # Only keep last 20 sessions to limit file size
+        data['sessions'] = data['sessions'][-20:]
+        return data
+
+    @staticmethod
+    def merge_career(base: dict, ours: dict, theirs: dict) -> dict:
+        """
+        Fold this manager's changes since ``base`` into the stats file ``theirs``.
+
+        Totals add our delta, records keep the better value, and sessions we
+        finished since ``base`` are appended to the file's history.
+        """
+        records = ("best_survival_turns", "fastest_victory_turns", "sessions")
+        merged = merge_counters(base, {key: value for key, value in ours.items() if key not in records}, theirs)
+        merged["best_survival_turns"] = max(ours.get("best_survival_turns", 0),
+                                            theirs.get("best_survival_turns", 0))
+        merged["fastest_victory_turns"] = min(ours.get("fastest_victory_turns", 999999),
+                                              theirs.get("fastest_victory_turns", 999999))
+        finished = ours.get("total_games", 0) - base.get("total_games", 0)
+        sessions = list(theirs.get("sessions", []))
+        if finished > 0:
+            sessions.extend(ours.get("sessions", [])[-finished:])
+        merged["sessions"] = sessions[-20:]
+        return merged
 
     def save(self):
-        """Save career statistics to file."""
-        try:
-            data = asdict(self.career)
-            # Only keep last 20 sessions to limit file size
-            data['sessions'] = data['sessions'][-20:]
-            with open(STATS_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-        except IOError:
-            pass  # Can't save
+        """Save career statistics to file now."""
+        self._store.mark_dirty(self.stats_file, self._store_token)
+        self._store.flush(self.stats_file)
 
     def start_session(self, difficulty: str = "Normal"):
         """Start tracking a new game session."""
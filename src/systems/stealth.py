@@ -5,6 +5,7 @@ from core.resolution import Attribute, ResolutionSystem, Skill
 from core.perception import normalize_perception_payload
 from systems.room_state import RoomState
 from entities.crew_member import StealthPosture
+from systems.spatial_index import crew_index
 from systems.dialogue import DialogueSystem
 
 class StealthSystem:
@@ -108,10 +109,8 @@ class StealthSystem:
             return
 
         room = station_map.get_room_name(*player.location)
-        nearby_infected = [
-            m for m in self._detect_candidates(crew)
-            if getattr(m, "location", None) == player.location and m != player
-        ]
+        sharing_tile = crew_index(game_state).at(player.location)
+        nearby_infected = [m for m in self._detect_candidates(sharing_tile) if m != player]
 
         if not nearby_infected or self.cooldown > 0:
             return
@@ -291,65 +290,108 @@ class StealthSystem:
 
         self.cooldown = self.config.get("cooldown_turns", 1)
 
-    def evaluate_detection(self, observer, subject, game_state, noise_level=None, alert_bonus: int = 0) -> bool:
+    def evaluate_detection(self, observer, subject, game_state, noise_level=None, alert_bonus: int = 0,
+                           subject_context: Optional[dict] = None) -> bool:
         """
         Check if observer detects subject.
         Returns True if detected.
         """
+        return self.evaluate_detection_batch([observer], subject, game_state, noise_level, alert_bonus,
+                                             subject_context)[0]
+
+    def evaluate_detection_batch(self, observers, subject, game_state, noise_level=None, alert_bonus: int = 0,
+                                 subject_context: Optional[dict] = None) -> List[bool]:
+        """
+        Check several observers (e.g. everyone in a room) against one subject.
+
+        All contest pools - subject, visual and, in unfrozen darkness, thermal -
+        are rolled in a single batch in observer order. Returns one detection
+        flag per observer. subject_context (from prepare_subject_context) skips
+        rebuilding the subject's side of the contest.
+        """
         if noise_level is None:
             noise_level = subject.get_noise_level()
 
-        ctx = self._prepare_detection_context(observer, subject, game_state, noise_level, alert_bonus)
+        if subject_context is None:
+            subject_context = self.prepare_subject_context(subject, game_state, noise_level, alert_bonus)
+        contexts = []
+        pools = []
+        for observer in observers:
+            ctx = self._prepare_detection_context(observer, subject, game_state, noise_level, alert_bonus,
+                                                  subject_context)
+            ctx["thermal_allowed"] = ctx["is_dark"] and not ctx["is_frozen"]
+            pools.extend((ctx["subject_pool"], ctx["observer_pool"]))
+            if ctx["thermal_allowed"]:
+                ctx["thermal_pool"] = self._thermal_pool(observer, ctx)
+                pools.append(ctx["thermal_pool"])
+            contexts.append(ctx)
+
+        rolls = iter(ResolutionSystem.roll_checks(pools, game_state.rng))
+        results = []
+        for observer, ctx in zip(observers, contexts):
+            subject_successes = next(rolls)
+
+            # Visual detection
+            observer_score = next(rolls)
+            if ctx["env_effects"]:
+                observer_score = max(0, observer_score + ctx["env_effects"].stealth_detection_modifier)
+            visual_detected = observer_score >= subject_successes
+
+            # Heat-based detection when room is dark and not frozen
+            thermal_detected = False
+            if ctx["thermal_allowed"]:
+                thermal_successes = next(rolls)
+                # Subject's thermal signature (Things run hotter)
+                if hasattr(subject, 'get_thermal_signature'):
+                    subject_thermal = subject.get_thermal_signature()
+                else:
+                    subject_thermal = 2  # Default human thermal
+                # Thermal detection is easier against higher thermal signatures
+                thermal_threshold = max(0, subject_successes - max(0, subject_thermal - 2))
+                thermal_detected = thermal_successes >= thermal_threshold
 
-        res = ResolutionSystem()
-        subject_result = ResolutionSystem.roll_check(ctx["subject_pool"], game_state.rng)
+            results.append(visual_detected or thermal_detected)
 
-        # Visual detection
-        observer_result = ResolutionSystem.roll_check(ctx["observer_pool"], game_state.rng)
-        observer_score = observer_result['success_count']
-        if ctx["env_effects"]:
-            observer_score = max(0, observer_score + ctx["env_effects"].stealth_detection_modifier)
+        # Reverse thermal checks roll their own dice, so they run after the batch
+        for i, (observer, detected) in enumerate(zip(observers, results)):
+            if not detected and getattr(observer, "is_infected", False):
+                results[i] = self.check_reverse_thermal_detection(observer, subject, game_state)
 
-        visual_detected = observer_score >= subject_result['success_count']
+        return results
 
-        # Heat-based detection when room is dark and not frozen
-        thermal_detected = False
+    @staticmethod
+    def _thermal_pool(observer, ctx) -> int:
         thermal_bonus = 0
         thermal_context = ctx["env_effects"] or ctx.get("resolution_mods")
         if thermal_context and getattr(thermal_context, "heat_detection_enabled", False):
             thermal_bonus = getattr(thermal_context, "thermal_detection_bonus", 0)
 
-        thermal_allowed = ctx["is_dark"] and not ctx["is_frozen"]
-
-        if thermal_allowed:
-            # Get observer's thermal detection pool (includes thermal goggles bonus)
-            if hasattr(observer, 'get_thermal_detection_pool'):
-                thermal_pool = observer.get_thermal_detection_pool()
-            else:
-                thermal_pool = observer.attributes.get(Attribute.THERMAL, 2)
-
-            # Environmental/room thermal bonus (power off gives equipment bonus)
-            thermal_pool += thermal_bonus
-
-            # Subject's thermal signature (Things run hotter)
-            if hasattr(subject, 'get_thermal_signature'):
-                subject_thermal = subject.get_thermal_signature()
-            else:
-                subject_thermal = 2  # Default human thermal
+        # Get observer's thermal detection pool (includes thermal goggles bonus)
+        if hasattr(observer, 'get_thermal_detection_pool'):
+            thermal_pool = observer.get_thermal_detection_pool()
+        else:
+            thermal_pool = observer.attributes.get(Attribute.THERMAL, 2)
 
-            thermal_pool = max(1, thermal_pool)
-            thermal_result = ResolutionSystem.roll_check(thermal_pool, game_state.rng)
-            # Thermal detection is easier against higher thermal signatures
-            thermal_threshold = max(0, subject_result['success_count'] - max(0, subject_thermal - 2))
-            thermal_detected = thermal_result['success_count'] >= thermal_threshold
+        # Environmental/room thermal bonus (power off gives equipment bonus)
+        return max(1, thermal_pool + thermal_bonus)
 
-        if not (visual_detected or thermal_detected) and getattr(observer, "is_infected", False):
-            thermal_detected = self.check_reverse_thermal_detection(observer, subject, game_state)
+    def _prepare_detection_context(self, observer, subject, game_state, noise_level: int, alert_bonus: int = 0,
+                                   subject_context: Optional[dict] = None):
+        """Build detection pools and environmental context for repeated calculations."""
+        if subject_context is None:
+            subject_context = self.prepare_subject_context(subject, game_state, noise_level, alert_bonus)
+        ctx = dict(subject_context)
+        ctx["observer_pool"] = self._observer_pool(observer, subject_context)
+        return ctx
 
-        return visual_detected or thermal_detected
+    def prepare_subject_context(self, subject, game_state, noise_level: int, alert_bonus: int = 0) -> dict:
+        """
+        Observer-independent half of a detection context: the subject's room,
+        darkness, environmental modifiers and dice pool.
 
-    def _prepare_detection_context(self, observer, subject, game_state, noise_level: int, alert_bonus: int = 0):
-        """Build detection pools and environmental context for repeated calculations."""
+        Build it once per turn and pass it as subject_context= when checking
+        several observers against the same subject.
+        """
         station_map = getattr(game_state, "station_map", None)
         room_states = getattr(game_state, "room_states", None)
         env = getattr(game_state, "environmental_coordinator", None)
@@ -360,11 +402,6 @@ class StealthSystem:
         is_dark = room_states.has_state(room_name, RoomState.DARK) if room_states and room_name else False
         is_frozen = room_states.has_state(room_name, RoomState.FROZEN) if room_states and room_name else False
 
-        # Base visual pools
-        logic = observer.attributes.get(Attribute.LOGIC, 1)
-        observation = observer.skills.get(Skill.OBSERVATION, 0)
-        observer_pool = logic + observation
-
         # Station Alert Bonus (all NPCs more vigilant during alert)
         alert_system = getattr(game_state, 'alert_system', None)
         system_bonus = alert_system.get_observation_bonus() if alert_system and alert_system.is_active else 0
@@ -372,8 +409,6 @@ class StealthSystem:
         if getattr(game_state, "alert_status", "").upper() == "ALERT" and getattr(game_state, "alert_turns_remaining", 0) > 0:
             status_bonus = max(status_bonus, 1)
 
-        observer_pool += max(system_bonus, alert_bonus, status_bonus)
-
         prowess = subject.attributes.get(Attribute.PROWESS, 1)
         stealth = subject.skills.get(Skill.STEALTH, 0)
         subject_pool = prowess + stealth
@@ -394,7 +429,6 @@ class StealthSystem:
         env_effects = None
         if env and room_name:
             env_effects = env.get_current_modifiers(room_name, game_state)
-            observer_pool = ResolutionSystem.adjust_pool(observer_pool, env_effects.observation_pool_modifier)
 
         has_resolution_mods = hasattr(room_states, "get_resolution_modifiers")
         resolution_mods = room_states.get_resolution_modifiers(room_name) if has_resolution_mods and room_name else None
@@ -402,12 +436,10 @@ class StealthSystem:
         # Darkness makes visual spotting harder
         if is_dark:
             subject_pool += 2
-            observer_pool = max(1, observer_pool - 2)
 
-        # Noise acts as penalty to subject pool (inverse of stealth) and a boon to observers
+        # Noise acts as penalty to subject pool (inverse of stealth)
         noise_penalty = noise_level // 2
         subject_pool = max(1, subject_pool - noise_penalty)
-        observer_pool = max(1, observer_pool + noise_level)
 
         # Apply hiding spot modifiers when present
         hiding_spot, cover_bonus, blocks_los = self._hiding_spot_modifiers(getattr(game_state, "station_map", None), subject)
@@ -417,10 +449,10 @@ class StealthSystem:
         else:
             observer_result_penalty = 0
 
-        # Return context dict for use by detection methods
         return {
             "subject_pool": subject_pool,
-            "observer_pool": observer_pool,
+            "observer_bonus": max(system_bonus, alert_bonus, status_bonus),
+            "noise_level": noise_level,
             "is_dark": is_dark,
             "is_frozen": is_frozen,
             "env_effects": env_effects,
@@ -429,6 +461,22 @@ class StealthSystem:
             "room_name": room_name
         }
 
+    @staticmethod
+    def _observer_pool(observer, subject_context: dict) -> int:
+        """Observer's visual pool against a prepared subject context."""
+        # Base visual pools
+        logic = observer.attributes.get(Attribute.LOGIC, 1)
+        observation = observer.skills.get(Skill.OBSERVATION, 0)
+        observer_pool = logic + observation + subject_context["observer_bonus"]
+
+        env_effects = subject_context["env_effects"]
+        if env_effects:
+            observer_pool = ResolutionSystem.adjust_pool(observer_pool, env_effects.observation_pool_modifier)
+        if subject_context["is_dark"]:
+            observer_pool = max(1, observer_pool - 2)
+        # Noise is a boon to observers
+        return max(1, observer_pool + subject_context["noise_level"])
+
     # === VENT MECHANICS CONFIGURATION ===
     VENT_BASE_NOISE = 14        # Louder echoing noise in metal ducts
     VENT_ENCOUNTER_CHANCE = 0.20  # 20% chance to encounter Thing in vents (configurable)
@@ -455,9 +503,7 @@ class StealthSystem:
             }))
 
         if result.success:
-            event_bus.emit(GameEvent(EventType.SYSTEM_LOG, {
-                "text": f"{observer.name}'s suspicion drops after your explanation."
-            }))
+            event_bus.emit_text(EventType.SYSTEM_LOG, "{}'s suspicion drops after your explanation.", observer.name)
         elif result.success is False:
             event_bus.emit(GameEvent(EventType.WARNING, {
                 "text": f"{observer.name} grows hostile and keeps eyes on you!"
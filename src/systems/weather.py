@@ -1,5 +1,5 @@
 from enum import Enum
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, EventType, GameEvent, EventPriority
 from systems.architect import RandomnessEngine
 
 class WindDirection(Enum):
@@ -38,7 +38,7 @@ class WeatherSystem:
         self._recalculate_modifiers()
         
         # Subscribe to turn advances
-        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
+        event_bus.subscribe(EventType.TURN_ADVANCE, self.on_turn_advance, priority=EventPriority.ENVIRONMENT)
 
     def cleanup(self):
         event_bus.unsubscribe(EventType.TURN_ADVANCE, self.on_turn_advance)
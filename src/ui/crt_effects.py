@@ -3,8 +3,14 @@ CRT Shader/Styling System
 Authentic 1982 terminal aesthetics with text crawl, glitches, and scanlines.
 """
 
+import atexit
+import os
+import select
 import sys
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 
 # ANSI color codes for terminal effects
 class ANSI:
@@ -74,10 +80,172 @@ PALETTES = {
 }
 
 
+def _input_pending():
+    """True if the player has typed ahead of the text currently animating."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            return msvcrt.kbhit()
+        stdin = sys.stdin
+        if stdin is None or not stdin.isatty():
+            return False
+        return bool(select.select([stdin], [], [], 0)[0])
+    except (OSError, ValueError, ImportError):
+        return False
+
+
+class TerminalWriter:
+    """
+    Plays output segments on the calling thread (the default, non-interactive path).
+
+    A segment is ``(kind, text, timing)``: ``"write"`` text goes out in one burst,
+    ``"crawl"`` text is revealed per character with ``timing`` holding each delay,
+    and ``"pause"`` waits ``timing`` seconds.
+    """
+
+    def __init__(self, stream=None):
+        self._stream = stream
+
+    @property
+    def stream(self):
+        return self._stream or sys.stdout
+
+    def submit(self, segment):
+        self._play(segment)
+
+    def skip(self):
+        pass
+
+    def drain(self, timeout=None):
+        return True
+
+    def close(self):
+        pass
+
+    def _skipping(self):
+        return False
+
+    def _wait(self, seconds):
+        time.sleep(seconds)
+
+    def _play(self, segment):
+        kind, text, timing = segment
+        stream = self.stream
+        if kind == "crawl":
+            for index, (char, delay) in enumerate(zip(text, timing)):
+                if self._skipping():
+                    stream.write(text[index:])
+                    break
+                stream.write(char)
+                stream.flush()
+                if delay:
+                    self._wait(delay)
+        elif kind == "pause":
+            if not self._skipping():
+                self._wait(timing)
+        else:
+            stream.write(text)
+        stream.flush()
+
+
+class ThreadedTerminalWriter(TerminalWriter):
+    """
+    Plays segments on a dedicated output thread so the game loop never sleeps on
+    cosmetic effects. ``skip()`` (or a keypress while text animates) fast-forwards
+    everything queued until the writer catches up.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream or sys.stdout)
+        self._segments = deque()
+        self._cond = threading.Condition()
+        self._skip = threading.Event()
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="crt-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, segment):
+        with self._cond:
+            if not self._closed:
+                self._segments.append(segment)
+                self._cond.notify_all()
+                return
+        self._play(segment)
+
+    def skip(self):
+        self._skip.set()
+
+    def idle(self):
+        with self._cond:
+            return not self._segments and not self._busy
+
+    def drain(self, timeout=None):
+        """Block until every queued segment has been written. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._segments and not self._busy, timeout)
+
+    def close(self):
+        self.drain()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _skipping(self):
+        if not self._skip.is_set() and _input_pending():
+            self._skip.set()
+        return self._skip.is_set()
+
+    def _wait(self, seconds):
+        self._skip.wait(seconds)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._segments or self._closed)
+                if not self._segments:
+                    return
+                segment = self._segments.popleft()
+                self._busy = True
+            try:
+                self._play(segment)
+            except Exception as e:
+                sys.stderr.write(f"CRT writer error: {e}\n")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    if not self._segments:
+                        self._skip.clear()
+                        self._cond.notify_all()
+
+
+class _PipelineStdout:
+    """Stands in for sys.stdout while the pipeline runs so stray print() calls stay in order."""
+
+    def __init__(self, writer, stream):
+        self._writer = writer
+        self._stream = stream
+
+    def write(self, text):
+        self._writer.submit(("write", text, None))
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 class CRTOutput:
     """
     Wraps all text output to simulate a 1982 CRT terminal.
     Features: text crawl, glitches, scanlines, flicker.
+
+    Output is handed to a writer as segments. By default they play synchronously;
+    interactive loops call ``start_pipeline()`` to animate them on a background
+    thread, and ``frame()`` batches a whole screen into a single write.
     """
 
     def __init__(self, palette="amber", crawl_speed=0.02, rng=None):
@@ -93,6 +261,11 @@ class CRTOutput:
         self.capture_mode = False
         self.buffer = []
 
+        # Terminal output: synchronous until an interactive loop starts the pipeline
+        self._writer = TerminalWriter()
+        self._frame = None
+        self._saved_stdout = None
+
         # Set color based on palette
         self.set_palette(palette)
 
@@ -126,6 +299,102 @@ class CRTOutput:
         self.buffer = []
         return messages
 
+    def start_pipeline(self, stream=None):
+        """
+        Move terminal output onto a background writer thread.
+
+        Crawls, glitches and pauses then animate without blocking the caller, and
+        sys.stdout is routed through the same queue so plain print() calls keep
+        their place after any text still animating.
+        """
+        if isinstance(self._writer, ThreadedTerminalWriter):
+            return
+        stream = stream or sys.stdout
+        self._writer = ThreadedTerminalWriter(stream)
+        self._saved_stdout = sys.stdout
+        sys.stdout = _PipelineStdout(self._writer, stream)
+        atexit.register(self.stop_pipeline)
+
+    def stop_pipeline(self):
+        """Finish writing queued output and return to synchronous printing."""
+        writer = self._writer
+        if not isinstance(writer, ThreadedTerminalWriter):
+            return
+        atexit.unregister(self.stop_pipeline)
+        if self._saved_stdout is not None:
+            sys.stdout = self._saved_stdout
+            self._saved_stdout = None
+        self._writer = TerminalWriter()
+        writer.close()
+
+    def skip_effects(self):
+        """Fast-forward any text still animating and wait for it to land."""
+        self._writer.skip()
+        self._writer.drain()
+
+    def read_line(self, prompt=""):
+        """
+        Read a command. With the pipeline running the prompt queues behind any
+        animating text and the Enter key skips what is left of it.
+        """
+        if not isinstance(self._writer, ThreadedTerminalWriter):
+            return input(prompt)
+        self._write(prompt)
+        try:
+            return input()
+        finally:
+            self.skip_effects()
+
+    @contextmanager
+    def frame(self):
+        """Compose all output made inside the block and present it as one write."""
+        if self._frame is not None:
+            yield self
+            return
+        self._frame = []
+        try:
+            yield self
+        finally:
+            segments, self._frame = self._frame, None
+            for segment in segments:
+                self._writer.submit(segment)
+
+    def _submit(self, segment):
+        frame = self._frame
+        if frame is None:
+            self._writer.submit(segment)
+        elif segment[0] == "write" and frame and frame[-1][0] == "write":
+            frame[-1] = ("write", frame[-1][1] + segment[1], None)
+        else:
+            frame.append(segment)
+
+    def _write(self, text):
+        self._submit(("write", text, None))
+
+    def _print(self, text=""):
+        self._submit(("write", f"{text}\n", None))
+
+    def _pause(self, seconds):
+        self._submit(("pause", "", seconds))
+
+    def _crawl(self, text, timing):
+        self._submit(("crawl", text, timing))
+
+    @staticmethod
+    def _pace(text, speed, newline=1):
+        """Per-character delays: slower on punctuation, faster on spaces."""
+        delays = []
+        for char in text:
+            if char in '.!?':
+                delays.append(speed * 3)
+            elif char == ' ':
+                delays.append(speed * 0.5)
+            elif char == '\n':
+                delays.append(speed * newline)
+            else:
+                delays.append(speed)
+        return delays
+
     def output(self, text, crawl=False, glitch=False):
         """
         Main output method. Replaces print().
@@ -134,7 +403,7 @@ class CRTOutput:
             if self.capture_mode:
                 self.buffer.append(text)
             else:
-                print(text)
+                self._print(text)
             return
         
         # Apply color
@@ -153,9 +422,8 @@ class CRTOutput:
                 for i, line in enumerate(lines):
                     if i % 2 == 1:
                         # Dim every other line (scanline effect)
-                        print(f"{ANSI.DIM}{line}{ANSI.RESET}")
-                    else:
-                        print(line)
+                        lines[i] = f"{ANSI.DIM}{line}{ANSI.RESET}"
+                self._print('\n'.join(lines))
 
     def event(self, text, type="info", crawl=True):
         """
@@ -200,21 +468,13 @@ class CRTOutput:
             speed = 0.04 if type in ["danger", "mutiny"] else 0.02
             self._crawl_with_color(message, text_style, speed)
         else:
-            print(f"{text_style}{message}{ANSI.RESET}")
+            self._print(f"{text_style}{message}{ANSI.RESET}")
 
     def _crawl_with_color(self, text, color, speed):
         """Crawl text with a specific color and speed."""
-        sys.stdout.write(color)
-        for char in text:
-            sys.stdout.write(char)
-            sys.stdout.flush()
-            if char in '.!?':
-                time.sleep(speed * 3)
-            elif char == ' ':
-                time.sleep(speed * 0.5)
-            else:
-                time.sleep(speed)
-        print(ANSI.RESET)
+        self._write(color)
+        self._crawl(text, self._pace(text, speed))
+        self._print(ANSI.RESET)
     
     def crawl(self, text, speed=None):
         """
@@ -223,22 +483,10 @@ class CRTOutput:
         if speed is None:
             speed = self.crawl_speed
         
-        colored = f"{self.color}"
-        for char in text:
-            sys.stdout.write(colored + char)
-            sys.stdout.flush()
-            
-            # Variable speed: faster for spaces, slower for punctuation
-            if char in '.!?':
-                time.sleep(speed * 3)
-            elif char == ' ':
-                time.sleep(speed * 0.5)
-            elif char == '\n':
-                time.sleep(speed * 2)
-            else:
-                time.sleep(speed)
-        
-        print(ANSI.RESET)
+        # Variable speed: faster for spaces, slower for punctuation
+        self._write(self.color)
+        self._crawl(text, self._pace(text, speed, newline=2))
+        self._print(ANSI.RESET)
     
     def _crawl_text(self, text):
         """Internal crawl with color already applied."""
@@ -249,18 +497,14 @@ class CRTOutput:
             self.buffer.append(clean_text)
             return
 
-        for char in text:
-            sys.stdout.write(char)
-            sys.stdout.flush()
-            if char not in '\n\r':
-                time.sleep(self.crawl_speed)
-        print()
+        self._crawl(text, [0 if char in '\n\r' else self.crawl_speed for char in text])
+        self._print()
 
     def crawl_pause(self, seconds=1.0):
         """Insert a dramatic pause in output."""
         if not self.enabled or self.capture_mode:
             return
-        time.sleep(seconds)
+        self._pause(seconds)
     
     def _glitch_text(self, text):
         """Apply random glitch effects to text."""
@@ -270,7 +514,7 @@ class CRTOutput:
                 glitched.append(self.rng.choose(ANSI.GLITCH_CHARS))
             else:
                 glitched.append(char)
-        print("".join(glitched))
+        self._print("".join(glitched))
     
     def glitch(self, intensity=50, duration=0.5):
         """
@@ -279,18 +523,15 @@ class CRTOutput:
         if not self.enabled:
             return
         
-        start = time.time()
-        while time.time() - start < duration:
+        for _ in range(max(1, int(duration / 0.05))):
             # Generate random static line
             width = 60
             static_line = "".join(self.rng.choose(ANSI.STATIC) for _ in range(width))
-            sys.stdout.write(f"\r{self.color}{static_line}{ANSI.RESET}")
-            sys.stdout.flush()
-            time.sleep(0.05)
+            self._write(f"\r{self.color}{static_line}{ANSI.RESET}")
+            self._pause(0.05)
         
         # Clear the glitch line
-        sys.stdout.write("\r" + " " * 60 + "\r")
-        sys.stdout.flush()
+        self._write("\r" + " " * 60 + "\r")
     
     def flicker(self, count=3, interval=0.1):
         """
@@ -301,10 +542,10 @@ class CRTOutput:
         
         for _ in range(count):
             # "Turn off" - print empty lines
-            print("\033[2J\033[H", end="")  # Clear screen
-            time.sleep(interval)
+            self._write("\033[2J\033[H")  # Clear screen
+            self._pause(interval)
             # "Turn on" - will be followed by redraw
-            time.sleep(interval)
+            self._pause(interval)
     
     def scanline(self, text):
         """
@@ -333,25 +574,25 @@ class CRTOutput:
         width = len(text) + 4
         border = "=" * width
         
-        print(f"{self.color}+{border}+{ANSI.RESET}")
-        print(f"{self.color}|  {ANSI.BOLD}{text}{ANSI.RESET}{self.color}  |{ANSI.RESET}")
-        print(f"{self.color}+{border}+{ANSI.RESET}")
+        self._print(f"{self.color}+{border}+{ANSI.RESET}")
+        self._print(f"{self.color}|  {ANSI.BOLD}{text}{ANSI.RESET}{self.color}  |{ANSI.RESET}")
+        self._print(f"{self.color}+{border}+{ANSI.RESET}")
 
     def header_danger(self, text):
         """Dramatic danger header."""
         width = len(text) + 6
         border = "#" * width
-        print(f"{ANSI.DANGER}{ANSI.BOLD}{border}{ANSI.RESET}")
-        print(f"{ANSI.DANGER}{ANSI.BOLD}#  {text.upper()}  #{ANSI.RESET}")
-        print(f"{ANSI.DANGER}{ANSI.BOLD}{border}{ANSI.RESET}")
+        self._print(f"{ANSI.DANGER}{ANSI.BOLD}{border}{ANSI.RESET}")
+        self._print(f"{ANSI.DANGER}{ANSI.BOLD}#  {text.upper()}  #{ANSI.RESET}")
+        self._print(f"{ANSI.DANGER}{ANSI.BOLD}{border}{ANSI.RESET}")
 
     def header_success(self, text):
         """Success header."""
         width = len(text) + 6
         border = "*" * width
-        print(f"{ANSI.SUCCESS}{ANSI.BOLD}{border}{ANSI.RESET}")
-        print(f"{ANSI.SUCCESS}{ANSI.BOLD}*  {text}  *{ANSI.RESET}")
-        print(f"{ANSI.SUCCESS}{ANSI.BOLD}{border}{ANSI.RESET}")
+        self._print(f"{ANSI.SUCCESS}{ANSI.BOLD}{border}{ANSI.RESET}")
+        self._print(f"{ANSI.SUCCESS}{ANSI.BOLD}*  {text}  *{ANSI.RESET}")
+        self._print(f"{ANSI.SUCCESS}{ANSI.BOLD}{border}{ANSI.RESET}")
 
     def ascii_art(self, art_type):
         """Display ASCII art for major events."""
@@ -377,8 +618,8 @@ class CRTOutput:
         lines = arts.get(art_type, [])
         color = ANSI.DANGER if art_type == "the_thing" else self.color
         for line in lines:
-            print(f"{color}{line}{ANSI.RESET}")
-            time.sleep(0.05)
+            self._print(f"{color}{line}{ANSI.RESET}")
+            self._pause(0.05)
     
     def prompt(self, text="CMD"):
         """
@@ -393,7 +634,7 @@ class CRTOutput:
         if self.capture_mode:
             self.buffer.append(f"[WARNING] {text}")
         else:
-            print(f"{ANSI.BLINK}{self.color}[!] {text}{ANSI.RESET}")
+            self._print(f"{ANSI.BLINK}{self.color}[!] {text}{ANSI.RESET}")
     
     def status_bar(self, turn, temp, location, power):
         """
@@ -401,7 +642,7 @@ class CRTOutput:
         """
         power_str = f"{ANSI.BOLD}ON{ANSI.RESET}" if power else f"{ANSI.DIM}OFF{ANSI.RESET}"
         bar = f"[TURN {turn:03d}] TEMP: {temp:+03d}C | LOC: {location} | POWER: {power_str}"
-        print(f"{self.color}{bar}{ANSI.RESET}")
+        self._print(f"{self.color}{bar}{ANSI.RESET}")
     
     def set_glitch_level(self, paranoia):
         """
@@ -428,4 +669,4 @@ class CRTOutput:
         self.header("SYSTEM BOOT")
         for line in boot_lines:
             self.crawl(line, speed=0.01)
-            time.sleep(0.1)
+            self._pause(0.1)
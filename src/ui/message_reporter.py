@@ -4,6 +4,8 @@ Subscribes to reporting events and displays messages through CRT output.
 Systems emit events instead of returning strings.
 """
 
+from functools import partial
+
 from core.event_system import event_bus, EventType, GameEvent
 from systems.architect import Difficulty
 
@@ -79,6 +81,10 @@ class MessageReporter:
 
         return cur_val >= req_val
 
+    def _gate(self, event_type: EventType):
+        """Verbosity check registered with the bus so emitters can skip muted events."""
+        return partial(self._should_report, event_type)
+
     def flush(self):
         """Flush any batched messages to the output."""
         self._flush_combat()
@@ -137,16 +143,16 @@ class MessageReporter:
 
     def _subscribe_all(self):
         """Subscribe to all reporting event types."""
-        event_bus.subscribe(EventType.MESSAGE, self._handle_message)
-        event_bus.subscribe(EventType.WARNING, self._handle_warning)
-        event_bus.subscribe(EventType.ERROR, self._handle_error)
-        event_bus.subscribe(EventType.COMBAT_LOG, self._handle_combat)
-        event_bus.subscribe(EventType.DIALOGUE, self._handle_dialogue)
-        event_bus.subscribe(EventType.SYSTEM_LOG, self._handle_system)
-        event_bus.subscribe(EventType.MOVEMENT, self._handle_movement)
-        event_bus.subscribe(EventType.ITEM_PICKUP, self._handle_item_pickup)
-        event_bus.subscribe(EventType.ITEM_DROP, self._handle_item_drop)
-        event_bus.subscribe(EventType.ATTACK_RESULT, self._handle_attack)
+        event_bus.subscribe(EventType.MESSAGE, self._handle_message, gate=self._gate(EventType.MESSAGE))
+        event_bus.subscribe(EventType.WARNING, self._handle_warning, gate=self._gate(EventType.WARNING))
+        event_bus.subscribe(EventType.ERROR, self._handle_error, gate=self._gate(EventType.ERROR))
+        event_bus.subscribe(EventType.COMBAT_LOG, self._handle_combat, gate=self._gate(EventType.COMBAT_LOG))
+        event_bus.subscribe(EventType.DIALOGUE, self._handle_dialogue, gate=self._gate(EventType.DIALOGUE))
+        event_bus.subscribe(EventType.SYSTEM_LOG, self._handle_system, gate=self._gate(EventType.SYSTEM_LOG))
+        event_bus.subscribe(EventType.MOVEMENT, self._handle_movement, gate=self._gate(EventType.MOVEMENT))
+        event_bus.subscribe(EventType.ITEM_PICKUP, self._handle_item_pickup, gate=self._gate(EventType.ITEM_PICKUP))
+        event_bus.subscribe(EventType.ITEM_DROP, self._handle_item_drop, gate=self._gate(EventType.ITEM_DROP))
+        event_bus.subscribe(EventType.ATTACK_RESULT, self._handle_attack, gate=self._gate(EventType.ATTACK_RESULT))
         event_bus.subscribe(EventType.TEST_RESULT, self._handle_test)
         event_bus.subscribe(EventType.BARRICADE_ACTION, self._handle_barricade)
         event_bus.subscribe(EventType.STEALTH_REPORT, self._handle_stealth)
@@ -3,6 +3,9 @@ ASCII Renderer with Camera/Viewport System
 The "eye" through which the player sees the station.
 """
 
+from systems.schedule_index import schedule_snapshot
+from systems.spatial_index import CrewSpatialIndex
+
 class Camera:
     """Viewport controller that follows the player."""
     
@@ -63,6 +66,7 @@ class TerminalRenderer:
         Returns a list of strings (one per row).
         """
         schedule_flags = self._compute_out_of_schedule(game_state)
+        occupants = self._occupancy(game_state)
 
         if player:
             self.camera.follow(
@@ -86,7 +90,7 @@ class TerminalRenderer:
             
             for screen_x in range(self.camera.viewport_width):
                 world_x = screen_x + self.camera.x
-                char = self._get_char_at(world_x, world_y, game_state, player, schedule_flags)
+                char = self._get_char_at(world_x, world_y, game_state, player, schedule_flags, occupants)
                 row_chars.append(char)
             
             # Add row with border
@@ -117,15 +121,27 @@ class TerminalRenderer:
         if not game_state or not getattr(game_state, "crew", None):
             return flags
 
+        # One shared expected-vs-actual snapshot per turn instead of a schedule scan per NPC
+        try:
+            snapshot = schedule_snapshot(game_state)
+        except Exception:
+            return flags
         for member in game_state.crew:
-            if hasattr(member, "is_out_of_schedule"):
-                try:
-                    flags[member.name] = member.is_out_of_schedule(game_state)
-                except Exception:
-                    flags[member.name] = False
+            flags[member.name] = snapshot.is_out_of_place(member)
         return flags
 
-    def _get_char_at(self, x, y, game_state, player, schedule_flags=None):
+    def _occupancy(self, game_state):
+        """The game's crew spatial index, synced to this map.
+
+        Drawing a tile is then a bucket lookup rather than a scan of the whole
+        crew, keeping a frame O(cells + crew).
+        """
+        index = getattr(game_state, "crew_index", None)
+        if not isinstance(index, CrewSpatialIndex):
+            index = CrewSpatialIndex()
+        return index.sync(getattr(game_state, "crew", None) or [], self.map)
+
+    def _get_char_at(self, x, y, game_state, player, schedule_flags=None, occupants=None):
         """Determine what character to display at this position."""
         # Bounds check
         if not (0 <= x < self.map.width and 0 <= y < self.map.height):
@@ -136,13 +152,15 @@ class TerminalRenderer:
             return self.CHAR_PLAYER
         
         # Layer 2: NPCs
-        for member in game_state.crew:
-            if member.location == (x, y) and member != player:
-                if not member.is_alive:
-                    return self.CHAR_CORPSE
-                if schedule_flags and schedule_flags.get(member.name):
-                    return self.CHAR_OUT_OF_PLACE
-                return member.name[0].upper()
+        if occupants is None:
+            occupants = self._occupancy(game_state)
+        member = occupants.first_at((x, y), exclude=player)
+        if member is not None:
+            if not member.is_alive:
+                return self.CHAR_CORPSE
+            if schedule_flags and schedule_flags.get(member.name):
+                return self.CHAR_OUT_OF_PLACE
+            return member.name[0].upper()
         
         # Layer 3: Items
         room_name = self.map.get_room_name(x, y)
@@ -282,7 +300,8 @@ class TerminalRenderer:
         """Render a small 5x5 local area minimap."""
         lines = []
         px, py = player.location
-        
+        occupants = self._occupancy(game_state)
+
         for dy in range(-2, 3):
             row = []
             for dx in range(-2, 3):
@@ -293,8 +312,7 @@ class TerminalRenderer:
                     row.append(' ')
                 else:
                     # Check for NPCs
-                    npc = next((m for m in game_state.crew 
-                               if m.location == (wx, wy) and m != player), None)
+                    npc = occupants.first_at((wx, wy), exclude=player)
                     if npc:
                         row.append(npc.name[0])
                     else:
@@ -309,10 +327,11 @@ class TerminalRenderer:
         No viewport headers or borders, just the tiles.
         """
         lines = []
+        occupants = self._occupancy(game_state)
         for y in range(self.map.height):
             row = []
             for x in range(self.map.width):
-                char = self._get_char_at(x, y, game_state, player)
+                char = self._get_char_at(x, y, game_state, player, occupants=occupants)
                 row.append(char)
             lines.append("".join(row))
         return "\n".join(lines)
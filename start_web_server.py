@@ -6,7 +6,9 @@ Starts the browser-based interface for The Thing game
 
 import os
 import sys
+import secrets
 import subprocess
+import argparse
 
 def check_dependencies():
     """Check if required packages are installed"""
@@ -59,12 +61,18 @@ def main():
         print("Restarting server...")
         print()
 
+    args = parse_args()
+
     # Start the server
     print("Starting web server...")
     print()
 
     # Execute the server module
     server_path = os.path.join(os.path.dirname(__file__), 'server.py')
+    if args.workers > 1:
+        run_sharded(server_path, args.workers)
+        return
+
     try:
         subprocess.check_call([sys.executable, server_path])
     except KeyboardInterrupt:
@@ -73,5 +81,64 @@ def main():
         print(f"\nServer exited with error code {e.returncode}")
         sys.exit(e.returncode)
 
+def parse_args():
+    """Command line options (WEB_WORKERS env sets the default worker count)"""
+    parser = argparse.ArgumentParser(description="Start The Thing web server")
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_WORKERS', 1)),
+                        help="Server processes to run; sessions are sharded across them")
+    return parser.parse_args()
+
+def run_sharded(server_path, workers):
+    """
+    Run one server process per shard on consecutive ports (PORT, PORT+1, ...).
+
+    Each process owns the sessions whose session_id hashes to its index; any of
+    them serves the page and answers /api/shard/<session_id> so clients stick to
+    the owner. Cross-shard events go through a local relay hub in this process.
+    """
+    # Imported here so single-process launches don't need src on the path
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+    from core.sharding import RelayHub
+
+    host = os.environ.get('HOST', '127.0.0.1')
+    base_port = int(os.environ.get('PORT', 5000))
+    relay_key = secrets.token_bytes(16)
+    hub = RelayHub(('127.0.0.1', 0), authkey=relay_key).start()
+    relay_host, relay_port = hub.address
+
+    origins = [f"http://{name}:{base_port + i}" for i in range(workers) for name in (host, 'localhost', '127.0.0.1')]
+    if os.environ.get('CORS_ORIGINS'):
+        origins.append(os.environ['CORS_ORIGINS'])
+
+    processes = []
+    for index in range(workers):
+        env = dict(os.environ)
+        env.update({
+            'PORT': str(base_port + index),
+            'SHARD_INDEX': str(index),
+            'SHARD_COUNT': str(workers),
+            'SHARD_BASE_PORT': str(base_port),
+            'SHARD_RELAY_ADDRESS': f"{relay_host}:{relay_port}",
+            'SHARD_RELAY_KEY': relay_key.hex(),
+            'CORS_ORIGINS': ','.join(dict.fromkeys(origins)),
+        })
+        processes.append(subprocess.Popen([sys.executable, server_path], env=env))
+        print(f"Shard {index + 1}/{workers} on port {base_port + index}")
+
+    try:
+        exit_code = 0
+        for process in processes:
+            exit_code = process.wait() or exit_code
+        if exit_code:
+            print(f"\nServer exited with error code {exit_code}")
+            sys.exit(exit_code)
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        hub.close()
+
 if __name__ == "__main__":
     main()
@@ -10,7 +10,7 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(project_root / "src"))
 
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, isolated_bus, EventType, GameEvent
 from systems.endgame import EndgameSystem
 from systems.architect import RandomnessEngine
 
@@ -30,14 +30,13 @@ class TestAlternativeEndingsIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        event_bus._subscribers.clear()
+        # Fresh root bus, so other tests' sessions don't see (or answer) our emits
+        bus_scope = isolated_bus()
+        bus_scope.__enter__()
+        self.addCleanup(bus_scope.__exit__, None, None, None)
         self.ending_events = []
         event_bus.subscribe(EventType.ENDING_REPORT, self._capture_ending)
 
-    def tearDown(self):
-        """Clean up after tests."""
-        event_bus._subscribers.clear()
-
     def _capture_ending(self, event: GameEvent):
         """Capture ending events for verification."""
         self.ending_events.append(event)
@@ -0,0 +1,102 @@
+import gzip
+import json
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine import GameState
+from systems.persistence import (AsyncSaveWriter, SaveManager, compute_checksum,
+                                 encode_save, read_save_file, write_atomic)
+
+
+def test_encode_save_checksum_matches_compute_checksum():
+    data = {"turn": 4, "crew": [{"name": "MacReady"}], "checksum": "stale"}
+    payload = encode_save(data)
+    decoded = json.loads(payload)
+    assert decoded["checksum"] == data["checksum"] == compute_checksum(decoded)
+    assert gzip.decompress(encode_save(dict(decoded), compress=True)) == payload
+
+
+def test_writer_coalesces_superseded_snapshots():
+    release = threading.Event()
+    written = []
+
+    def slow_write(slot, data):
+        release.wait(5)
+        written.append((slot, data["turn"]))
+        return True
+
+    writer = AsyncSaveWriter(slow_write)
+    writer.submit("autosave", {"turn": 10})
+    # Let the thread pick up turn 10, then queue two more behind it
+    while writer.pending() and not writer._busy:
+        pass
+    writer.submit("autosave", {"turn": 20})
+    writer.submit("autosave", {"turn": 30})
+    release.set()
+    assert writer.flush(5)
+    writer.close()
+
+    assert written == [("autosave", 10), ("autosave", 30)]
+    assert writer.stats["coalesced"] == 1
+
+
+def test_autosave_is_atomic_compressed_and_loadable(tmp_path):
+    game = GameState(seed=9)
+    manager = SaveManager(save_dir=str(tmp_path), game_state_factory=GameState.from_dict, compress=True)
+    try:
+        assert manager.autosave_game(game) is True
+        assert manager.autosave_game(game) is False  # Same turn already queued
+        manager.cleanup()  # Flushes the writer
+
+        path = tmp_path / "autosave.json"
+        assert path.read_bytes()[:2] == b'\x1f\x8b'
+        assert not list(tmp_path.glob("*.tmp"))
+        assert read_save_file(str(path))["turn"] == game.turn
+
+        loaded = manager.load_game("autosave")
+        assert loaded is not None
+        assert [m.name for m in loaded.crew] == [m.name for m in game.crew]
+        loaded.cleanup()
+    finally:
+        game.cleanup()
+
+
+def test_older_snapshot_never_overwrites_newer_save(tmp_path):
+    game = GameState(seed=4)
+    manager = SaveManager(save_dir=str(tmp_path))
+    try:
+        game.turn = 3
+        stale = (next(manager._snapshot_seq), {"turn": -1})
+        assert manager.save_game(game, "slot") is True
+        # The writer only reaches the older snapshot after the explicit save
+        assert manager._write_queued("slot", stale) is True
+        assert read_save_file(str(tmp_path / "slot.json"))["turn"] == 3
+    finally:
+        manager.cleanup()
+        game.cleanup()
+
+
+def test_concurrent_atomic_writes_to_one_path(tmp_path):
+    # Every server session's SaveManager writes the same autosave and index files
+    path = str(tmp_path / "autosave.json")
+    errors = []
+
+    def writer(tag):
+        for i in range(100):
+            try:
+                write_atomic(path, json.dumps({"writer": tag, "i": i}).encode("utf-8"))
+            except OSError as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(tag,)) for tag in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert json.loads((tmp_path / "autosave.json").read_text())["i"] == 99
+    assert not list(tmp_path.glob("*.tmp"))
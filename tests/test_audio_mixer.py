@@ -0,0 +1,75 @@
+import gc
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from audio.audio_manager import AudioManager, AudioMixer, Sound
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_disabled_sessions_use_null_backend_without_threads():
+    mixer = AudioMixer()
+    audio = AudioManager(enabled=False, mixer=mixer)
+    try:
+        audio.play(Sound.ALERT)
+        audio.ambient_loop(Sound.THRUM)
+        assert audio.backend == "null"
+        assert not mixer.is_running()
+    finally:
+        audio.cleanup()
+
+
+def test_sessions_share_one_mixer_thread_in_priority_order():
+    release = threading.Event()
+    played = []
+    mixer = AudioMixer()
+    low = AudioManager(enabled=True, session_priority=0, mixer=mixer)
+    high = AudioManager(enabled=True, session_priority=5, mixer=mixer)
+
+    def recorder(name):
+        def _play(sound, ambient=False):
+            if not played:
+                release.wait(2)
+            played.append((name, sound))
+        return _play
+
+    low._play_sound = recorder("low")
+    high._play_sound = recorder("high")
+    try:
+        low.play(Sound.BEEP)
+        assert _wait_for(lambda: low.queue.empty())
+        # Both sessions queue while the mixer is busy with the first sound
+        low.play(Sound.ALERT)
+        high.play(Sound.CLICK)
+        # One thread serves both sessions
+        assert mixer.is_running() and high._attached
+        release.set()
+
+        assert _wait_for(lambda: len(played) == 3)
+        assert played == [("low", Sound.BEEP), ("high", Sound.CLICK), ("low", Sound.ALERT)]
+    finally:
+        low.cleanup()
+        high.cleanup()
+    assert _wait_for(lambda: not mixer.is_running())
+
+
+def test_sessions_dropped_without_cleanup_stop_playing():
+    mixer = AudioMixer()
+    audio = AudioManager(enabled=True, mixer=mixer)
+    audio._play_sound = lambda sound, ambient=False: None
+    audio.ambient_loop(Sound.THRUM)
+    assert mixer.is_running()
+
+    # Event subscriptions must not keep a leaked session in the mixer
+    del audio
+    gc.collect()
+    assert _wait_for(lambda: not mixer.is_running())
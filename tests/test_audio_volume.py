@@ -1,4 +1,5 @@
 
+import gc
 import sys
 import unittest
 from unittest.mock import MagicMock, patch
@@ -8,16 +9,22 @@ mock_winsound = MagicMock()
 sys.modules['winsound'] = mock_winsound
 
 # Now import the class
-from src.audio.audio_manager import AudioManager, Sound
+from src.audio.audio_manager import AudioManager, AudioMixer, Sound
 
 class TestAudioManagerVolume(unittest.TestCase):
     def setUp(self):
-        self.audio = AudioManager(enabled=True)
+        # Own mixer and a fresh mock, so sounds from other tests' sessions don't count here
+        gc.collect()
+        mock_winsound.reset_mock()
+        self.audio = AudioManager(enabled=True, mixer=AudioMixer())
         # Force enable even if import failed (though with mock it should succeed)
         self.audio.enabled = True
         # But wait, the module level AUDIO_AVAILABLE depends on the import.
         # Since we mocked sys.modules['winsound'], the try-except in audio_manager should pass.
 
+    def tearDown(self):
+        self.audio.cleanup()
+
     def test_initial_volume(self):
         self.assertEqual(self.audio.volume, 1.0)
 
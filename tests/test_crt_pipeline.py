@@ -0,0 +1,58 @@
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ui.crt_effects import CRTOutput
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_crawl_animates_off_the_caller_and_can_be_skipped():
+    stream = _CountingStream()
+    original_stdout = sys.stdout
+    crt = CRTOutput()
+    crt.start_pipeline(stream=stream)
+    try:
+        start = time.perf_counter()
+        crt.crawl("Nobody trusts anybody now. And we're all very tired.", speed=0.5)
+        crt.glitch(duration=2.0)
+        print("CMD>")
+        assert time.perf_counter() - start < 0.5
+
+        crt.skip_effects()
+        assert time.perf_counter() - start < 2.0
+        text = stream.getvalue()
+        # Stray print() calls queue behind the effects instead of cutting into them
+        assert text.index("very tired.") < text.index("CMD>")
+        assert text.rstrip().endswith("CMD>")
+    finally:
+        crt.stop_pipeline()
+    assert sys.stdout is original_stdout
+
+
+def test_frame_presents_a_screen_in_one_write():
+    stream = _CountingStream()
+    crt = CRTOutput()
+    crt.start_pipeline(stream=stream)
+    try:
+        with crt.frame():
+            crt.output("[TURN 4] MODE: INVESTIGATIVE")
+            crt.output("[LOC: Rec Room]")
+            crt.status_bar(4, -40, "Rec Room", True)
+            crt.warning("Radio: OFFLINE")
+        crt.skip_effects()
+        assert stream.writes == 1
+        assert stream.getvalue().count("\n") == 4
+    finally:
+        crt.stop_pipeline()
@@ -0,0 +1,115 @@
+"""Batched dice-pool resolution.
+
+Checks that RandomnessEngine.calculate_success_batch replays exactly like
+one-at-a-time checks, and benchmarks checks/second for both paths.
+
+Run directly for a throughput table:
+    python tests/test_dice_batch.py [checks]
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.resolution import Attribute, ResolutionSystem, Skill
+from entities.crew_member import CrewMember
+from systems.architect import RandomnessEngine
+from systems.stealth import StealthSystem
+
+POOLS = (1, 2, 3, 4, 5, 6, 8, 10)
+
+
+def _pools(count):
+    return [POOLS[i % len(POOLS)] for i in range(count)]
+
+
+def test_batch_matches_sequential_checks():
+    pools = [3, 0, 5, 1, 9, 12, 2]
+    sequential, batched = RandomnessEngine(seed=7), RandomnessEngine(seed=7)
+
+    expected = [sequential.calculate_success(pool)["success_count"] for pool in pools]
+    assert batched.calculate_success_batch(pools) == expected
+    # Both engines consumed the same number of draws
+    assert sequential.random_float() == batched.random_float()
+
+
+def test_batch_replays_from_saved_state():
+    rng = RandomnessEngine(seed=3)
+    rng.calculate_success_batch(_pools(20))
+    saved = rng.to_dict()
+    first = rng.calculate_success_batch(_pools(50))
+
+    restored = RandomnessEngine()
+    restored.from_dict(saved)
+    assert restored.calculate_success_batch(_pools(50)) == first
+
+
+def test_roll_checks_clamps_pools_and_supports_plain_engines():
+    class OnlyCalculateSuccess:
+        def calculate_success(self, pool_size):
+            return {"success_count": pool_size}
+
+    assert ResolutionSystem.roll_checks([0, 2, -3], OnlyCalculateSuccess()) == [1, 2, 1]
+    assert len(ResolutionSystem.roll_checks([0, 4], RandomnessEngine(seed=1))) == 2
+
+
+def test_stealth_batch_matches_individual_detection():
+    def observers():
+        crew = []
+        for i in range(5):
+            member = CrewMember(f"Watcher{i}", "Crew", "Neutral")
+            member.attributes[Attribute.LOGIC] = 1 + i % 3
+            member.skills[Skill.OBSERVATION] = i % 2
+            crew.append(member)
+        return crew
+
+    subject = CrewMember("Sneak", "Crew", "Neutral")
+    stealth = StealthSystem()
+    try:
+        state_a = SimpleNamespace(rng=RandomnessEngine(seed=11))
+        state_b = SimpleNamespace(rng=RandomnessEngine(seed=11))
+        one_by_one = [stealth.evaluate_detection(o, subject, state_a, noise_level=2) for o in observers()]
+        batched = stealth.evaluate_detection_batch(observers(), subject, state_b, noise_level=2)
+        assert batched == one_by_one
+    finally:
+        stealth.cleanup()
+
+
+def benchmark_checks(count: int = 20000, seed: int = 42) -> dict:
+    """Checks per second for one-at-a-time roll_check vs a single roll_checks batch."""
+    pools = _pools(count)
+
+    rng = RandomnessEngine(seed=seed)
+    start = time.perf_counter()
+    for pool in pools:
+        ResolutionSystem.roll_check(pool, rng)
+    sequential = time.perf_counter() - start
+
+    rng = RandomnessEngine(seed=seed)
+    start = time.perf_counter()
+    ResolutionSystem.roll_checks(pools, rng)
+    batched = time.perf_counter() - start
+
+    return {
+        "checks": count,
+        "sequential_per_s": count / sequential,
+        "batched_per_s": count / batched,
+        "speedup": sequential / batched,
+    }
+
+
+def test_batched_checks_throughput_report():
+    # Timing depends on the machine; report it, run `python tests/test_dice_batch.py` to compare
+    row = benchmark_checks(2000)
+    print(f"\n{row['checks']} checks: sequential={row['sequential_per_s']:,.0f}/s  "
+          f"batched={row['batched_per_s']:,.0f}/s  speedup={row['speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    row = benchmark_checks(count)
+    print(f"{row['checks']} checks: sequential={row['sequential_per_s']:,.0f}/s  "
+          f"batched={row['batched_per_s']:,.0f}/s  speedup={row['speedup']:.1f}x")
@@ -0,0 +1,65 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.event_system import EventBus, EventType
+from ui.message_reporter import MessageReporter
+
+
+class _Recorder:
+    """Counts how often the bus actually formats it into a message."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __format__(self, spec):
+        self.formatted += 1
+        return "Blair"
+
+
+class _Screen:
+    def __init__(self):
+        self.lines = []
+
+    def output(self, text, crawl=False):
+        self.lines.append(text)
+
+
+def test_emit_text_skips_formatting_without_listeners():
+    bus = EventBus()
+    name = _Recorder()
+    assert bus.emit_text(EventType.SYSTEM_LOG, "{} is searching", name) is False
+    assert name.formatted == 0
+
+    received = []
+    bus.subscribe(EventType.SYSTEM_LOG, received.append)
+    assert bus.emit_text(EventType.SYSTEM_LOG, "{} is searching", name, turn=4) is True
+    assert name.formatted == 1
+    assert received[0].payload == {"text": "Blair is searching", "turn": 4}
+
+
+def test_reporter_verbosity_gates_are_consulted_before_emit():
+    root = EventBus()
+    session = EventBus(parent=root)
+    with session.activate():
+        reporter = MessageReporter(_Screen())
+    try:
+        # SYSTEM_LOG is VERBOSE-only, so the reporter alone does not count as listening
+        assert session.has_subscribers(EventType.SYSTEM_LOG)
+        assert not session.is_listening(EventType.SYSTEM_LOG)
+        assert not root.is_listening(EventType.SYSTEM_LOG)
+        assert session.is_listening(EventType.MESSAGE)
+
+        # Any ungated subscriber (a log tap, a test) re-enables the payload
+        received = []
+        root.subscribe(EventType.SYSTEM_LOG, received.append)
+        assert session.emit_text(EventType.SYSTEM_LOG, "Tripwire in {}.", "Lab")
+        assert received[0].payload["text"] == "Tripwire in Lab."
+        assert reporter.crt.lines == []
+
+        root.unsubscribe(EventType.SYSTEM_LOG, received.append)
+    finally:
+        with session.activate():
+            reporter.cleanup()
+    assert not session._gates
@@ -0,0 +1,123 @@
+from engine import GameState
+from entities.station_map import StationMap
+from systems.pathfinding import FlowField, FlowFieldRouter, PathfindingSystem, pathfinder
+from systems.room_state import RoomState
+
+
+def _walk(field, start, limit=200):
+    position, steps = start, [start]
+    while position != field.goal and len(steps) < limit:
+        position = field.next_step(position)
+        if position is None:
+            break
+        steps.append(position)
+    return steps
+
+
+def test_flow_field_routes_are_as_short_as_astar():
+    station_map = StationMap()
+    goal = station_map.rooms["Generator"][:2]
+    field = FlowField(goal, station_map)
+    finder = PathfindingSystem()
+
+    for start in [(0, 0), (19, 0), (3, 12), (10, 10)]:
+        walked = _walk(field, start)
+        assert walked[-1] == goal
+        assert len(walked) == len(finder.find_path(start, goal, station_map))
+    assert field.next_step(goal) is None
+
+
+def test_blocked_rooms_are_routed_around_but_not_the_goal_room():
+    station_map = StationMap()
+    goal = station_map.rooms["Generator"][:2]           # (15, 15)
+    field = FlowField(goal, station_map, frozenset({"Lab", "Generator"}))
+
+    assert field.blocked_rooms == frozenset({"Lab"})
+    walked = _walk(field, (10, 10))
+    assert walked[-1] == goal
+    assert all(station_map.get_room_name(*tile) != "Lab" for tile in walked)
+
+
+def test_router_rebuilds_only_when_blocked_rooms_change():
+    station_map = StationMap()
+    router = FlowFieldRouter()
+    goal = station_map.rooms["Rec Room"][:2]
+
+    assert router.is_room_goal(goal, station_map)
+    assert not router.is_room_goal((1, 1), station_map)
+
+    first = router.field_for(goal, station_map)
+    assert router.field_for(goal, station_map) is first
+    # Barricading the goal's own room doesn't change how to reach it
+    assert router.field_for(goal, station_map, frozenset({"Rec Room"})) is first
+    assert router.stats == {"builds": 1, "hits": 2, "rebases": 0}
+
+    # Other barricades adapt the field; it matches a fresh build either way
+    field = router.field_for(goal, station_map, frozenset({"Lab"}))
+    assert field.distance == FlowField(goal, station_map, frozenset({"Lab"})).distance
+    assert router.stats["builds"] + router.stats["rebases"] == 2
+
+
+def test_rebased_fields_match_fresh_builds():
+    station_map = StationMap()
+    router = FlowFieldRouter()
+    sequence = [frozenset(), frozenset({"Lab"}), frozenset({"Lab", "Infirmary"}),
+                frozenset({"Infirmary"}), frozenset({"Kennel", "Generator"}), frozenset()]
+    for name in ["Generator", "Rec Room", "Radio Room"]:
+        goal = station_map.rooms[name][:2]
+        for blocked in sequence:
+            field = router.field_for(goal, station_map, blocked)
+            fresh = FlowField(goal, station_map, blocked)
+            assert field.distance == fresh.distance
+            assert field.blocked_rooms == fresh.blocked_rooms
+    assert router.stats["rebases"] > 0
+
+
+def test_room_states_other_than_barricades_keep_fields():
+    game = GameState(seed=32)
+    try:
+        goal = game.station_map.rooms["Rec Room"][:2]
+        router = FlowFieldRouter()
+        field = router.field_for(goal, game.station_map, game.room_states.get_blocked_rooms())
+
+        game.room_states.add_state("Lab", RoomState.LOCKED)
+        game.room_states.add_state("Lab", RoomState.FROZEN)
+        assert router.field_for(goal, game.station_map, game.room_states.get_blocked_rooms()) is field
+        assert router.stats["builds"] == 1
+    finally:
+        game.cleanup()
+
+
+def test_schedule_movement_uses_flow_field_without_astar():
+    game = GameState(seed=31)
+    try:
+        member = next(m for m in game.crew if m is not game.player)
+        member.location = (0, 19)
+        ai = game.ai_system
+        ai.budget_limit = 100
+        goal = game.station_map.rooms["Radio Room"][:2]
+
+        misses = pathfinder.stats["misses"]
+        with game.event_bus.activate():
+            ai._pathfind_step(member, goal[0], goal[1], game)
+
+        assert member.location == (1, 18)
+        assert pathfinder.stats["misses"] == misses
+        assert ai.budget_spent == ai.COST_PATH_CACHE
+    finally:
+        game.cleanup()
+
+
+def test_router_rebuilds_after_walls_change():
+    station_map = StationMap()
+    goal = station_map.rooms["Generator"][:2]
+    router = FlowFieldRouter()
+    blocked = router.field_for(goal, station_map).next_step((10, 10))
+
+    station_map.set_walkable(*blocked, False)
+    field = router.field_for(goal, station_map)
+    step = field.next_step((10, 10))
+    assert step != blocked and station_map.is_walkable(*step)
+    walked = _walk(field, (10, 10))
+    assert walked[-1] == goal and blocked not in walked
+    assert router.stats["builds"] == 2
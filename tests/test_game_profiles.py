@@ -0,0 +1,87 @@
+import os
+import time
+
+from core import config_cache
+from engine import GameState, LazySubsystem
+from systems.architect import GameProfile
+from systems.persistence import SaveManager
+
+
+def test_config_cache_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text('{"value": 1}')
+    first = config_cache.load_json(path)
+    assert config_cache.load_json(str(path)) is first
+
+    path.write_text('{"value": 2}')
+    future = time.time() + 5
+    os.utime(path, (future, future))
+    assert config_cache.load_json(path) == {"value": 2}
+
+
+def test_games_do_not_share_mutable_character_data():
+    first, second = GameState(seed=1), GameState(seed=1)
+    try:
+        member = next(m for m in first.crew if m.schedule)
+        twin = next(m for m in second.crew if m.name == member.name)
+        member.schedule[0]["room"] = "Nowhere"
+        member.forbidden_rooms.append("Lab")
+        assert twin.schedule[0]["room"] != "Nowhere"
+        assert "Lab" not in twin.forbidden_rooms
+    finally:
+        first.cleanup()
+        second.cleanup()
+
+
+def test_rarely_used_subsystems_are_built_on_first_use():
+    game = GameState(seed=2, profile=GameProfile.headless())
+    try:
+        assert LazySubsystem.built(game, "crafting") is None
+        assert game.to_dict()["crafting"] == {}
+        assert LazySubsystem.built(game, "crafting") is None
+
+        crafting = game.crafting
+        assert game.crafting is crafting
+        assert crafting.recipes
+        assert game.interrogation_system.room_states is game.room_states
+    finally:
+        game.cleanup()
+
+
+def test_profiles_control_side_channels(tmp_path):
+    game = GameState(seed=3, profile=GameProfile.server())
+    try:
+        assert game.audio.enabled is False
+        assert game.crt.capture_mode is False
+        assert game.save_manager.autosave is True
+    finally:
+        game.cleanup()
+
+    save_dir = tmp_path / "saves"
+    manager = SaveManager(save_dir=str(save_dir))
+    assert not save_dir.exists()
+    manager.save_campaign({"chapter": 1})
+    assert (save_dir / "campaign.json").exists()
+    manager.cleanup()
+
+
+def test_restored_games_keep_the_requested_profile():
+    game = GameState(seed=4, profile=GameProfile.server())
+    try:
+        data = game.to_dict()
+    finally:
+        game.cleanup()
+
+    restored = GameState.from_dict(data, profile=GameProfile.server())
+    try:
+        assert restored.profile == GameProfile.server()
+        assert restored.audio.enabled is False
+        assert restored.save_manager.journaled
+        assert not GameProfile.headless().journal
+        loaded = restored.save_manager.game_state_factory(data)
+        try:
+            assert loaded.audio.enabled is False
+        finally:
+            loaded.cleanup()
+    finally:
+        restored.cleanup()
@@ -0,0 +1,70 @@
+from entities.map_layers import MapLayers, camera_cone
+from entities.station_map import StationMap
+from systems.pathfinding import PathfindingSystem
+from systems.security import Camera
+
+
+def test_room_raster_matches_room_rectangles():
+    station_map = StationMap()
+    for y in range(station_map.height):
+        for x in range(station_map.width):
+            expected = next(
+                (name for name, (x1, y1, x2, y2) in station_map.rooms.items()
+                 if x1 <= x <= x2 and y1 <= y <= y2),
+                f"Corridor (Sector {x},{y})",
+            )
+            assert station_map.get_room_name(x, y) == expected
+    assert station_map.get_room_name(-1, 3) == "Corridor (Sector -1,3)"
+
+
+def test_batch_queries():
+    station_map = StationMap()
+    layers = station_map.layers
+
+    assert layers.get(layers.vents, 7, 8) == 1
+    assert layers.get(layers.cover, 16, 18) == 3
+    assert layers.get(layers.opaque, 6, 6) == 1
+    # Lab camera at (12, 12) facing south covers the tile below it
+    assert layers.get(layers.camera_cover, 12, 13) >= 1
+
+    assert station_map.get_rooms_in_radius(15, 15, 0) == {"Generator"}
+    assert "Lab" in station_map.get_rooms_in_radius(15, 15, 3)
+
+    counts = station_map.get_room_occupancy([(1, 1), (2, 2), (15, 15), (10, 10), (0, 13), (99, 99)])
+    assert counts == {"Infirmary": 2, "Generator": 1, "Rec Room": 1}
+
+
+def test_line_of_sight_stops_at_opaque_cover():
+    layers = MapLayers(10, 10)
+    layers.set(layers.opaque, 5, 5, 1)
+    visible = layers.visible_tiles(5, 2, 6)
+
+    assert (5, 5) in visible          # the blocker itself is seen
+    assert (5, 7) not in visible      # but not what's behind it
+    assert (2, 2) in visible
+    assert (5, 9) not in visible      # out of range along the blocked line anyway
+
+
+def test_walls_are_routed_around_and_invalidate_paths():
+    station_map = StationMap()
+    finder = PathfindingSystem()
+    before = finder.find_path((0, 5), (6, 5), station_map)
+    assert (3, 5) in before
+
+    revision = station_map.topology_revision
+    for y in range(0, 9):
+        station_map.set_walkable(3, y, False)
+    assert station_map.topology_revision == revision + 9
+    station_map.set_walkable(3, 0, False)
+    assert station_map.topology_revision == revision + 9
+
+    after = finder.find_path((0, 5), (6, 5), station_map)
+    assert after[-1] == (6, 5)
+    assert all(x != 3 or y >= 9 for x, y in after)
+    assert not station_map.is_walkable(3, 4)
+
+
+def test_camera_cone_is_shared_with_security_cameras():
+    camera = Camera((12, 12), "Lab", "S", 3)
+    assert camera.get_visible_tiles() == camera_cone((12, 12), "S", 3)
+    assert len(camera.get_visible_tiles()) == 1 + 3 + 5
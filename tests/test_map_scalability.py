@@ -0,0 +1,92 @@
+"""Map scalability benchmark.
+
+Measures GameState construction, advance_turn, AI update and rendering on the
+classic 20x20 station and on generated 100x100 / 500x500 stations, so
+regressions in systems that scale with map area or room count show up.
+The test itself asserts on operation counts (map lookups per turn, tiles drawn
+per frame), which do not depend on the machine; timings are only printed.
+
+Run directly for a timing table:
+    python tests/test_map_scalability.py [sizes...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine import GameState
+from entities.station_layout import StationGenerator
+
+MAP_SIZES = (20, 100, 500)
+
+
+def _timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def _counted(counts, key, fn):
+    def wrapper(*args, **kwargs):
+        counts[key] += 1
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def benchmark_station(size: int, turns: int = 3, seed: int = 42) -> dict:
+    """Return per-phase timings (ms) and operation counts for a station of size x size tiles."""
+    # The classic map is the 20x20 case; larger sizes are generated
+    layout = None if size <= 20 else StationGenerator(seed=seed).generate(size, size)
+    holder = {}
+    results = {"size": size, "rooms": 0}
+    results["construct_ms"] = _timed(lambda: holder.update(game=GameState(seed=seed, station_layout=layout)))
+    game = holder["game"]
+    results["rooms"] = len(game.station_map.rooms)
+
+    # Tile queries made by the turn and tiles drawn by the renderer
+    counts = {"turn_lookups": 0, "render_tiles": 0}
+    station_map, renderer = game.station_map, game.renderer
+
+    game.reporter.crt.start_capture()
+    try:
+        with game.event_bus.activate():
+            results["ai_update_ms"] = _timed(lambda: game.ai_system.update(game), turns)
+        station_map.get_room_name = _counted(counts, "turn_lookups", station_map.get_room_name)
+        station_map.is_walkable = _counted(counts, "turn_lookups", station_map.is_walkable)
+        results["advance_turn_ms"] = _timed(game.advance_turn, turns)
+        del station_map.get_room_name, station_map.is_walkable
+        renderer._get_char_at = _counted(counts, "render_tiles", renderer._get_char_at)
+        results["render_ms"] = _timed(lambda: renderer.render(game, game.player), turns)
+    finally:
+        game.reporter.crt.stop_capture()
+        game.cleanup()
+    results.update(counts)
+    return results
+
+
+def test_station_systems_scale_with_map_size():
+    print("\n--- Station Map Scalability ---")
+    rows = [benchmark_station(size) for size in MAP_SIZES]
+    for row in rows:
+        print(f"{row['size']:>4}x{row['size']:<4} rooms={row['rooms']:<5} "
+              f"construct={row['construct_ms']:8.1f}ms  turn={row['advance_turn_ms']:7.1f}ms  "
+              f"ai={row['ai_update_ms']:7.1f}ms  render={row['render_ms']:6.1f}ms  "
+              f"lookups={row['turn_lookups']}  tiles={row['render_tiles']}")
+
+    small, large = rows[0], rows[-1]
+    assert large["rooms"] >= 500
+    # Guardrails: a 625x larger map must not make a turn or a frame do 625x the work
+    assert large["render_tiles"] == small["render_tiles"]
+    assert large["turn_lookups"] < small["turn_lookups"] * 2
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or list(MAP_SIZES)
+    for size in sizes:
+        row = benchmark_station(size)
+        print(f"{row['size']:>4}x{row['size']:<4} rooms={row['rooms']:<5} "
+              f"construct={row['construct_ms']:8.1f}ms  turn={row['advance_turn_ms']:7.1f}ms  "
+              f"ai={row['ai_update_ms']:7.1f}ms  render={row['render_ms']:6.1f}ms")
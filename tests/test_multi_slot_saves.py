@@ -145,6 +145,46 @@ class TestMultiSlotSaves:
         # Verify it's gone
         assert self.manager.get_slot_metadata("slot_4") is None
 
+    def test_slot_listing_uses_metadata_index(self):
+        """Test that listing reads the sidecar index instead of parsing saves."""
+        game = MockGameState("IndexTest")
+        game.turn = 12
+        self.manager.save_to_slot(game, 2)
+
+        index_path = os.path.join(self.temp_dir, "slots.index.json")
+        with open(index_path) as f:
+            entry = json.load(f)["slot_2"]
+        assert entry["turn"] == 12
+        assert entry["checksum"]
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("save file parsed during listing")
+
+        import systems.persistence as persistence
+        original = persistence.read_save_file
+        persistence.read_save_file = lambda path: original(path) if path == index_path else fail_parse()
+        try:
+            manager = SaveManager(save_dir=self.temp_dir)
+            slot_2 = next(s for s in manager.list_save_slots() if s["slot_name"] == "slot_2")
+            assert slot_2["turn"] == 12
+            manager.cleanup()
+        finally:
+            persistence.read_save_file = original
+
+    def test_slot_index_refreshes_stale_entries(self):
+        """Test that a save file changed behind the index's back is re-read."""
+        game = MockGameState("StaleTest")
+        self.manager.save_to_slot(game, 1)
+        assert self.manager.get_slot_metadata("slot_1")["turn"] == 1
+
+        with open(os.path.join(self.temp_dir, "slot_1.json"), "w") as f:
+            json.dump({"turn": 30, "crew": [], "player_location": [1, 1]}, f)
+        assert self.manager.get_slot_metadata("slot_1")["turn"] == 30
+
+        self.manager.delete_slot(1)
+        with open(os.path.join(self.temp_dir, "slots.index.json")) as f:
+            assert "slot_1" not in json.load(f)
+
     def test_invalid_slot_number(self):
         """Test that invalid slot numbers are rejected."""
         game = MockGameState("InvalidTest")
@@ -201,6 +241,8 @@ def run_tests():
         ("get slot metadata", test.test_get_slot_metadata),
         ("list all slots", test.test_list_all_slots),
         ("delete slot", test.test_delete_slot),
+        ("slot listing uses metadata index", test.test_slot_listing_uses_metadata_index),
+        ("slot index refreshes stale entries", test.test_slot_index_refreshes_stale_entries),
         ("invalid slot number", test.test_invalid_slot_number),
         ("campaign save and load", test.test_campaign_save_load),
         ("delete campaign", test.test_delete_campaign),
@@ -0,0 +1,77 @@
+from core.event_system import EventType
+from engine import GameState
+from entities.station_map import StationMap
+from systems.pathfinding import PathfindingSystem
+from systems.room_state import RoomStateManager, RoomState
+
+
+def test_paths_survive_turn_changes():
+    finder = PathfindingSystem()
+    station_map = StationMap()
+
+    first = finder.find_path((5, 5), (17, 17), station_map, current_turn=1)
+    second = finder.find_path((5, 5), (17, 17), station_map, current_turn=2)
+
+    assert second is first
+    assert finder.stats["hits"] == 1 and finder.stats["misses"] == 1
+
+
+def test_topology_change_invalidates_only_that_map():
+    finder = PathfindingSystem()
+    station_map = StationMap()
+    other_map = StationMap()
+    rooms = RoomStateManager(list(station_map.rooms.keys()))
+
+    finder.find_path((0, 0), (10, 10), station_map)
+    finder.find_path((0, 0), (10, 10), other_map)
+
+    # A* only reads walkability, so room states never invalidate its paths
+    revision = station_map.topology_revision
+    rooms.add_state("Lab", RoomState.DARK)
+    rooms.barricade_room("Lab")
+    rooms.add_state("Lab", RoomState.LOCKED)
+    rooms.add_state("Lab", RoomState.FROZEN)
+    assert station_map.topology_revision == revision
+    assert finder.is_cached((0, 0), (10, 10), station_map)
+
+    # Walls do
+    station_map.set_walkable(5, 5, False)
+    assert not finder.is_cached((0, 0), (10, 10), station_map)
+    assert finder.is_cached((0, 0), (10, 10), other_map)
+
+
+def test_lru_eviction_is_bounded():
+    finder = PathfindingSystem(max_cache_size=2)
+    station_map = StationMap()
+
+    finder.find_path((0, 0), (3, 3), station_map)
+    finder.find_path((0, 0), (4, 4), station_map)
+    finder.find_path((0, 0), (3, 3), station_map)  # refresh
+    finder.find_path((0, 0), (5, 5), station_map)
+
+    assert finder.cache_size() == 2
+    assert finder.is_cached((0, 0), (3, 3), station_map)
+    assert not finder.is_cached((0, 0), (4, 4), station_map)
+    assert finder.stats["evictions"] == 1
+
+
+def test_ai_reports_cache_stats():
+    game = GameState(seed=21)
+    reports = []
+    game.event_bus.subscribe(
+        EventType.DIAGNOSTIC,
+        lambda e: reports.append(e.payload) if e.payload.get("type") == "PATH_CACHE" else None,
+    )
+    ai = game.ai_system
+    member = next(m for m in game.crew if m is not game.player)
+    ai.budget_limit = 100
+    try:
+        with game.event_bus.activate():
+            ai._pathfind_step(member, 19, 19, game)
+            ai._pathfind_step(member, 19, 19, game)
+            ai._emit_path_cache_stats(game)
+        assert len(reports) == 1
+        assert reports[0]["misses"] >= 1
+        assert {"hits", "size", "total"} <= set(reports[0])
+    finally:
+        game.cleanup()
@@ -0,0 +1,103 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine import GameState
+from entities.crew_member import StealthPosture
+from systems.ai_cache import AICache
+from systems.perception_map import perception_for
+from systems.architect import RandomnessEngine
+from systems.room_state import RoomState
+
+
+def _crowd_player_room(game):
+    observers = [m for m in game.crew if m is not game.player]
+    for member in observers:
+        member.location = game.player.location
+    return observers
+
+
+def test_prepared_subject_context_rolls_identically():
+    game = GameState(seed=21)
+    try:
+        observers = _crowd_player_room(game)
+        game.player.stealth_posture = StealthPosture.CROUCHING
+        game.room_states.add_state(game.station_map.get_room_name(*game.player.location), RoomState.DARK)
+
+        game.rng = RandomnessEngine(seed=5)
+        fresh = [game.stealth.evaluate_detection(o, game.player, game, noise_level=3) for o in observers]
+
+        game.rng = RandomnessEngine(seed=5)
+        prepared = game.stealth.prepare_subject_context(game.player, game, 3)
+        reused = [game.stealth.evaluate_detection(o, game.player, game, noise_level=3, subject_context=prepared)
+                  for o in observers]
+        assert reused == fresh
+        assert prepared["is_dark"] and "observer_pool" not in prepared
+    finally:
+        game.cleanup()
+
+
+def test_ai_builds_player_context_once_per_turn():
+    game = GameState(seed=22)
+    try:
+        observers = _crowd_player_room(game)
+        env = game.environmental_coordinator
+        calls = []
+        original = env.get_current_modifiers
+        env.get_current_modifiers = lambda room, gs: calls.append(room) or original(room, gs)
+
+        ai = game.ai_system
+        ai.cache = AICache(game)
+        ai.alert_context = ai._build_alert_context(game)
+        for member in observers:
+            ai._perceive_player(member, game)
+
+        assert len(calls) == 1
+        assert len(ai.cache.perception.subject_contexts) == 1
+        assert game.perception is ai.cache.perception
+    finally:
+        game.cleanup()
+
+
+def test_witnesses_match_line_of_sight_checks():
+    game = GameState(seed=23)
+    try:
+        perception = perception_for(game)
+        station_map = game.station_map
+        for agent in game.crew:
+            expected = [m for m in game.crew
+                        if game.missionary.is_visible(agent.location, m.location, station_map)]
+            assert perception.witnesses(agent.location, game) == expected
+        assert perception_for(game) is perception
+    finally:
+        game.cleanup()
+
+
+def test_ai_rolls_co_located_observers_in_one_batch():
+    game = GameState(seed=23)
+    try:
+        observers = _crowd_player_room(game)
+        for member in observers:
+            member.is_infected = False
+        stealth = game.stealth_system
+        batches = []
+        original = stealth.evaluate_detection_batch
+        stealth.evaluate_detection_batch = lambda obs, *a, **kw: batches.append(list(obs)) or original(obs, *a, **kw)
+
+        game.rng = RandomnessEngine(seed=9)
+        ai = game.ai_system
+        ai.cache = AICache(game)
+        ai.alert_context = ai._build_alert_context(game)
+        seen = [ai._perceive_player(member, game) for member in observers]
+
+        assert batches == [observers]
+        assert ai.cache.player_detections == {}
+
+        stealth.evaluate_detection_batch = original
+        game.rng = RandomnessEngine(seed=9)
+        ai.cache = AICache(game)
+        expected = stealth.evaluate_detection_batch(observers, game.player, game, noise_level=game.player.get_noise_level())
+        assert seen == expected
+    finally:
+        game.cleanup()
@@ -55,6 +55,11 @@ def test_ai_scaling_performance():
 def test_budget_exhaustion_logging():
     print("\n--- Testing Budget Exhaustion Logging ---")
     game = create_scalable_state(100) # Force huge crew
+    # Schedule moves read precomputed room flow fields; investigations target
+    # arbitrary tiles, so each NPC still needs its own A* search.
+    for i, member in enumerate(game.crew[1:], start=1):
+        member.investigating = True
+        member.last_known_player_location = ((i * 7 + 3) % 20, (i * 3 + 1) % 20)
     ai_system = AISystem()
     
     exhaustion_events = []
@@ -0,0 +1,163 @@
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.event_system import EventType, GameEvent
+from systems.meta_progression import MetaProgressionSystem
+from systems.profile_store import ProfileStore
+from systems.statistics import StatisticsManager
+
+ROLES = {
+    "roles": {
+        "default": {"name": "Crew", "unlock_condition": None, "bonuses": {}},
+        "survivor": {"name": "Survivor", "unlock_condition": {"stat": "total_turns_survived", "threshold": 3},
+                     "bonuses": {"max_health_modifier": 20}},
+        "scientist": {"name": "Scientist", "unlock_condition": {"stat": "blood_tests_performed", "threshold": 2},
+                      "bonuses": {}},
+    }
+}
+
+
+def _meta(tmp_path, store):
+    unlockables = tmp_path / "unlockables.json"
+    unlockables.write_text(json.dumps(ROLES))
+    return MetaProgressionSystem(progress_file=str(tmp_path / "meta.json"),
+                                 unlockables_file=str(unlockables), store=store)
+
+
+def test_turn_counters_batch_until_session_end(tmp_path):
+    store = ProfileStore(flush_interval=None)
+    meta = _meta(tmp_path, store)
+    try:
+        for _ in range(4):
+            meta._on_turn(GameEvent(EventType.TURN_ADVANCE))
+        assert "survivor" in meta.unlocked_roles
+        assert store.stats["writes"] == 0 and store.is_dirty(meta.progress_file)
+        assert not os.path.exists(meta.progress_file)
+
+        meta.record_game_end(won=True, ending_type="ESCAPE")
+        assert store.stats["writes"] == 1 and not store.is_dirty(meta.progress_file)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+        # A second manager over the same file reuses the cached parse
+        loads = store.stats["loads"]
+        other = MetaProgressionSystem(progress_file=meta.progress_file,
+                                      unlockables_file=meta.unlockables_file, store=store)
+        assert store.stats["loads"] == loads
+        assert other.stats.total_turns_survived == 4 and "survivor" in other.unlocked_roles
+        other.cleanup()
+    finally:
+        meta.cleanup()
+
+
+def test_unlocks_only_recheck_roles_watching_the_changed_stat(tmp_path):
+    meta = _meta(tmp_path, ProfileStore(flush_interval=None))
+    try:
+        assert [role for _, role in meta._pending_unlocks["blood_tests_performed"]] == ["scientist"]
+        for _ in range(3):
+            meta._on_turn(GameEvent(EventType.TURN_ADVANCE))
+        assert not meta._pending_unlocks.get("total_turns_survived")
+        assert "scientist" not in meta.unlocked_roles
+
+        meta._on_blood_test(GameEvent(EventType.TEST_RESULT))
+        meta._on_blood_test(GameEvent(EventType.TEST_RESULT))
+        assert "scientist" in meta.unlocked_roles
+    finally:
+        meta.cleanup()
+
+
+def test_store_rereads_files_changed_on_disk(tmp_path):
+    store = ProfileStore(flush_interval=None)
+    path = str(tmp_path / "stats.json")
+    manager = StatisticsManager(stats_file=path, store=store)
+    manager.start_session()
+    manager.end_session("victory", 12)
+    assert json.loads(open(path).read())["victories"] == 1
+
+    with open(path, "w") as f:
+        json.dump({"victories": 7, "total_games": 9}, f)
+    future = time.time() + 5
+    os.utime(path, (future, future))
+    reloaded = StatisticsManager(stats_file=path, store=store)
+    assert reloaded.career.victories == 7 and reloaded.career.total_games == 9
+
+
+def test_owners_sharing_a_file_flush_their_own_state(tmp_path):
+    store = ProfileStore(flush_interval=None)
+    first, second = _meta(tmp_path, store), _meta(tmp_path, store)
+    try:
+        for _ in range(3):
+            first.stats.games_won += 1
+        second.stats.games_won += 1
+
+        second.cleanup()  # Clean, so it must not write or detach the other owner
+        assert not os.path.exists(first.progress_file)
+        first.save()
+        with open(first.progress_file) as f:
+            assert json.load(f)["stats"]["games_won"] == 3
+
+        # Each owner folds in only its own changes, so neither loses the other's
+        second = _meta(tmp_path, store)
+        second.stats.games_won += 1
+        second._mark_dirty()
+        first.stats.games_won += 1
+        first.save()
+        first.save()
+        with open(first.progress_file) as f:
+            assert json.load(f)["stats"]["games_won"] == 5
+    finally:
+        first.cleanup()
+        second.cleanup()
+
+
+def test_separate_stores_merge_instead_of_overwriting(tmp_path):
+    # Two server shards: separate processes, separate stores, one profile file
+    shard_a = _meta(tmp_path, ProfileStore(flush_interval=None))
+    shard_b = _meta(tmp_path, ProfileStore(flush_interval=None))
+    try:
+        for _ in range(3):
+            shard_a._on_turn(GameEvent(EventType.TURN_ADVANCE))
+        shard_b._on_blood_test(GameEvent(EventType.TEST_RESULT))
+        shard_a.save()
+        shard_b.save()
+        shard_b._on_blood_test(GameEvent(EventType.TEST_RESULT))
+        shard_b.record_game_end(won=True, ending_type="ESCAPE")
+
+        with open(shard_a.progress_file) as f:
+            data = json.load(f)
+        assert data["stats"]["total_turns_survived"] == 3
+        assert data["stats"]["blood_tests_performed"] == 2
+        assert data["stats"]["games_won"] == 1
+        assert set(data["unlocked_roles"]) == {"survivor", "scientist"}
+    finally:
+        shard_a.cleanup()
+        shard_b.cleanup()
+
+
+def test_career_merge_keeps_records_and_sessions(tmp_path):
+    path = str(tmp_path / "stats.json")
+    first = StatisticsManager(stats_file=path, store=ProfileStore(flush_interval=None))
+    second = StatisticsManager(stats_file=path, store=ProfileStore(flush_interval=None))
+    first.start_session()
+    first.end_session("victory", 30)
+    second.start_session()
+    second.end_session("death", 50)
+
+    with open(path) as f:
+        data = json.load(f)
+    assert data["total_games"] == 2 and data["victories"] == 1 and data["deaths"] == 1
+    assert data["fastest_victory_turns"] == 30 and data["best_survival_turns"] == 50
+    assert [session["outcome"] for session in data["sessions"]] == ["victory", "death"]
+
+
+def test_meta_records_roles_unlocked_elsewhere(tmp_path):
+    meta = _meta(tmp_path, ProfileStore(flush_interval=None))
+    try:
+        meta._on_unlock(GameEvent(EventType.META_UNLOCK, {"role_id": "scientist", "relayed_from": 1}))
+        assert "scientist" in meta.unlocked_roles
+        assert not meta._pending_unlocks.get("blood_tests_performed")
+    finally:
+        meta.cleanup()
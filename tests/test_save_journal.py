@@ -0,0 +1,97 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine import GameState
+from systems.persistence import SaveJournal, SaveManager, apply_journal_delta
+
+
+def test_deltas_only_carry_changed_sections(tmp_path):
+    path = str(tmp_path / "slot.journal")
+    journal = SaveJournal(path)
+    state = {
+        "turn": 1,
+        "power_on": True,
+        "journal": ["Day 1"],
+        "crew": [{"name": "Childs", "health": 3}, {"name": "Blair", "health": 3}],
+    }
+    checkpoint_size = journal.record(state)
+
+    state = dict(state, turn=2, journal=["Day 1", "Day 2"],
+                 crew=[{"name": "Childs", "health": 2}, {"name": "Blair", "health": 3}])
+    delta_size = journal.record(state)
+    assert delta_size < checkpoint_size
+
+    delta = SaveJournal.read_records(path)[-1]
+    assert delta["extend"] == {"journal": ["Day 2"]}
+    assert delta["crew"] == {"Childs": {"name": "Childs", "health": 2}}
+    assert "set" not in delta or set(delta["set"]) == {"turn"}
+    assert SaveJournal.replay(path) == state
+
+
+def test_replay_ignores_torn_tail_and_stops_at_turn(tmp_path):
+    path = str(tmp_path / "slot.journal")
+    journal = SaveJournal(path)
+    for turn in range(1, 5):
+        journal.record({"turn": turn, "log": list(range(turn))})
+    with open(path, "ab") as f:
+        f.write(b'{"type":"delta","turn":5,"se')
+
+    assert SaveJournal.turns(path) == [1, 2, 3, 4]
+    assert SaveJournal.replay(path)["log"] == [0, 1, 2, 3]
+    assert SaveJournal.replay(path, turn=2) == {"turn": 2, "log": [0, 1]}
+
+
+def test_crew_reorder_and_removal_round_trip():
+    state = {"crew": [{"name": "A"}, {"name": "B"}, {"name": "C"}]}
+    apply_journal_delta(state, {"crew_order": ["C", "A"], "crew": {"C": {"name": "C", "hp": 1}}})
+    assert state["crew"] == [{"name": "C", "hp": 1}, {"name": "A"}]
+
+
+def test_journaled_autosave_resumes_from_any_turn(tmp_path):
+    game = GameState(seed=6, headless=True)
+    manager = SaveManager(save_dir=str(tmp_path), game_state_factory=GameState.from_dict, journaled=True)
+    try:
+        for _ in range(4):
+            game.advance_turn()
+            manager.autosave_game(game)
+            manager.journal_writer.flush()
+        turns = manager.journal_turns()
+        assert turns[-1] == game.turn and len(turns) == 4
+
+        earlier = manager.load_journal(turn=turns[1])
+        assert earlier.turn == turns[1]
+        earlier.cleanup()
+        # Resuming compacts the journal into a single checkpoint at that turn
+        assert manager.journal_turns() == [turns[1]]
+
+        for _ in range(2):
+            game.advance_turn()
+            manager.autosave_game(game)
+        latest = manager.load_journal()
+        assert latest.turn == game.turn
+        assert [m.location for m in latest.crew] == [m.location for m in game.crew]
+        latest.cleanup()
+    finally:
+        manager.cleanup()
+        game.cleanup()
+
+
+def test_load_falls_back_to_the_autosave_journal(tmp_path):
+    game = GameState(seed=7, headless=True)
+    manager = SaveManager(save_dir=str(tmp_path), game_state_factory=GameState.from_dict, journaled=True)
+    manager.autosave_slot = "autosave_session"
+    try:
+        for _ in range(2):
+            game.advance_turn()
+            manager.autosave_game(game)
+        assert manager.journal_turns() == manager.journal_turns("autosave_session")
+        assert not (tmp_path / "autosave_session.json").exists()
+
+        loaded = manager.load_game("autosave_session")
+        assert loaded.turn == game.turn
+        loaded.cleanup()
+    finally:
+        manager.cleanup()
+        game.cleanup()
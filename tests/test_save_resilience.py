@@ -34,8 +34,9 @@ def test_partial_save_hydrates_defaults():
     assert game.station_map.height == data["station_map"]["height"]
     # Crew list should fall back to generated defaults when missing/empty in save
     assert len(game.crew) > 0
-    # Trust matrix should hydrate when present
-    assert game.trust_system.matrix == data["trust"]
+    # Unreadable trust rows are skipped; the matrix keeps one row per crew member
+    assert "MacReady->Childs" not in game.trust_system.matrix
+    assert set(game.trust_system.to_dict()) == {m.name for m in game.crew}
     assert game.journal == data["journal"]
 
 
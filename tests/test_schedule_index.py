@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+from engine import GameState
+from entities.crew_member import CrewMember
+from entities.station_map import StationMap
+from systems.schedule_index import CompiledSchedule, ScheduleIndex
+
+
+def test_compiled_table_handles_wraparound_and_first_match():
+    compiled = CompiledSchedule([
+        {"start": 20, "end": 8, "room": "Sleeping Quarters"},
+        {"start": 8, "end": 20, "room": "Lab"},
+        {"start": 0, "end": 24, "room": "Rec Room"},   # shadowed everywhere
+        {"start": 0, "end": 24},                        # no room: ignored
+    ])
+    assert compiled.room_at(23) == "Sleeping Quarters"
+    assert compiled.room_at(3) == "Sleeping Quarters"
+    assert compiled.room_at(8) == "Lab"
+    assert compiled.room_at(19) == "Lab"
+    assert compiled.room_at(24 + 9) == "Lab"
+    assert "Rec Room" not in compiled.rooms
+
+    station_map = StationMap()
+    assert compiled.target_at(9, station_map) == station_map.rooms["Lab"][:2]
+
+
+def test_reassigning_schedule_recompiles():
+    member = CrewMember("Test", "Crew", "Neutral", schedule=[{"start": 0, "end": 24, "room": "Lab"}])
+    first = member.compiled_schedule
+    assert member.compiled_schedule is first
+    assert first.room_at(12) == "Lab"
+
+    member.schedule = [{"start": 0, "end": 24, "room": "Kennel"}]
+    assert member.compiled_schedule.room_at(12) == "Kennel"
+
+    member.schedule[0]["room"] = "Hangar"
+    member.invalidate_schedule()
+    assert member.compiled_schedule.room_at(12) == "Hangar"
+
+
+def test_snapshot_is_shared_until_someone_moves():
+    game = GameState(seed=17)
+    try:
+        index = game.schedule_index
+        member = next(m for m in game.crew if m is not game.player and m.schedule)
+        expected = member.compiled_schedule.room_at(game.time_system.hour)
+        far_room = next(name for name in game.station_map.rooms if name != expected)
+        member.location = game.station_map.rooms[far_room][:2]
+
+        flags = game.renderer._compute_out_of_schedule(game)
+        assert flags[member.name] is True
+        assert member.is_out_of_schedule(game) is True
+        game.room_states._check_schedule_slips(game)
+        assert member.schedule_slip_flag is True
+        assert index.stats["builds"] == 1
+        assert index.stats["hits"] >= 2
+
+        member.location = game.station_map.rooms[expected][:2]
+        assert member.is_out_of_schedule(game) is False
+        assert index.stats["builds"] == 2
+    finally:
+        game.cleanup()
+
+
+def test_untracked_members_are_still_classified():
+    game = GameState(seed=17)
+    try:
+        stranger = CrewMember("Stranger", "Crew", "Neutral",
+                              schedule=[{"start": 0, "end": 24, "room": "Lab"}])
+        stranger.location = game.station_map.rooms["Kennel"][:2]
+        snapshot = ScheduleIndex().snapshot(game)
+        assert snapshot.expected_room(stranger) == "Lab"
+        assert snapshot.is_out_of_place(stranger)
+    finally:
+        game.cleanup()
+
+
+def test_cache_key_follows_crew_revision_and_untracked_doubles():
+    game = GameState(seed=17)
+    try:
+        index = ScheduleIndex()
+        member = next(m for m in game.crew if m is not game.player and m.schedule)
+        index.snapshot(game)
+        index.snapshot(game)
+        assert index.stats == {"builds": 1, "hits": 1}
+
+        member.is_alive = False
+        assert not index.snapshot(game).is_slipped(member)
+        member.schedule = [{"start": 0, "end": 24, "room": "Kennel"}]
+        assert index.snapshot(game).expected_room(member) == "Kennel"
+        assert index.stats["builds"] == 3
+
+        # Crew objects that don't report changes are compared member by member
+        double = SimpleNamespace(name="Double", location=game.station_map.rooms["Lab"][:2],
+                                 is_alive=True, schedule=[{"start": 0, "end": 24, "room": "Lab"}])
+        game.crew.append(double)
+        assert not index.snapshot(game).is_out_of_place(double)
+        double.location = game.station_map.rooms["Kennel"][:2]
+        assert index.snapshot(game).is_out_of_place(double)
+    finally:
+        game.cleanup()
+
+
+def test_other_games_moving_crew_keep_the_cache():
+    game, other = GameState(seed=17), GameState(seed=18)
+    try:
+        index = game.schedule_index
+        index.snapshot(game)
+        builds = index.stats["builds"]
+        for member in other.crew:
+            member.location = other.station_map.rooms["Kennel"][:2]
+        index.snapshot(game)
+        assert index.stats["builds"] == builds
+
+        game.crew[1].location = game.station_map.rooms["Kennel"][:2]
+        index.snapshot(game)
+        assert index.stats["builds"] == builds + 1
+    finally:
+        game.cleanup()
+        other.cleanup()
@@ -422,6 +422,72 @@ def test_security_log_prioritized_ordering():
     print("[PASS] Security log prioritized ordering works correctly")
 
 
+def test_device_index_matches_full_scan():
+    """Test that the tile index finds exactly the devices a full scan would."""
+    from systems.security import SecuritySystem
+
+    system = SecuritySystem()
+    for x in range(20):
+        for y in range(20):
+            expected = [c for c in system.cameras.values() if c.can_see((x, y))]
+            expected += [s for s in system.motion_sensors.values() if s.detects((x, y))]
+            found = [d for d in system.devices_covering((x, y)) if d.is_operational()]
+            assert found == expected
+
+    system.cleanup()
+    print("[PASS] Device index matches full scan")
+
+
+def test_device_index_follows_refacing_and_sabotage():
+    """Test that refaced cameras and sabotaged devices are reflected in movement checks."""
+    from systems.security import SecuritySystem
+    from core.event_system import GameEvent, EventType
+
+    system = SecuritySystem()
+    camera = system.cameras[(6, 6)]
+    mover = MockCrewMember("Nauls")
+
+    def move_to(pos):
+        before = len(system.security_log.entries)
+        system.on_movement(GameEvent(EventType.MOVEMENT, {"mover": mover, "to": pos, "game_state": None}))
+        return len(system.security_log.entries) - before
+
+    assert move_to((6, 7)) == 1
+    camera.facing = "N"
+    assert (6, 7) not in camera.coverage
+    assert move_to((6, 7)) == 0
+    assert move_to((6, 5)) == 1
+
+    camera.operational = False
+    assert move_to((6, 5)) == 0
+
+    system.cleanup()
+    print("[PASS] Device index follows refacing and sabotage")
+
+
+def test_refacing_cameras_only_rebuilds_their_own_system():
+    """Test that another system's camera changes leave this system's device index alone."""
+    from systems.security import SecuritySystem
+
+    system, other = SecuritySystem(), SecuritySystem()
+    system.devices_covering((6, 7))
+    index = system._device_index
+
+    other.devices_covering((6, 7))
+    other.cameras[(6, 6)].facing = "N"
+    assert other.devices_covering((6, 7)) == []
+    system.devices_covering((6, 7))
+    assert system._device_index is index
+
+    system.cameras[(6, 6)].facing = "N"
+    system.devices_covering((6, 7))
+    assert system._device_index is not index
+
+    system.cleanup()
+    other.cleanup()
+    print("[PASS] Camera changes stay within their system")
+
+
 if __name__ == "__main__":
     test_security_system_init()
     test_camera_visible_tiles()
@@ -439,5 +505,8 @@ if __name__ == "__main__":
     test_has_unread_alerts()
     test_security_log_max_size()
     test_security_log_prioritized_ordering()
+    test_device_index_matches_full_scan()
+    test_device_index_follows_refacing_and_sabotage()
+    test_refacing_cameras_only_rebuilds_their_own_system()
 
     print("\n=== ALL SECURITY SYSTEM TESTS PASSED ===")
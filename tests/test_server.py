@@ -0,0 +1,154 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_socketio")
+pytest.importorskip("flask_cors")
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import server
+
+
+@pytest.fixture
+def session(tmp_path, request, monkeypatch):
+    """A fresh server game whose saves go to tmp_path."""
+    monkeypatch.setattr(server.process_bus, 'broadcast_unscoped', False)
+    session_id = f"test_{request.node.name}"
+    response = server.app.test_client().post('/api/new_game', json={'session_id': session_id})
+    assert response.get_json()['success']
+    with server.game_sessions.use(session_id) as game:
+        game.save_manager.save_dir = str(tmp_path)
+    yield session_id
+    server.game_sessions.discard(session_id)
+
+
+def _client():
+    return server.socketio.test_client(server.app)
+
+
+def _frames(client):
+    return [msg['args'][0] for msg in client.get_received() if msg['name'] == 'turn_frame']
+
+
+def _command(client, session_id, command):
+    client.emit('command', {'session_id': session_id, 'command': command})
+    frames = _frames(client)
+    assert len(frames) == 1
+    return frames[0]
+
+
+def _join(client, session_id):
+    """Join a session's room; returns the socket's server-side sid."""
+    before = set(server.socket_sessions)
+    client.emit('join_session', {'session_id': session_id})
+    _frames(client)
+    sid, = set(server.socket_sessions) - before
+    return sid
+
+
+def _detached(bus):
+    return bus not in bus._parent._sessions
+
+
+def test_join_session_sends_a_full_snapshot(session):
+    client = _client()
+    try:
+        client.emit('join_session', {'session_id': session})
+        frame, = _frames(client)
+        assert frame['success']
+        assert frame['game_state']['full'] is True
+        assert frame['game_state']['crew']
+    finally:
+        client.disconnect()
+
+
+def test_command_sends_each_socket_its_own_frame(session):
+    first, second = _client(), _client()
+    try:
+        _join(first, session)
+        _join(second, session)
+        _frames(first)
+
+        own = _command(first, session, "WAIT")
+        other, = _frames(second)
+        assert own['message'] == other['message']
+        assert own['game_state']['full'] is False
+        assert own['game_state']['state_version'] == other['game_state']['state_version']
+
+        # Both sockets were brought up to date, so a clean command sends no sections
+        _command(first, session, "HELP")
+        other, = _frames(second)
+        assert 'crew' not in other['game_state']
+    finally:
+        first.disconnect()
+        second.disconnect()
+
+
+def test_disconnect_drops_the_socket_baseline(session):
+    first, second = _client(), _client()
+    try:
+        first_sid = _join(first, session)
+        second_sid = _join(second, session)
+        assert len(server.session_sockets[session]) == 2
+        with server.game_sessions.use(session) as game:
+            assert second_sid in game.state_tracker._last_sent
+
+        second.disconnect()
+        assert second_sid not in server.socket_sessions
+        assert server.session_sockets[session] == {first_sid}
+        with server.game_sessions.use(session) as game:
+            assert second_sid not in game.state_tracker._last_sent
+        _command(first, session, "WAIT")
+    finally:
+        first.disconnect()
+    assert session not in server.session_sockets
+
+
+def test_load_swaps_the_bridged_game(session):
+    client = _client()
+    try:
+        _join(client, session)
+        _command(client, session, "SAVE slot1")
+        with server.game_sessions.use(session) as game:
+            game.save_manager.writer.flush()
+            old_bus = game.event_bus
+
+        frame = _command(client, session, "LOAD slot1")
+        assert frame['message'] == "*** GAME LOADED ***"
+        assert frame['game_state']['full'] is True
+        with server.game_sessions.use(session) as loaded:
+            assert loaded.event_bus is not old_bus
+            assert server.event_bridges[session].bus is loaded.event_bus
+        assert _detached(old_bus)
+    finally:
+        client.disconnect()
+
+
+def test_resume_rewinds_to_a_journaled_turn(session):
+    client = _client()
+    try:
+        _join(client, session)
+        for _ in range(3):
+            _command(client, session, "WAIT")
+        with server.game_sessions.use(session) as game:
+            turns = game.save_manager.journal_turns()
+            old_bus = game.event_bus
+        # The journal writer may coalesce turns queued behind a slow write
+        assert len(turns) >= 2
+
+        listing = _command(client, session, "RESUME")
+        assert "Resumable turns" in listing['message']
+
+        frame = _command(client, session, f"RESUME {turns[0]}")
+        assert frame['message'] == f"*** RESUMED AT TURN {turns[0]} ***"
+        with server.game_sessions.use(session) as resumed:
+            assert resumed.turn == turns[0]
+            assert server.event_bridges[session].bus is resumed.event_bus
+            assert resumed.save_manager.autosave_slot == server._autosave_slot(session)
+        assert _detached(old_bus)
+    finally:
+        client.disconnect()
@@ -0,0 +1,97 @@
+from core.event_system import event_bus, isolated_bus, new_session_bus, process_bus, EventType, GameEvent
+from engine import GameState
+
+
+def _turn_counter(game):
+    """Subscribe a TURN_ADVANCE counter on the game's own session bus."""
+    seen = []
+    game.event_bus.subscribe(EventType.TURN_ADVANCE, lambda e: seen.append(e.payload.get("game_state")))
+    return seen
+
+
+def test_advance_turn_only_dispatches_to_own_session():
+    game_a = GameState(seed=1)
+    game_b = GameState(seed=2)
+    try:
+        seen_a = _turn_counter(game_a)
+        seen_b = _turn_counter(game_b)
+
+        game_a.advance_turn()
+
+        assert seen_a == [game_a]
+        assert seen_b == []
+    finally:
+        game_a.cleanup()
+        game_b.cleanup()
+
+
+def test_subsystems_subscribe_to_session_bus_not_process_bus():
+    before = len(process_bus._subscribers.get(EventType.TURN_ADVANCE, []))
+    game = GameState(seed=3)
+    try:
+        assert game.trust_system.on_turn_advance in game.event_bus._subscribers[EventType.TURN_ADVANCE]
+        assert len(process_bus._subscribers.get(EventType.TURN_ADVANCE, [])) == before
+    finally:
+        game.cleanup()
+    assert game.event_bus._subscribers == {}
+
+
+def test_process_listeners_still_receive_session_events():
+    game = GameState(seed=4)
+    received = []
+
+    def listener(event: GameEvent):
+        received.append(event.payload.get("turn"))
+
+    event_bus.subscribe(EventType.TURN_ADVANCE, listener)
+    try:
+        game.advance_turn()
+        assert received == [game.turn]
+    finally:
+        event_bus.unsubscribe(EventType.TURN_ADVANCE, listener)
+        game.cleanup()
+
+
+def test_unscoped_emit_keeps_legacy_broadcast():
+    game = GameState(seed=5)
+    try:
+        seen = _turn_counter(game)
+        event_bus.emit(GameEvent(EventType.TURN_ADVANCE, {"game_state": game, "rng": game.rng, "turn": game.turn}))
+        assert seen == [game]
+    finally:
+        game.cleanup()
+
+
+def test_unscoped_broadcast_can_be_limited_to_a_single_session():
+    with isolated_bus() as root:
+        root.broadcast_unscoped = False
+        seen = []
+        first = new_session_bus()
+        first.subscribe(EventType.DIAGNOSTIC, lambda e: seen.append("first"))
+
+        root.emit(GameEvent(EventType.DIAGNOSTIC))
+        assert seen == ["first"]
+
+        second = new_session_bus()
+        second.subscribe(EventType.DIAGNOSTIC, lambda e: seen.append("second"))
+        root.emit(GameEvent(EventType.DIAGNOSTIC))
+        assert seen == ["first"]
+        assert not root.has_subscribers(EventType.DIAGNOSTIC)
+
+        second.detach()
+        root.emit(GameEvent(EventType.DIAGNOSTIC))
+        assert seen == ["first", "first"]
+
+
+def test_activate_routes_module_bus_to_session():
+    game = GameState(seed=6)
+    try:
+        def listener(event):
+            pass
+
+        with game.event_bus.activate():
+            event_bus.subscribe(EventType.DIAGNOSTIC, listener)
+        assert listener in game.event_bus._subscribers[EventType.DIAGNOSTIC]
+        assert listener not in process_bus._subscribers.get(EventType.DIAGNOSTIC, [])
+    finally:
+        game.cleanup()
@@ -0,0 +1,173 @@
+import os
+
+import pytest
+
+from core.event_system import EventType
+from core.session_manager import SessionManager
+from engine import GameState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _manager(tmp_path, **kwargs):
+    released = []
+    activated = []
+    manager = SessionManager(
+        loader=GameState.from_dict,
+        hibernate_dir=str(tmp_path),
+        on_activate=lambda sid, game: activated.append(sid),
+        on_release=lambda sid, game: released.append(sid),
+        **kwargs,
+    )
+    return manager, activated, released
+
+
+def test_lru_session_is_hibernated_and_rehydrated(tmp_path):
+    manager, activated, released = _manager(tmp_path, max_active=2, idle_seconds=0)
+    games = {sid: GameState(seed=i) for i, sid in enumerate(["a", "b", "c"], start=1)}
+    try:
+        manager.put("a", games["a"])
+        manager.put("b", games["b"])
+        manager.get("a")  # "b" is now least recently used
+        manager.put("c", games["c"])
+
+        assert manager.is_resident("a") and manager.is_resident("c")
+        assert not manager.is_resident("b")
+        assert "b" in manager and len(manager) == 3
+        assert released == ["b"]
+        # Evicted game had its subsystems cleaned up
+        assert games["b"].event_bus._subscribers == {}
+        assert len(os.listdir(tmp_path)) == 1
+
+        restored = manager.get("b")
+        assert restored is not games["b"]
+        assert restored.turn == games["b"].turn
+        assert restored.player.location == games["b"].player.location
+        assert activated[-1] == "b"
+        assert manager.stats["rehydrated"] == 1
+    finally:
+        manager.close()
+        for sid in ["a", "b", "c"]:
+            manager.discard(sid)
+    assert os.listdir(tmp_path) == []
+
+
+def test_idle_sessions_hibernate_on_next_access(tmp_path):
+    clock = FakeClock()
+    manager, _, released = _manager(tmp_path, idle_seconds=60, clock=clock)
+    try:
+        manager.put("idle", GameState(seed=4))
+        clock.now = 30
+        manager.put("busy", GameState(seed=5))
+        clock.now = 75
+        manager.get("busy")
+
+        assert released == ["idle"]
+        assert manager.is_resident("busy")
+        assert manager.active_count == 1
+    finally:
+        manager.discard("idle")
+        manager.discard("busy")
+
+
+def test_session_cap_discards_oldest_snapshot(tmp_path):
+    manager, _, _ = _manager(tmp_path, max_active=1, max_sessions=2, idle_seconds=0)
+    try:
+        for i, sid in enumerate(["x", "y", "z"], start=1):
+            manager.put(sid, GameState(seed=i))
+
+        assert "x" not in manager
+        assert manager.get("x") is None
+        assert "y" in manager and manager.is_resident("z")
+        assert manager.stats["evicted"] == 1
+    finally:
+        for sid in ["x", "y", "z"]:
+            manager.discard(sid)
+
+
+def test_replacing_a_session_cleans_up_the_old_game(tmp_path):
+    manager, _, released = _manager(tmp_path)
+    first = GameState(seed=6)
+    try:
+        manager.put("s", first)
+        manager.put("s", GameState(seed=7))
+        assert released == ["s"]
+        assert EventType.TURN_ADVANCE not in first.event_bus._subscribers
+    finally:
+        manager.discard("s")
+
+
+def test_sessions_in_use_are_not_evicted(tmp_path):
+    clock = FakeClock()
+    manager, _, released = _manager(tmp_path, max_active=1, idle_seconds=60, clock=clock)
+    busy = GameState(seed=8)
+    try:
+        manager.put("busy", busy)
+        with manager.use("busy") as game:
+            assert game is busy and manager.is_pinned("busy")
+            # Another request admits a session and reaps idle ones mid-command
+            clock.now = 100
+            manager.put("other", GameState(seed=9))
+            manager.reap_idle()
+            assert manager.is_resident("busy") and released == []
+
+            # Replacing a pinned game defers its cleanup until the command ends
+            manager.put("busy", GameState(seed=10))
+            assert released == ["other"]
+            assert EventType.TURN_ADVANCE in busy.event_bus._subscribers
+
+        assert released == ["other", "busy"]
+        assert not manager.is_pinned("busy") and manager.active_count == 1
+    finally:
+        manager.discard("busy")
+        manager.discard("other")
+
+
+def test_snapshots_are_written_outside_the_lock(tmp_path):
+    manager, _, released = _manager(tmp_path, max_active=1, idle_seconds=0)
+    write_snapshot = manager._write_snapshot
+    held = []
+
+    def recording_write(session_id, data):
+        held.append(manager._lock._is_owned())
+        return write_snapshot(session_id, data)
+
+    manager._write_snapshot = recording_write
+    try:
+        manager.put("a", GameState(seed=11))
+        manager.put("b", GameState(seed=12))
+
+        assert held == [False]
+        assert released == ["a"] and "a" in manager and not manager.is_resident("a")
+        assert manager.stats["hibernated"] == 1
+    finally:
+        manager.discard("a")
+        manager.discard("b")
+
+
+def test_failed_rehydration_keeps_the_snapshot(tmp_path):
+    manager, _, _ = _manager(tmp_path, max_active=1, idle_seconds=0)
+
+    def broken_loader(data):
+        raise RuntimeError("loader crashed")
+
+    try:
+        manager.put("a", GameState(seed=13))
+        manager.put("b", GameState(seed=14))
+        manager.loader = broken_loader
+        with pytest.raises(RuntimeError):
+            manager.get("a")
+        assert "a" in manager and len(os.listdir(tmp_path)) == 1
+
+        manager.loader = GameState.from_dict
+        assert manager.get("a") is not None
+        assert manager.is_resident("a")
+    finally:
+        manager.discard("a")
+        manager.discard("b")
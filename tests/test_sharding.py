@@ -0,0 +1,68 @@
+import threading
+import time
+
+from core.event_system import EventBus, EventType, GameEvent
+from core.sharding import ShardConfig, ShardRelay, RelayHub, shard_for, RELAY_ORIGIN_KEY
+
+
+def test_shard_for_is_stable_and_spreads_sessions():
+    ids = [f"session_{i}" for i in range(400)]
+    first = [shard_for(sid, 4) for sid in ids]
+    assert first == [shard_for(sid, 4) for sid in ids]
+    counts = [first.count(index) for index in range(4)]
+    assert min(counts) > 60
+    assert shard_for("anything", 1) == 0
+
+
+def test_config_from_env():
+    config = ShardConfig.from_env({
+        "SHARD_INDEX": "2", "SHARD_COUNT": "3", "SHARD_BASE_PORT": "6000",
+        "SHARD_RELAY_ADDRESS": "127.0.0.1:7001", "SHARD_RELAY_KEY": "abcd",
+    })
+    assert config.sharded
+    assert config.port_for(1) == 6001
+    assert config.relay_address == ("127.0.0.1", 7001)
+    assert config.relay_key == b"\xab\xcd"
+    owned = [sid for sid in ("a", "b", "c", "d", "e", "f") if config.owns(sid)]
+    assert all(shard_for(sid, 3) == 2 for sid in owned)
+    assert not ShardConfig.from_env({}).sharded
+
+
+def test_relay_forwards_events_between_shards_without_echo():
+    hub = RelayHub(authkey=b"key").start()
+    bus_a, bus_b = EventBus(), EventBus()
+    relay_a = ShardRelay(ShardConfig(index=0, count=2, relay_address=hub.address, relay_key=b"key"), bus=bus_a).start()
+    relay_b = ShardRelay(ShardConfig(index=1, count=2, relay_address=hub.address, relay_key=b"key"), bus=bus_b).start()
+
+    received_b = []
+    arrived = threading.Event()
+    received_a = []
+
+    def on_b(event):
+        received_b.append(event.payload)
+        arrived.set()
+
+    bus_b.subscribe(EventType.META_UNLOCK, on_b)
+    session_b = EventBus(parent=bus_b)
+    session_b_events = []
+    session_b.subscribe(EventType.META_UNLOCK, session_b_events.append)
+    bus_a.subscribe(EventType.META_UNLOCK, lambda e: received_a.append(e.payload))
+    try:
+        # Both clients must be registered with the hub before publishing
+        for _ in range(100):
+            if len(hub._connections) == 2:
+                break
+            time.sleep(0.01)
+        bus_a.emit(GameEvent(EventType.META_UNLOCK, {"role_id": "pilot", "game_state": object()}))
+
+        assert arrived.wait(5)
+        assert received_b == [{"role_id": "pilot", RELAY_ORIGIN_KEY: 0}]
+        # Relayed events stay on the relay's scoped bus, out of live sessions
+        assert session_b_events == []
+        # Only the local emit reached shard A; B did not re-publish the relayed copy
+        time.sleep(0.05)
+        assert len(received_a) == 1
+    finally:
+        relay_a.cleanup()
+        relay_b.cleanup()
+        hub.close()
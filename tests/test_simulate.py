@@ -0,0 +1,45 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine import GameState
+from simulate import COLUMNS, ColumnarWriter, read_columns, run_game, simulate
+from systems.architect import Difficulty
+
+
+def test_headless_game_has_no_side_channels():
+    game = GameState(seed=1, headless=True)
+    try:
+        assert game.audio.enabled is False
+        assert game.save_manager.autosave is False
+        assert game.crt.capture_mode is True
+    finally:
+        game.cleanup()
+
+
+def test_run_game_is_a_pure_function_of_its_inputs():
+    first = run_game(5, Difficulty.HARD, policy="wander", turns=25)
+    assert first == run_game(5, Difficulty.HARD, policy="wander", turns=25)
+    assert set(first) == set(COLUMNS)
+    assert first["difficulty"] == "HARD"
+    assert first["turns"] <= 25
+    assert first["initial_infected"] >= 2
+
+
+def test_scripted_policy_and_columnar_round_trip(tmp_path):
+    path = str(tmp_path / "runs.cols.gz")
+    with ColumnarWriter(path, block_rows=2) as writer:
+        for row in simulate(range(3), turns=10, workers=1, script=["MOVE N", "WAIT"]):
+            writer.write(row)
+
+    columns = read_columns(path)
+    assert columns["seed"] == [0, 1, 2]
+    assert columns["policy"] == ["script"] * 3
+    assert set(columns) == set(COLUMNS)
+
+
+def test_process_pool_matches_in_process_rows():
+    in_process = list(simulate([7, 8], turns=10, workers=1))
+    pooled = list(simulate([7, 8], turns=10, workers=2))
+    assert pooled == in_process
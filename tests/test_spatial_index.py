@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+from engine import GameState
+from entities.crew_member import CrewMember
+from entities.station_map import StationMap
+from systems.spatial_index import CrewRoster, CrewSpatialIndex, crew_index
+
+
+def _crew(*locations):
+    crew = []
+    for i, location in enumerate(locations):
+        member = CrewMember(f"Crew{i}", "Crew", "Neutral")
+        member.location = location
+        crew.append(member)
+    return crew
+
+
+def test_buckets_follow_moves_and_keep_crew_order():
+    station_map = StationMap()
+    crew = _crew((6, 6), (6, 6), (1, 1))
+    index = CrewSpatialIndex().sync(crew, station_map)
+
+    assert index.at((6, 6)) == [crew[0], crew[1]]
+    assert index.in_room("Infirmary") == [crew[2]]
+
+    crew[2].move(5, 5, station_map)                     # (1,1) -> (6,6)
+    crew[0].location = (15, 15)
+    assert index.at((6, 6)) == [crew[1], crew[2]]
+    assert index.first_at((6, 6), exclude=crew[1]) is crew[2]
+    assert index.in_room("Generator") == [crew[0]]
+    assert index.in_room("Infirmary") == []
+    assert index.stats["rebuilds"] == 1
+
+
+def test_radius_queries():
+    station_map = StationMap()
+    crew = _crew((10, 10), (12, 10), (12, 12), (0, 19))
+    index = CrewSpatialIndex().sync(crew, station_map)
+
+    assert index.within((10, 10), 2) == crew[:2]
+    assert index.within((10, 10), 4, metric="euclidean") == crew[:3]
+    assert index.within((10, 10), 3, metric="chebyshev") == crew[:3]
+
+
+def test_roster_changes_trigger_rebuild_and_plain_objects_are_polled():
+    station_map = StationMap()
+    crew = _crew((2, 2))
+    stranger = SimpleNamespace(name="Stranger", location=(2, 2), is_alive=True)
+    state = SimpleNamespace(crew=crew, station_map=station_map, crew_index=CrewSpatialIndex())
+
+    assert crew_index(state).at((2, 2)) == crew
+    crew.append(stranger)
+    assert crew_index(state).at((2, 2)) == [crew[0], stranger]
+    stranger.location = (3, 3)
+    assert crew_index(state).at((3, 3)) == [stranger]
+    assert state.crew_index.stats["rebuilds"] == 2
+
+
+def test_renderer_uses_index():
+    game = GameState(seed=4)
+    try:
+        npc = next(m for m in game.crew if m is not game.player)
+        npc.location = (game.player.location[0] + 1, game.player.location[1])
+        frame = game.renderer.render_raw_grid(game, game.player)
+        row = frame.splitlines()[npc.location[1]]
+        assert row[npc.location[0]] in (npc.name[0].upper(), "!")
+        assert game.crew_index.stats["rebuilds"] == 1
+    finally:
+        game.cleanup()
+
+
+def test_roster_revision_drives_rebuilds():
+    station_map = StationMap()
+    crew = CrewRoster(_crew((6, 6), (1, 1)))
+    index = CrewSpatialIndex().sync(crew, station_map)
+    index.sync(crew, station_map)
+    assert index.stats["rebuilds"] == 1
+
+    newcomer = _crew((15, 15))[0]
+    crew[1] = newcomer
+    assert index.sync(crew, station_map).at((15, 15)) == [newcomer]
+    crew.reverse()
+    assert index.sync(crew, station_map).within((6, 6), 20) == [newcomer, crew[1]]
+    assert index.stats["rebuilds"] == 3
+
+
+def test_game_crew_is_always_a_roster():
+    game = GameState(seed=32)
+    try:
+        assert isinstance(game.crew, CrewRoster)
+        game.crew = list(game.crew)
+        assert isinstance(game.crew, CrewRoster)
+    finally:
+        game.cleanup()
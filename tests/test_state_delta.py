@@ -0,0 +1,133 @@
+from core.event_system import EventType, GameEvent
+from core.state_delta import StateDeltaTracker, StateSection, diff_rows, apply_rows
+from engine import GameState
+
+
+def _counting_builders(values, calls):
+    def make(section):
+        def build():
+            calls.append(section)
+            return values[section]
+        return build
+    return {section: make(section) for section in values}
+
+
+def test_first_collect_is_full_then_clean_sections_are_skipped():
+    game = GameState(seed=7)
+    try:
+        tracker = game.state_tracker
+        values = {
+            StateSection.CREW: [{"name": "A", "hp": 3}, {"name": "B", "hp": 3}],
+            StateSection.INVENTORY: [],
+        }
+        calls = []
+        builders = _counting_builders(values, calls)
+
+        first = tracker.collect(builders)
+        assert first[StateSection.CREW] == values[StateSection.CREW]
+        assert set(calls) == {StateSection.CREW, StateSection.INVENTORY}
+
+        calls.clear()
+        assert tracker.collect(builders) == {}
+        assert calls == []
+    finally:
+        game.cleanup()
+
+
+def test_events_mark_sections_and_only_changed_entries_are_sent():
+    game = GameState(seed=8)
+    try:
+        tracker = game.state_tracker
+        values = {
+            StateSection.CREW: [{"name": "A", "hp": 3}, {"name": "B", "hp": 3}],
+            StateSection.INVENTORY: [],
+        }
+        calls = []
+        builders = _counting_builders(values, calls)
+        tracker.collect(builders)
+
+        version = tracker.version
+        values[StateSection.CREW] = [{"name": "A", "hp": 3}, {"name": "B", "hp": 1}]
+        with game.event_bus.activate():
+            game.event_bus.emit(GameEvent(EventType.CREW_DEATH, {"name": "B"}))
+        assert tracker.version > version
+
+        calls.clear()
+        delta = tracker.collect(builders)
+        assert calls == [StateSection.CREW]
+        assert delta == {StateSection.CREW: [{"name": "B", "hp": 1}]}
+    finally:
+        game.cleanup()
+
+
+def test_full_collect_resends_everything():
+    tracker = StateDeltaTracker()
+    try:
+        values = {StateSection.LIGHTING: {"Rec Room": {"is_dark": False}, "Lab": {"is_dark": True}}}
+        builders = _counting_builders(values, [])
+        tracker.collect(builders)
+        assert tracker.collect(builders, full=True) == values
+    finally:
+        tracker.cleanup()
+
+
+def test_each_client_gets_deltas_against_its_own_baseline():
+    tracker = StateDeltaTracker()
+    try:
+        values = {StateSection.CREW: [{"name": "A", "hp": 3}, {"name": "B", "hp": 3}]}
+        calls = []
+        builders = _counting_builders(values, calls)
+        assert tracker.collect(builders, client="first") == values
+
+        values[StateSection.CREW] = [{"name": "A", "hp": 2}, {"name": "B", "hp": 3}]
+        tracker.mark(StateSection.CREW)
+        assert tracker.collect(builders, client="first") == {StateSection.CREW: [{"name": "A", "hp": 2}]}
+
+        # A client that never received anything gets whole sections, and the
+        # first client's collect didn't clear the change for anyone else
+        assert tracker.collect(builders, client="second") == values
+        assert tracker.is_dirty(StateSection.CREW)
+        assert tracker.collect(builders) == values
+
+        tracker.forget("first")
+        assert tracker.collect(builders, client="first") == values
+    finally:
+        tracker.cleanup()
+
+
+def test_idle_and_surplus_client_baselines_expire():
+    now = [0.0]
+    tracker = StateDeltaTracker(max_clients=2, client_ttl=60, clock=lambda: now[0])
+    try:
+        values = {StateSection.INVENTORY: ["knife"]}
+        builders = _counting_builders(values, [])
+        for client in ("a", "b", "c"):
+            tracker.collect(builders, client=client)
+        # "a" was least recently seen and fell out when "c" arrived
+        assert tracker.collect(builders, client="a") == values
+        assert tracker.collect(builders, client="c") == {}
+
+        now[0] = 120
+        tracker.collect(builders, client="c")
+        assert set(tracker._last_sent) == {None, "c"}
+        assert len(tracker._dirty) == 2
+    finally:
+        tracker.cleanup()
+
+
+def test_map_row_patch_round_trip():
+    before = "#####\n#...#\n#####"
+    after = "#####\n#.@.#\n#####"
+    patch = diff_rows(before, after)
+    assert patch == {"rows": {1: "#.@.#"}, "length": 3}
+    assert apply_rows(before, patch) == after
+
+
+def test_game_state_turn_dirties_every_section():
+    game = GameState(seed=9)
+    try:
+        game.state_tracker.collect({})
+        game.advance_turn()
+        assert all(game.state_tracker.is_dirty(section) for section in StateSection)
+    finally:
+        game.cleanup()
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from engine import GameState
+from entities.station_layout import CORE_ROOMS, StationGenerator, StationLayout
+from entities.station_map import StationMap
+
+
+def test_generator_is_deterministic_and_keeps_core_rooms():
+    first = StationGenerator(seed=11).generate(200, 200)
+    second = StationGenerator(seed=11).generate(200, 200)
+
+    assert first.to_dict() == second.to_dict()
+    assert len(first.rooms) == 400
+    assert set(CORE_ROOMS) <= set(first.rooms)
+    for x1, y1, x2, y2 in first.rooms.values():
+        assert 0 < x1 <= x2 < 200 and 0 < y1 <= y2 < 200
+
+
+def test_generated_map_is_navigable():
+    station_map = StationMap(layout=StationGenerator(seed=5).generate(60, 60))
+
+    assert (station_map.width, station_map.height) == (60, 60)
+    x1, y1, _, _ = station_map.rooms["Kennel"]
+    assert station_map.get_room_name(x1, y1) == "Kennel"
+    assert station_map.get_connections("Kennel")
+    assert all(station_map.get_room_name(*room_vent) in station_map.rooms
+               for room_vent in station_map.get_vent_entry_nodes())
+    vent = next(iter(station_map.vents))
+    assert station_map.get_vent_neighbors(*vent)
+
+
+def test_too_small_station_is_rejected():
+    with pytest.raises(ValueError):
+        StationGenerator(seed=1).generate(20, 20)
+
+
+def test_layout_json_round_trip(tmp_path):
+    layout = StationGenerator(seed=3).generate(50, 50)
+    path = tmp_path / "station.json"
+    layout.save(str(path))
+
+    loaded = StationLayout.load(str(path))
+    assert loaded.to_dict() == json.loads(path.read_text())
+    assert loaded.rooms == layout.rooms
+    assert loaded.vent_links == layout.vent_links
+    assert loaded.cameras == layout.cameras
+
+
+def test_game_save_keeps_generated_layout():
+    layout = StationGenerator(seed=9).generate(100, 100)
+    game = GameState(seed=9, station_layout=layout)
+    try:
+        data = json.loads(json.dumps(game.to_dict()))
+        assert "layout" in data["station_map"]
+        assert "layout" not in StationMap().to_dict()
+
+        restored = GameState.from_dict(data)
+        assert restored.station_map.width == 100
+        assert restored.station_map.rooms == layout.rooms
+        restored.cleanup()
+    finally:
+        game.cleanup()
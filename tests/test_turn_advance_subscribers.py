@@ -1,6 +1,6 @@
 import pytest
 
-from core.event_system import event_bus, EventType, GameEvent
+from core.event_system import event_bus, isolated_bus, EventType, GameEvent
 from systems.architect import RandomnessEngine
 from systems.weather import WeatherSystem
 from systems.sabotage import SabotageManager
@@ -8,13 +8,9 @@ from systems.sabotage import SabotageManager
 
 @pytest.fixture
 def clean_bus():
-    """Isolate event bus subscribers for this test."""
-    original = {k: list(v) for k, v in event_bus._subscribers.items()}
-    event_bus._subscribers = {}
-    try:
-        yield
-    finally:
-        event_bus._subscribers = original
+    """Isolate event bus subscribers (and live sessions) for this test."""
+    with isolated_bus() as bus:
+        yield bus
 
 
 def test_turn_advance_subscribers_run_once(clean_bus):
@@ -1,6 +1,8 @@
 // The Thing: Browser Interface JavaScript
 
 let sessionId = 'session_' + Date.now();
+// Identifies this tab's REST state deltas when the socket is down
+const clientId = 'client_' + Math.random().toString(36).slice(2);
 let gameState = null;
 let renderer3d = null;
 let commandHistory = [];
@@ -10,6 +12,8 @@ let currentEventMode = null; // 'blood-test', 'interrogation', 'combat', or null
 let commandModalOpen = false;
 let currentCommandCategory = 'all';
 let journalFilter = 'all';
+let socket = null;
+let apiBase = ''; // Owning shard's URL when the server runs sharded ('' = this server)
 let previousCrewState = {}; // Track crew changes for notifications
 
 // Game statistics tracking
@@ -95,42 +99,84 @@ document.addEventListener('DOMContentLoaded', function () {
     }
 
     // Initialize Socket.IO
-    const socket = io();
+    connectSocket();
+
+    // --- Terminal Click Event (Tier 11.2) ---
+    window.addEventListener('terminalClicked', (event) => {
+        openTerminalModal(event.detail.roomName);
+    });
+
+    // Let the server drop this tab's REST delta baseline
+    window.addEventListener('pagehide', () => {
+        if (gameState && navigator.sendBeacon) {
+            const body = JSON.stringify({ session_id: sessionId, client: clientId });
+            navigator.sendBeacon(`${apiBase}/api/release_client`, new Blob([body], { type: 'application/json' }));
+        }
+    });
+});
+
+// ===== SOCKET / SHARD ROUTING =====
+function connectSocket() {
+    if (socket) {
+        socket.disconnect();
+    }
+    socket = apiBase ? io(apiBase) : io();
     socket.on('connect', () => {
         console.log('Socket connected');
+        // Rejoin our room (and resync) after a reconnect
+        if (gameState) {
+            socket.emit('join_session', { session_id: sessionId });
+        }
     });
 
-    socket.on('game_event', (event) => {
-        console.log('Game Event:', event);
+    // One frame per command/turn: output, state delta and batched events
+    socket.on('turn_frame', applyTurnFrame);
 
-        if (event.type === 'STEALTH') {
-            // Pass stealth events to 3D renderer for visualization
-            if (renderer3d) {
-                renderer3d.handleStealthEvent(event.data);
-            }
+    // Events pushed outside a socket command (e.g. REST fallback)
+    socket.on('game_events', (batch) => {
+        (batch.events || []).forEach(handleGameEvent);
+    });
+}
 
-            // Also show toast/log
-            const outcome = event.data.outcome;
-            const opponent = event.data.opponent;
-            if (outcome === 'detected') {
-                showToast(`DETECTED by ${opponent}!`, 'danger', 4000);
-                addOutput(`[STEALTH] You are spotted by ${opponent}!`, 'danger');
-            } else {
-                showToast(`Evaded ${opponent}`, 'success', 2000);
-                addOutput(`[STEALTH] You slip past ${opponent} unseen.`, 'info');
+// Sessions are owned by one server process; ask any of them which.
+function resolveShard() {
+    return fetch(`/api/shard/${sessionId}`)
+        .then(response => response.json())
+        .then(data => {
+            const base = data.url || '';
+            if (base !== apiBase) {
+                apiBase = base;
+                connectSocket();
             }
+        })
+        .catch(() => { /* single-process server: stay on this origin */ });
+}
+
+function handleGameEvent(event) {
+    console.log('Game Event:', event);
+
+    if (event.type === 'STEALTH') {
+        // Pass stealth events to 3D renderer for visualization
+        if (renderer3d) {
+            renderer3d.handleStealthEvent(event.data);
         }
-        else if (event.type === 'WARNING') {
-            addOutput(`[WARNING] ${event.data.text}`, 'warning');
-            showToast(event.data.text, 'warning');
-        }
-    });
 
-    // --- Terminal Click Event (Tier 11.2) ---
-    window.addEventListener('terminalClicked', (event) => {
-        openTerminalModal(event.detail.roomName);
-    });
-});
+        // Also show toast/log
+        const outcome = event.data.outcome;
+        const opponent = event.data.opponent;
+        if (outcome === 'detected') {
+            showToast(`DETECTED by ${opponent}!`, 'danger', 4000);
+            addOutput(`[STEALTH] You are spotted by ${opponent}!`, 'danger');
+        } else {
+            showToast(`Evaded ${opponent}`, 'success', 2000);
+            addOutput(`[STEALTH] You slip past ${opponent} unseen.`, 'info');
+        }
+    }
+    else if (event.type === 'WARNING') {
+        addOutput(`[WARNING] ${event.data.text}`, 'warning');
+        showToast(event.data.text, 'warning');
+    }
+}
 
 // ===== TERMINAL MODAL (Tier 11.2) =====
 let terminalModalOpen = false;
@@ -446,7 +492,7 @@ function startGame(difficulty) {
     addOutput(`Difficulty: ${difficulty}`);
     addOutput('Starting new game...');
 
-    fetch('/api/new_game', {
+    resolveShard().then(() => fetch(`${apiBase}/api/new_game`, {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json'
@@ -455,11 +501,14 @@ function startGame(difficulty) {
             difficulty: difficulty,
             session_id: sessionId
         })
-    })
+    }))
         .then(response => response.json())
         .then(data => {
             if (data.success) {
                 gameState = data.game_state;
+                if (socket && socket.connected) {
+                    socket.emit('join_session', { session_id: sessionId });
+                }
                 switchToGameScreen();
                 updateGameDisplay(gameState);
                 addOutput('System initialized. Welcome to Outpost 31.');
@@ -484,36 +533,81 @@ function switchToGameScreen() {
     document.getElementById('command-input').focus();
 }
 
+// ===== STATE DELTAS =====
+// The server sends full snapshots (full: true) or deltas holding only changed
+// sections: changed crew members, changed rooms in room_lighting, and
+// {rows, length} patches for map/ascii_map. Always returns a new object so
+// previous-state comparisons keep working.
+function applyRowPatch(text, patch) {
+    if (typeof patch === 'string') return patch;
+    const rows = (text || '').split('\n').slice(0, patch.length);
+    while (rows.length < patch.length) rows.push('');
+    Object.keys(patch.rows).forEach(index => {
+        rows[Number(index)] = patch.rows[index];
+    });
+    return rows.join('\n');
+}
+
+function mergeGameState(previous, incoming) {
+    if (!previous || !incoming || incoming.full || incoming.error) return incoming;
+
+    const merged = Object.assign({}, previous, incoming);
+    if (incoming.crew) {
+        const changed = {};
+        incoming.crew.forEach(member => { changed[member.name] = member; });
+        merged.crew = (previous.crew || []).map(member => changed[member.name] || member);
+        incoming.crew.forEach(member => {
+            if (!merged.crew.some(existing => existing.name === member.name)) merged.crew.push(member);
+        });
+    }
+    if (incoming.room_lighting) {
+        merged.room_lighting = Object.assign({}, previous.room_lighting, incoming.room_lighting);
+    }
+    if (incoming.map !== undefined) merged.map = applyRowPatch(previous.map, incoming.map);
+    if (incoming.ascii_map !== undefined) merged.ascii_map = applyRowPatch(previous.ascii_map, incoming.ascii_map);
+    return merged;
+}
+
+function applyTurnFrame(frame) {
+    if (!frame.success) {
+        addOutput('Error: ' + (frame.error || 'Command failed'));
+        return;
+    }
+    if (frame.message) {
+        addOutput(frame.message);
+    }
+    (frame.events || []).forEach(handleGameEvent);
+    gameState = mergeGameState(gameState, frame.game_state);
+    updateGameDisplay(gameState);
+
+    // Check for game over
+    if (gameState.game_over) {
+        showGameOver(gameState.won, gameState.game_over_message);
+    }
+}
+
 function sendCommand(command) {
     addOutput('> ' + command, 'input');
 
-    fetch('/api/command', {
+    // Push channel: the server answers with a turn_frame on our room
+    if (socket && socket.connected) {
+        socket.emit('command', { session_id: sessionId, command: command });
+        return;
+    }
+
+    fetch(`${apiBase}/api/command`, {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json'
         },
         body: JSON.stringify({
             session_id: sessionId,
+            client: clientId,
             command: command
         })
     })
         .then(response => response.json())
-        .then(data => {
-            if (data.success) {
-                if (data.message) {
-                    addOutput(data.message);
-                }
-                gameState = data.game_state;
-                updateGameDisplay(gameState);
-
-                // Check for game over
-                if (gameState.game_over) {
-                    showGameOver(gameState.won, gameState.game_over_message);
-                }
-            } else {
-                addOutput('Error: ' + (data.error || 'Command failed'));
-            }
-        })
+        .then(applyTurnFrame)
         .catch(error => {
             console.error('Error:', error);
             addOutput('Network error: ' + error.message);
@@ -980,15 +1074,16 @@ function showGameOver(won, message) {
     }, 1000);
 }
 
-// Periodically refresh game state
+// Periodically refresh game state; only needed while the socket is down,
+// since connected clients get every change pushed as a turn_frame.
 function startGameStateRefresh() {
     setInterval(() => {
-        if (gameState && !gameState.game_over) {
-            fetch(`/api/game_state/${sessionId}`)
+        if (gameState && !gameState.game_over && !(socket && socket.connected)) {
+            fetch(`${apiBase}/api/game_state/${sessionId}?client=${clientId}`)
                 .then(response => response.json())
                 .then(data => {
                     if (data && !data.error) {
-                        gameState = data;
+                        gameState = mergeGameState(gameState, data);
                         updateGameDisplay(gameState);
 
                         if (gameState.game_over) {